@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+MCP 请求流水线基准测试
+
+启动一个本地 echo stdio MCP 服务器，对同一连接并发发送 N 个 tools/call 请求，
+对比 max_in_flight=1（串行）与 max_in_flight=N（多路复用）的总耗时。
+
+用法:
+    python scripts/benchmark_mcp_pipelining.py --requests 20 --delay 0.2
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from simacode.mcp.connection import StdioTransport
+from simacode.mcp.protocol import MCPProtocol, MCPMethods
+
+
+async def run_echo_server(delay: float) -> None:
+    """Minimal JSON-RPC echo server that answers each request after `delay` seconds."""
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    write_lock = asyncio.Lock()
+
+    async def handle(request: dict) -> None:
+        await asyncio.sleep(delay)
+        response = {
+            "jsonrpc": "2.0",
+            "id": request["id"],
+            "result": {"content": [{"type": "text", "text": json.dumps(request.get("params"))}]}
+        }
+        async with write_lock:
+            sys.stdout.write(json.dumps(response) + "\n")
+            sys.stdout.flush()
+
+    while True:
+        line = await reader.readline()
+        if not line:
+            break
+        request = json.loads(line)
+        if request.get("id") is not None:
+            asyncio.create_task(handle(request))
+
+
+async def measure(requests: int, delay: float, max_in_flight: int) -> float:
+    """Send `requests` concurrent tools/call requests and return the elapsed time."""
+    transport = StdioTransport(
+        command=[sys.executable, __file__, "--serve", "--delay", str(delay)]
+    )
+    await transport.connect()
+    protocol = MCPProtocol(transport, max_in_flight=max_in_flight)
+
+    try:
+        # Warm up so interpreter startup is not part of the measurement
+        await protocol.call_method(MCPMethods.PING)
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*[
+            protocol.call_method(MCPMethods.TOOLS_CALL, {"name": "echo", "arguments": {"i": i}})
+            for i in range(requests)
+        ])
+        elapsed = time.perf_counter() - start
+        assert len(results) == requests
+        return elapsed
+    finally:
+        await protocol.shutdown()
+        await transport.disconnect()
+
+
+async def main(args: argparse.Namespace) -> None:
+    print(f"📊 {args.requests} concurrent tools/call requests, server delay {args.delay:.3f}s")
+
+    serial = await measure(args.requests, args.delay, max_in_flight=1)
+    print(f"  max_in_flight=1:   {serial:.3f}s")
+
+    pipelined = await measure(args.requests, args.delay, max_in_flight=args.requests)
+    print(f"  max_in_flight={args.requests}: {pipelined:.3f}s")
+
+    print(f"  speedup: {serial / pipelined:.1f}x (ideal ≈ {args.requests}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark pipelined MCP requests")
+    parser.add_argument("--requests", type=int, default=20, help="Number of concurrent requests")
+    parser.add_argument("--delay", type=float, default=0.2, help="Simulated server latency per request")
+    parser.add_argument("--serve", action="store_true", help="Run as the echo stdio server")
+    args = parser.parse_args()
+
+    if args.serve:
+        asyncio.run(run_echo_server(args.delay))
+    else:
+        asyncio.run(main(args))
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+MCP 工具输入模型基准测试
+
+生成 N 个合成 MCP 工具，测量:
+  1. 注册耗时：首次构建包装器（冷缓存）与重新注册（命中进程级模型缓存）
+  2. 单次调用校验开销：validate_input（model_validate）与原先的 model(**data) 构造
+
+用法:
+    python scripts/benchmark_mcp_tool_schemas.py --tools 500 --calls 20
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from simacode.mcp.protocol import MCPTool
+from simacode.mcp.tool_wrapper import MCPToolWrapper, input_model_cache
+from simacode.permissions import PermissionManager
+
+
+def make_tools(count: int) -> list:
+    """Synthetic tools with flat schemas of 2-9 fields."""
+    types = ["string", "integer", "number", "boolean", "array", "object"]
+    tools = []
+    for i in range(count):
+        properties = {
+            f"field_{j}": {"type": types[(i + j) % len(types)], "description": f"Field {j}"}
+            for j in range(2 + i % 8)
+        }
+        tools.append(MCPTool(
+            name=f"tool_{i}",
+            description=f"Synthetic tool {i}",
+            server_name=f"server_{i % 10}",
+            input_schema={"type": "object", "properties": properties, "required": ["field_0"]}
+        ))
+    return tools
+
+
+def sample_input(tool: MCPTool) -> dict:
+    values = {"string": "text", "integer": 7, "number": 1.5, "boolean": True, "array": [1, 2], "object": {"k": "v"}}
+    return {name: values[spec["type"]] for name, spec in tool.input_schema["properties"].items()}
+
+
+def register(tools: list, permission_manager: PermissionManager) -> tuple:
+    """Wrap every tool the way MCPToolRegistry does, sharing one permission manager."""
+    start = time.perf_counter()
+    wrappers = [
+        MCPToolWrapper(tool, server_manager=None, permission_manager=permission_manager)
+        for tool in tools
+    ]
+    return wrappers, time.perf_counter() - start
+
+
+async def measure_validation(wrappers: list, inputs: list, calls: int) -> tuple:
+    """Average µs per call of model(**data) and of validate_input."""
+    start = time.perf_counter()
+    for _ in range(calls):
+        for wrapper, data in zip(wrappers, inputs):
+            wrapper.get_input_schema()(**data)
+    construct = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(calls):
+        for wrapper, data in zip(wrappers, inputs):
+            await wrapper.validate_input(data)
+    validate = time.perf_counter() - start
+
+    per_call = 1e6 / (calls * len(wrappers))
+    return construct * per_call, validate * per_call
+
+
+async def main(args: argparse.Namespace) -> None:
+    tools = make_tools(args.tools)
+    inputs = [sample_input(tool) for tool in tools]
+    print(f"📊 {args.tools} synthetic tools, {args.calls} validations per tool")
+
+    permission_manager = PermissionManager()
+
+    input_model_cache.clear()
+    wrappers, cold = register(tools, permission_manager)
+    print(f"  registration (cold cache):  {cold * 1000:.1f}ms")
+
+    # Re-registration after a refresh builds new MCPTool objects with the same schemas
+    _, warm = register(make_tools(args.tools), permission_manager)
+    print(f"  re-registration (cached):   {warm * 1000:.1f}ms ({cold / warm:.1f}x faster)")
+    print(f"  model cache: {input_model_cache.get_stats()}")
+
+    construct, validate = await measure_validation(wrappers, inputs, args.calls)
+    print(f"  model(**data):              {construct:.1f}µs/call")
+    print(f"  validate_input:             {validate:.1f}µs/call")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark MCP tool input model creation and validation")
+    parser.add_argument("--tools", type=int, default=500, help="Number of synthetic tools")
+    parser.add_argument("--calls", type=int, default=20, help="Validations per tool")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    asyncio.run(main(args))
@@ -3,9 +3,11 @@ Base interfaces for AI clients.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional, List, Dict, Any, AsyncIterator
+from typing import Optional, List, Dict, Any, AsyncIterator, FrozenSet, Tuple
+
+from .tokenizer import TokenCounter, get_token_counter
 
 
 class Role(str, Enum):
@@ -16,6 +18,16 @@ class Role(str, Enum):
     TOOL = "tool"
 
 
+# Tags assigned to a message when any of the keywords occurs in its content
+MESSAGE_TAG_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "important": ("decision", "important", "error", "problem", "solution", "决定", "重要", "错误", "问题", "解决"),
+    "code": ("code", "function", "class", "代码", "函数"),
+    "problem": ("error", "problem", "fix", "错误", "问题", "修复"),
+    "implementation": ("create", "build", "implement", "创建", "构建", "实现"),
+    "config": ("config", "setup", "install", "配置", "设置", "安装"),
+}
+
+
 @dataclass
 class Message:
     """A single message in a conversation."""
@@ -23,6 +35,15 @@ class Message:
     content: str
     metadata: Optional[Dict[str, Any]] = None
     
+    # Derived from content and recomputed only when content is replaced:
+    # (content, counter, tokens) and (content, tags)
+    _token_cache: Optional[Tuple[Any, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _tags_cache: Optional[Tuple[Any, ...]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
     def __post_init__(self):
         """Validate message fields after initialization."""
         if not isinstance(self.role, Role):
@@ -34,6 +55,39 @@ class Message:
             else:
                 raise TypeError(f"Role must be a Role enum or string, got {type(self.role)}")
     
+    def count_tokens(self, counter: Optional[TokenCounter] = None) -> int:
+        """
+        Count the tokens of the content, cached per message.
+        
+        Args:
+            counter: Token counter to use (defaults to get_token_counter())
+            
+        Returns:
+            int: Number of tokens
+        """
+        counter = counter or get_token_counter()
+        cached = self._token_cache
+        if cached is not None and cached[0] is self.content and cached[1] is counter:
+            return cached[2]
+        
+        count = counter.count(self.content)
+        self._token_cache = (self.content, counter, count)
+        return count
+    
+    def get_tags(self) -> FrozenSet[str]:
+        """Get the MESSAGE_TAG_KEYWORDS tags matching the content, cached per message."""
+        cached = self._tags_cache
+        if cached is not None and cached[0] is self.content:
+            return cached[1]
+        
+        content = self.content.lower()
+        tags = frozenset(
+            tag for tag, keywords in MESSAGE_TAG_KEYWORDS.items()
+            if any(keyword in content for keyword in keywords)
+        )
+        self._tags_cache = (self.content, tags)
+        return tags
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert message to dictionary format."""
         result = {
@@ -90,4 +144,8 @@ class AIClient(ABC):
     @abstractmethod
     def provider_name(self) -> str:
         """Get the provider name."""
+        pass
+    
+    async def close(self) -> None:
+        """Release network resources held by the client."""
         pass
\ No newline at end of file
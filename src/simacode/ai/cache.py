@@ -0,0 +1,351 @@
+"""
+Response caching for AI clients.
+
+This module provides a caching wrapper around AIClient so repeated prompts
+(the same system prompt, tool list and request) are answered from a local
+cache instead of another model round-trip. Two backends are available: an
+in-memory LRU and an on-disk SQLite store.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+
+from .base import AIClient, AIResponse, Message
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCacheBackend(ABC):
+    """Abstract storage backend for cached AI responses."""
+
+    def __init__(self, max_entries: int = 1000, ttl: Optional[float] = 3600):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.evictions = 0
+
+    def _is_expired(self, created_at: float) -> bool:
+        """Check whether an entry created at `created_at` has outlived the TTL."""
+        return bool(self.ttl) and time.time() - created_at > self.ttl
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[AIResponse]:
+        """Get a cached response, or None if missing or expired."""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, response: AIResponse) -> None:
+        """Store a response, evicting old entries if needed."""
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove a cached response."""
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove all cached responses."""
+        pass
+
+    @abstractmethod
+    def size(self) -> int:
+        """Get the number of cached entries."""
+        pass
+
+    async def close(self) -> None:
+        """Release backend resources."""
+        pass
+
+
+class MemoryCacheBackend(ResponseCacheBackend):
+    """In-memory LRU cache with TTL expiry."""
+
+    def __init__(self, max_entries: int = 1000, ttl: Optional[float] = 3600):
+        super().__init__(max_entries, ttl)
+        self._entries: "OrderedDict[str, Tuple[float, AIResponse]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[AIResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        created_at, response = entry
+        if self._is_expired(created_at):
+            del self._entries[key]
+            self.evictions += 1
+            return None
+
+        self._entries.move_to_end(key)
+        return response
+
+    async def set(self, key: str, response: AIResponse) -> None:
+        self._entries[key] = (time.time(), response)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+    def size(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheBackend(ResponseCacheBackend):
+    """
+    On-disk cache stored in a SQLite database.
+
+    Entries survive restarts, so batch workloads that replay the same prompts
+    across runs still hit the cache. Database access runs in a worker thread
+    to keep the event loop responsive.
+    """
+
+    def __init__(self, db_path: Union[str, Path], max_entries: int = 10000, ttl: Optional[float] = 86400):
+        super().__init__(max_entries, ttl)
+        self.db_path = Path(db_path).expanduser()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS ai_responses (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_ai_responses_accessed ON ai_responses (accessed_at)"
+        )
+        self._conn.commit()
+
+    def _get_sync(self, key: str) -> Optional[AIResponse]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM ai_responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            response_json, created_at = row
+            if self._is_expired(created_at):
+                self._conn.execute("DELETE FROM ai_responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self.evictions += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE ai_responses SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+
+        return AIResponse(**json.loads(response_json))
+
+    def _set_sync(self, key: str, response: AIResponse) -> None:
+        now = time.time()
+        response_json = json.dumps(asdict(response), ensure_ascii=False, default=str)
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ai_responses (key, response, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, response_json, now, now)
+            )
+
+            if self.ttl:
+                cursor = self._conn.execute(
+                    "DELETE FROM ai_responses WHERE created_at < ?", (now - self.ttl,)
+                )
+                self.evictions += cursor.rowcount
+
+            overflow = self._count_sync() - self.max_entries
+            if overflow > 0:
+                cursor = self._conn.execute(
+                    "DELETE FROM ai_responses WHERE key IN "
+                    "(SELECT key FROM ai_responses ORDER BY accessed_at ASC LIMIT ?)",
+                    (overflow,)
+                )
+                self.evictions += cursor.rowcount
+
+            self._conn.commit()
+
+    def _count_sync(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM ai_responses").fetchone()[0]
+
+    def _execute_sync(self, sql: str, params: tuple = ()) -> None:
+        with self._lock:
+            self._conn.execute(sql, params)
+            self._conn.commit()
+
+    async def get(self, key: str) -> Optional[AIResponse]:
+        return await asyncio.to_thread(self._get_sync, key)
+
+    async def set(self, key: str, response: AIResponse) -> None:
+        await asyncio.to_thread(self._set_sync, key, response)
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self._execute_sync, "DELETE FROM ai_responses WHERE key = ?", (key,))
+
+    async def clear(self) -> None:
+        await asyncio.to_thread(self._execute_sync, "DELETE FROM ai_responses")
+
+    def size(self) -> int:
+        with self._lock:
+            return self._count_sync()
+
+    async def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class CachedAIClient(AIClient):
+    """
+    AIClient wrapper that answers repeated chat requests from a cache.
+
+    Cache keys are a SHA-256 hash of the model, temperature and the
+    normalized messages (role plus whitespace-collapsed content). Streaming
+    responses are passed through uncached. Pass ``use_cache=False`` to
+    ``chat`` to bypass the cache for a single call.
+    """
+
+    def __init__(self, client: AIClient, backend: ResponseCacheBackend):
+        super().__init__(client.config)
+        self.client = client
+        self.backend = backend
+
+        # Metrics
+        self.hits = 0
+        self.misses = 0
+        self.bypassed = 0
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose attributes of the wrapped client (model, get_pool_stats, ...)
+        if name == "client":
+            raise AttributeError(name)
+        return getattr(self.client, name)
+
+    @property
+    def provider_name(self) -> str:
+        """Get the provider name of the wrapped client."""
+        return self.client.provider_name
+
+    def validate_config(self) -> bool:
+        """Validate the wrapped client's configuration."""
+        return self.client.validate_config()
+
+    def make_cache_key(self, messages: List[Message]) -> str:
+        """Build the cache key for a list of messages."""
+        normalized = [
+            [message.role.value, " ".join(message.content.split())]
+            for message in messages
+        ]
+        key_data = {
+            "model": getattr(self.client, "model", None),
+            "temperature": getattr(self.client, "temperature", None),
+            "messages": normalized,
+        }
+        payload = json.dumps(key_data, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def chat(self, messages: List[Message], use_cache: bool = True) -> AIResponse:
+        """Send chat request, returning a cached response when available."""
+        if not use_cache:
+            self.bypassed += 1
+            return await self.client.chat(messages)
+
+        key = self.make_cache_key(messages)
+        try:
+            cached = await self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"AI response cache lookup failed: {e}")
+            cached = None
+
+        if cached is not None:
+            self.hits += 1
+            logger.debug(f"AI response cache hit: {key[:12]}")
+            return cached
+
+        self.misses += 1
+        response = await self.client.chat(messages)
+
+        try:
+            await self.backend.set(key, response)
+        except Exception as e:
+            logger.warning(f"AI response cache store failed: {e}")
+
+        return response
+
+    async def chat_stream(self, messages: List[Message]) -> AsyncIterator[str]:
+        """Stream chat responses from the wrapped client (not cached)."""
+        async for chunk in self.client.chat_stream(messages):
+            yield chunk
+
+    async def invalidate(self, messages: List[Message]) -> None:
+        """Drop the cached response for these messages (e.g. if it failed to parse)."""
+        await self.backend.delete(self.make_cache_key(messages))
+
+    async def close(self) -> None:
+        """Close the cache backend and the wrapped client."""
+        await self.backend.close()
+        await self.client.close()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss metrics."""
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__,
+            "entries": self.backend.size(),
+            "max_entries": self.backend.max_entries,
+            "ttl": self.backend.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypassed": self.bypassed,
+            "evictions": self.backend.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def create_cache_backend(cache_config: Dict[str, Any]) -> ResponseCacheBackend:
+    """
+    Create a cache backend from configuration.
+
+    Args:
+        cache_config: Dict with ``backend`` ("memory" or "sqlite"),
+            ``max_entries``, ``ttl`` and, for SQLite, ``db_path``
+
+    Returns:
+        ResponseCacheBackend instance
+
+    Raises:
+        ValueError: If the backend type is not supported
+    """
+    backend = cache_config.get("backend", "memory")
+    max_entries = cache_config.get("max_entries", 1000)
+    ttl = cache_config.get("ttl", 3600)
+
+    if backend == "memory":
+        return MemoryCacheBackend(max_entries=max_entries, ttl=ttl)
+    if backend == "sqlite":
+        db_path = cache_config.get("db_path") or Path.cwd() / ".simacode" / "cache" / "ai_responses.db"
+        return SQLiteCacheBackend(db_path, max_entries=max_entries, ttl=ttl)
+
+    raise ValueError(f"Unsupported AI response cache backend: {backend}")
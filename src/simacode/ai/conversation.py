@@ -3,10 +3,14 @@ Conversation and message history management.
 """
 
 import json
+import os
 import uuid
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
 from .base import Message, Role
 
 
@@ -30,6 +34,9 @@ class Conversation:
             content=content,
             metadata=metadata
         )
+        # Count and tag once here so context budgeting only touches new messages
+        message.count_tokens()
+        message.get_tags()
         self.messages.append(message)
         self.updated_at = datetime.now()
         return message
@@ -86,15 +93,127 @@ class Conversation:
         return conv
 
 
+@dataclass
+class ConversationSummary:
+    """Index entry describing a conversation without loading its messages."""
+    id: str
+    title: str
+    created_at: datetime
+    updated_at: datetime
+    message_count: int
+
+
+class _ConversationCache(MutableMapping):
+    """
+    Mapping of conversation ID to Conversation backed by the on-disk index.
+    
+    Membership and length come from the index; conversation bodies are loaded
+    on first access and kept in an LRU of bounded size. Evicted conversations
+    are saved first so no messages are lost.
+    """
+    
+    def __init__(self, manager: "ConversationManager"):
+        self._manager = manager
+        self._loaded: "OrderedDict[str, Conversation]" = OrderedDict()
+    
+    def __getitem__(self, conversation_id: str) -> Conversation:
+        conversation = self._loaded.get(conversation_id)
+        if conversation is not None:
+            self._loaded.move_to_end(conversation_id)
+            return conversation
+        
+        if conversation_id not in self._manager._index:
+            raise KeyError(conversation_id)
+        
+        conversation = self._manager._read_conversation(conversation_id)
+        if conversation is None:
+            raise KeyError(conversation_id)
+        
+        self._loaded[conversation_id] = conversation
+        self._evict()
+        return conversation
+    
+    def __setitem__(self, conversation_id: str, conversation: Conversation) -> None:
+        self._manager._index.setdefault(conversation_id, self._manager._index_entry(conversation))
+        self._loaded[conversation_id] = conversation
+        self._loaded.move_to_end(conversation_id)
+        self._evict()
+    
+    def __delitem__(self, conversation_id: str) -> None:
+        if conversation_id not in self._manager._index:
+            raise KeyError(conversation_id)
+        del self._manager._index[conversation_id]
+        self._loaded.pop(conversation_id, None)
+    
+    def __contains__(self, conversation_id: object) -> bool:
+        return conversation_id in self._manager._index
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._manager._index))
+    
+    def __len__(self) -> int:
+        return len(self._manager._index)
+    
+    def values(self) -> List[Conversation]:  # type: ignore[override]
+        """Load and return all readable conversations (skips unreadable ones)."""
+        return [conversation for conversation in map(self.get, self) if conversation is not None]
+    
+    def loaded(self) -> List[Conversation]:
+        """Get the conversations currently held in memory."""
+        return list(self._loaded.values())
+    
+    def is_loaded(self, conversation_id: str) -> bool:
+        """Check whether a conversation is held in memory."""
+        return conversation_id in self._loaded
+    
+    def _evict(self) -> None:
+        """Drop least recently used conversations beyond the cache size."""
+        current = self._manager.current_conversation
+        for conversation_id in list(self._loaded):
+            if len(self._loaded) <= self._manager.cache_size:
+                break
+            conversation = self._loaded[conversation_id]
+            if conversation is current:
+                continue
+            self._manager._save_conversation(conversation)
+            del self._loaded[conversation_id]
+
+
 class ConversationManager:
-    """Manages multiple conversations and persists them to disk."""
+    """
+    Manages multiple conversations and persists them to disk.
+    
+    Each conversation is stored as a JSON Lines file (a header line followed
+    by one line per message) so new messages are appended rather than the
+    whole file being rewritten. A separate append-only index records the
+    title, timestamps and message count of every conversation; listing is
+    served from the index and conversation bodies are only loaded on demand.
+    Legacy ``<id>.json`` conversation files are converted on startup.
+    """
     
-    def __init__(self, storage_dir: Path):
-        """Initialize conversation manager."""
+    INDEX_FILE = "conversations.index.jsonl"
+    
+    def __init__(self, storage_dir: Path, cache_size: int = 32):
+        """
+        Initialize conversation manager.
+        
+        Args:
+            storage_dir: Directory to store conversations in
+            cache_size: Maximum number of conversations kept in memory
+        """
         self.storage_dir = storage_dir
-        self.conversations: Dict[str, Conversation] = {}
+        self.cache_size = cache_size
         self.current_conversation: Optional[Conversation] = None
         
+        # Index state
+        self._index: Dict[str, Dict[str, Any]] = {}
+        self._ignored_files: Dict[str, float] = {}  # legacy file name -> mtime
+        self._index_log_lines = 0
+        # What is already on disk per conversation: {"count": messages, "header": header line}
+        self._persisted: Dict[str, Dict[str, Any]] = {}
+        
+        self.conversations = _ConversationCache(self)
+        
         # Ensure storage directory exists
         try:
             if self.storage_dir.is_file():
@@ -106,34 +225,56 @@ class ConversationManager:
             import tempfile
             self.storage_dir = Path(tempfile.mkdtemp(prefix="simacode_conversations_"))
         
-        # Load existing conversations
-        self._load_conversations()
+        # Load the conversation index
+        self._load_index()
     
     def create_conversation(self, title: Optional[str] = None, 
                           metadata: Optional[Dict[str, Any]] = None) -> Conversation:
         """Create a new conversation."""
         conversation = Conversation(title=title, metadata=metadata)
-        self.conversations[conversation.id] = conversation
         self.current_conversation = conversation
+        self.conversations[conversation.id] = conversation
         self._save_conversation(conversation)
         return conversation
     
     def get_conversation(self, conversation_id: str) -> Optional[Conversation]:
-        """Get conversation by ID."""
+        """Get conversation by ID, loading it from disk if needed."""
         return self.conversations.get(conversation_id)
     
     def list_conversations(self) -> List[Conversation]:
-        """List all conversations sorted by updated time."""
+        """
+        List all conversations sorted by updated time.
+        
+        Every conversation is loaded from disk; use list_conversation_summaries()
+        when only titles, timestamps and message counts are needed.
+        """
         return sorted(
             self.conversations.values(),
             key=lambda x: x.updated_at,
             reverse=True
         )
     
+    def list_conversation_summaries(self) -> List[ConversationSummary]:
+        """List all conversations sorted by updated time, without loading their messages."""
+        summaries = []
+        for conversation_id, entry in self._index.items():
+            if self.conversations.is_loaded(conversation_id):
+                entry = self._index_entry(self.conversations[conversation_id])
+            summaries.append(ConversationSummary(
+                id=conversation_id,
+                title=entry["title"],
+                created_at=datetime.fromisoformat(entry["created_at"]),
+                updated_at=datetime.fromisoformat(entry["updated_at"]),
+                message_count=entry["message_count"]
+            ))
+        
+        return sorted(summaries, key=lambda x: x.updated_at, reverse=True)
+    
     def set_current_conversation(self, conversation_id: str) -> bool:
         """Set the current conversation."""
-        if conversation_id in self.conversations:
-            self.current_conversation = self.conversations[conversation_id]
+        conversation = self.conversations.get(conversation_id)
+        if conversation is not None:
+            self.current_conversation = conversation
             return True
         return False
     
@@ -147,52 +288,231 @@ class ConversationManager:
     def delete_conversation(self, conversation_id: str) -> bool:
         """Delete a conversation."""
         if conversation_id in self.conversations:
-            # Remove from memory
+            # Remove from memory and index
             del self.conversations[conversation_id]
+            self._persisted.pop(conversation_id, None)
             
             # Remove from disk
-            file_path = self._get_conversation_file_path(conversation_id)
-            if file_path.exists():
-                file_path.unlink()
+            for file_path in (self._get_conversation_file_path(conversation_id),
+                              self.storage_dir / f"{conversation_id}.json"):
+                if file_path.exists():
+                    file_path.unlink()
+            self._append_index([{"id": conversation_id, "deleted": True}])
             
             # Update current conversation if needed
             if self.current_conversation and self.current_conversation.id == conversation_id:
-                conversations = list(self.conversations.values())
-                self.current_conversation = conversations[0] if conversations else None
+                remaining = sorted(self._index, key=lambda cid: self._index[cid]["updated_at"], reverse=True)
+                self.current_conversation = self.conversations.get(remaining[0]) if remaining else None
             
             return True
         return False
     
     def _get_conversation_file_path(self, conversation_id: str) -> Path:
         """Get the file path for a conversation."""
-        return self.storage_dir / f"{conversation_id}.json"
+        return self.storage_dir / f"{conversation_id}.jsonl"
+    
+    @staticmethod
+    def _dumps(data: Any) -> str:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    
+    @staticmethod
+    def _index_entry(conversation: Conversation) -> Dict[str, Any]:
+        """Build the index entry for a conversation."""
+        return {
+            "id": conversation.id,
+            "title": conversation.title,
+            "created_at": conversation.created_at.isoformat(),
+            "updated_at": conversation.updated_at.isoformat(),
+            "message_count": len(conversation.messages)
+        }
+    
+    def _header_line(self, conversation: Conversation) -> str:
+        """Serialize the conversation header (everything except messages)."""
+        return self._dumps({
+            "id": conversation.id,
+            "title": conversation.title,
+            "metadata": conversation.metadata,
+            "created_at": conversation.created_at.isoformat()
+        })
     
     def _save_conversation(self, conversation: Conversation) -> None:
-        """Save conversation to disk."""
+        """
+        Save conversation to disk.
+        
+        New messages are appended to the conversation file. The file is only
+        rewritten when the header changed or messages were removed.
+        """
         try:
             file_path = self._get_conversation_file_path(conversation.id)
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(conversation.to_dict(), f, ensure_ascii=False, indent=2)
+            header = self._header_line(conversation)
+            persisted = self._persisted.get(conversation.id)
+            message_count = len(conversation.messages)
+            
+            if persisted is None or persisted["header"] != header or persisted["count"] > message_count \
+                    or not file_path.exists():
+                lines = [header] + [self._dumps(msg.to_dict()) for msg in conversation.messages]
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    f.write("\n".join(lines) + "\n")
+            elif persisted["count"] < message_count:
+                new_messages = conversation.messages[persisted["count"]:]
+                with open(file_path, 'a', encoding='utf-8') as f:
+                    f.write("".join(self._dumps(msg.to_dict()) + "\n" for msg in new_messages))
+            
+            self._persisted[conversation.id] = {"count": message_count, "header": header}
+            
+            entry = self._index_entry(conversation)
+            if self._index.get(conversation.id) != entry or self._index_log_lines == 0:
+                self._index[conversation.id] = entry
+                self._append_index([entry])
         except (OSError, PermissionError):
             # If we can't save, just skip (conversation remains in memory)
             pass
     
-    def _load_conversations(self) -> None:
-        """Load conversations from disk."""
+    def _read_conversation(self, conversation_id: str) -> Optional[Conversation]:
+        """Load a conversation body from disk."""
+        try:
+            with open(self._get_conversation_file_path(conversation_id), 'r', encoding='utf-8') as f:
+                lines = [line for line in f.read().split("\n") if line.strip()]
+            
+            header = json.loads(lines[0])
+            conversation = Conversation(
+                conversation_id=header["id"],
+                title=header["title"],
+                metadata=header.get("metadata", {})
+            )
+            conversation.created_at = datetime.fromisoformat(header["created_at"])
+            
+            intact = True
+            for line in lines[1:]:
+                try:
+                    conversation.messages.append(Message.from_dict(json.loads(line)))
+                except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                    # e.g. a partially written trailing line; rewrite the file on next save
+                    intact = False
+            
+            entry = self._index.get(conversation_id)
+            conversation.updated_at = datetime.fromisoformat(entry["updated_at"]) if entry \
+                else conversation.created_at
+            
+            self._persisted[conversation_id] = {
+                "count": len(conversation.messages) if intact else -1,
+                "header": lines[0] if intact else ""
+            }
+            return conversation
+            
+        except (json.JSONDecodeError, KeyError, TypeError, OSError, ValueError, IndexError):
+            return None
+    
+    def _append_index(self, records: List[Dict[str, Any]]) -> None:
+        """Append records to the index log, compacting it when it grows too long."""
+        index_path = self.storage_dir / self.INDEX_FILE
+        
+        if self._index_log_lines + len(records) > 2 * len(self._index) + 64:
+            self._rewrite_index()
+            return
+        
+        with open(index_path, 'a', encoding='utf-8') as f:
+            f.write("".join(self._dumps(record) + "\n" for record in records))
+        self._index_log_lines += len(records)
+    
+    def _rewrite_index(self) -> None:
+        """Rewrite the index log with one record per conversation."""
+        records = list(self._index.values()) + [
+            {"ignored": name, "mtime": mtime} for name, mtime in self._ignored_files.items()
+        ]
+        index_path = self.storage_dir / self.INDEX_FILE
+        tmp_path = index_path.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write("".join(self._dumps(record) + "\n" for record in records))
+        os.replace(tmp_path, index_path)
+        self._index_log_lines = len(records)
+    
+    def _load_index(self) -> None:
+        """Load the conversation index and reconcile it with the files on disk."""
         if not self.storage_dir.exists():
             return
         
-        for file_path in self.storage_dir.glob("*.json"):
+        index_path = self.storage_dir / self.INDEX_FILE
+        if index_path.exists():
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    conversation = Conversation.from_dict(data)
-                    self.conversations[conversation.id] = conversation
-            except (json.JSONDecodeError, KeyError, TypeError, OSError, ValueError):
-                # Skip invalid conversation files
-                continue
+                with open(index_path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        self._index_log_lines += 1
+                        try:
+                            record = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue
+                        if "ignored" in record:
+                            self._ignored_files[record["ignored"]] = record.get("mtime")
+                        elif record.get("deleted"):
+                            self._index.pop(record["id"], None)
+                        elif "id" in record:
+                            self._index[record["id"]] = record
+            except OSError:
+                self._index.clear()
+        
+        try:
+            file_names = os.listdir(self.storage_dir)
+        except OSError:
+            return
+        
+        body_ids = {
+            name[:-len(".jsonl")] for name in file_names
+            if name.endswith(".jsonl") and name != self.INDEX_FILE
+        }
+        
+        # Drop index entries whose file disappeared, index files the index missed
+        stale = [conversation_id for conversation_id in self._index if conversation_id not in body_ids]
+        for conversation_id in stale:
+            del self._index[conversation_id]
+        
+        new_records = []
+        for conversation_id in body_ids - set(self._index):
+            conversation = self._read_conversation(conversation_id)
+            if conversation is not None:
+                entry = self._index_entry(conversation)
+                self._index[conversation_id] = entry
+                new_records.append(entry)
+        
+        # Convert legacy one-JSON-file-per-conversation storage
+        for name in file_names:
+            if name.endswith(".json"):
+                self._import_legacy_file(self.storage_dir / name, new_records)
+        
+        try:
+            if stale:
+                self._rewrite_index()
+            elif new_records:
+                self._append_index(new_records)
+        except (OSError, PermissionError):
+            pass
+    
+    def _import_legacy_file(self, file_path: Path, new_records: List[Dict[str, Any]]) -> None:
+        """Convert a legacy ``<id>.json`` conversation file, remembering files that are not conversations."""
+        try:
+            mtime = file_path.stat().st_mtime
+            if self._ignored_files.get(file_path.name) == mtime:
+                return
+            
+            with open(file_path, 'r', encoding='utf-8') as f:
+                conversation = Conversation.from_dict(json.load(f))
+            
+            if conversation.id not in self._index:
+                self._save_conversation(conversation)
+                if self._get_conversation_file_path(conversation.id).exists():
+                    file_path.unlink()
+                return
+        except (json.JSONDecodeError, KeyError, TypeError, OSError, ValueError, AttributeError):
+            # Not a conversation (e.g. a session file sharing the directory)
+            pass
+        
+        try:
+            self._ignored_files[file_path.name] = file_path.stat().st_mtime
+            new_records.append({"ignored": file_path.name, "mtime": self._ignored_files[file_path.name]})
+        except OSError:
+            pass
     
     def save_all_conversations(self) -> None:
-        """Save all conversations to disk."""
-        for conversation in self.conversations.values():
-            self._save_conversation(conversation)
\ No newline at end of file
+        """Save all loaded conversations to disk (others are already persisted)."""
+        for conversation in self.conversations.loaded():
+            self._save_conversation(conversation)
@@ -2,8 +2,9 @@
 AI client factory for creating appropriate AI clients based on configuration.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from .base import AIClient
+from .cache import CachedAIClient, create_cache_backend
 from .openai_client import OpenAIClient
 
 
@@ -28,6 +29,14 @@ class AIClientFactory:
         
         return client_class(client_config)
     
+    @classmethod
+    def create_cached_client(cls, client: AIClient, cache_config: Optional[Dict[str, Any]]) -> AIClient:
+        """Wrap a client with a response cache if caching is enabled."""
+        if not cache_config or not cache_config.get("enabled"):
+            return client
+        
+        return CachedAIClient(client, create_cache_backend(cache_config))
+    
     @classmethod
     def register_provider(cls, name: str, client_class: type) -> None:
         """Register a new AI provider."""
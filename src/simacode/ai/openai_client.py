@@ -3,7 +3,7 @@ OpenAI API client implementation.
 """
 
 import asyncio
-from typing import List, Dict, Any, AsyncIterator
+from typing import List, Dict, Any, AsyncIterator, Optional
 import aiohttp
 from .base import AIClient, AIResponse, Message
 
@@ -21,8 +21,25 @@ class OpenAIClient(AIClient):
         self.temperature = config.get("temperature", 0.1)
         self.timeout = config.get("timeout", 60)
         
+        # Connection pool settings for the shared HTTP session
+        self.max_connections = config.get("max_connections", 100)
+        self.max_connections_per_host = config.get("max_connections_per_host", 20)
+        self.keepalive_timeout = config.get("keepalive_timeout", 30)
+        self.dns_cache_ttl = config.get("dns_cache_ttl", 300)
+        
         if not self.api_key:
             raise ValueError("OpenAI API key is required")
+        
+        # Long-lived session, created lazily in the running event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pool_stats = {
+            "requests": 0,
+            "connections_created": 0,
+            "connections_reused": 0,
+            "waiters": 0,
+            "max_waiters": 0,
+        }
     
     @property
     def provider_name(self) -> str:
@@ -48,6 +65,100 @@ class OpenAIClient(AIClient):
             
         return True
     
+    def _create_trace_config(self) -> aiohttp.TraceConfig:
+        """Create trace hooks that feed the connection pool statistics."""
+        stats = self._pool_stats
+        trace_config = aiohttp.TraceConfig()
+        
+        async def on_request_start(session, context, params):
+            stats["requests"] += 1
+        
+        async def on_connection_create_end(session, context, params):
+            stats["connections_created"] += 1
+        
+        async def on_connection_reuseconn(session, context, params):
+            stats["connections_reused"] += 1
+        
+        async def on_connection_queued_start(session, context, params):
+            stats["waiters"] += 1
+            stats["max_waiters"] = max(stats["max_waiters"], stats["waiters"])
+        
+        async def on_connection_queued_end(session, context, params):
+            stats["waiters"] -= 1
+        
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_connection_queued_start.append(on_connection_queued_start)
+        trace_config.on_connection_queued_end.append(on_connection_queued_end)
+        return trace_config
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it for the current event loop if needed."""
+        current_loop = asyncio.get_running_loop()
+        
+        if self._session is not None and not self._session.closed:
+            if self._session_loop is current_loop:
+                return self._session
+            # Sessions are bound to the loop they were created in
+            if not self._session_loop.is_closed():
+                await self._session.close()
+        
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=self.max_connections_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.dns_cache_ttl,
+            use_dns_cache=True
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            trace_configs=[self._create_trace_config()]
+        )
+        self._session_loop = current_loop
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the shared HTTP session and its connection pool."""
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
+            try:
+                await session.close()
+            except RuntimeError:
+                # The owning event loop is already gone; nothing left to release
+                pass
+        self._session_loop = None
+    
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        Get connection pool statistics.
+        
+        Returns:
+            Dict with open/idle/active connections, current waiters and the
+            fraction of requests that reused a keep-alive connection
+        """
+        stats = dict(self._pool_stats)
+        connector = self._session.connector if self._session and not self._session.closed else None
+        
+        idle = 0
+        active = 0
+        if connector is not None:
+            idle = sum(len(conns) for conns in getattr(connector, "_conns", {}).values())
+            active = len(getattr(connector, "_acquired", ()))
+        
+        acquired_total = stats["connections_created"] + stats["connections_reused"]
+        stats.update({
+            "session_open": connector is not None,
+            "open_connections": idle + active,
+            "idle_connections": idle,
+            "active_connections": active,
+            "limit": self.max_connections,
+            "limit_per_host": self.max_connections_per_host,
+            "reuse_ratio": stats["connections_reused"] / acquired_total if acquired_total else 0.0,
+        })
+        return stats
+    
     async def chat(self, messages: List[Message]) -> AIResponse:
         """Send chat request to OpenAI API."""
         headers = {
@@ -62,32 +173,30 @@ class OpenAIClient(AIClient):
             "temperature": self.temperature
         }
         
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=self.timeout)
-        ) as session:
-            async with session.post(
-                f"{self.base_url}/chat/completions",
-                headers=headers,
-                json=payload
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(f"OpenAI API error: {response.status} - {error_text}")
-                
-                data = await response.json()
-                
-                choice = data["choices"][0]
-                return AIResponse(
-                    content=choice["message"]["content"],
-                    usage=data.get("usage"),
-                    model=self.model,
-                    finish_reason=choice.get("finish_reason"),
-                    metadata={
-                        "response_id": data.get("id"),
-                        "created": data.get("created"),
-                        "system_fingerprint": data.get("system_fingerprint")
-                    }
-                )
+        session = await self._get_session()
+        async with session.post(
+            f"{self.base_url}/chat/completions",
+            headers=headers,
+            json=payload
+        ) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(f"OpenAI API error: {response.status} - {error_text}")
+            
+            data = await response.json()
+            
+            choice = data["choices"][0]
+            return AIResponse(
+                content=choice["message"]["content"],
+                usage=data.get("usage"),
+                model=self.model,
+                finish_reason=choice.get("finish_reason"),
+                metadata={
+                    "response_id": data.get("id"),
+                    "created": data.get("created"),
+                    "system_fingerprint": data.get("system_fingerprint")
+                }
+            )
     
     async def chat_stream(self, messages: List[Message]) -> AsyncIterator[str]:
         """Send streaming chat request to OpenAI API."""
@@ -104,32 +213,30 @@ class OpenAIClient(AIClient):
             "stream": True
         }
         
-        async with aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=self.timeout)
-        ) as session:
-            async with session.post(
-                f"{self.base_url}/chat/completions",
-                headers=headers,
-                json=payload
-            ) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise Exception(f"OpenAI API error: {response.status} - {error_text}")
-                
-                async for line in response.content:
-                    line = line.decode('utf-8').strip()
-                    if line.startswith('data: '):
-                        data_str = line[6:]
+        session = await self._get_session()
+        async with session.post(
+            f"{self.base_url}/chat/completions",
+            headers=headers,
+            json=payload
+        ) as response:
+            if response.status != 200:
+                error_text = await response.text()
+                raise Exception(f"OpenAI API error: {response.status} - {error_text}")
+            
+            async for line in response.content:
+                line = line.decode('utf-8').strip()
+                if line.startswith('data: '):
+                    data_str = line[6:]
+                    
+                    if data_str == '[DONE]':
+                        break
                         
-                        if data_str == '[DONE]':
-                            break
-                            
-                        try:
-                            import json
-                            data = json.loads(data_str)
-                            if "choices" in data and data["choices"]:
-                                delta = data["choices"][0].get("delta", {})
-                                if "content" in delta:
-                                    yield delta["content"]
-                        except json.JSONDecodeError:
-                            continue
\ No newline at end of file
+                    try:
+                        import json
+                        data = json.loads(data_str)
+                        if "choices" in data and data["choices"]:
+                            delta = data["choices"][0].get("delta", {})
+                            if "content" in delta:
+                                yield delta["content"]
+                    except json.JSONDecodeError:
+                        continue
\ No newline at end of file
@@ -0,0 +1,183 @@
+"""
+Token counting for context budgeting.
+
+``TokenCounter`` implementations turn text into a token count. The default is
+the ``len(text) // 4`` heuristic; ``BPETokenCounter`` runs byte-level BPE with
+merge ranks from a local vocab file in the tiktoken format (one
+``<base64 token> <rank>`` pair per line, e.g. ``cl100k_base.tiktoken``), so no
+tokenizer package or network access is needed.
+"""
+
+import base64
+import logging
+import re
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+# Pre-tokenization close to cl100k_base, using only the standard library
+DEFAULT_SPLIT_PATTERN = (
+    r"'(?i:[sdmt]|ll|ve|re)"
+    r"|[^\r\n\w]?[^\W\d_]+"
+    r"|\d{1,3}"
+    r"| ?[^\s\w]+[\r\n]*"
+    r"|\s*[\r\n]+"
+    r"|\s+(?!\S)"
+    r"|\s+"
+)
+
+
+class TokenCounter(ABC):
+    """Counts the tokens of a piece of text."""
+
+    name: str = "token_counter"
+
+    @abstractmethod
+    def count(self, text: str) -> int:
+        """Return the number of tokens in text."""
+        pass
+
+
+class HeuristicTokenCounter(TokenCounter):
+    """Estimates 1 token per 4 characters."""
+
+    name = "heuristic"
+
+    def count(self, text: str) -> int:
+        return len(text) // 4
+
+
+class BPETokenCounter(TokenCounter):
+    """
+    Byte-level BPE token counter.
+
+    Text is split into pieces with ``split_pattern``. Each piece's UTF-8
+    bytes are merged pairwise, lowest rank first, until no adjacent pair is
+    in the vocab. Counts of repeated pieces are memoized.
+    """
+
+    def __init__(
+        self,
+        ranks: Dict[bytes, int],
+        name: str = "bpe",
+        split_pattern: str = DEFAULT_SPLIT_PATTERN,
+        piece_cache_size: int = 65536
+    ):
+        if not ranks:
+            raise ValueError("BPE vocab is empty")
+
+        self.ranks = ranks
+        self.name = name
+        self._split = re.compile(split_pattern).findall
+        self._count_piece = lru_cache(maxsize=piece_cache_size)(self._bpe_count)
+
+    @classmethod
+    def from_file(cls, vocab_path: Union[str, Path], **kwargs) -> "BPETokenCounter":
+        """
+        Load merge ranks from a tiktoken-format vocab file.
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not a valid vocab file
+        """
+        vocab_path = Path(vocab_path).expanduser()
+        ranks: Dict[bytes, int] = {}
+
+        with open(vocab_path, "rb") as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    token, rank = line.split()
+                    ranks[base64.b64decode(token)] = int(rank)
+                except ValueError as e:
+                    raise ValueError(f"Invalid vocab line {line_number} in {vocab_path}: {e}")
+
+        kwargs.setdefault("name", f"bpe:{vocab_path.stem}")
+        return cls(ranks, **kwargs)
+
+    def _bpe_count(self, piece: bytes) -> int:
+        ranks = self.ranks
+        if piece in ranks:
+            return 1
+
+        parts = [piece[i:i + 1] for i in range(len(piece))]
+        while len(parts) > 1:
+            best_index = -1
+            best_rank = None
+            for i in range(len(parts) - 1):
+                rank = ranks.get(parts[i] + parts[i + 1])
+                if rank is not None and (best_rank is None or rank < best_rank):
+                    best_index, best_rank = i, rank
+            if best_rank is None:
+                break
+            parts[best_index:best_index + 2] = [parts[best_index] + parts[best_index + 1]]
+
+        return len(parts)
+
+    def count(self, text: str) -> int:
+        count_piece = self._count_piece
+        return sum(count_piece(piece.encode("utf-8")) for piece in self._split(text))
+
+
+_heuristic_counter = HeuristicTokenCounter()
+_default_counter: Optional[TokenCounter] = None
+# Vocab path -> loaded counter, or None if loading failed
+_loaded_counters: Dict[str, Optional[TokenCounter]] = {}
+
+
+def set_default_token_counter(counter: Optional[TokenCounter]) -> None:
+    """Install a counter used wherever none is configured (None restores the heuristic)."""
+    global _default_counter
+    _default_counter = counter
+
+
+def get_token_counter(vocab_path: Optional[Union[str, Path]] = None) -> TokenCounter:
+    """
+    Get the token counter for a vocab file.
+
+    Each vocab file is loaded once per process. Without a path, or if the
+    file cannot be loaded, the default counter is returned: the one set
+    with ``set_default_token_counter``, otherwise the heuristic.
+
+    Args:
+        vocab_path: Optional path to a tiktoken-format vocab file
+
+    Returns:
+        TokenCounter: Counter to use
+    """
+    fallback = _default_counter or _heuristic_counter
+    if not vocab_path:
+        return fallback
+
+    key = str(Path(vocab_path).expanduser())
+    if key not in _loaded_counters:
+        try:
+            _loaded_counters[key] = BPETokenCounter.from_file(key)
+            logger.info(f"Loaded BPE tokenizer vocab from {key} ({len(_loaded_counters[key].ranks)} tokens)")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to load tokenizer vocab {key}: {e}; using {fallback.name} token counts")
+            _loaded_counters[key] = None
+
+    return _loaded_counters[key] or fallback
+
+
+def configure_token_counter(vocab_path: Optional[Union[str, Path]]) -> TokenCounter:
+    """
+    Install the counter for a configured vocab file as the default.
+
+    Call this once at startup with ``conversation_context.tokenizer_vocab``
+    so messages warm their token caches with the same counter the planner
+    budgets with.
+
+    Returns:
+        TokenCounter: The installed default counter
+    """
+    counter = get_token_counter(vocab_path) if vocab_path else _heuristic_counter
+    set_default_token_counter(counter)
+    return counter
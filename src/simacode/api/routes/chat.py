@@ -24,6 +24,7 @@ from ..models import (
 )
 from ..chat_confirmation import chat_confirmation_manager
 from ...core.service import SimaCodeService, ChatRequest as CoreChatRequest
+from ...core.events import StreamEvent, batch_frames, dumps, sse_frame
 from ...mcp.async_integration import get_global_task_manager, TaskType
 
 logger = logging.getLogger(__name__)
@@ -112,45 +113,11 @@ async def chat_stream(
                 response_gen = await service.process_chat(core_request)
                 
                 if hasattr(response_gen, '__aiter__'):
-                    # 流式响应处理
+                    # 流式响应处理：每个事件只序列化一次，无需解析前缀
+                    # 确认请求只发送给客户端，等待确认的逻辑由ReAct引擎处理
                     session_id = request.session_id or "new"
-                    async for chunk in response_gen:
-                        # 处理确认请求
-                        if chunk.startswith("[confirmation_request]"):
-                            confirmation_chunk = await handle_confirmation_request(
-                                request.session_id, chunk, service
-                            )
-                            yield f"data: {confirmation_chunk.model_dump_json()}\n\n"
-                            
-                            # 注意：不需要在这里等待确认，ReAct引擎会处理等待确认的逻辑
-                            # 这里只负责发送确认请求给客户端
-                            # confirmation_response = await chat_confirmation_manager.wait_for_confirmation(
-                            #     request.session_id
-                            # )
-                            
-                            # 不需要处理确认响应，让ReAct引擎处理
-                            # if confirmation_response and confirmation_response.action != "cancel":
-                            #     # 发送确认接收消息
-                            #     received_chunk = create_confirmation_received_chunk(
-                            #         session_id, confirmation_response
-                            #     )
-                            #     yield f"data: {received_chunk.model_dump_json()}\n\n"
-                            #     
-                            #     # 注意：不需要再次提交确认，因为ReAct引擎的wait_for_confirmation已经处理了
-                            #     # await service.submit_confirmation(confirmation_response)
-                            #     
-                            #     # 不用continue，让流继续处理后续的数据
-                            # else:
-                            #     # 取消或超时
-                            #     cancel_reason = "用户取消" if confirmation_response and confirmation_response.action == "cancel" else "确认超时"
-                            #     cancel_chunk = create_error_chunk(f"任务已取消：{cancel_reason}", session_id, cancel_reason)
-                            #     yield f"data: {cancel_chunk.model_dump_json()}\n\n"
-                            #     return
-                        
-                        # 处理常规chunks
-                        else:
-                            chunk_data = process_regular_chunk(chunk, session_id)
-                            yield f"data: {chunk_data.model_dump_json()}\n\n"
+                    async for event in response_gen:
+                        yield sse_frame(event.to_chunk(session_id))
                     
                     # 发送完成信号
                     # 尝试获取session信息以生成详细摘要
@@ -162,7 +129,7 @@ async def chat_stream(
                         pass  # 忽略获取session失败的情况
                     
                     final_chunk = await create_completion_chunk(session_id, session_info, service)
-                    yield f"data: {final_chunk.model_dump_json()}\n\n"
+                    yield sse_frame(final_chunk.model_dump())
                 else:
                     # 非流式响应（回退）
                     fallback_chunk = create_content_chunk(
@@ -171,15 +138,15 @@ async def chat_stream(
                         finished=True,
                         metadata=response_gen.metadata
                     )
-                    yield f"data: {fallback_chunk.model_dump_json()}\n\n"
+                    yield sse_frame(fallback_chunk.model_dump())
                     
             except Exception as e:
                 logger.error(f"流式处理错误: {e}")
                 error_chunk = create_error_chunk(str(e), request.session_id or "error")
-                yield f"data: {error_chunk.model_dump_json()}\n\n"
+                yield sse_frame(error_chunk.model_dump())
         
         return StreamingResponse(
-            generate_chunks(),
+            batch_frames(generate_chunks()),
             media_type="text/plain",
             headers={"Cache-Control": "no-cache", "Connection": "keep-alive"}
         )
@@ -269,7 +236,7 @@ async def handle_confirmation_request(
     service: SimaCodeService
 ) -> StreamingChatChunk:
     """
-    处理确认请求chunk - 按照设计文档规范实现
+    处理旧格式的确认请求chunk - 按照设计文档规范实现
     
     Args:
         session_id: 会话ID
@@ -281,41 +248,10 @@ async def handle_confirmation_request(
     """
     try:
         # 解析确认请求数据
-        confirmation_data_str = chunk[len("[confirmation_request]"):].strip()
-        confirmation_data = json.loads(confirmation_data_str)
-        
         # 注意：不要重复创建确认请求，因为ReAct引擎已经创建过了
-        # 这里只需要格式化确认消息给客户端
-        # await chat_confirmation_manager.request_confirmation(
-        #     session_id=session_id,
-        #     tasks=confirmation_data.get("tasks", []),
-        #     timeout_seconds=confirmation_data.get("timeout_seconds", 300)
-        # )
-        
-        # 按照设计文档格式化确认消息
-        tasks = confirmation_data.get("tasks", [])
-        task_descriptions = []
-        for task in tasks:
-            task_descriptions.append(f"{task.get('index', '-')} {task.get('description', '未知任务')}")
-        
-        confirmation_message = f"请确认执行以下{len(tasks)}个任务：\n" + "\n".join(task_descriptions)
-        
-        # 创建标准化的确认请求chunk
-        return StreamingChatChunk(
-            chunk=confirmation_message,
-            session_id=session_id,
-            finished=False,
-            chunk_type="confirmation_request",
-            confirmation_data=confirmation_data,
-            requires_response=True,
-            stream_paused=True,
-            metadata={
-                "total_tasks": len(tasks),
-                "risk_level": confirmation_data.get("risk_level", "unknown"),
-                "timeout_seconds": confirmation_data.get("timeout_seconds", 300),
-                "confirmation_round": confirmation_data.get("confirmation_round", 1)
-            }
-        )
+        confirmation_data = json.loads(chunk[len("[confirmation_request]"):].strip())
+        event = StreamEvent.confirmation_request(confirmation_data)
+        return StreamingChatChunk(**event.to_chunk(session_id))
         
     except Exception as e:
         logger.error(f"Error handling confirmation request: {e}")
@@ -365,7 +301,7 @@ async def handle_confirmation_response(
                     session_id
                 )
             
-            yield f"data: {response_chunk.model_dump_json()}\n\n"
+            yield sse_frame(response_chunk.model_dump())
         
         return StreamingResponse(
             generate_response(),
@@ -378,7 +314,7 @@ async def handle_confirmation_response(
         
         async def error_response():
             error_chunk = create_error_chunk(f"确认格式错误: {str(e)}", request.session_id or "error")
-            yield f"data: {error_chunk.model_dump_json()}\n\n"
+            yield sse_frame(error_chunk.model_dump())
         
         return StreamingResponse(
             error_response(),
@@ -611,11 +547,11 @@ async def chat_async_websocket(
                 # Stream progress updates
                 try:
                     async for progress_data in task_manager.get_task_progress_stream(task_id):
-                        await websocket.send_json({
+                        await websocket.send_text(dumps({
                             "type": "progress_update",
                             "task_id": task_id,
                             "progress": progress_data
-                        })
+                        }).decode("utf-8"))
 
                         # Stop streaming after final result
                         if progress_data.get("type") == "final_result":
@@ -648,7 +584,9 @@ async def chat_async_websocket(
 
 def process_regular_chunk(chunk: str, session_id: str) -> StreamingChatChunk:
     """
-    处理常规chunk - 按照设计文档规范实现
+    处理旧格式（带前缀字符串）的chunk - 按照设计文档规范实现
+    
+    SimaCodeService 现在直接产生 StreamEvent，此函数仅用于兼容旧格式的字符串。
     
     Args:
         chunk: chunk内容
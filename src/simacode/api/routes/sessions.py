@@ -20,24 +20,30 @@ router = APIRouter()
 @router.get("/", response_model=List[SessionInfo])
 async def list_sessions(
     limit: int = 10,
+    offset: int = 0,
     service: SimaCodeService = Depends(get_simacode_service)
 ) -> List[SessionInfo]:
     """
-    List active sessions.
+    List sessions, newest first.
     
     Args:
         limit: Maximum number of sessions to return
+        offset: Number of sessions to skip (for pagination)
         service: SimaCode service instance
         
     Returns:
         List of session information
     """
     try:
-        sessions_data = await service.list_sessions()
+        sessions_data = await service.list_sessions(limit=limit, offset=offset)
         sessions = []
         
-        for session_data in sessions_data[:limit]:
-            sessions.append(SessionInfo(**session_data))
+        for session_data in sessions_data:
+            sessions.append(SessionInfo(
+                session_id=session_data["id"],
+                created_at=session_data.get("created_at"),
+                status=session_data.get("state", "active")
+            ))
             
         return sessions
         
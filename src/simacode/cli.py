@@ -1006,9 +1006,68 @@ def _get_config_save_path() -> Path:
     return user_config_dir / "config.yaml"
 
 
+# Session management commands
+@click.group(name="session")
+def session_group():
+    """Manage stored ReAct sessions."""
+    pass
+
+
+@session_group.command("migrate")
+@click.option(
+    "--source",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help="Directory with legacy <session_id>.json files (default: ./.simacode/sessions)",
+)
+@click.option(
+    "--database",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Destination SQLite database (default: sessions.db in the source directory)",
+)
+@click.option("--overwrite", is_flag=True, help="Replace sessions that already exist in the database")
+@click.option("--delete-source", is_flag=True, help="Delete JSON files after they are imported")
+@click.pass_context
+def migrate_sessions(
+    ctx: click.Context,
+    source: Optional[Path],
+    database: Optional[Path],
+    overwrite: bool,
+    delete_source: bool
+) -> None:
+    """Import legacy JSON session files into the SQLite session store."""
+    asyncio.run(_migrate_sessions_async(source, database, overwrite, delete_source))
+
+
+async def _migrate_sessions_async(
+    source: Optional[Path],
+    database: Optional[Path],
+    overwrite: bool,
+    delete_source: bool
+) -> None:
+    """Async implementation of session migration."""
+    from .session.store import SQLiteSessionStore, migrate_json_sessions
+
+    source = source or Path.cwd() / ".simacode" / "sessions"
+    store = SQLiteSessionStore(database or source / "sessions.db")
+
+    try:
+        results = await migrate_json_sessions(source, store, overwrite=overwrite, delete_source=delete_source)
+        console.print(
+            f"[green]✅ Imported {results['imported']} sessions into {store.db_path}[/green] "
+            f"[dim](skipped {results['skipped']}, failed {results['failed']})[/dim]"
+        )
+    except Exception as e:
+        console.print(f"[red]Error migrating sessions: {e}[/red]")
+    finally:
+        await store.close()
+
+
 # Add command groups to main CLI
 main.add_command(task_group)
 main.add_command(mcp_group)
+main.add_command(session_group)
 
 
 if __name__ == "__main__":
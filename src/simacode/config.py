@@ -84,6 +84,39 @@ class SecurityConfig(BaseModel):
         return v
 
 
+class AIResponseCacheConfig(BaseModel):
+    """AI response cache configuration model."""
+    
+    enabled: bool = Field(
+        default=False,
+        description="Cache planner and evaluator responses for identical prompts"
+    )
+    backend: str = Field(
+        default="memory",
+        description="Cache backend: memory (LRU) or sqlite (on-disk)"
+    )
+    max_entries: int = Field(
+        default=1000,
+        ge=1,
+        description="Maximum number of cached responses"
+    )
+    ttl: int = Field(
+        default=3600,
+        ge=0,
+        description="Seconds a cached response stays valid (0 disables expiry)"
+    )
+    db_path: Optional[Path] = Field(
+        default=None,
+        description="SQLite database path (defaults to .simacode/cache/ai_responses.db)"
+    )
+    
+    @validator('backend')
+    def validate_backend(cls, v: str) -> str:
+        if v.lower() not in {'memory', 'sqlite'}:
+            raise ValueError(f"Invalid cache backend: {v}. Must be 'memory' or 'sqlite'")
+        return v.lower()
+
+
 class AIConfig(BaseModel):
     """AI provider configuration model."""
     
@@ -120,6 +153,30 @@ class AIConfig(BaseModel):
         ge=1,
         description="API timeout in seconds"
     )
+    max_connections: int = Field(
+        default=100,
+        ge=1,
+        description="Maximum open HTTP connections in the client's connection pool"
+    )
+    max_connections_per_host: int = Field(
+        default=20,
+        ge=0,
+        description="Maximum open HTTP connections per host (0 for unlimited)"
+    )
+    keepalive_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds an idle keep-alive connection stays in the pool"
+    )
+    dns_cache_ttl: int = Field(
+        default=300,
+        ge=0,
+        description="Seconds resolved DNS entries are cached"
+    )
+    response_cache: AIResponseCacheConfig = Field(
+        default_factory=AIResponseCacheConfig,
+        description="Response cache for planner and evaluator calls"
+    )
     
     @validator('api_key', pre=True, always=True)
     def load_from_env(cls, v: Optional[str]) -> Optional[str]:
@@ -147,6 +204,16 @@ class SessionConfig(BaseModel):
         default=True,
         description="Automatically clean up old sessions"
     )
+    storage_backend: str = Field(
+        default="sqlite",
+        description="Session storage backend: sqlite (indexed database) or json (one file per session)"
+    )
+    
+    @validator('storage_backend')
+    def validate_storage_backend(cls, v: str) -> str:
+        if v.lower() not in {'sqlite', 'json'}:
+            raise ValueError(f"Invalid session storage backend: {v}. Must be 'sqlite' or 'json'")
+        return v.lower()
     
     @validator('session_dir', pre=True)
     def ensure_session_dir(cls, v: Union[str, Path]) -> Path:
@@ -180,6 +247,54 @@ class ReactConfig(BaseModel):
     )
 
 
+class AsyncTaskConfig(BaseModel):
+    """Async task queue configuration model."""
+    
+    queue_backend: str = Field(
+        default="sqlite",
+        description="Async task queue backend: sqlite (durable, shared by worker processes) or memory"
+    )
+    queue_path: Path = Field(
+        default_factory=lambda: Path.home() / ".simacode" / "jobs.db",
+        description="SQLite database holding queued and finished async tasks"
+    )
+    max_concurrent_tasks: int = Field(
+        default=5,
+        ge=1,
+        description="Async task workers per process"
+    )
+    lease_seconds: float = Field(
+        default=60.0,
+        gt=0,
+        description="How long a worker holds a task before another worker may take it over"
+    )
+    max_attempts: int = Field(
+        default=3,
+        ge=1,
+        description="Maximum executions of a task that fails or whose worker dies"
+    )
+    poll_interval: float = Field(
+        default=1.0,
+        gt=0,
+        description="Seconds between checks for tasks queued or progressed by other processes"
+    )
+    job_retention_seconds: float = Field(
+        default=7 * 24 * 3600,
+        ge=0,
+        description="How long finished tasks and their progress stay in the queue database (0 keeps them forever)"
+    )
+    
+    @validator('queue_backend')
+    def validate_queue_backend(cls, v: str) -> str:
+        if v.lower() not in {'sqlite', 'memory'}:
+            raise ValueError(f"Invalid async task queue backend: {v}. Must be 'sqlite' or 'memory'")
+        return v.lower()
+    
+    @validator('queue_path', pre=True)
+    def expand_queue_path(cls, v: Union[str, Path]) -> Path:
+        return Path(v).expanduser()
+
+
 class DevelopmentConfig(BaseModel):
     """Development configuration model."""
     
@@ -236,6 +351,22 @@ class EmailSMTPConfig(BaseModel):
         default=None,
         description="SMTP password"
     )
+    pool_size: int = Field(
+        default=3,
+        ge=1,
+        le=20,
+        description="Maximum number of pooled SMTP sessions"
+    )
+    pool_keepalive: int = Field(
+        default=30,
+        ge=1,
+        description="Check pooled SMTP sessions idle longer than this many seconds with NOOP"
+    )
+    pool_max_idle: int = Field(
+        default=240,
+        ge=1,
+        description="Close pooled SMTP sessions idle longer than this many seconds"
+    )
     
     @validator('username', pre=True, always=True)
     def load_username_from_env(cls, v: Optional[str]) -> Optional[str]:
@@ -283,6 +414,35 @@ class EmailIMAPConfig(BaseModel):
         default=None,
         description="IMAP password"
     )
+    pool_size: int = Field(
+        default=2,
+        ge=1,
+        le=10,
+        description="Maximum number of pooled IMAP connections"
+    )
+    cache_enabled: bool = Field(
+        default=True,
+        description="Cache downloaded messages locally, keyed by UIDVALIDITY and UID"
+    )
+    cache_path: Optional[Path] = Field(
+        default=Path(".simacode/cache/imap_messages.db"),
+        description="SQLite database path of the IMAP message cache (None keeps it in memory)"
+    )
+    cache_max_messages: int = Field(
+        default=5000,
+        ge=1,
+        description="Maximum number of cached IMAP messages"
+    )
+    cache_max_bytes: int = Field(
+        default=256 * 1024 * 1024,
+        ge=1,
+        description="Maximum total size in bytes of full messages kept in the IMAP cache"
+    )
+    cache_max_message_bytes: int = Field(
+        default=10 * 1024 * 1024,
+        ge=1,
+        description="Full messages larger than this are cached as header and attachment metadata only"
+    )
 
 
 class EmailSecurityConfig(BaseModel):
@@ -410,6 +570,10 @@ class ConversationContextConfig(BaseModel):
     max_messages: int = Field(default=100, description="Maximum messages to preserve")
     max_tokens: int = Field(default=8000, description="Maximum tokens limit")
     preserve_all: bool = Field(default=False, description="Preserve all messages")
+    tokenizer_vocab: Optional[str] = Field(
+        default=None,
+        description="BPE vocab file (tiktoken format) for token counting; 1 token ≈ 4 characters when unset"
+    )
     
     # Compressed context settings
     recent_messages: int = Field(default=5, description="Recent messages to preserve fully")
@@ -464,6 +628,10 @@ class Config(BaseModel):
         default_factory=ReactConfig,
         description="ReAct engine configuration"
     )
+    async_tasks: AsyncTaskConfig = Field(
+        default_factory=AsyncTaskConfig,
+        description="Async task queue configuration"
+    )
     development: DevelopmentConfig = Field(
         default_factory=DevelopmentConfig,
         description="Development configuration"
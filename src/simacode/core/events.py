@@ -0,0 +1,149 @@
+"""
+Typed stream events for SimaCode service responses.
+
+SimaCodeService streams ``StreamEvent`` objects to the API layer instead of
+prefix-tagged strings, so the HTTP writers can serialize each event once,
+without parsing it back, and batch small events into a single write.
+"""
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StreamEvent:
+    """
+    A single event of a streamed chat response.
+
+    ``type`` is the chunk type sent to clients ('content', 'status',
+    'tool_output', 'task_init', 'error', 'completion', 'confirmation_request',
+    ...).
+    """
+    type: str
+    content: str = ""
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    confirmation_data: Optional[Dict[str, Any]] = None
+    finished: bool = False
+
+    def to_chunk(self, session_id: str) -> Dict[str, Any]:
+        """Convert to the wire format of StreamingChatChunk."""
+        return {
+            "chunk": self.content,
+            "session_id": session_id,
+            "finished": self.finished,
+            "chunk_type": self.type,
+            "metadata": self.metadata,
+            "confirmation_data": self.confirmation_data
+        }
+
+    @classmethod
+    def confirmation_request(cls, confirmation_data: Dict[str, Any]) -> "StreamEvent":
+        """Create a confirmation request event from flattened confirmation data."""
+        tasks = confirmation_data.get("tasks", [])
+        task_descriptions = [
+            f"{task.get('index', '-')} {task.get('description', '未知任务')}" for task in tasks
+        ]
+
+        return cls(
+            type="confirmation_request",
+            content=f"请确认执行以下{len(tasks)}个任务：\n" + "\n".join(task_descriptions),
+            confirmation_data=confirmation_data,
+            metadata={
+                "total_tasks": len(tasks),
+                "risk_level": confirmation_data.get("risk_level", "unknown"),
+                "timeout_seconds": confirmation_data.get("timeout_seconds", 300),
+                "confirmation_round": confirmation_data.get("confirmation_round", 1)
+            }
+        )
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def sse_frame(data: Any) -> bytes:
+    """Encode a payload as one Server-Sent Events ``data:`` frame."""
+    return b"data: " + dumps(data) + b"\n\n"
+
+
+_END = object()
+
+
+async def batch_frames(
+    frames: AsyncIterator[bytes],
+    max_batch_bytes: int = 64 * 1024,
+    max_pending: int = 256
+) -> AsyncGenerator[bytes, None]:
+    """
+    Coalesce frames that are already waiting into a single write.
+
+    The source is drained in a background task. Each batch starts with the
+    next frame and adds frames that are queued by then, so a burst of small
+    chunks costs one write and a lone frame is never delayed. At most
+    ``max_pending`` frames are queued; beyond that the background task waits,
+    so a slow client still slows down the source.
+
+    Args:
+        frames: Source of encoded frames
+        max_batch_bytes: Soft limit on the size of one batch
+        max_pending: Maximum number of frames read ahead of the client
+
+    Yields:
+        bytes: One or more concatenated frames
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+
+    async def pump():
+        try:
+            async for frame in frames:
+                await queue.put(frame)
+            end = _END
+        except Exception as e:
+            end = e
+        await queue.put(end)
+
+    pump_task = asyncio.create_task(pump())
+    try:
+        done = False
+        while not done:
+            batch = [await queue.get()]
+            size = len(batch[0]) if isinstance(batch[0], bytes) else 0
+            while size < max_batch_bytes and not queue.empty():
+                batch.append(queue.get_nowait())
+                if isinstance(batch[-1], bytes):
+                    size += len(batch[-1])
+
+            frames_ready = []
+            for item in batch:
+                if item is _END:
+                    done = True
+                elif isinstance(item, Exception):
+                    if frames_ready:
+                        yield b"".join(frames_ready)
+                    raise item
+                else:
+                    frames_ready.append(item)
+            if frames_ready:
+                yield b"".join(frames_ready)
+    finally:
+        if not pump_task.done():
+            pump_task.cancel()
+            try:
+                await pump_task
+            except asyncio.CancelledError:
+                pass
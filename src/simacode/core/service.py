@@ -12,12 +12,13 @@ from typing import Any, AsyncGenerator, Dict, List, Optional, Union
 from pathlib import Path
 
 from ..config import Config
+from .events import StreamEvent
 from ..services.react_service import ReActService
 from ..session.manager import SessionManager
 from ..ai.conversation import ConversationManager
 from ..ai.factory import AIClientFactory
 from ..tools.base import execute_tool
-from ..mcp.async_integration import get_global_task_manager, TaskType
+from ..mcp.async_integration import configure_global_task_manager, get_global_task_manager, TaskType
 
 logger = logging.getLogger(__name__)
 
@@ -150,8 +151,11 @@ class SimaCodeService:
         # Don't start ReAct service in __init__ - will be started in async context
         self._react_service_started = False
 
-        # 异步任务管理
-        self.task_manager = get_global_task_manager()
+        # 异步任务管理（API 模式使用可跨进程共享、重启后恢复的持久化队列）
+        if api_mode:
+            self.task_manager = configure_global_task_manager(config.async_tasks)
+        else:
+            self.task_manager = get_global_task_manager()
 
         logger.info("SimaCodeService initialized successfully (async startup pending)")
     
@@ -164,6 +168,7 @@ class SimaCodeService:
         try:
             logger.info("Starting SimaCodeService asynchronously...")
             await self.react_service.start()
+            await self.task_manager.start()
             self._react_service_started = True
             logger.info("SimaCodeService started successfully")
         except Exception as e:
@@ -174,15 +179,40 @@ class SimaCodeService:
         """Stop the service asynchronously."""
         if not self._react_service_started:
             logger.debug("SimaCodeService not started, nothing to stop")
+            await self._close_ai_clients()
             return
             
         try:
             logger.info("Stopping SimaCodeService...")
+            await self.task_manager.stop()
             await self.react_service.stop()
             self._react_service_started = False
             logger.info("SimaCodeService stopped successfully")
         except Exception as e:
             logger.error(f"Failed to stop SimaCodeService: {e}")
+        finally:
+            await self._close_ai_clients()
+    
+    async def _close_ai_clients(self):
+        """Close the HTTP connection pools held by the AI clients."""
+        for client in (self.ai_client, self.react_service.ai_client):
+            try:
+                await client.close()
+            except Exception as e:
+                logger.warning(f"Failed to close AI client: {e}")
+    
+    def get_ai_pool_stats(self) -> Dict[str, Any]:
+        """
+        Get HTTP connection pool statistics for the AI clients.
+        
+        Returns:
+            Pool statistics keyed by client role
+        """
+        stats = {}
+        for name, client in (("chat", self.ai_client), ("react", self.react_service.ai_client)):
+            if hasattr(client, "get_pool_stats"):
+                stats[name] = client.get_pool_stats()
+        return stats
     
     async def _ensure_react_service_started(self):
         """Ensure ReAct service is started before processing requests."""
@@ -199,7 +229,7 @@ class SimaCodeService:
         self, 
         request: Union[ChatRequest, str], 
         session_id: Optional[str] = None
-    ) -> Union[ChatResponse, AsyncGenerator[str, None]]:
+    ) -> Union[ChatResponse, AsyncGenerator[StreamEvent, None]]:
         """
         Enhanced chat processing with TICMaker detection and ReAct capabilities.
         
@@ -250,7 +280,7 @@ class SimaCodeService:
                 error=str(e)
             )
     
-    async def _process_conversational_chat(self, request: ChatRequest) -> Union[ChatResponse, AsyncGenerator[str, None]]:
+    async def _process_conversational_chat(self, request: ChatRequest) -> Union[ChatResponse, AsyncGenerator[StreamEvent, None]]:
         """处理对话性输入（使用传统chat逻辑）"""
         try:
             # Get or create current conversation
@@ -290,7 +320,7 @@ class SimaCodeService:
                 error=str(e)
             )
     
-    async def _process_with_react_engine(self, request: ChatRequest) -> Union[ChatResponse, AsyncGenerator[str, None]]:
+    async def _process_with_react_engine(self, request: ChatRequest) -> Union[ChatResponse, AsyncGenerator[StreamEvent, None]]:
         """使用ReAct引擎处理请求（完全复用 chat --react 模式的逻辑）"""
         try:
             # 确保ReAct服务已启动
@@ -342,13 +372,13 @@ class SimaCodeService:
         self, 
         request: ChatRequest, 
         conversation
-    ) -> AsyncGenerator[str, None]:
+    ) -> AsyncGenerator[StreamEvent, None]:
         """生成对话性流式响应"""
         try:
             response_chunks = []
             async for chunk in self.ai_client.chat_stream(conversation.get_messages()):
                 response_chunks.append(chunk)
-                yield chunk
+                yield StreamEvent("content", chunk)
             
             # After streaming, add complete response to conversation
             complete_response = "".join(response_chunks)
@@ -357,34 +387,32 @@ class SimaCodeService:
             
         except Exception as e:
             logger.error(f"Error in conversational streaming: {str(e)}")
-            yield f"Error: {str(e)}"
+            yield StreamEvent("error", f"❌ Error: {str(e)}")
+    
+    # ReAct update types forwarded to chat streams, mapped to their chunk types
+    TASK_STREAM_EVENT_TYPES = {
+        "conversational_response": "content",
+        "task_init": "task_init",
+        "confirmation_skipped": "content",
+        "tool_execution": "tool_output",
+        "status_update": "status",
+    }
     
-    async def _stream_task_response(self, react_request: ReActRequest) -> AsyncGenerator[str, None]:
+    async def _stream_task_response(self, react_request: ReActRequest) -> AsyncGenerator[StreamEvent, None]:
         """生成任务性流式响应"""
         try:
             async for update in await self.process_react(react_request, stream=True):
-                # 将 ReAct 更新转换为 Chat 流式格式
+                # 将 ReAct 更新转换为 Chat 流式事件
                 update_type = update.get("type", "")
                 content = update.get("content", "")
                 
-                if update_type == "conversational_response":
-                    yield content
-                #elif update_type == "final_result":
-                #    yield f"[status_update] {content}"
-                #elif update_type == "sub_task_result":
-                #    yield content
+                if update_type in self.TASK_STREAM_EVENT_TYPES:
+                    yield StreamEvent(self.TASK_STREAM_EVENT_TYPES[update_type], content)
                 elif update_type == "confirmation_request":
                     # 🆕 保持确认请求的完整结构信息，但扁平化以匹配客户端期望
-                    import json
-                    
-                    # 从嵌套结构中提取数据并创建扁平化结构
                     confirmation_request = update.get("confirmation_request", {})
                     tasks_summary = update.get("tasks_summary", {})
                     
-                    logger.debug(f"[CONFIRM_DEBUG] Service processing confirmation_request update")
-                    logger.debug(f"[CONFIRM_DEBUG] confirmation_request: {confirmation_request}")
-                    logger.debug(f"[CONFIRM_DEBUG] tasks_summary: {tasks_summary}")
-                    
                     confirmation_data = {
                         "type": "confirmation_request",
                         "content": content,
@@ -398,24 +426,15 @@ class SimaCodeService:
                         "confirmation_request": confirmation_request,
                         "tasks_summary": tasks_summary
                     }
-                    logger.debug(f"[CONFIRM_DEBUG] Final confirmation_data tasks count: {len(confirmation_data.get('tasks', []))}")
-                    yield f"[confirmation_request]{json.dumps(confirmation_data)}"
-                elif update_type == "task_init":
-                    # 🆕 Handle task_init message type
-                    yield f"[task_init] {content}"
-                elif update_type == "confirmation_skipped":
-                    # 🆕 Handle confirmation_skipped message type
-                    yield f"[confirmation_skipped] {content}"
-                elif update_type in ["tool_execution", "status_update"]:
-                    # 为工具执行和状态更新添加前缀标识
-                    yield f"[{update_type}] {content}"
+                    logger.debug(f"[CONFIRM_DEBUG] confirmation_data tasks count: {len(confirmation_data['tasks'])}")
+                    yield StreamEvent.confirmation_request(confirmation_data)
                 elif update_type == "error":
-                    yield f"❌ {content}"
+                    yield StreamEvent("error", f"❌ {content}")
                 # 过滤掉其他内部类型的更新
                 
         except Exception as e:
             logger.error(f"Error in task streaming: {str(e)}")
-            yield f"Error: {str(e)}"
+            yield StreamEvent("error", f"❌ Error: {str(e)}")
     
     async def _stream_chat_response(
         self, 
@@ -803,15 +822,19 @@ class SimaCodeService:
             logger.error(f"Error getting session info: {str(e)}")
             return {"error": str(e)}
     
-    async def list_sessions(self) -> List[Dict[str, Any]]:
+    async def list_sessions(self, limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
         """
-        List all active sessions.
+        List sessions, newest first.
         
+        Args:
+            limit: Maximum number of sessions to return
+            offset: Number of sessions to skip
+            
         Returns:
             List of session information dictionaries
         """
         try:
-            sessions = await self.react_service.list_sessions()
+            sessions = await self.react_service.list_sessions(limit, offset)
             return sessions
         except Exception as e:
             logger.error(f"Error listing sessions: {str(e)}")
@@ -865,6 +888,12 @@ class SimaCodeService:
                 health_status["components"]["ai_client"] = f"unhealthy: {str(e)}"
                 health_status["status"] = "degraded"
             
+            health_status["ai_connection_pool"] = self.get_ai_pool_stats()
+            
+            planning_client = getattr(getattr(self.react_service, "react_engine", None), "planning_client", None)
+            if hasattr(planning_client, "get_cache_stats"):
+                health_status["ai_response_cache"] = planning_client.get_cache_stats()
+            
             return health_status
             
         except Exception as e:
@@ -2,16 +2,21 @@
 MCP 异步任务集成模块。
 
 提供统一的异步任务管理器，支持长时间运行任务的执行、进度跟踪和结果回传。
+配置了持久化任务存储（SQLiteJobStore）时，任务进入持久化队列，由工作协程
+通过租约领取执行，进程重启或多个工作进程共享同一队列时任务不会丢失。
 """
 
 import asyncio
 import logging
 import time
 import uuid
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict, Any, Optional, Callable, AsyncGenerator, Union
+from typing import Dict, Any, List, Optional, Callable, AsyncGenerator, Set, Union
 from enum import Enum
 
+from .job_store import SQLiteJobStore, default_worker_id
+
 # Avoid circular imports - use TYPE_CHECKING for type hints
 from typing import TYPE_CHECKING
 
@@ -58,21 +63,172 @@ class MCPAsyncTask:
             self.metadata = {}
 
 
+def _serialize_request(request: Union[Any, Dict[str, Any]]) -> Dict[str, Any]:
+    """将任务请求转换为可持久化的字典"""
+    if isinstance(request, dict):
+        return {"kind": "dict", "data": request}
+    return {"kind": type(request).__name__, "data": dict(vars(request))}
+
+
+def _deserialize_request(payload: Dict[str, Any]) -> Union[Any, Dict[str, Any]]:
+    """从持久化的字典恢复任务请求"""
+    from ..core.service import ChatRequest, ReActRequest
+
+    request_classes = {"ChatRequest": ChatRequest, "ReActRequest": ReActRequest}
+    request_class = request_classes.get(payload.get("kind"))
+    if request_class is None:
+        return payload.get("data")
+    return request_class(**payload["data"])
+
+
+class _ProgressSubscription:
+    """单个订阅者的有界缓冲区"""
+
+    def __init__(self, max_buffer: int):
+        self.buffer: deque = deque()
+        self.max_buffer = max_buffer
+        self.wakeup = asyncio.Event()
+
+    def offer(self, progress_data: Dict[str, Any]) -> bool:
+        """
+        放入一条进度；缓冲区满时丢弃最旧的中间进度（慢消费者背压）。
+
+        Returns:
+            bool: 是否丢弃了一条旧进度
+        """
+        dropped = len(self.buffer) >= self.max_buffer
+        if dropped:
+            stale = next((item for item in self.buffer if item.get("type") == "progress"), None)
+            if stale is not None:
+                self.buffer.remove(stale)
+            else:
+                self.buffer.popleft()
+        self.buffer.append(progress_data)
+        self.wakeup.set()
+        return dropped
+
+
+class ProgressChannel:
+    """
+    任务进度广播通道。
+
+    每条进度推送给所有订阅者，并保存在有界回放缓冲区中，供晚到的订阅者补齐。
+    收到终止事件（final_result、error、cancelled）后通道关闭，订阅者读完缓冲即结束。
+    """
+
+    TERMINAL_TYPES = ("final_result", "error", "cancelled")
+
+    def __init__(self, replay_size: int = 50, subscriber_buffer: int = 100):
+        """
+        Args:
+            replay_size: 回放缓冲区保留的最近进度数
+            subscriber_buffer: 每个订阅者最多积压的进度数
+        """
+        self.history: deque = deque(maxlen=replay_size)
+        self.subscriber_buffer = subscriber_buffer
+        self.subscribers: set = set()
+        self.closed = False
+        self.dropped = 0
+
+    def publish(self, progress_data: Dict[str, Any]):
+        """广播一条进度（不阻塞发布者）"""
+        if self.closed:
+            return
+
+        self.history.append(progress_data)
+        for subscription in self.subscribers:
+            self.dropped += subscription.offer(progress_data)
+
+        if progress_data.get("type") in self.TERMINAL_TYPES:
+            self.close()
+
+    def close(self):
+        """关闭通道并唤醒所有订阅者"""
+        self.closed = True
+        for subscription in self.subscribers:
+            subscription.wakeup.set()
+
+    async def subscribe(self, replay: bool = True) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        订阅进度。
+
+        Args:
+            replay: 是否先回放缓冲区中的历史进度
+
+        Yields:
+            Dict[str, Any]: 进度数据
+        """
+        subscription = _ProgressSubscription(self.subscriber_buffer)
+        if replay:
+            for progress_data in self.history:
+                self.dropped += subscription.offer(progress_data)
+        self.subscribers.add(subscription)
+
+        try:
+            while True:
+                while subscription.buffer:
+                    yield subscription.buffer.popleft()
+                if self.closed:
+                    break
+                subscription.wakeup.clear()
+                await subscription.wakeup.wait()
+        finally:
+            self.subscribers.discard(subscription)
+
+
 class MCPAsyncTaskManager:
     """统一的异步任务管理器"""
 
-    def __init__(self, max_concurrent_tasks: int = 5):
+    TERMINAL_PROGRESS_TYPES = ProgressChannel.TERMINAL_TYPES
+
+    def __init__(
+        self,
+        max_concurrent_tasks: int = 5,
+        progress_replay_size: int = 50,
+        subscriber_buffer_size: int = 100,
+        store: Optional[SQLiteJobStore] = None,
+        lease_seconds: float = 60.0,
+        max_attempts: int = 3,
+        poll_interval: float = 1.0,
+        worker_id: Optional[str] = None,
+        job_retention: float = 7 * 24 * 3600,
+        purge_interval: float = 3600.0
+    ):
         """
         初始化异步任务管理器。
 
         Args:
-            max_concurrent_tasks: 最大并发任务数
+            max_concurrent_tasks: 最大并发任务数（持久化模式下为本进程的工作协程数）
+            progress_replay_size: 每个任务为晚到订阅者保留的进度数
+            subscriber_buffer_size: 每个订阅者最多积压的进度数，超出时合并中间进度
+            store: 持久化任务存储；为 None 时任务只保存在内存中
+            lease_seconds: 工作协程持有任务租约的时长，执行期间定期续约
+            max_attempts: 任务失败或工作进程崩溃后的最大执行次数
+            poll_interval: 空闲工作协程检查其他进程提交的任务、以及跨进程读取进度的间隔
+            worker_id: 工作进程标识（默认由主机名和进程号生成）
+            job_retention: 已结束任务在持久化存储中保留的秒数，为 0 时永久保留
+            purge_interval: 清理过期任务的间隔
         """
         self.active_tasks: Dict[str, MCPAsyncTask] = {}
-        self.task_queues: Dict[str, asyncio.Queue] = {}
+        self.progress_channels: Dict[str, ProgressChannel] = {}
+        self.progress_replay_size = progress_replay_size
+        self.subscriber_buffer_size = subscriber_buffer_size
+        self.max_concurrent_tasks = max_concurrent_tasks
         self.executor_pool = asyncio.Semaphore(max_concurrent_tasks)
         self._shutdown = False
 
+        self.store = store
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self.worker_id = worker_id or default_worker_id()
+        self.job_retention = job_retention
+        self.purge_interval = purge_interval
+        self._workers: List[asyncio.Task] = []
+        self._purge_task: Optional[asyncio.Task] = None
+        self._job_available: Optional[asyncio.Event] = None
+        self._progress_waiters: Dict[str, Set[asyncio.Event]] = {}
+
         logger.info(f"MCPAsyncTaskManager initialized with max_concurrent_tasks={max_concurrent_tasks}")
 
     async def submit_task(
@@ -105,7 +261,25 @@ class MCPAsyncTaskManager:
         )
 
         self.active_tasks[task_id] = task
-        self.task_queues[task_id] = asyncio.Queue()
+
+        if self.store:
+            # 持久化模式：写入队列，由工作协程（本进程或其他进程）领取执行
+            await self.store.enqueue({
+                "job_id": task_id,
+                "task_type": task_type.value,
+                "request": _serialize_request(request),
+                "max_attempts": self.max_attempts,
+                "created_at": task.created_at
+            })
+            self._start_workers()
+            self._job_available.set()
+            logger.info(f"Task {task_id} queued for async execution")
+            return task_id
+
+        self.progress_channels[task_id] = ProgressChannel(
+            replay_size=self.progress_replay_size,
+            subscriber_buffer=self.subscriber_buffer_size
+        )
 
         # 启动后台执行
         asyncio.create_task(self._execute_task(task))
@@ -115,43 +289,100 @@ class MCPAsyncTaskManager:
 
     async def get_task_status(self, task_id: str) -> Optional[MCPAsyncTask]:
         """获取任务状态"""
-        return self.active_tasks.get(task_id)
+        if not self.store:
+            return self.active_tasks.get(task_id)
+
+        job = await self.store.get(task_id)
+        if not job:
+            return None
+        return self._task_from_job(job)
+
+    def _task_from_job(self, job: Dict[str, Any]) -> MCPAsyncTask:
+        """用持久化记录创建或更新任务对象（保留本进程的进度回调）"""
+        task = self.active_tasks.get(job["job_id"])
+        if task is None:
+            task = MCPAsyncTask(
+                task_id=job["job_id"],
+                task_type=TaskType(job["task_type"]),
+                request=_deserialize_request(job["request"]),
+                created_at=job["created_at"]
+            )
+
+        task.status = TaskStatus(job["status"])
+        task.started_at = job["started_at"]
+        task.completed_at = job["completed_at"]
+        task.result = job["result"]
+        task.error = job["error"]
+        task.metadata = {**job["metadata"], "attempts": job["attempts"], "max_attempts": job["max_attempts"]}
+        return task
 
     async def get_task_progress_stream(self, task_id: str) -> AsyncGenerator[Dict[str, Any], None]:
         """
         获取任务进度流。
 
+        可以有多个订阅者同时读取；晚到的订阅者先收到回放缓冲区中的进度，
+        任务结束（final_result、error 或 cancelled）后流立即结束。
+
         Args:
             task_id: 任务ID
 
         Yields:
             Dict[str, Any]: 进度数据
         """
-        if task_id not in self.task_queues:
-            raise ValueError(f"Task {task_id} not found")
+        if self.store:
+            async for progress in self._stream_stored_progress(task_id):
+                yield progress
+            return
 
-        queue = self.task_queues[task_id]
-        task = self.active_tasks.get(task_id)
+        if task_id not in self.progress_channels:
+            raise ValueError(f"Task {task_id} not found")
 
-        if not task:
+        if task_id not in self.active_tasks:
             return
 
-        while True:
-            try:
-                # 等待进度更新，使用短超时以便定期检查任务状态
-                progress = await asyncio.wait_for(queue.get(), timeout=1.0)
-                yield progress
+        async for progress in self.progress_channels[task_id].subscribe():
+            yield progress
 
-                # 如果是最终结果，停止流式传输
-                if progress.get('type') == 'final_result':
-                    break
+    async def _stream_stored_progress(self, task_id: str) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        从持久化进度日志读取进度。
 
-            except asyncio.TimeoutError:
-                # 检查任务是否仍在运行
-                current_task = self.active_tasks.get(task_id)
-                if not current_task or current_task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED]:
-                    break
-                continue
+        本进程执行的任务写入进度时会立即唤醒读取者；其他进程执行的任务
+        每隔 poll_interval 检查一次新进度。
+        """
+        if not await self.store.get(task_id):
+            raise ValueError(f"Task {task_id} not found")
+
+        wakeup = asyncio.Event()
+        self._progress_waiters.setdefault(task_id, set()).add(wakeup)
+        last_seq = 0
+        try:
+            while True:
+                wakeup.clear()
+                entries = await self.store.get_progress(task_id, last_seq)
+                for last_seq, progress in entries:
+                    yield progress
+                    if progress.get("type") in self.TERMINAL_PROGRESS_TYPES:
+                        return
+
+                if not entries:
+                    job = await self.store.get(task_id)
+                    if not job or job["status"] in (TaskStatus.COMPLETED.value, TaskStatus.FAILED.value):
+                        # 终止进度与状态在同一事务中写入，读取剩余进度后结束
+                        for _, progress in await self.store.get_progress(task_id, last_seq):
+                            yield progress
+                        return
+
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            waiters = self._progress_waiters.get(task_id)
+            if waiters is not None:
+                waiters.discard(wakeup)
+                if not waiters:
+                    del self._progress_waiters[task_id]
 
     async def restart_task(self, task_id: str) -> Optional[str]:
         """
@@ -163,7 +394,7 @@ class MCPAsyncTaskManager:
         Returns:
             str: 新任务ID，如果无法重启则返回None
         """
-        task = self.active_tasks.get(task_id)
+        task = await self.get_task_status(task_id)
         if not task:
             return None
 
@@ -191,74 +422,201 @@ class MCPAsyncTaskManager:
         Returns:
             bool: 是否成功取消
         """
-        task = self.active_tasks.get(task_id)
-        if not task:
-            return False
+        cancelled = {
+            "type": "cancelled",
+            "message": "Task was cancelled",
+            "timestamp": time.time()
+        }
+
+        if self.store:
+            # 执行该任务的工作进程在下次续约时发现取消
+            if not await self.store.cancel(task_id, progress=cancelled):
+                return False
+            task = self.active_tasks.get(task_id)
+            if task:
+                task.status = TaskStatus.CANCELLED
+        else:
+            task = self.active_tasks.get(task_id)
+            if not task:
+                return False
 
-        if task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED]:
-            return False
+            if task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED]:
+                return False
 
-        task.status = TaskStatus.CANCELLED
+            task.status = TaskStatus.CANCELLED
 
         # 发送取消通知
-        await self._report_progress(task_id, {
-            "type": "cancelled",
-            "message": "Task was cancelled",
-            "timestamp": time.time()
-        })
+        await self._report_progress(task_id, cancelled, stored=bool(self.store))
 
         logger.info(f"Task {task_id} cancelled")
         return True
 
+    async def start(self):
+        """启动工作协程，继续执行上次运行时遗留在队列中的任务（仅持久化模式）"""
+        if self.store and not self._shutdown:
+            self._start_workers()
+
+    async def stop(self):
+        """停止工作协程，正在执行的任务归还队列（仅持久化模式）"""
+        tasks = self._workers + ([self._purge_task] if self._purge_task else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers = []
+        self._purge_task = None
+
+    def _start_workers(self):
+        """启动从持久化队列领取任务的工作协程"""
+        if self._workers:
+            return
+        self._job_available = asyncio.Event()
+        self._workers = [
+            asyncio.create_task(self._worker_loop(i)) for i in range(self.max_concurrent_tasks)
+        ]
+        if self.job_retention > 0:
+            self._purge_task = asyncio.create_task(self._purge_loop())
+        logger.info(f"Started {len(self._workers)} async task workers ({self.worker_id})")
+
+    async def _worker_loop(self, index: int):
+        """工作协程：领取任务、执行，空闲时等待新任务"""
+        while not self._shutdown:
+            try:
+                job = await self.store.claim(self.worker_id, self.lease_seconds)
+            except Exception as e:
+                logger.error(f"Worker {index} failed to claim a job: {e}")
+                job = None
+
+            if job is None:
+                # 本进程提交的任务立即唤醒；其他进程提交的任务按 poll_interval 发现
+                self._job_available.clear()
+                try:
+                    await asyncio.wait_for(self._job_available.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            task = self._task_from_job(job)
+            self.active_tasks[task.task_id] = task
+            await self._run_job(task)
+
+    async def _purge_loop(self):
+        """定期删除超过保留期的已结束任务及其进度记录"""
+        while not self._shutdown:
+            try:
+                purged = await self.store.purge(older_than=time.time() - self.job_retention)
+                if purged:
+                    logger.info(f"Purged {purged} finished async tasks older than {self.job_retention}s")
+            except Exception as e:
+                logger.warning(f"Failed to purge finished async tasks: {e}")
+            await asyncio.sleep(self.purge_interval)
+
+    async def _run_job(self, task: MCPAsyncTask):
+        """在持有租约期间执行持久化任务"""
+        heartbeat = asyncio.create_task(self._renew_lease(task))
+        try:
+            await self._run_task(task)
+        except asyncio.CancelledError:
+            # 进程关闭：归还任务，由其他工作进程或重启后的进程继续执行
+            await self.store.release(task.task_id, self.worker_id)
+            raise
+        finally:
+            heartbeat.cancel()
+
+    async def _renew_lease(self, task: MCPAsyncTask):
+        """定期续约；发现任务在其他进程中被取消时标记取消"""
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                status = await self.store.renew_lease(task.task_id, self.worker_id, self.lease_seconds)
+            except Exception as e:
+                logger.warning(f"Failed to renew lease of task {task.task_id}: {e}")
+                continue
+
+            if status == TaskStatus.CANCELLED.value:
+                task.status = TaskStatus.CANCELLED
+            elif status is None:
+                logger.warning(f"Lost lease of task {task.task_id}; another worker may take it over")
+                return
+
     async def _execute_task(self, task: MCPAsyncTask):
         """执行异步任务"""
         async with self.executor_pool:
-            try:
-                task.status = TaskStatus.RUNNING
-                task.started_at = time.time()
+            await self._run_task(task)
 
-                # 报告开始
-                await self._report_progress(task.task_id, {
-                    "type": "started",
-                    "message": f"Starting {task.task_type.value} task",
-                    "timestamp": task.started_at
-                })
+    async def _run_task(self, task: MCPAsyncTask):
+        """执行任务并报告结果"""
+        retrying = False
+        try:
+            task.status = TaskStatus.RUNNING
+            task.started_at = time.time()
 
-                # 根据任务类型执行
-                if task.task_type == TaskType.REACT:
-                    await self._execute_react_task(task)
-                elif task.task_type == TaskType.CHAT:
-                    await self._execute_chat_task(task)
-                else:
-                    raise ValueError(f"Unknown task type: {task.task_type}")
-
-                # 如果任务没有被取消，标记为完成
-                if task.status != TaskStatus.CANCELLED:
-                    task.status = TaskStatus.COMPLETED
-                    task.completed_at = time.time()
-
-                    await self._report_progress(task.task_id, {
-                        "type": "final_result",
-                        "result": task.result,
-                        "timestamp": task.completed_at,
-                        "execution_time": task.completed_at - task.started_at
-                    })
+            # 报告开始
+            await self._report_progress(task.task_id, {
+                "type": "started",
+                "message": f"Starting {task.task_type.value} task",
+                "timestamp": task.started_at
+            })
 
-            except Exception as e:
-                task.status = TaskStatus.FAILED
+            # 根据任务类型执行
+            if task.task_type == TaskType.REACT:
+                await self._execute_react_task(task)
+            elif task.task_type == TaskType.CHAT:
+                await self._execute_chat_task(task)
+            else:
+                raise ValueError(f"Unknown task type: {task.task_type}")
+
+            # 如果任务没有被取消，标记为完成
+            if task.status != TaskStatus.CANCELLED:
+                task.status = TaskStatus.COMPLETED
                 task.completed_at = time.time()
-                task.error = str(e)
-
-                logger.error(f"Task {task.task_id} failed: {e}")
 
+                final_result = {
+                    "type": "final_result",
+                    "result": task.result,
+                    "timestamp": task.completed_at,
+                    "execution_time": task.completed_at - task.started_at
+                }
+                if self.store:
+                    await self.store.finish(
+                        task.task_id, self.worker_id, TaskStatus.COMPLETED.value,
+                        result=task.result, progress=final_result
+                    )
+                await self._report_progress(task.task_id, final_result, stored=bool(self.store))
+
+        except Exception as e:
+            task.error = str(e)
+            logger.error(f"Task {task.task_id} failed: {e}")
+
+            # 持久化模式下还有剩余次数时重新入队
+            if self.store and await self.store.retry(task.task_id, self.worker_id, str(e)):
+                retrying = True
+                task.status = TaskStatus.PENDING
                 await self._report_progress(task.task_id, {
-                    "type": "error",
+                    "type": "retrying",
                     "error": str(e),
-                    "timestamp": task.completed_at
+                    "attempt": task.metadata.get("attempts", 1),
+                    "timestamp": time.time()
                 })
+                self._job_available.set()
+                return
 
-            finally:
-                # 清理资源（延迟清理以允许客户端获取最终状态）
+            task.status = TaskStatus.FAILED
+            task.completed_at = time.time()
+
+            error_progress = {
+                "type": "error",
+                "error": str(e),
+                "timestamp": task.completed_at
+            }
+            if self.store:
+                await self.store.finish(
+                    task.task_id, self.worker_id, TaskStatus.FAILED.value, error=str(e), progress=error_progress
+                )
+            await self._report_progress(task.task_id, error_progress, stored=bool(self.store))
+
+        finally:
+            # 清理资源（延迟清理以允许客户端获取最终状态）
+            if not retrying:
                 asyncio.create_task(self._cleanup_task(task.task_id, delay=300))  # 5分钟后清理
 
     async def _execute_react_task(self, task: MCPAsyncTask):
@@ -320,13 +678,27 @@ class MCPAsyncTaskManager:
         }
 
 
-    async def _report_progress(self, task_id: str, progress_data: Dict[str, Any]):
-        """报告任务进度"""
-        if task_id in self.task_queues:
-            try:
-                await self.task_queues[task_id].put(progress_data)
-            except Exception as e:
-                logger.error(f"Failed to report progress for task {task_id}: {e}")
+    async def _report_progress(self, task_id: str, progress_data: Dict[str, Any], stored: bool = False):
+        """
+        报告任务进度。
+
+        Args:
+            task_id: 任务ID
+            progress_data: 进度数据
+            stored: 进度是否已随状态变更写入持久化存储
+        """
+        if self.store:
+            if not stored:
+                try:
+                    await self.store.append_progress(task_id, progress_data)
+                except Exception as e:
+                    logger.error(f"Failed to store progress for task {task_id}: {e}")
+            for wakeup in self._progress_waiters.get(task_id, ()):
+                wakeup.set()
+
+        channel = self.progress_channels.get(task_id)
+        if channel:
+            channel.publish(progress_data)
 
         # 调用任务的进度回调
         task = self.active_tasks.get(task_id)
@@ -342,7 +714,9 @@ class MCPAsyncTaskManager:
             await asyncio.sleep(delay)
 
         self.active_tasks.pop(task_id, None)
-        self.task_queues.pop(task_id, None)
+        channel = self.progress_channels.pop(task_id, None)
+        if channel:
+            channel.close()
 
         logger.debug(f"Task {task_id} resources cleaned up")
 
@@ -350,6 +724,13 @@ class MCPAsyncTaskManager:
         """关闭任务管理器"""
         self._shutdown = True
 
+        if self.store:
+            # 持久化模式：停止工作协程，正在执行的任务归还队列，重启后继续执行
+            await self.stop()
+            self.store.close()
+            logger.info("MCPAsyncTaskManager shutdown completed")
+            return
+
         # 取消所有活动任务
         for task_id in list(self.active_tasks.keys()):
             await self.cancel_task(task_id)
@@ -364,9 +745,17 @@ class MCPAsyncTaskManager:
         """获取任务管理器统计信息"""
         stats = {
             "active_tasks": len(self.active_tasks),
-            "task_breakdown": {}
+            "task_breakdown": {},
+            "progress_subscribers": sum(len(c.subscribers) for c in self.progress_channels.values()),
+            "dropped_progress_events": sum(c.dropped for c in self.progress_channels.values())
         }
 
+        if self.store:
+            stats["task_breakdown"] = self.store.count_by_status()
+            stats["workers"] = len(self._workers)
+            stats["worker_id"] = self.worker_id
+            return stats
+
         for task in self.active_tasks.values():
             status = task.status.value
             if status not in stats["task_breakdown"]:
@@ -388,6 +777,32 @@ def get_global_task_manager() -> MCPAsyncTaskManager:
     return _global_task_manager
 
 
+def configure_global_task_manager(config) -> MCPAsyncTaskManager:
+    """
+    按配置创建全局任务管理器。
+
+    Args:
+        config: 异步任务配置（AsyncTaskConfig）
+
+    Returns:
+        MCPAsyncTaskManager: 新的全局任务管理器
+    """
+    global _global_task_manager
+    store = None
+    if config.queue_backend == "sqlite":
+        store = SQLiteJobStore(config.queue_path)
+
+    _global_task_manager = MCPAsyncTaskManager(
+        max_concurrent_tasks=config.max_concurrent_tasks,
+        store=store,
+        lease_seconds=config.lease_seconds,
+        max_attempts=config.max_attempts,
+        poll_interval=config.poll_interval,
+        job_retention=config.job_retention_seconds
+    )
+    return _global_task_manager
+
+
 async def shutdown_global_task_manager():
     """关闭全局任务管理器"""
     global _global_task_manager
@@ -154,7 +154,11 @@ class MCPAutoDiscovery:
             # Perform initial discovery
             await self.discover_all()
             
-            # Start continuous discovery if in active mode
+            # React to catalog changes pushed by servers
+            if self.policy.mode in (DiscoveryMode.ACTIVE, DiscoveryMode.REACTIVE):
+                self.server_manager.add_tools_changed_listener(self._on_server_tools_changed)
+            
+            # Active mode also reconciles periodically as a fallback
             if self.policy.mode == DiscoveryMode.ACTIVE:
                 self.discovery_task = asyncio.create_task(self._discovery_loop())
             
@@ -174,6 +178,9 @@ class MCPAutoDiscovery:
         
         self.is_running = False
         
+        if self.policy.mode in (DiscoveryMode.ACTIVE, DiscoveryMode.REACTIVE):
+            self.server_manager.remove_tools_changed_listener(self._on_server_tools_changed)
+        
         # Cancel discovery task
         if self.discovery_task:
             self.discovery_task.cancel()
@@ -205,10 +212,13 @@ class MCPAutoDiscovery:
             
             logger.info(f"Discovering tools from {len(eligible_servers)} eligible servers")
             
+            # One catalog snapshot for all servers instead of one per server
+            all_tools = await self.server_manager.get_all_tools() if eligible_servers else {}
+            
             # Discover tools from each server
             for server_name in eligible_servers:
                 try:
-                    count = await self.discover_server(server_name)
+                    count = await self._apply_server_tools(server_name, all_tools.get(server_name, []))
                     results[server_name] = count
                     self.stats["servers_processed"] += 1
                     
@@ -255,49 +265,73 @@ class MCPAutoDiscovery:
             
             # Get current tools
             server_tools = await self.server_manager.get_all_tools()
-            tools = server_tools.get(server_name, [])
-            
-            if not tools:
-                logger.debug(f"No tools found on server '{server_name}'")
-                return 0
-            
-            # Apply tool filtering
-            filtered_tools = await self._filter_tools(tools, server_name)
-            
-            # Detect changes
-            changes = await self._detect_tool_changes(server_name, filtered_tools)
-            
-            # Process changes
-            processed_count = 0
-            
-            # Handle new tools
-            for tool in changes["added"]:
-                if await self._process_new_tool(server_name, tool):
-                    processed_count += 1
-            
-            # Handle updated tools
-            for tool in changes["updated"]:
-                if await self._process_updated_tool(server_name, tool):
-                    processed_count += 1
-            
-            # Handle removed tools
-            for tool_name in changes["removed"]:
-                if await self._process_removed_tool(server_name, tool_name):
-                    processed_count += 1
-            
-            # Update known tools
-            self._update_known_tools(server_name, filtered_tools)
-            self.last_discovery[server_name] = datetime.now()
-            
-            if processed_count > 0:
-                logger.info(f"Processed {processed_count} tool changes from server '{server_name}'")
-            
-            return processed_count
+            return await self._apply_server_tools(server_name, server_tools.get(server_name, []))
             
         except Exception as e:
             logger.error(f"Server discovery failed for '{server_name}': {str(e)}")
             raise
     
+    async def _on_server_tools_changed(self, server_name: str, tools: List[MCPTool]) -> None:
+        """Process a catalog change pushed by the server manager."""
+        if not self.is_running or server_name in self.policy.excluded_servers:
+            return
+        if not await self._is_server_eligible(server_name):
+            return
+        
+        try:
+            await self._apply_server_tools(server_name, tools)
+        except Exception as e:
+            logger.error(f"Failed to apply tool changes from server '{server_name}': {str(e)}")
+            self._record_event("failed", "discovery", server_name, {"error": str(e)})
+    
+    async def _apply_server_tools(self, server_name: str, tools: List[MCPTool]) -> int:
+        """
+        Detect and process changes between known tools and a server's catalog.
+        
+        Args:
+            server_name: Name of the server
+            tools: The server's current tools
+            
+        Returns:
+            int: Number of tool changes processed
+        """
+        if not tools and not self.known_tools.get(server_name):
+            logger.debug(f"No tools found on server '{server_name}'")
+            return 0
+        
+        # Apply tool filtering
+        filtered_tools = await self._filter_tools(tools, server_name)
+        
+        # Detect changes
+        changes = await self._detect_tool_changes(server_name, filtered_tools)
+        
+        # Process changes
+        processed_count = 0
+        
+        # Handle new tools
+        for tool in changes["added"]:
+            if await self._process_new_tool(server_name, tool):
+                processed_count += 1
+        
+        # Handle updated tools
+        for tool in changes["updated"]:
+            if await self._process_updated_tool(server_name, tool):
+                processed_count += 1
+        
+        # Handle removed tools
+        for tool_name in changes["removed"]:
+            if await self._process_removed_tool(server_name, tool_name):
+                processed_count += 1
+        
+        # Update known tools
+        self._update_known_tools(server_name, filtered_tools)
+        self.last_discovery[server_name] = datetime.now()
+        
+        if processed_count > 0:
+            logger.info(f"Processed {processed_count} tool changes from server '{server_name}'")
+        
+        return processed_count
+    
     async def _filter_eligible_servers(self, servers: List[str]) -> List[str]:
         """Filter servers based on discovery policy."""
         eligible = []
@@ -369,10 +403,6 @@ class MCPAutoDiscovery:
     ) -> Dict[str, List]:
         """Detect changes in server tools."""
         current_tool_names = {tool.name for tool in current_tools}
-        current_signatures = {
-            tool.name: self._calculate_tool_signature(tool)
-            for tool in current_tools
-        }
         
         known_tool_names = self.known_tools.get(server_name, set())
         
@@ -389,33 +419,30 @@ class MCPAutoDiscovery:
             else:
                 # Check if tool has been updated
                 old_signature = self.tool_signatures.get(f"{server_name}:{tool.name}")
-                new_signature = current_signatures[tool.name]
                 
-                if old_signature != new_signature:
+                if old_signature != tool.signature:
                     changes["updated"].append(tool)
         
         return changes
     
     def _calculate_tool_signature(self, tool: MCPTool) -> str:
         """Calculate a signature for a tool to detect changes."""
-        import hashlib
-        import json
-        
-        signature_data = {
-            "name": tool.name,
-            "description": tool.description,
-            "schema": tool.input_schema
-        }
-        
-        signature_str = json.dumps(signature_data, sort_keys=True)
-        return hashlib.md5(signature_str.encode()).hexdigest()
+        return tool.signature
     
     async def _process_new_tool(self, server_name: str, tool: MCPTool) -> bool:
         """Process a newly discovered tool."""
         try:
             logger.debug(f"Processing new tool '{tool.name}' from server '{server_name}'")
             
-            if self.policy.auto_register_new_tools:
+            if self._registered_signature(server_name, tool.name) == tool.signature:
+                # Already registered from the same catalog change (e.g. by the registry)
+                self._record_event(
+                    "discovered",
+                    tool.name,
+                    server_name,
+                    {"already_registered": True}
+                )
+            elif self.policy.auto_register_new_tools:
                 # Auto-register the tool
                 success = await self.tool_registry.register_server_tools(server_name, [tool])
                 
@@ -464,13 +491,18 @@ class MCPAutoDiscovery:
             logger.debug(f"Processing updated tool '{tool.name}' from server '{server_name}'")
             
             # Update tool signature
-            signature = self._calculate_tool_signature(tool)
+            signature = tool.signature
             self.tool_signatures[f"{server_name}:{tool.name}"] = signature
             
             # Check if tool is currently registered
             namespace = self.tool_registry.namespace_manager._sanitize_namespace_name(server_name)
             tool_full_name = f"{namespace}:{tool.name}"
             
+            if self._registered_signature(server_name, tool.name) == signature:
+                # The registry already picked up this version
+                self._record_event("updated", tool.name, server_name, {"signature": signature})
+                return True
+            
             if tool_full_name in self.tool_registry.registered_tools:
                 # Re-register updated tool
                 await self.tool_registry.unregister_tool(tool_full_name)
@@ -517,14 +549,23 @@ class MCPAutoDiscovery:
             logger.error(f"Failed to process removed tool '{tool_name}': {str(e)}")
             return False
     
+    def _registered_signature(self, server_name: str, tool_name: str) -> Optional[str]:
+        """Get the signature of the registered version of a tool, if any."""
+        namespace = self.tool_registry.namespace_manager._sanitize_namespace_name(server_name)
+        wrapper = self.tool_registry.registered_tools.get(f"{namespace}:{tool_name}")
+        mcp_tool = getattr(wrapper, "mcp_tool", None)
+        return mcp_tool.signature if isinstance(mcp_tool, MCPTool) else None
+    
     def _update_known_tools(self, server_name: str, tools: List[MCPTool]) -> None:
         """Update the known tools for a server."""
-        self.known_tools[server_name] = {tool.name for tool in tools}
+        known_tools = {tool.name for tool in tools}
+        for tool_name in self.known_tools.get(server_name, set()) - known_tools:
+            self.tool_signatures.pop(f"{server_name}:{tool_name}", None)
+        self.known_tools[server_name] = known_tools
         
         # Update tool signatures
         for tool in tools:
-            signature = self._calculate_tool_signature(tool)
-            self.tool_signatures[f"{server_name}:{tool.name}"] = signature
+            self.tool_signatures[f"{server_name}:{tool.name}"] = tool.signature
     
     def _record_event(
         self,
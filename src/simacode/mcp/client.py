@@ -6,8 +6,9 @@ MCP servers, tool discovery, and method invocation.
 """
 
 import asyncio
+import hashlib
 import logging
-from typing import Dict, List, Optional, Any, AsyncGenerator, Callable
+from typing import Dict, List, Optional, Any, AsyncGenerator, Awaitable, Callable
 from cachetools import TTLCache
 
 from .protocol import (
@@ -42,10 +43,13 @@ class MCPClient:
     initialization, tool discovery, and method invocation.
     """
     
-    def __init__(self, server_config: MCPServerConfig):
+    def __init__(self, server_config: MCPServerConfig, discover_capabilities: bool = True):
         self.server_config = server_config
         self.server_name = server_config.name
         
+        # Replicas in a client pool reuse the primary's discovery results
+        self.discover_capabilities = discover_capabilities
+        
         # Connection management
         self.connection: Optional[MCPConnection] = None
         self.protocol: Optional[MCPProtocol] = None
@@ -56,6 +60,12 @@ class MCPClient:
         self.resources_cache: Dict[str, MCPResource] = {}
         self.prompts_cache: Dict[str, MCPPrompt] = {}
         
+        # Tool catalog change tracking
+        self.catalog_signature: Optional[str] = None
+        self.tools_changed_callbacks: List[Callable[[str, List[MCPTool]], Awaitable[None]]] = []
+        self._tools_refresh_lock = asyncio.Lock()
+        self._tools_refresh_pending = False
+        
         # Server capabilities and info
         self.server_info: Optional[Dict[str, Any]] = None
         self.server_capabilities: Optional[Dict[str, Any]] = None
@@ -117,8 +127,13 @@ class MCPClient:
                 self.protocol = EmbeddedProtocol(transport)
                 logger.debug(f"Using EmbeddedProtocol for embedded transport")
             else:
-                self.protocol = MCPProtocol(transport)
+                self.protocol = MCPProtocol(
+                    transport,
+                    max_in_flight=self.server_config.max_in_flight,
+                    request_timeout=self.server_config.request_timeout
+                )
                 logger.debug(f"Using standard MCPProtocol for {transport.__class__.__name__}")
+                self._subscribe_to_notifications()
             
             self.state = MCPClientState.CONNECTED
             logger.info(f"Connected to MCP server '{self.server_name}'")
@@ -168,6 +183,7 @@ class MCPClient:
                 self.resources_cache.clear()
                 self.prompts_cache.clear()
                 self.result_cache.clear()
+                self.catalog_signature = None
     
     def is_connected(self) -> bool:
         """Check if client is connected and ready."""
@@ -213,7 +229,8 @@ class MCPClient:
             await self.protocol.send_notification(MCPMethods.NOTIFICATIONS_INITIALIZED)
             
             # Discover available tools and resources
-            await self._discover_capabilities()
+            if self.discover_capabilities:
+                await self._discover_capabilities()
             
         except Exception as e:
             raise MCPConnectionError(f"Failed to initialize session: {str(e)}")
@@ -236,13 +253,18 @@ class MCPClient:
         except Exception as e:
             logger.warning(f"Error discovering capabilities for '{self.server_name}': {str(e)}")
     
-    async def _discover_tools(self) -> None:
-        """Discover available tools from the server."""
+    async def _discover_tools(self) -> bool:
+        """
+        Discover available tools from the server.
+        
+        Returns:
+            bool: True if the catalog differs from the previously discovered one
+        """
         try:
             result = await self.protocol.call_method(MCPMethods.TOOLS_LIST)
             tools_data = result.get("tools", [])
             
-            self.tools_cache.clear()
+            tools = {}
             for tool_data in tools_data:
                 tool = MCPTool(
                     name=tool_data["name"],
@@ -250,12 +272,88 @@ class MCPClient:
                     server_name=self.server_name,
                     input_schema=tool_data.get("input_schema")
                 )
-                self.tools_cache[tool.name] = tool
+                tools[tool.name] = tool
+            
+            # Update in place: pool replicas share this dict
+            self.tools_cache.clear()
+            self.tools_cache.update(tools)
+            
+            previous_signature = self.catalog_signature
+            self.catalog_signature = self._calculate_catalog_signature(tools.values())
             
             logger.info(f"Discovered {len(self.tools_cache)} tools from '{self.server_name}'")
+            return previous_signature is not None and previous_signature != self.catalog_signature
             
         except Exception as e:
             logger.warning(f"Failed to discover tools from '{self.server_name}': {str(e)}")
+            return False
+    
+    @staticmethod
+    def _calculate_catalog_signature(tools) -> str:
+        """Combine the per-tool signatures into one catalog signature."""
+        signatures = sorted(tool.signature for tool in tools)
+        return hashlib.sha256("|".join(signatures).encode()).hexdigest()[:16]
+    
+    def supports_list_changed(self) -> bool:
+        """Check whether the server pushes notifications/tools/list_changed."""
+        tools_capabilities = (self.server_capabilities or {}).get("tools") or {}
+        return bool(tools_capabilities.get("listChanged"))
+    
+    def add_tools_changed_callback(
+        self,
+        callback: Callable[[str, List[MCPTool]], Awaitable[None]]
+    ) -> None:
+        """
+        Add a callback invoked with (server_name, tools) when the catalog changes.
+        
+        Args:
+            callback: Coroutine function receiving the server name and new tools
+        """
+        self.tools_changed_callbacks.append(callback)
+    
+    def _subscribe_to_notifications(self) -> None:
+        """Listen for catalog change notifications on the protocol."""
+        # Pool replicas share the primary's catalog and leave refreshing to it
+        if self.discover_capabilities:
+            self.protocol.add_notification_handler(
+                MCPMethods.NOTIFICATIONS_TOOLS_LIST_CHANGED,
+                self._on_tools_list_changed
+            )
+    
+    async def _on_tools_list_changed(self, message) -> None:
+        """Re-list tools once per burst of list_changed notifications."""
+        if self._tools_refresh_lock.locked():
+            # A refresh is running; make it list once more when it finishes
+            self._tools_refresh_pending = True
+            return
+        
+        async with self._tools_refresh_lock:
+            self._tools_refresh_pending = True
+            while self._tools_refresh_pending and self.is_connected():
+                self._tools_refresh_pending = False
+                await self.refresh_tools()
+    
+    async def refresh_tools(self) -> bool:
+        """
+        Re-list tools from the server and notify callbacks if the catalog changed.
+        
+        Returns:
+            bool: True if the catalog changed
+        """
+        if not self.is_connected():
+            return False
+        
+        changed = await self._discover_tools()
+        if changed:
+            logger.info(f"Tool catalog of '{self.server_name}' changed")
+            tools = list(self.tools_cache.values())
+            for callback in list(self.tools_changed_callbacks):
+                try:
+                    await callback(self.server_name, tools)
+                except Exception as e:
+                    logger.error(f"Tools changed callback failed for '{self.server_name}': {str(e)}")
+        
+        return changed
     
     async def _discover_resources(self) -> None:
         """Discover available resources from the server."""
@@ -561,6 +659,30 @@ class MCPClient:
         except Exception:
             return False
     
+    async def probe(self, timeout: float = 5.0) -> bool:
+        """
+        Check liveness at the transport level without an MCP round-trip.
+        
+        Args:
+            timeout: Maximum time to wait for the probe
+            
+        Returns:
+            bool: True if the transport reports the server alive
+        """
+        if not self.is_connected():
+            return False
+        
+        try:
+            return await self.connection.transport.probe(timeout)
+        except Exception as e:
+            logger.debug(f"Probe of MCP server '{self.server_name}' failed: {str(e)}")
+            return False
+    
+    @property
+    def last_activity(self) -> Optional[float]:
+        """Monotonic time of the last message received from the server."""
+        return getattr(self.protocol, "last_activity", None) if self.protocol else None
+    
     def get_server_info(self) -> Optional[Dict[str, Any]]:
         """Get server information."""
         return self.server_info
@@ -586,6 +708,7 @@ class MCPClient:
             "cached_tools": len(self.tools_cache),
             "cached_resources": len(self.resources_cache),
             "cached_results": len(self.result_cache),
+            "in_flight_requests": self.protocol.get_in_flight_count() if isinstance(self.protocol, MCPProtocol) else 0,
             "last_error": str(self.last_error) if self.last_error else None,
             "server_info": self.server_info,
             "server_capabilities": self.server_capabilities
@@ -0,0 +1,404 @@
+"""
+MCP client pool implementation.
+
+This module runs several replica processes of the same MCP server behind one
+logical server name. Calls are dispatched to the least-loaded healthy replica
+and the pool scales between its minimum and maximum size based on queue depth.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional, Any, AsyncGenerator, Awaitable, Callable
+
+from .client import MCPClient, MCPClientState
+from .config import MCPServerConfig
+from .protocol import MCPTool, MCPResult
+from .exceptions import MCPConnectionError
+
+logger = logging.getLogger(__name__)
+
+
+class MCPClientPool:
+    """
+    Pool of MCP clients connected to replicas of the same server.
+
+    The pool exposes the same interface as MCPClient so the server manager,
+    health monitor and tool discovery can treat it as a single server. Tool
+    discovery runs once on the primary replica and its caches are shared by
+    every other replica, so the registry never sees duplicate tools.
+    """
+
+    def __init__(self, server_config: MCPServerConfig):
+        self.server_config = server_config
+        self.server_name = server_config.name
+
+        # Pool sizing
+        self.initial_size = server_config.pool_size
+        self.min_size = server_config.pool_min_size or server_config.pool_size
+        self.max_size = server_config.pool_max_size or server_config.pool_size
+        self.scale_up_threshold = server_config.pool_scale_up_threshold
+        self.idle_timeout = server_config.pool_idle_timeout
+
+        # Replica management
+        self.replicas: List[MCPClient] = []
+        self._in_flight: Dict[int, int] = {}
+        self._last_used: Dict[int, float] = {}
+        self._scale_lock = asyncio.Lock()
+        self._scale_task: Optional[asyncio.Task] = None
+        self._idle_check_task: Optional[asyncio.Task] = None
+
+        # Catalog change callbacks, handed to whichever replica is primary
+        self.tools_changed_callbacks: List[Callable[[str, List[MCPTool]], Awaitable[None]]] = []
+
+        # Statistics
+        self.scale_ups = 0
+        self.scale_downs = 0
+        self.dispatched_calls = 0
+
+        self.last_error: Optional[Exception] = None
+
+    @property
+    def primary(self) -> Optional[MCPClient]:
+        """The replica that owns tool discovery."""
+        return self.replicas[0] if self.replicas else None
+
+    @property
+    def tools_cache(self) -> Dict[str, MCPTool]:
+        """Tools discovered on the primary replica."""
+        return self.primary.tools_cache if self.primary else {}
+
+    @property
+    def resources_cache(self) -> Dict[str, Any]:
+        """Resources discovered on the primary replica."""
+        return self.primary.resources_cache if self.primary else {}
+
+    @property
+    def prompts_cache(self) -> Dict[str, Any]:
+        """Prompts discovered on the primary replica."""
+        return self.primary.prompts_cache if self.primary else {}
+
+    async def connect(self) -> bool:
+        """
+        Start the initial replicas.
+
+        Returns:
+            bool: True if at least one replica is ready
+        """
+        if self.is_connected() and len(self.replicas) >= self.min_size:
+            return True
+
+        async with self._scale_lock:
+            # The primary must be ready first so the others can share its catalog
+            if not self.primary or not self.primary.is_connected():
+                if self.primary:
+                    await self._stop_replica(self.primary)
+                primary = MCPClient(self.server_config)
+                primary.tools_changed_callbacks = self.tools_changed_callbacks
+                if not await primary.connect():
+                    self.last_error = primary.get_last_error()
+                    return False
+                self.replicas.insert(0, primary)
+                self._track(primary)
+                for replica in self.replicas[1:]:
+                    self._share_caches(replica)
+
+            # Drop replicas that died and start the rest concurrently
+            for replica in [r for r in self.replicas[1:] if not r.is_connected()]:
+                await self._stop_replica(replica)
+
+            missing = self.initial_size - len(self.replicas)
+            if missing > 0:
+                await asyncio.gather(*[self._start_replica() for _ in range(missing)])
+
+        # Surplus replicas must be stopped even when no further calls arrive
+        if self.max_size > self.min_size and (not self._idle_check_task or self._idle_check_task.done()):
+            self._idle_check_task = asyncio.create_task(self._idle_check_loop())
+
+        logger.info(f"MCP server pool '{self.server_name}' ready with {len(self.replicas)} replicas")
+        return True
+
+    async def disconnect(self) -> None:
+        """Stop all replicas."""
+        for task in (self._scale_task, self._idle_check_task):
+            if task and not task.done():
+                task.cancel()
+        self._idle_check_task = None
+
+        async with self._scale_lock:
+            # Stop secondaries first; they share the primary's caches
+            for replica in list(reversed(self.replicas)):
+                await self._stop_replica(replica)
+
+    def is_connected(self) -> bool:
+        """Check if at least one replica is connected and ready."""
+        return any(replica.is_connected() for replica in self.replicas)
+
+    async def _start_replica(self) -> Optional[MCPClient]:
+        """Start one secondary replica sharing the primary's discovery caches."""
+        replica = MCPClient(self.server_config, discover_capabilities=False)
+        if not await replica.connect():
+            self.last_error = replica.get_last_error()
+            logger.warning(f"Failed to start replica for MCP server '{self.server_name}'")
+            return None
+
+        self._share_caches(replica)
+        self.replicas.append(replica)
+        self._track(replica)
+        return replica
+
+    def _share_caches(self, replica: MCPClient) -> None:
+        """Point a secondary replica at the primary's discovery caches."""
+        primary = self.primary
+        if primary and replica is not primary:
+            replica.tools_cache = primary.tools_cache
+            replica.resources_cache = primary.resources_cache
+            replica.prompts_cache = primary.prompts_cache
+
+    async def _stop_replica(self, replica: MCPClient) -> None:
+        """Disconnect a replica and forget it."""
+        # Detach shared caches so disconnect() only clears this replica's own
+        if replica is not self.primary:
+            replica.tools_cache = {}
+            replica.resources_cache = {}
+            replica.prompts_cache = {}
+
+        if replica in self.replicas:
+            self.replicas.remove(replica)
+        self._in_flight.pop(id(replica), None)
+        self._last_used.pop(id(replica), None)
+
+        await replica.disconnect()
+
+    def _track(self, replica: MCPClient) -> None:
+        """Start load tracking for a replica."""
+        self._in_flight[id(replica)] = 0
+        self._last_used[id(replica)] = time.monotonic()
+
+    def _healthy_replicas(self) -> List[MCPClient]:
+        """Get connected replicas."""
+        return [replica for replica in self.replicas if replica.is_connected()]
+
+    def _acquire_replica(self) -> MCPClient:
+        """Pick the least-loaded healthy replica and reserve a slot on it."""
+        healthy = self._healthy_replicas()
+        if not healthy:
+            raise MCPConnectionError(f"No healthy replicas for server '{self.server_name}'")
+
+        replica = min(healthy, key=lambda r: self._in_flight.get(id(r), 0))
+        self._in_flight[id(replica)] = self._in_flight.get(id(replica), 0) + 1
+        self._last_used[id(replica)] = time.monotonic()
+        self.dispatched_calls += 1
+
+        self._maybe_scale(len(healthy))
+        return replica
+
+    def _release_replica(self, replica: MCPClient) -> None:
+        """Release a slot reserved by _acquire_replica."""
+        if id(replica) in self._in_flight:
+            self._in_flight[id(replica)] = max(0, self._in_flight[id(replica)] - 1)
+            self._last_used[id(replica)] = time.monotonic()
+
+    def get_queue_depth(self) -> int:
+        """Get the total number of in-flight calls across all replicas."""
+        return sum(self._in_flight.values())
+
+    def _maybe_scale(self, healthy_count: int) -> None:
+        """Schedule a scale up or scale down based on the current queue depth."""
+        if self._scale_task and not self._scale_task.done():
+            return
+
+        average_depth = self.get_queue_depth() / max(healthy_count, 1)
+        if average_depth >= self.scale_up_threshold and len(self.replicas) < self.max_size:
+            self._scale_task = asyncio.create_task(self._scale_up())
+        elif len(self.replicas) > self.min_size and self._idle_replicas():
+            self._scale_task = asyncio.create_task(self._scale_down())
+
+    def _idle_replicas(self) -> List[MCPClient]:
+        """Get secondary replicas that have been idle longer than idle_timeout."""
+        now = time.monotonic()
+        return [
+            replica for replica in self.replicas[1:]
+            if self._in_flight.get(id(replica), 0) == 0
+            and now - self._last_used.get(id(replica), now) > self.idle_timeout
+        ]
+
+    async def _idle_check_loop(self) -> None:
+        """Periodically scale down idle replicas between calls."""
+        while True:
+            await asyncio.sleep(self.idle_timeout)
+            try:
+                if len(self.replicas) > self.min_size and self._idle_replicas():
+                    await self._scale_down()
+            except Exception as e:
+                logger.warning(f"Idle check failed for MCP server pool '{self.server_name}': {str(e)}")
+
+    async def _scale_up(self) -> None:
+        """Add one replica to the pool."""
+        async with self._scale_lock:
+            if len(self.replicas) >= self.max_size:
+                return
+            if await self._start_replica():
+                self.scale_ups += 1
+                logger.info(
+                    f"Scaled up MCP server pool '{self.server_name}' to {len(self.replicas)} replicas "
+                    f"(queue depth {self.get_queue_depth()})"
+                )
+
+    async def _scale_down(self) -> None:
+        """Stop idle replicas while staying at or above the minimum size."""
+        async with self._scale_lock:
+            for replica in self._idle_replicas():
+                if len(self.replicas) <= self.min_size:
+                    break
+                await self._stop_replica(replica)
+                self.scale_downs += 1
+                logger.info(f"Scaled down MCP server pool '{self.server_name}' to {len(self.replicas)} replicas")
+
+    async def list_tools(self) -> List[MCPTool]:
+        """Get list of available tools from the primary replica."""
+        if not self.primary:
+            raise MCPConnectionError(f"Not connected to server '{self.server_name}'")
+        return await self.primary.list_tools()
+
+    async def get_tool(self, tool_name: str) -> Optional[MCPTool]:
+        """Get a specific tool by name from the primary replica."""
+        if not self.primary:
+            raise MCPConnectionError(f"Not connected to server '{self.server_name}'")
+        return await self.primary.get_tool(tool_name)
+
+    def supports_list_changed(self) -> bool:
+        """Check whether the server pushes notifications/tools/list_changed."""
+        return self.primary.supports_list_changed() if self.primary else False
+
+    def add_tools_changed_callback(
+        self,
+        callback: Callable[[str, List[MCPTool]], Awaitable[None]]
+    ) -> None:
+        """Add a callback invoked with (server_name, tools) when the catalog changes."""
+        self.tools_changed_callbacks.append(callback)
+
+    async def refresh_tools(self) -> bool:
+        """Re-list tools on the primary replica; the others share its catalog."""
+        return await self.primary.refresh_tools() if self.primary else False
+
+    async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> MCPResult:
+        """
+        Call a tool on the least-loaded healthy replica.
+
+        Args:
+            tool_name: Name of the tool to call
+            arguments: Arguments to pass to the tool
+
+        Returns:
+            MCPResult: Result of tool execution
+        """
+        replica = self._acquire_replica()
+        try:
+            return await replica.call_tool(tool_name, arguments)
+        finally:
+            self._release_replica(replica)
+
+    async def call_tool_async(
+        self,
+        tool_name: str,
+        arguments: Dict[str, Any],
+        progress_callback: Optional[Callable] = None,
+        timeout: Optional[float] = None
+    ) -> AsyncGenerator[MCPResult, None]:
+        """
+        Call a tool asynchronously on the least-loaded healthy replica.
+
+        Yields:
+            MCPResult: Progress updates and final result
+        """
+        replica = self._acquire_replica()
+        try:
+            async for result in replica.call_tool_async(
+                tool_name=tool_name,
+                arguments=arguments,
+                progress_callback=progress_callback,
+                timeout=timeout
+            ):
+                yield result
+        finally:
+            self._release_replica(replica)
+
+    async def list_resources(self) -> List[Any]:
+        """Get list of available resources from the primary replica."""
+        if not self.primary:
+            raise MCPConnectionError(f"Not connected to server '{self.server_name}'")
+        return await self.primary.list_resources()
+
+    async def read_resource(self, uri: str) -> Dict[str, Any]:
+        """Read a resource from the least-loaded healthy replica."""
+        replica = self._acquire_replica()
+        try:
+            return await replica.read_resource(uri)
+        finally:
+            self._release_replica(replica)
+
+    async def ping(self) -> bool:
+        """Ping every replica; the pool is responsive if any replica answers."""
+        if not self.replicas:
+            return False
+        results = await asyncio.gather(*[replica.ping() for replica in self.replicas])
+        return any(results)
+
+    async def probe(self, timeout: float = 5.0) -> bool:
+        """Probe every replica's transport; the pool is alive if any replica is."""
+        if not self.replicas:
+            return False
+        results = await asyncio.gather(*[replica.probe(timeout) for replica in self.replicas])
+        return any(results)
+
+    @property
+    def last_activity(self) -> Optional[float]:
+        """Most recent server traffic seen by any replica."""
+        activity = [r.last_activity for r in self.replicas if r.last_activity is not None]
+        return max(activity) if activity else None
+
+    def get_server_info(self) -> Optional[Dict[str, Any]]:
+        """Get server information."""
+        return self.primary.get_server_info() if self.primary else None
+
+    def get_server_capabilities(self) -> Optional[Dict[str, Any]]:
+        """Get server capabilities."""
+        return self.primary.get_server_capabilities() if self.primary else None
+
+    def get_state(self) -> str:
+        """Get pool state: ready if any replica is ready."""
+        if self.is_connected():
+            return MCPClientState.READY
+        if self.last_error:
+            return MCPClientState.ERROR
+        return MCPClientState.DISCONNECTED
+
+    def get_last_error(self) -> Optional[Exception]:
+        """Get last error that occurred."""
+        return self.last_error
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics."""
+        return {
+            "server_name": self.server_name,
+            "state": self.get_state(),
+            "pool_size": len(self.replicas),
+            "healthy_replicas": len(self._healthy_replicas()),
+            "min_size": self.min_size,
+            "max_size": self.max_size,
+            "queue_depth": self.get_queue_depth(),
+            "dispatched_calls": self.dispatched_calls,
+            "scale_ups": self.scale_ups,
+            "scale_downs": self.scale_downs,
+            "cached_tools": len(self.tools_cache),
+            "cached_resources": len(self.resources_cache),
+            "last_error": str(self.last_error) if self.last_error else None,
+            "replicas": [
+                {
+                    "state": replica.get_state(),
+                    "in_flight": self._in_flight.get(id(replica), 0)
+                }
+                for replica in self.replicas
+            ]
+        }
@@ -62,6 +62,13 @@ class MCPServerConfig(BaseModel):
     timeout: int = Field(default=30, ge=1, le=300)
     max_retries: int = Field(default=3, ge=0, le=10)
     retry_delay: float = Field(default=1.0, ge=0.1, le=60.0)
+    max_in_flight: int = Field(default=32, ge=1, le=1024, description="Maximum concurrent requests pipelined on one connection")
+    request_timeout: float = Field(default=300.0, ge=1.0, le=3600.0, description="Default timeout in seconds for a single request")
+    pool_size: int = Field(default=1, ge=1, le=32, description="Number of replica processes started for a stdio server")
+    pool_min_size: Optional[int] = Field(default=None, ge=1, le=32, description="Minimum replicas kept when scaling down (defaults to pool_size)")
+    pool_max_size: Optional[int] = Field(default=None, ge=1, le=32, description="Maximum replicas when scaling up (defaults to pool_size)")
+    pool_scale_up_threshold: int = Field(default=4, ge=1, description="Average in-flight calls per replica that triggers a scale up")
+    pool_idle_timeout: float = Field(default=300.0, ge=1.0, description="Seconds a surplus replica may stay idle before it is stopped")
     security: MCPSecurityConfig = Field(default_factory=MCPSecurityConfig)
     
     @field_validator('command')
@@ -113,6 +120,28 @@ class MCPServerConfig(BaseModel):
                 raise ValueError(f"Invalid environment variable '{key}={value}': {str(e)}")
         return expanded_env
     
+    @field_validator('pool_min_size')
+    @classmethod
+    def validate_pool_min_size(cls, v: Optional[int], info) -> Optional[int]:
+        """Validate that the minimum pool size does not exceed pool_size."""
+        pool_size = info.data.get('pool_size', 1)
+        if v is not None and v > pool_size:
+            raise ValueError(f"pool_min_size ({v}) cannot be greater than pool_size ({pool_size})")
+        return v
+
+    @field_validator('pool_max_size')
+    @classmethod
+    def validate_pool_max_size(cls, v: Optional[int], info) -> Optional[int]:
+        """Validate that the maximum pool size is not below pool_size."""
+        pool_size = info.data.get('pool_size', 1)
+        if v is not None and v < pool_size:
+            raise ValueError(f"pool_max_size ({v}) cannot be less than pool_size ({pool_size})")
+        return v
+
+    def is_pooled(self) -> bool:
+        """Check whether this server should run as a pool of replicas."""
+        return max(self.pool_size, self.pool_max_size or 0) > 1
+
     @field_validator('working_directory')
     @classmethod
     def validate_working_directory(cls, v: Optional[str]) -> Optional[str]:
@@ -134,6 +163,7 @@ class MCPGlobalConfig(BaseModel):
     log_level: str = Field(default="INFO")
     cache_ttl: int = Field(default=300, ge=0)  # 5 minutes
     health_check_interval: int = Field(default=30, ge=10)  # 30 seconds
+    tool_poll_interval: int = Field(default=300, ge=30)  # Re-list tools of servers without listChanged
     
     @field_validator('log_level')
     @classmethod
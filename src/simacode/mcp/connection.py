@@ -161,6 +161,14 @@ class StdioTransport(MCPTransport):
             return False
             
         return True
+    
+    async def probe(self, timeout: float = 5.0) -> bool:
+        """Check that the server process is alive and its stdin still accepts writes."""
+        if not self.is_connected():
+            return False
+        
+        stdin = self.process.stdin
+        return stdin is not None and not stdin.is_closing()
 
 
 class WebSocketTransport(MCPTransport):
@@ -346,6 +354,26 @@ class WebSocketTransport(MCPTransport):
         else:
             # Fallback
             return True
+    
+    async def probe(self, timeout: float = 5.0) -> bool:
+        """Send a WebSocket ping frame and wait for the pong."""
+        if not self.is_connected():
+            return False
+        
+        # A server we spawned must also still be running
+        if self.process and self.process.returncode is not None:
+            return False
+        
+        try:
+            pong_waiter = await self.websocket.ping()
+            await asyncio.wait_for(pong_waiter, timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            logger.debug(f"WebSocket ping to {self.url} timed out after {timeout}s")
+            return False
+        except Exception as e:
+            logger.debug(f"WebSocket ping to {self.url} failed: {str(e)}")
+            return False
 
 
 class MCPConnection:
@@ -149,6 +149,19 @@ class MCPToolDiscovery:
             finally:
                 self.discovery_in_progress.discard(server_name)
     
+    async def update_server_tools(self, server_name: str, tools: List[MCPTool]) -> None:
+        """
+        Replace a server's indexed tools with a catalog pushed by the server.
+        
+        Args:
+            server_name: Name of the MCP server
+            tools: The server's current tools
+        """
+        lock = self.discovery_locks.setdefault(server_name, asyncio.Lock())
+        async with lock:
+            await self._update_tools_index(server_name, tools)
+            self.last_discovery[server_name] = time.time()
+    
     async def discover_all_tools(self, server_manager) -> Dict[str, List[MCPTool]]:
         """
         Discover tools from all connected MCP servers.
@@ -11,8 +11,6 @@ from typing import Dict, List, Optional, Set, Any, Callable, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from enum import Enum
-import hashlib
-import json
 
 from .server_manager import MCPServerManager
 from .tool_registry import MCPToolRegistry
@@ -105,6 +103,7 @@ class UpdatePolicy:
     # Monitoring
     health_check_after_update: bool = True
     verify_tool_functionality: bool = True
+    monitor_interval: int = 30  # seconds between health checks and batch flushes
     
     # Rate limiting
     max_updates_per_minute: int = 30
@@ -197,6 +196,9 @@ class DynamicUpdateManager:
                 )
                 self.update_workers.append(worker)
             
+            # Tool changes are pushed by the server manager
+            self.server_manager.add_tools_changed_listener(self._on_server_tools_changed)
+            
             # Start monitoring task
             self.monitor_task = asyncio.create_task(
                 self._monitoring_loop(),
@@ -219,6 +221,8 @@ class DynamicUpdateManager:
         
         self.is_running = False
         
+        self.server_manager.remove_tools_changed_listener(self._on_server_tools_changed)
+        
         # Cancel monitoring task
         if self.monitor_task:
             self.monitor_task.cancel()
@@ -248,18 +252,19 @@ class DynamicUpdateManager:
             
             for server_name, tools in all_tools.items():
                 # Create server snapshot
+                health = self.server_manager.get_server_health(server_name)
                 server_snapshot = {
                     "tools": {tool.name: self._create_tool_snapshot(tool) for tool in tools},
                     "timestamp": datetime.now().isoformat(),
-                    "health": self.server_manager.get_server_health(server_name)
+                    "health": health,
+                    "health_status": health.status if health else None
                 }
                 self.server_snapshots[server_name] = server_snapshot
                 
                 # Track tool versions
                 for tool in tools:
                     full_name = self._get_tool_full_name(server_name, tool.name)
-                    version_hash = self._calculate_tool_version(tool)
-                    self.tool_versions[full_name] = version_hash
+                    self.tool_versions[full_name] = tool.signature
             
             logger.info(f"Initialized version tracking for {len(self.tool_versions)} tools")
             
@@ -335,6 +340,8 @@ class DynamicUpdateManager:
             for tool_name, tool in current_tool_map.items():
                 if tool_name in old_tools:
                     old_version = old_tools[tool_name]
+                    if old_version.get("version_hash") == tool.signature:
+                        continue
                     new_version = self._create_tool_snapshot(tool)
                     
                     changes = self._detect_tool_changes(old_version, new_version)
@@ -353,34 +360,57 @@ class DynamicUpdateManager:
                         updates.append(update)
             
             # Check for health changes
-            current_health = self.server_manager.get_server_health(server_name)
-            old_health = old_snapshot.get("health")
-            
-            if old_health and current_health:
-                if current_health.status != old_health.status:
-                    for tool_name in current_tool_map:
-                        update = ToolUpdate(
-                            update_type=UpdateType.HEALTH_CHANGE,
-                            tool_name=tool_name,
-                            server_name=server_name,
-                            changes=[f"Server health: {old_health.status.value} -> {current_health.status.value}"],
-                            priority=UpdatePriority.HIGH if current_health.status == HealthStatus.FAILED else UpdatePriority.NORMAL,
-                            metadata={"old_health": old_health.status.value, "new_health": current_health.status.value}
-                        )
-                        updates.append(update)
+            updates.extend(self._check_health_updates(server_name, list(current_tool_map)))
             
             # Update snapshot
+            health = self.server_manager.get_server_health(server_name)
             self.server_snapshots[server_name] = {
                 "tools": {tool.name: self._create_tool_snapshot(tool) for tool in current_tools},
                 "timestamp": datetime.now().isoformat(),
-                "health": current_health
+                "health": health,
+                "health_status": health.status if health else None
             }
             
+            # Track tool versions
+            for tool in current_tools:
+                self.tool_versions[self._get_tool_full_name(server_name, tool.name)] = tool.signature
+            for tool_name in set(old_tools) - set(current_tool_map):
+                self.tool_versions.pop(self._get_tool_full_name(server_name, tool_name), None)
+            
         except Exception as e:
             logger.error(f"Failed to check updates for server '{server_name}': {str(e)}")
         
         return updates
     
+    def _check_health_updates(self, server_name: str, tool_names: List[str]) -> List[ToolUpdate]:
+        """Detect a server health change against the last snapshot."""
+        updates = []
+        snapshot = self.server_snapshots.get(server_name)
+        if snapshot is None:
+            return updates
+        
+        current_health = self.server_manager.get_server_health(server_name)
+        # HealthMetrics is updated in place, so compare against the recorded status
+        old_status = snapshot.get("health_status")
+        if old_status is None and snapshot.get("health"):
+            old_status = snapshot["health"].status
+        
+        if old_status and current_health and current_health.status != old_status:
+            for tool_name in tool_names:
+                update = ToolUpdate(
+                    update_type=UpdateType.HEALTH_CHANGE,
+                    tool_name=tool_name,
+                    server_name=server_name,
+                    changes=[f"Server health: {old_status.value} -> {current_health.status.value}"],
+                    priority=UpdatePriority.HIGH if current_health.status == HealthStatus.FAILED else UpdatePriority.NORMAL,
+                    metadata={"old_health": old_status.value, "new_health": current_health.status.value}
+                )
+                updates.append(update)
+        
+        snapshot["health"] = current_health
+        snapshot["health_status"] = current_health.status if current_health else None
+        return updates
+    
     def _create_tool_snapshot(self, tool: MCPTool) -> Dict[str, Any]:
         """Create a snapshot of a tool's current state."""
         return {
@@ -388,20 +418,13 @@ class DynamicUpdateManager:
             "description": tool.description,
             "server_name": tool.server_name,
             "input_schema": tool.input_schema,
-            "version_hash": self._calculate_tool_version(tool),
+            "version_hash": tool.signature,
             "timestamp": datetime.now().isoformat()
         }
     
     def _calculate_tool_version(self, tool: MCPTool) -> str:
         """Calculate a version hash for a tool."""
-        version_data = {
-            "name": tool.name,
-            "description": tool.description,
-            "input_schema": tool.input_schema
-        }
-        
-        version_str = json.dumps(version_data, sort_keys=True)
-        return hashlib.sha256(version_str.encode()).hexdigest()[:16]
+        return tool.signature
     
     def _detect_tool_changes(
         self,
@@ -518,25 +541,45 @@ class DynamicUpdateManager:
         self.update_timestamps.append(now)
         return True
     
+    async def _on_server_tools_changed(self, server_name: str, tools: List[MCPTool]) -> None:
+        """Queue updates for a catalog change pushed by the server manager."""
+        if not self.is_running:
+            return
+        
+        try:
+            updates = await self._check_server_updates(server_name, tools)
+            for update in updates:
+                await self.queue_update(update)
+            
+            # Don't hold batched updates until the next monitor tick
+            if updates and self.policy.batch_updates:
+                await self._process_batched_updates()
+        except Exception as e:
+            logger.error(f"Failed to handle tool changes from server '{server_name}': {str(e)}")
+    
     async def _monitoring_loop(self) -> None:
-        """Main monitoring loop for detecting updates."""
+        """
+        Monitor server health and flush batched updates.
+        
+        Tool additions, removals and modifications arrive through
+        _on_server_tools_changed; this loop only compares locally tracked
+        health and never re-lists tools.
+        """
         logger.info("Starting update monitoring loop")
         
         while self.is_running:
             try:
-                # Check for updates
-                updates = await self.check_for_updates()
-                
-                # Queue detected updates
-                for update in updates:
-                    await self.queue_update(update)
+                # Check for health changes
+                for server_name, snapshot in list(self.server_snapshots.items()):
+                    for update in self._check_health_updates(server_name, list(snapshot.get("tools", {}))):
+                        await self.queue_update(update)
                 
                 # Process batched updates
                 if self.policy.batch_updates:
                     await self._process_batched_updates()
                 
                 # Wait before next check
-                await asyncio.sleep(30)  # Check every 30 seconds
+                await asyncio.sleep(self.policy.monitor_interval)
                 
             except asyncio.CancelledError:
                 break
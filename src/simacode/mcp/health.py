@@ -45,6 +45,7 @@ class HealthMetrics:
     total_checks: int = 0
     successful_checks: int = 0
     failed_checks: int = 0
+    passive_checks: int = 0
     average_response_time: float = 0.0
     last_error: Optional[str] = None
     last_error_time: Optional[datetime] = None
@@ -89,6 +90,11 @@ class HealthMetrics:
         # Determine health status
         self.status = self._calculate_status()
     
+    def record_passive_check(self) -> None:
+        """Count recent client traffic as a successful check without probing."""
+        self.passive_checks += 1
+        self.update_check_result(True, self.response_time)
+    
     def record_recovery_attempt(self, success: bool) -> None:
         """Record a recovery attempt."""
         self.recovery_attempts += 1
@@ -130,6 +136,7 @@ class HealthMetrics:
             "total_checks": self.total_checks,
             "successful_checks": self.successful_checks,
             "failed_checks": self.failed_checks,
+            "passive_checks": self.passive_checks,
             "average_response_time": round(self.average_response_time, 4),
             "last_error": self.last_error,
             "last_error_time": self.last_error_time.isoformat() if self.last_error_time else None,
@@ -147,10 +154,24 @@ class MCPHealthMonitor:
     capabilities for MCP servers.
     """
     
-    def __init__(self, check_interval: int = 30, recovery_enabled: bool = True):
+    def __init__(
+        self,
+        check_interval: int = 30,
+        recovery_enabled: bool = True,
+        min_check_interval: Optional[float] = None,
+        max_check_interval: Optional[float] = None,
+        probe_timeout: float = 5.0
+    ):
         self.check_interval = check_interval
         self.recovery_enabled = recovery_enabled
         
+        # Adaptive check intervals: back off while healthy, tighten after failures
+        self.min_check_interval = min_check_interval if min_check_interval is not None else min(5.0, check_interval)
+        self.max_check_interval = max_check_interval if max_check_interval is not None else check_interval * 8
+        self.interval_backoff_factor = 1.5
+        self.probe_timeout = probe_timeout
+        self.check_intervals: Dict[str, float] = {}
+        
         # Health tracking
         self.health_metrics: Dict[str, HealthMetrics] = {}
         self.monitoring_tasks: Dict[str, asyncio.Task] = {}
@@ -222,6 +243,7 @@ class MCPHealthMonitor:
         
         # Initialize health metrics
         self.health_metrics[server_name] = HealthMetrics(server_name)
+        self.check_intervals[server_name] = self.check_interval
         
         # Start monitoring task for this server
         task = asyncio.create_task(
@@ -252,6 +274,7 @@ class MCPHealthMonitor:
         # Remove metrics
         if server_name in self.health_metrics:
             del self.health_metrics[server_name]
+        self.check_intervals.pop(server_name, None)
         
         # Clear alert history
         if server_name in self.alert_history:
@@ -296,7 +319,7 @@ class MCPHealthMonitor:
                 try:
                     await asyncio.wait_for(
                         self.shutdown_event.wait(),
-                        timeout=self.check_interval
+                        timeout=self.check_intervals.get(server_name, self.check_interval)
                     )
                 except asyncio.TimeoutError:
                     continue  # Normal timeout, continue loop
@@ -308,33 +331,32 @@ class MCPHealthMonitor:
                 await asyncio.sleep(5)  # Wait before retrying
     
     async def _perform_health_check(self, server_name: str, client: MCPClient) -> None:
-        """Perform a health check on a server."""
+        """
+        Perform a health check on a server.
+        
+        Uses the transport's lightweight probe instead of an MCP round-trip, and
+        skips probing entirely when the client received server traffic within
+        the server's current check interval.
+        """
         metrics = self.health_metrics[server_name]
         
+        if self._has_recent_activity(server_name, client):
+            old_status = metrics.status
+            metrics.record_passive_check()
+            self._adjust_check_interval(server_name, metrics)
+            if metrics.status != old_status:
+                await self._handle_status_change(server_name, old_status, metrics.status, client)
+            return
+        
         start_time = time.time()
         success = False
         error_message = None
         
         try:
             if client.is_connected():
-                # Try to ping the server, but fall back to connection check if ping fails
-                try:
-                    success = await asyncio.wait_for(client.ping(), timeout=60.0)
-                    if not success:
-                        # Ping returned False, try alternative health check
-                        tools = await asyncio.wait_for(client.list_tools(), timeout=60.0)
-                        success = True  # If we can list tools, server is healthy
-                except asyncio.TimeoutError:
-                    error_message = "Health check timeout"
-                except Exception as ping_error:
-                    # If ping fails, use tool list as health check for servers that don't support ping
-                    logger.debug(f"Ping failed for '{server_name}': {str(ping_error)}, trying list_tools as fallback")
-                    try:
-                        tools = await asyncio.wait_for(client.list_tools(), timeout=60.0)
-                        success = True  # If we can list tools, server is healthy
-                    except Exception as tools_error:
-                        logger.debug(f"List tools also failed for '{server_name}': {str(tools_error)}, but client reports connected")
-                        success = True  # Still consider connected if client says it's connected
+                success = bool(await asyncio.wait_for(client.probe(self.probe_timeout), timeout=self.probe_timeout))
+                if not success:
+                    error_message = f"Transport probe failed (client_state: {client.get_state()})"
             else:
                 last_error = client.get_last_error()
                 state = client.get_state()
@@ -362,6 +384,7 @@ class MCPHealthMonitor:
         # Update metrics
         old_status = metrics.status
         metrics.update_check_result(success, response_time, error_message)
+        self._adjust_check_interval(server_name, metrics)
         
         # Log health check result
         if success:
@@ -377,6 +400,28 @@ class MCPHealthMonitor:
         # Trigger alerts if needed
         await self._check_alert_conditions(server_name, metrics)
     
+    def _has_recent_activity(self, server_name: str, client: MCPClient) -> bool:
+        """Check whether real traffic within the current interval already proved the server responsive."""
+        last_activity = getattr(client, "last_activity", None)
+        if not isinstance(last_activity, (int, float)) or not client.is_connected():
+            return False
+        
+        interval = self.check_intervals.get(server_name, self.check_interval)
+        return time.monotonic() - last_activity < interval
+    
+    def _adjust_check_interval(self, server_name: str, metrics: HealthMetrics) -> None:
+        """Back off while a server stays healthy and check again soon after a failure."""
+        current = self.check_intervals.get(server_name, self.check_interval)
+        
+        if metrics.consecutive_failures > 0:
+            interval = self.min_check_interval
+        elif metrics.status == HealthStatus.HEALTHY:
+            interval = min(max(current, self.check_interval) * self.interval_backoff_factor, self.max_check_interval)
+        else:
+            interval = self.check_interval
+        
+        self.check_intervals[server_name] = interval
+    
     async def _handle_status_change(self, server_name: str, old_status: HealthStatus, 
                                    new_status: HealthStatus, client: MCPClient) -> None:
         """Handle server status changes."""
@@ -537,6 +582,8 @@ class MCPHealthMonitor:
             "total_servers": total_servers,
             "active_monitors": len(self.monitoring_tasks),
             "check_interval": self.check_interval,
+            "check_intervals": {name: round(interval, 2) for name, interval in self.check_intervals.items()},
+            "passive_checks": sum(metrics.passive_checks for metrics in self.health_metrics.values()),
             "recovery_enabled": self.recovery_enabled,
             "status_distribution": status_counts,
             "alert_callbacks_count": len(self.alert_callbacks),
@@ -186,6 +186,7 @@ class SimaCodeToolRegistry:
             # Set up callbacks for cache management
             self.mcp_tool_registry.add_registration_callback(self._on_mcp_tool_registered)
             self.mcp_tool_registry.add_unregistration_callback(self._on_mcp_tool_unregistered)
+            self.mcp_tool_registry.add_update_callback(self._on_mcp_tool_updated)
             
             # Start MCP tool registry
             await self.mcp_tool_registry.start()
@@ -496,6 +497,11 @@ class SimaCodeToolRegistry:
         self._invalidate_cache()
         logger.debug(f"MCP tool unregistered: {tool_name}")
     
+    def _on_mcp_tool_updated(self, tool_name: str, tool: MCPToolWrapper) -> None:
+        """Callback for when an MCP tool is updated."""
+        self._invalidate_cache()
+        logger.debug(f"MCP tool updated: {tool_name}")
+    
     def _invalidate_cache(self) -> None:
         """Mark the tool cache as dirty."""
         self._cache_dirty = True
@@ -0,0 +1,416 @@
+"""
+Durable job queue for MCPAsyncTaskManager.
+
+Jobs are stored in a SQLite database so queued and running async tasks
+survive process restarts, and several worker processes can pull from the
+same queue. A worker claims a job by taking a time-limited lease and keeps
+renewing it while the job runs; a job whose lease expires (the worker
+crashed or was killed) is handed to the next worker that asks for work,
+until it runs out of attempts. Progress events are appended to a per-job
+log so status and progress can be read from any process.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Job states stored in the database (values match TaskStatus)
+PENDING = "pending"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+FINISHED_STATES = (COMPLETED, FAILED, CANCELLED)
+
+
+def default_worker_id() -> str:
+    """Identify this worker process (host, pid and a random suffix)."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class SQLiteJobStore:
+    """
+    Job queue backed by a SQLite database.
+
+    Claims run inside ``BEGIN IMMEDIATE`` transactions, so concurrent workers
+    in different processes never lease the same job. Database access runs in
+    a worker thread to keep the event loop responsive. The database file is
+    created on first write.
+    """
+
+    SCHEMA_VERSION = 1
+
+    def __init__(self, db_path: Path, progress_history: int = 500):
+        """
+        Args:
+            db_path: SQLite database path
+            progress_history: Progress events kept per job (older ones are trimmed)
+        """
+        self.db_path = Path(db_path).expanduser()
+        self.progress_history = progress_history
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _get_connection(self, create: bool) -> Optional[sqlite3.Connection]:
+        """Open the database, creating it only if `create` is True."""
+        if self._conn is not None:
+            return self._conn
+        if not create and not self.db_path.exists():
+            return None
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode; multi-statement changes use explicit transactions
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        self._migrate_schema(conn)
+        self._conn = conn
+        return conn
+
+    def _migrate_schema(self, conn: sqlite3.Connection) -> None:
+        """Create or upgrade the database schema."""
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+
+        if version < 1:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    task_type TEXT NOT NULL,
+                    request TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    max_attempts INTEGER NOT NULL DEFAULT 1,
+                    lease_owner TEXT,
+                    lease_expires_at REAL,
+                    created_at REAL NOT NULL,
+                    started_at REAL,
+                    completed_at REAL,
+                    result TEXT,
+                    error TEXT,
+                    metadata TEXT NOT NULL DEFAULT '{}'
+                );
+                CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, created_at);
+                CREATE TABLE IF NOT EXISTS job_progress (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_id TEXT NOT NULL,
+                    data TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_job_progress_job ON job_progress (job_id, seq);
+                """
+            )
+
+        conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+    @staticmethod
+    def _dumps(value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row) -> Dict[str, Any]:
+        job = dict(row)
+        job["request"] = json.loads(job["request"])
+        job["result"] = json.loads(job["result"]) if job["result"] is not None else None
+        job["metadata"] = json.loads(job["metadata"])
+        return job
+
+    def _append_progress_locked(self, conn: sqlite3.Connection, job_id: str, data: Dict[str, Any]) -> int:
+        """Append a progress event and trim the job's log; caller holds the lock."""
+        seq = conn.execute(
+            "INSERT INTO job_progress (job_id, data) VALUES (?, ?)", (job_id, self._dumps(data))
+        ).lastrowid
+        if self.progress_history and seq % 50 == 0:
+            conn.execute(
+                "DELETE FROM job_progress WHERE job_id = ? AND seq <= ("
+                "SELECT seq FROM job_progress WHERE job_id = ? ORDER BY seq DESC LIMIT 1 OFFSET ?)",
+                (job_id, job_id, self.progress_history)
+            )
+        return seq
+
+    # Synchronous implementations (run in a worker thread)
+
+    def _enqueue_sync(self, job: Dict[str, Any]) -> None:
+        with self._lock:
+            conn = self._get_connection(create=True)
+            conn.execute(
+                "INSERT INTO jobs (job_id, task_type, request, status, max_attempts, created_at, metadata) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job["job_id"], job["task_type"], self._dumps(job["request"]), PENDING,
+                    job.get("max_attempts", 1), job.get("created_at", time.time()),
+                    self._dumps(job.get("metadata", {}))
+                )
+            )
+
+    def _claim_sync(self, worker_id: str, lease_seconds: float) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            conn = self._get_connection(create=False)
+            if conn is None:
+                return None
+
+            now = time.time()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                while True:
+                    row = conn.execute(
+                        "SELECT * FROM jobs WHERE status = ? OR (status = ? AND lease_expires_at < ?) "
+                        "ORDER BY created_at LIMIT 1",
+                        (PENDING, RUNNING, now)
+                    ).fetchone()
+                    if row is None:
+                        conn.execute("COMMIT")
+                        return None
+
+                    if row["attempts"] >= row["max_attempts"]:
+                        # Abandoned by a worker on its last attempt
+                        error = f"Worker lease expired after {row['attempts']} attempt(s)"
+                        conn.execute(
+                            "UPDATE jobs SET status = ?, error = ?, completed_at = ?, lease_owner = NULL "
+                            "WHERE job_id = ?",
+                            (FAILED, error, now, row["job_id"])
+                        )
+                        self._append_progress_locked(
+                            conn, row["job_id"], {"type": "error", "error": error, "timestamp": now}
+                        )
+                        continue
+
+                    conn.execute(
+                        "UPDATE jobs SET status = ?, lease_owner = ?, lease_expires_at = ?, "
+                        "attempts = attempts + 1, started_at = ? WHERE job_id = ?",
+                        (RUNNING, worker_id, now + lease_seconds, now, row["job_id"])
+                    )
+                    claimed = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (row["job_id"],)).fetchone()
+                    conn.execute("COMMIT")
+                    return self._row_to_job(claimed)
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def _renew_lease_sync(self, job_id: str, worker_id: str, lease_seconds: float) -> Optional[str]:
+        with self._lock:
+            conn = self._get_connection(create=True)
+            cursor = conn.execute(
+                "UPDATE jobs SET lease_expires_at = ? WHERE job_id = ? AND lease_owner = ? AND status = ?",
+                (time.time() + lease_seconds, job_id, worker_id, RUNNING)
+            )
+            if cursor.rowcount:
+                return RUNNING
+            row = conn.execute(
+                "SELECT status, lease_owner FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            if row is None or row["lease_owner"] != worker_id:
+                return None
+            return row["status"]
+
+    def _finish_sync(
+        self,
+        job_id: str,
+        worker_id: str,
+        status: str,
+        result: Any,
+        error: Optional[str],
+        metadata: Optional[Dict[str, Any]],
+        progress: Optional[Dict[str, Any]]
+    ) -> bool:
+        with self._lock:
+            conn = self._get_connection(create=True)
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = conn.execute(
+                    "UPDATE jobs SET status = ?, result = ?, error = ?, completed_at = ?, lease_owner = NULL, "
+                    "metadata = COALESCE(?, metadata) WHERE job_id = ? AND lease_owner = ? AND status = ?",
+                    (
+                        status, self._dumps(result) if result is not None else None, error, time.time(),
+                        self._dumps(metadata) if metadata is not None else None, job_id, worker_id, RUNNING
+                    )
+                )
+                finished = cursor.rowcount > 0
+                if finished and progress is not None:
+                    self._append_progress_locked(conn, job_id, progress)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            return finished
+
+    def _retry_sync(self, job_id: str, worker_id: str, error: str) -> bool:
+        with self._lock:
+            conn = self._get_connection(create=True)
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, lease_owner = NULL, lease_expires_at = NULL "
+                "WHERE job_id = ? AND lease_owner = ? AND status = ? AND attempts < max_attempts",
+                (PENDING, error, job_id, worker_id, RUNNING)
+            )
+            return cursor.rowcount > 0
+
+    def _release_sync(self, job_id: str, worker_id: str) -> bool:
+        with self._lock:
+            conn = self._get_connection(create=True)
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, attempts = MAX(attempts - 1, 0), lease_owner = NULL, "
+                "lease_expires_at = NULL WHERE job_id = ? AND lease_owner = ? AND status = ?",
+                (PENDING, job_id, worker_id, RUNNING)
+            )
+            return cursor.rowcount > 0
+
+    def _cancel_sync(self, job_id: str, progress: Optional[Dict[str, Any]]) -> bool:
+        with self._lock:
+            conn = self._get_connection(create=False)
+            if conn is None:
+                return False
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = conn.execute(
+                    "UPDATE jobs SET status = ?, completed_at = ? WHERE job_id = ? AND status IN (?, ?)",
+                    (CANCELLED, time.time(), job_id, PENDING, RUNNING)
+                )
+                cancelled = cursor.rowcount > 0
+                if cancelled and progress is not None:
+                    self._append_progress_locked(conn, job_id, progress)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            return cancelled
+
+    def _get_sync(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            conn = self._get_connection(create=False)
+            if conn is None:
+                return None
+            row = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            return self._row_to_job(row) if row else None
+
+    def _append_progress_sync(self, job_id: str, data: Dict[str, Any]) -> int:
+        with self._lock:
+            return self._append_progress_locked(self._get_connection(create=True), job_id, data)
+
+    def _get_progress_sync(self, job_id: str, after_seq: int) -> List[Tuple[int, Dict[str, Any]]]:
+        with self._lock:
+            conn = self._get_connection(create=False)
+            if conn is None:
+                return []
+            rows = conn.execute(
+                "SELECT seq, data FROM job_progress WHERE job_id = ? AND seq > ? ORDER BY seq",
+                (job_id, after_seq)
+            ).fetchall()
+            return [(row["seq"], json.loads(row["data"])) for row in rows]
+
+    def count_by_status(self) -> Dict[str, int]:
+        """Count jobs per status (a single indexed query, safe to call from sync code)."""
+        with self._lock:
+            conn = self._get_connection(create=False)
+            if conn is None:
+                return {}
+            rows = conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+            return {status: count for status, count in rows}
+
+    def _purge_sync(self, older_than: float) -> int:
+        with self._lock:
+            conn = self._get_connection(create=False)
+            if conn is None:
+                return 0
+            placeholders = ",".join("?" * len(FINISHED_STATES))
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    f"DELETE FROM job_progress WHERE job_id IN (SELECT job_id FROM jobs "
+                    f"WHERE status IN ({placeholders}) AND completed_at < ?)",
+                    (*FINISHED_STATES, older_than)
+                )
+                cursor = conn.execute(
+                    f"DELETE FROM jobs WHERE status IN ({placeholders}) AND completed_at < ?",
+                    (*FINISHED_STATES, older_than)
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            return cursor.rowcount
+
+    # Async API
+
+    async def enqueue(self, job: Dict[str, Any]) -> None:
+        """Add a pending job (job_id, task_type, request, max_attempts, metadata)."""
+        await asyncio.to_thread(self._enqueue_sync, job)
+
+    async def claim(self, worker_id: str, lease_seconds: float) -> Optional[Dict[str, Any]]:
+        """Lease the oldest pending job, or a running job whose lease expired."""
+        return await asyncio.to_thread(self._claim_sync, worker_id, lease_seconds)
+
+    async def renew_lease(self, job_id: str, worker_id: str, lease_seconds: float) -> Optional[str]:
+        """
+        Extend a job's lease.
+
+        Returns:
+            The job's status (e.g. "cancelled" if cancelled elsewhere), or None
+            if the worker no longer holds the lease
+        """
+        return await asyncio.to_thread(self._renew_lease_sync, job_id, worker_id, lease_seconds)
+
+    async def finish(
+        self,
+        job_id: str,
+        worker_id: str,
+        status: str,
+        result: Any = None,
+        error: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        progress: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Record the outcome of a job; ignored unless the worker holds its lease.
+
+        The final progress event, if given, is appended in the same transaction
+        so readers never see a finished job without it.
+        """
+        return await asyncio.to_thread(
+            self._finish_sync, job_id, worker_id, status, result, error, metadata, progress
+        )
+
+    async def retry(self, job_id: str, worker_id: str, error: str) -> bool:
+        """Put a failed job back in the queue if it has attempts left."""
+        return await asyncio.to_thread(self._retry_sync, job_id, worker_id, error)
+
+    async def release(self, job_id: str, worker_id: str) -> bool:
+        """Give a job back to the queue without using up an attempt (graceful shutdown)."""
+        return await asyncio.to_thread(self._release_sync, job_id, worker_id)
+
+    async def cancel(self, job_id: str, progress: Optional[Dict[str, Any]] = None) -> bool:
+        """Cancel a pending or running job, appending `progress` atomically if given."""
+        return await asyncio.to_thread(self._cancel_sync, job_id, progress)
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a job by ID."""
+        return await asyncio.to_thread(self._get_sync, job_id)
+
+    async def append_progress(self, job_id: str, data: Dict[str, Any]) -> int:
+        """Append a progress event to a job's log and return its sequence number."""
+        return await asyncio.to_thread(self._append_progress_sync, job_id, data)
+
+    async def get_progress(self, job_id: str, after_seq: int = 0) -> List[Tuple[int, Dict[str, Any]]]:
+        """Get a job's progress events with sequence numbers greater than `after_seq`."""
+        return await asyncio.to_thread(self._get_progress_sync, job_id, after_seq)
+
+    async def purge(self, older_than: float) -> int:
+        """Delete finished jobs completed before the given timestamp."""
+        return await asyncio.to_thread(self._purge_sync, older_than)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -6,12 +6,15 @@ protocol handling, and communication patterns.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
+import time
 import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union, AsyncGenerator, Callable
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Set, Union, AsyncGenerator, Callable
 
 from .exceptions import MCPProtocolError
 
@@ -119,6 +122,22 @@ class MCPTool:
             "input_schema": self.input_schema
         }
 
+    @cached_property
+    def signature(self) -> str:
+        """
+        Hash of the tool's name, description and input schema.
+
+        Computed once per discovered tool object, so every subsystem that
+        compares catalogs shares the same value instead of re-hashing.
+        """
+        signature_data = {
+            "name": self.name,
+            "description": self.description,
+            "input_schema": self.input_schema
+        }
+        signature_str = json.dumps(signature_data, sort_keys=True, default=str)
+        return hashlib.sha256(signature_str.encode()).hexdigest()[:16]
+
 
 @dataclass 
 class MCPResource:
@@ -199,6 +218,22 @@ class MCPTransport(ABC):
     def is_connected(self) -> bool:
         """Check if transport is connected."""
         pass
+    
+    async def probe(self, timeout: float = 5.0) -> bool:
+        """
+        Cheap liveness check that does not go through the MCP protocol.
+        
+        Transports override this with a check that suits them (process
+        liveness, WebSocket ping frames, ...). The default only reports
+        whether the transport considers itself connected.
+        
+        Args:
+            timeout: Maximum time to wait for the probe
+            
+        Returns:
+            bool: True if the server looks alive
+        """
+        return self.is_connected()
 
     def _prepare_environment(self) -> Dict[str, str]:
         """
@@ -222,19 +257,44 @@ class MCPProtocol:
     MCP protocol handler implementing JSON-RPC 2.0 over various transports.
     """
     
-    def __init__(self, transport: MCPTransport):
+    DEFAULT_MAX_IN_FLIGHT = 32
+    DEFAULT_REQUEST_TIMEOUT = 300.0
+
+    def __init__(
+        self,
+        transport: MCPTransport,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        request_timeout: float = DEFAULT_REQUEST_TIMEOUT
+    ):
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+
         self.transport = transport
         self._request_id_counter = 0
         self._pending_requests: Dict[str, asyncio.Future] = {}
         self._receive_task: Optional[asyncio.Task] = None
+        # Only guards receiver startup and the write of a request; responses are
+        # matched by id in _message_receiver_loop so many calls can be in flight.
         self._protocol_lock = asyncio.Lock()
         self._loop: Optional[asyncio.AbstractEventLoop] = None
 
+        # Request multiplexing limits
+        self.max_in_flight = max_in_flight
+        self.request_timeout = request_timeout
+        self._in_flight_semaphore = asyncio.Semaphore(max_in_flight)
+
         # 新增：异步任务和进度回传支持
         self._long_running_tasks: Dict[str, asyncio.Task] = {}
         self._progress_callbacks: Dict[str, List[Callable]] = {}
         self._async_response_queues: Dict[str, asyncio.Queue] = {}
         self._server_capabilities: Optional[Dict[str, Any]] = None
+
+        # Server-pushed notification handlers (e.g. notifications/tools/list_changed)
+        self._notification_handlers: Dict[str, List[Callable]] = {}
+        self._notification_tasks: Set[asyncio.Task] = set()
+        
+        # Monotonic time of the last message received from the server
+        self.last_activity: Optional[float] = None
         
     async def send_message(self, message: MCPMessage) -> None:
         """Send MCP message through transport."""
@@ -253,13 +313,23 @@ class MCPProtocol:
         json_str = data.decode('utf-8')
         return MCPMessage.from_json(json_str)
     
-    async def call_method(self, method: str, params: Optional[Dict[str, Any]] = None) -> Any:
+    async def call_method(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None
+    ) -> Any:
         """
         Call MCP method and wait for response.
+
+        Requests are pipelined: the protocol lock is only held while the request
+        is written, so up to ``max_in_flight`` calls can await their responses
+        concurrently on the same connection.
         
         Args:
             method: Method name to call
             params: Method parameters
+            timeout: Per-call timeout in seconds (defaults to ``request_timeout``)
             
         Returns:
             Method result
@@ -267,43 +337,32 @@ class MCPProtocol:
         Raises:
             MCPProtocolError: If method call fails
         """
-        async with self._protocol_lock:
-            # Initialize loop reference on first call
-            current_loop = asyncio.get_running_loop()
-            if self._loop is None:
-                self._loop = current_loop
-            elif self._loop != current_loop:
-                # Event loop has changed, reset everything
-                logger.warning("Event loop changed, reinitializing MCP protocol")
-                self._pending_requests.clear()
-                if self._receive_task and not self._receive_task.done():
-                    self._receive_task.cancel()
-                self._receive_task = None
-                self._loop = current_loop
-                
-            # Start message receiver if not already running
-            if self._receive_task is None or self._receive_task.done():
-                self._receive_task = self._loop.create_task(self._message_receiver_loop())
-            
-            # Generate unique request ID
-            request_id = self._generate_request_id()
-            
-            # Create future for response (use the protocol's loop)
-            future = self._loop.create_future()
-            self._pending_requests[request_id] = future
-            
+        call_timeout = self.request_timeout if timeout is None else timeout
+
+        async with self._in_flight_semaphore:
+            request_id = None
             try:
-                # Create and send request message
-                request = MCPMessage(
-                    id=request_id,
-                    method=method,
-                    params=params
-                )
-                
-                await self.send_message(request)
-                
-                # Wait for response with timeout
-                response = await asyncio.wait_for(future, timeout=300.0)
+                async with self._protocol_lock:
+                    self._ensure_receiver_running()
+
+                    # Generate unique request ID
+                    request_id = self._generate_request_id()
+
+                    # Create future for response (use the protocol's loop)
+                    future = self._loop.create_future()
+                    self._pending_requests[request_id] = future
+
+                    # Create and send request message
+                    request = MCPMessage(
+                        id=request_id,
+                        method=method,
+                        params=params
+                    )
+
+                    await self.send_message(request)
+
+                # Wait for response with timeout, outside the lock
+                response = await asyncio.wait_for(future, timeout=call_timeout)
                 
                 # Validate response
                 if response.is_error():
@@ -319,7 +378,31 @@ class MCPProtocol:
                 raise MCPProtocolError(f"Method call timeout: {method}")
             finally:
                 # Clean up pending request
-                self._pending_requests.pop(request_id, None)
+                if request_id is not None:
+                    self._pending_requests.pop(request_id, None)
+
+    def _ensure_receiver_running(self) -> None:
+        """Bind to the running event loop and start the receiver task if needed."""
+        # Initialize loop reference on first call
+        current_loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = current_loop
+        elif self._loop != current_loop:
+            # Event loop has changed, reset everything
+            logger.warning("Event loop changed, reinitializing MCP protocol")
+            self._pending_requests.clear()
+            if self._receive_task and not self._receive_task.done():
+                self._receive_task.cancel()
+            self._receive_task = None
+            self._loop = current_loop
+
+        # Start message receiver if not already running
+        if self._receive_task is None or self._receive_task.done():
+            self._receive_task = self._loop.create_task(self._message_receiver_loop())
+
+    def get_in_flight_count(self) -> int:
+        """Get the number of requests currently awaiting a response."""
+        return len(self._pending_requests)
     
     async def send_notification(self, method: str, params: Optional[Dict[str, Any]] = None) -> None:
         """
@@ -579,10 +662,53 @@ class MCPProtocol:
                     logger.error(f"Failed to route notification for request {request_id}: {e}")
             else:
                 logger.debug(f"MCP {message.method} notification without request queue (request_id: {request_id})")
+        elif message.method in self._notification_handlers:
+            self._dispatch_notification(message)
         else:
             # 其他通知类型，记录日志
             logger.debug(f"Received notification: {message.method}")
 
+    def add_notification_handler(self, method: str, handler: Callable) -> None:
+        """
+        Register a handler for a server notification.
+
+        Coroutine handlers run as separate tasks so they may call back into
+        the server (e.g. re-list tools) without blocking the receiver loop
+        that has to deliver the response.
+
+        Args:
+            method: Notification method name
+            handler: Callable taking the MCPMessage; may be a coroutine function
+        """
+        self._notification_handlers.setdefault(method, []).append(handler)
+
+    def remove_notification_handler(self, method: str, handler: Callable) -> None:
+        """Remove a previously registered notification handler."""
+        handlers = self._notification_handlers.get(method, [])
+        if handler in handlers:
+            handlers.remove(handler)
+        if not handlers:
+            self._notification_handlers.pop(method, None)
+
+    def _dispatch_notification(self, message: MCPMessage) -> None:
+        """Invoke the handlers registered for a notification."""
+        logger.debug(f"Dispatching notification: {message.method}")
+        for handler in list(self._notification_handlers.get(message.method, [])):
+            try:
+                result = handler(message)
+                if asyncio.iscoroutine(result):
+                    task = asyncio.create_task(result)
+                    self._notification_tasks.add(task)
+                    task.add_done_callback(self._notification_task_done)
+            except Exception as e:
+                logger.error(f"Notification handler failed for {message.method}: {e}")
+
+    def _notification_task_done(self, task: asyncio.Task) -> None:
+        """Forget a finished handler task and log its failure."""
+        self._notification_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.error(f"Notification handler failed: {task.exception()}")
+
     def set_server_capabilities(self, capabilities: Dict[str, Any]):
         """设置服务器能力信息（通常在初始化时调用）"""
         self._server_capabilities = capabilities
@@ -600,6 +726,7 @@ class MCPProtocol:
             while self.transport.is_connected():
                 try:
                     message = await self.receive_message()
+                    self.last_activity = time.monotonic()
                     
                     # Handle responses to pending requests
                     if message.is_response() and message.id in self._pending_requests:
@@ -631,6 +758,10 @@ class MCPProtocol:
                 await self._receive_task
             except asyncio.CancelledError:
                 pass
+
+        for task in list(self._notification_tasks):
+            task.cancel()
+        self._notification_tasks.clear()
         
         # Complete any remaining pending requests with cancellation
         for future in self._pending_requests.values():
@@ -667,6 +798,7 @@ class MCPMethods:
     # Notification methods
     NOTIFICATIONS_INITIALIZED = "notifications/initialized"
     NOTIFICATIONS_CANCELLED = "notifications/cancelled"
+    NOTIFICATIONS_TOOLS_LIST_CHANGED = "notifications/tools/list_changed"
 
 
 # MCP error codes (following JSON-RPC 2.0 specification)
@@ -705,6 +837,9 @@ class EmbeddedProtocol:
         self._request_id_counter = 0
         self._server_capabilities: Optional[Dict[str, Any]] = None
 
+        # Monotonic time of the last response from the embedded server
+        self.last_activity: Optional[float] = None
+
     def _generate_request_id(self) -> str:
         """Generate unique request ID."""
         self._request_id_counter += 1
@@ -737,6 +872,7 @@ class EmbeddedProtocol:
         try:
             # Send message directly to embedded server
             response = await self.transport.send_message(request)
+            self.last_activity = time.monotonic()
 
             # Handle direct response from embedded server
             if isinstance(response, dict):
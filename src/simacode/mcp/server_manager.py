@@ -7,11 +7,12 @@ including connection management, health monitoring, and tool discovery.
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Any, Set, AsyncGenerator, Callable
+from typing import Dict, List, Optional, Any, Set, AsyncGenerator, Awaitable, Callable, Union
 from pathlib import Path
 import time
 
 from .client import MCPClient, MCPClientState
+from .client_pool import MCPClientPool
 from .config import MCPConfigManager, MCPConfig, MCPServerConfig
 from .protocol import MCPTool, MCPResource, MCPResult
 from .discovery import MCPToolDiscovery, ToolMetadata
@@ -68,7 +69,7 @@ class MCPServerManager:
         self.config: Optional[MCPConfig] = None
         
         # Server management
-        self.servers: Dict[str, MCPClient] = {}
+        self.servers: Dict[str, Union[MCPClient, MCPClientPool]] = {}
         self.connection_locks: Dict[str, asyncio.Lock] = {}
         
         # Concurrency control
@@ -80,6 +81,11 @@ class MCPServerManager:
         
         # Tool discovery system
         self.tool_discovery = MCPToolDiscovery(cache_ttl=300)  # 5 minutes
+        
+        # Catalog change fan-out; servers without listChanged are polled slowly
+        self.tools_changed_listeners: List[Callable[[str, List[MCPTool]], Awaitable[None]]] = []
+        self.tool_poll_interval = 300
+        self._tool_poll_task: Optional[asyncio.Task] = None
     
     async def start(self) -> None:
         """Start the server manager and load configuration."""
@@ -92,6 +98,9 @@ class MCPServerManager:
             # Start health monitoring
             await self.health_monitor.start_monitoring()
             
+            # Start fallback polling for servers that don't push list_changed
+            self._tool_poll_task = asyncio.create_task(self._tool_poll_loop())
+            
             logger.info("MCP server manager started successfully")
             
         except Exception as e:
@@ -105,6 +114,14 @@ class MCPServerManager:
         # Signal shutdown
         self._shutdown_event.set()
         
+        if self._tool_poll_task:
+            self._tool_poll_task.cancel()
+            try:
+                await self._tool_poll_task
+            except asyncio.CancelledError:
+                pass
+            self._tool_poll_task = None
+        
         # Stop health monitoring
         await self.health_monitor.stop_monitoring()
         
@@ -121,6 +138,7 @@ class MCPServerManager:
             if self.config.mcp.enabled:
                 # Update health monitor configuration
                 self.health_monitor.check_interval = self.config.mcp.health_check_interval
+                self.tool_poll_interval = self.config.mcp.tool_poll_interval
                 
                 # Load enabled servers
                 await self.load_servers_from_config()
@@ -161,8 +179,9 @@ class MCPServerManager:
             return False
         
         try:
-            # Create client
-            client = MCPClient(config)
+            # Create client, or a pool of replicas for pooled stdio servers
+            client = self._create_client(config)
+            client.add_tools_changed_callback(self._on_server_tools_changed)
             
             # Create connection lock
             self.connection_locks[name] = asyncio.Lock()
@@ -191,6 +210,32 @@ class MCPServerManager:
             
             return False
     
+    def _create_client(self, config: MCPServerConfig) -> Union[MCPClient, MCPClientPool]:
+        """
+        Create the client for a server configuration.
+        
+        Args:
+            config: Server configuration
+            
+        Returns:
+            MCPClient or MCPClientPool when replicas are configured
+        """
+        if not config.is_pooled():
+            return MCPClient(config)
+        
+        if config.type != "stdio":
+            logger.warning(
+                f"Server '{config.name}' sets pool_size but pooling is only supported "
+                f"for stdio servers, using a single client"
+            )
+            return MCPClient(config)
+        
+        logger.info(
+            f"Creating client pool for server '{config.name}' "
+            f"({config.pool_size} replicas, max {config.pool_max_size or config.pool_size})"
+        )
+        return MCPClientPool(config)
+    
     async def remove_server(self, name: str) -> bool:
         """
         Remove an MCP server.
@@ -366,6 +411,86 @@ class MCPServerManager:
         """
         return await self.tool_discovery.discover_all_tools(self)
     
+    def add_tools_changed_listener(
+        self,
+        listener: Callable[[str, List[MCPTool]], Awaitable[None]]
+    ) -> None:
+        """
+        Add a listener invoked with (server_name, tools) when a server's catalog changes.
+        
+        Changes are detected once per server, from notifications/tools/list_changed
+        or the fallback poll, and the same MCPTool objects (with their cached
+        signatures) are handed to every listener.
+        
+        Args:
+            listener: Coroutine function receiving the server name and new tools
+        """
+        self.tools_changed_listeners.append(listener)
+    
+    def remove_tools_changed_listener(
+        self,
+        listener: Callable[[str, List[MCPTool]], Awaitable[None]]
+    ) -> None:
+        """Remove a catalog change listener."""
+        if listener in self.tools_changed_listeners:
+            self.tools_changed_listeners.remove(listener)
+    
+    def supports_list_changed(self, server_name: str) -> bool:
+        """Check whether a server pushes notifications/tools/list_changed."""
+        client = self.servers.get(server_name)
+        return bool(client and client.is_connected() and client.supports_list_changed())
+    
+    async def poll_tool_changes(self, include_subscribed: bool = False) -> List[str]:
+        """
+        Re-list tools on servers that don't send list_changed notifications.
+        
+        Args:
+            include_subscribed: Also poll servers that advertise listChanged
+            
+        Returns:
+            List[str]: Names of servers whose catalog changed
+        """
+        names = [
+            name for name, client in self.servers.items()
+            if client.is_connected() and (include_subscribed or not client.supports_list_changed())
+        ]
+        if not names:
+            return []
+        
+        results = await asyncio.gather(
+            *[self.servers[name].refresh_tools() for name in names],
+            return_exceptions=True
+        )
+        
+        changed = []
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to poll tools of server '{name}': {str(result)}")
+            elif result:
+                changed.append(name)
+        return changed
+    
+    async def _on_server_tools_changed(self, server_name: str, tools: List[MCPTool]) -> None:
+        """Update the discovery index and fan a catalog change out to listeners."""
+        await self.tool_discovery.update_server_tools(server_name, tools)
+        
+        for listener in list(self.tools_changed_listeners):
+            try:
+                await listener(server_name, tools)
+            except Exception as e:
+                logger.error(f"Tools changed listener failed for server '{server_name}': {str(e)}")
+    
+    async def _tool_poll_loop(self) -> None:
+        """Slow fallback poll for servers that don't advertise listChanged."""
+        while not self._shutdown_event.is_set():
+            try:
+                await asyncio.sleep(self.tool_poll_interval)
+                await self.poll_tool_changes()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in tool poll loop: {str(e)}")
+    
     async def find_tool(self, tool_name: str) -> Optional[tuple[str, MCPTool]]:
         """
         Find a tool by name across all servers.
@@ -646,6 +771,10 @@ class MCPServerManager:
         return {
             "total_servers": len(self.servers),
             "connected_servers": connected_count,
+            "list_changed_servers": [
+                name for name in self.servers if self.supports_list_changed(name)
+            ],
+            "tool_poll_interval": self.tool_poll_interval,
             "discovery": discovery_stats,
             "health_monitoring": health_stats,
             "servers": {
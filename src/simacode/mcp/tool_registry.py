@@ -196,6 +196,7 @@ class MCPToolRegistry:
         self.registered_tools: Dict[str, MCPToolWrapper] = {}
         self.server_tools: Dict[str, List[str]] = {}  # server -> tool names
         self.namespace_manager = NamespaceManager()
+        self.version = 0  # Bumped on register/unregister/update
         
         # Event callbacks
         self.registration_callbacks: List[Callable[[str, MCPToolWrapper], None]] = []
@@ -225,8 +226,9 @@ class MCPToolRegistry:
             if self.auto_register:
                 await self.discover_and_register_all_tools()
             
-            # Start background discovery task
+            # Follow catalog changes pushed by servers, with a slow background check
             if self.auto_update_enabled:
+                self.server_manager.add_tools_changed_listener(self._on_server_tools_changed)
                 self.discovery_task = asyncio.create_task(self._background_discovery_loop())
             
             logger.info("MCP tool registry started successfully")
@@ -239,6 +241,10 @@ class MCPToolRegistry:
         """Stop the MCP tool registry."""
         logger.info("Stopping MCP tool registry")
         
+        # Stop following catalog changes
+        if self.auto_update_enabled:
+            self.server_manager.remove_tools_changed_listener(self._on_server_tools_changed)
+        
         # Stop background task
         if self.discovery_task:
             self.discovery_task.cancel()
@@ -306,13 +312,7 @@ class MCPToolRegistry:
         for tool in tools:
             try:
                 # Create tool wrapper
-                wrapper = MCPToolWrapper(
-                    mcp_tool=tool,
-                    server_manager=self.server_manager,
-                    permission_manager=self.permission_manager,
-                    namespace=namespace,
-                    session_manager=self.session_manager
-                )
+                wrapper = self._create_wrapper(tool, namespace)
                 
                 # Register the wrapper
                 if await self.register_tool(wrapper):
@@ -329,6 +329,80 @@ class MCPToolRegistry:
         logger.info(f"Successfully registered {registered_count}/{len(tools)} tools from server '{server_name}'")
         return registered_count
     
+    async def sync_server_tools(self, server_name: str, tools: List[MCPTool]) -> Tuple[int, int, int]:
+        """
+        Bring a server's registered tools in line with its current catalog.
+        
+        Only tools that were added, removed or whose signature changed are
+        touched; unchanged wrappers stay registered as they are.
+        
+        Args:
+            server_name: Name of the MCP server
+            tools: The server's current tools
+            
+        Returns:
+            Tuple[int, int, int]: (added_count, updated_count, removed_count)
+        """
+        if server_name not in self.server_tools:
+            return await self.register_server_tools(server_name, tools), 0, 0
+        
+        registered = {
+            wrapper.original_name: wrapper
+            for wrapper in (self.registered_tools.get(name) for name in self.server_tools[server_name])
+            if wrapper is not None
+        }
+        namespace = (
+            next(iter(registered.values())).namespace if registered
+            else self.namespace_manager._sanitize_namespace_name(server_name)
+        )
+        namespace_tools = self.namespace_manager.namespaces.setdefault(namespace, set())
+        current = {tool.name: tool for tool in tools}
+        added = updated = removed = 0
+        
+        for tool_name, wrapper in registered.items():
+            if tool_name not in current and await self.unregister_tool(wrapper.name):
+                namespace_tools.discard(wrapper.name)
+                self.namespace_manager.tool_to_namespace.pop(wrapper.name, None)
+                removed += 1
+        
+        for tool in tools:
+            wrapper = registered.get(tool.name)
+            if wrapper is not None and wrapper.mcp_tool.signature == tool.signature:
+                continue
+            
+            try:
+                new_wrapper = self._create_wrapper(tool, namespace)
+            except Exception as e:
+                logger.error(f"Failed to wrap tool '{tool.name}' from server '{server_name}': {str(e)}")
+                self.registration_stats["failed_registrations"] += 1
+                continue
+            
+            if wrapper is not None:
+                if await self.update_tool(new_wrapper):
+                    updated += 1
+            elif await self.register_tool(new_wrapper):
+                self.server_tools[server_name].append(new_wrapper.name)
+                namespace_tools.add(new_wrapper.name)
+                self.namespace_manager.tool_to_namespace[new_wrapper.name] = namespace
+                added += 1
+        
+        if added or updated or removed:
+            logger.info(
+                f"Synced tools of server '{server_name}': "
+                f"{added} added, {updated} updated, {removed} removed"
+            )
+        return added, updated, removed
+    
+    def _create_wrapper(self, tool: MCPTool, namespace: str) -> MCPToolWrapper:
+        """Wrap an MCP tool for registration under a namespace."""
+        return MCPToolWrapper(
+            mcp_tool=tool,
+            server_manager=self.server_manager,
+            permission_manager=self.permission_manager,
+            namespace=namespace,
+            session_manager=self.session_manager
+        )
+    
     async def register_tool(self, tool_wrapper: MCPToolWrapper) -> bool:
         """
         Register a single MCP tool wrapper.
@@ -354,6 +428,7 @@ class MCPToolRegistry:
             
             # Register tool
             self.registered_tools[tool_name] = tool_wrapper
+            self.version += 1
             
             # Update statistics
             self.registration_stats["total_registered"] += 1
@@ -374,6 +449,34 @@ class MCPToolRegistry:
             self.registration_stats["failed_registrations"] += 1
             return False
     
+    async def update_tool(self, tool_wrapper: MCPToolWrapper) -> bool:
+        """
+        Replace a registered tool with an updated wrapper (e.g. a new schema).
+        
+        Args:
+            tool_wrapper: Updated MCP tool wrapper
+            
+        Returns:
+            bool: True if the tool was updated
+        """
+        tool_name = tool_wrapper.name
+        
+        if tool_name not in self.registered_tools:
+            return False
+        
+        self.registered_tools[tool_name] = tool_wrapper
+        self.version += 1
+        
+        # Notify callbacks
+        for callback in self.update_callbacks:
+            try:
+                callback(tool_name, tool_wrapper)
+            except Exception as e:
+                logger.error(f"Update callback failed for '{tool_name}': {str(e)}")
+        
+        logger.debug(f"Successfully updated MCP tool: {tool_name}")
+        return True
+    
     async def _validate_tool_for_registration(self, tool_wrapper: MCPToolWrapper) -> bool:
         """
         Validate a tool before registration.
@@ -418,6 +521,7 @@ class MCPToolRegistry:
         try:
             # Remove from registry
             del self.registered_tools[tool_name]
+            self.version += 1
             
             # Remove from server tools tracking
             for server_name, tool_names in self.server_tools.items():
@@ -568,8 +672,18 @@ class MCPToolRegistry:
         """Add a callback for tool update events."""
         self.update_callbacks.append(callback)
     
+    async def _on_server_tools_changed(self, server_name: str, tools: List[MCPTool]) -> None:
+        """Apply a catalog change pushed by the server manager."""
+        if self.auto_register:
+            await self.sync_server_tools(server_name, tools)
+    
     async def _background_discovery_loop(self) -> None:
-        """Background loop for automatic tool discovery and updates."""
+        """
+        Slow background check for removed servers and servers not yet registered.
+        
+        Catalog changes of connected servers arrive through
+        _on_server_tools_changed, so this loop never re-lists tools itself.
+        """
         logger.info("Starting background tool discovery loop")
         
         while True:
@@ -579,9 +693,9 @@ class MCPToolRegistry:
                 # Check for server changes
                 await self._check_for_server_changes()
                 
-                # Discover new tools
+                # Register servers that connected since the last check
                 if self.auto_register:
-                    await self.discover_and_register_all_tools()
+                    await self._register_new_servers()
                 
             except asyncio.CancelledError:
                 break
@@ -589,6 +703,17 @@ class MCPToolRegistry:
                 logger.error(f"Error in background discovery loop: {str(e)}")
                 await asyncio.sleep(30)  # Wait before retrying
     
+    async def _register_new_servers(self) -> int:
+        """Register tools of connected servers that have none registered yet."""
+        registered_count = 0
+        all_tools = await self.server_manager.get_all_tools()
+        
+        for server_name, tools in all_tools.items():
+            if tools and server_name not in self.server_tools:
+                registered_count += await self.register_server_tools(server_name, tools)
+        
+        return registered_count
+    
     async def _check_for_server_changes(self) -> None:
         """Check for changes in MCP servers and update tool registrations."""
         current_servers = set(self.server_manager.list_servers())
@@ -614,6 +739,7 @@ class MCPToolRegistry:
         return {
             **self.registration_stats,
             "currently_registered": len(self.registered_tools),
+            "version": self.version,
             "healthy_tools": healthy_tools,
             "unhealthy_tools": len(self.registered_tools) - healthy_tools,
             "servers_with_tools": len(self.server_tools),
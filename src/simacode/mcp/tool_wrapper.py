@@ -6,10 +6,12 @@ enabling seamless integration of MCP servers into the SimaCode tool ecosystem.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 import time
-from typing import Any, AsyncGenerator, Dict, List, Optional, Type, Union, Callable
+from collections import OrderedDict
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple, Type, Union, Callable
 from datetime import datetime
 from pathlib import Path
 from enum import Enum
@@ -46,6 +48,60 @@ class MCPToolInput(ToolInput):
         arbitrary_types_allowed = True
 
 
+class InputModelCache:
+    """
+    Process-wide LRU cache of generated input models.
+    
+    Models are keyed by the hash of the tool's input schema and the model
+    name, so re-registering a tool, updating it without a schema change, or
+    wrapping it again for another client replica reuses the model built
+    the first time.
+    """
+    
+    def __init__(self, max_size: int = 2048):
+        self.max_size = max_size
+        self._models: "OrderedDict[Tuple[str, str], Type[MCPToolInput]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def schema_hash(schema: Dict[str, Any]) -> str:
+        """Stable hash of a JSON schema."""
+        schema_str = json.dumps(schema, sort_keys=True, default=str)
+        return hashlib.sha256(schema_str.encode()).hexdigest()
+    
+    def get(self, key: Tuple[str, str]) -> Optional[Type[MCPToolInput]]:
+        """Return a cached model, or None."""
+        model = self._models.get(key)
+        if model is None:
+            self.misses += 1
+            return None
+        
+        self._models.move_to_end(key)
+        self.hits += 1
+        return model
+    
+    def put(self, key: Tuple[str, str], model: Type[MCPToolInput]) -> None:
+        """Store a model, evicting the least recently used one when full."""
+        self._models[key] = model
+        self._models.move_to_end(key)
+        while len(self._models) > self.max_size:
+            self._models.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Drop all cached models."""
+        self._models.clear()
+        self.hits = 0
+        self.misses = 0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {"size": len(self._models), "max_size": self.max_size, "hits": self.hits, "misses": self.misses}
+
+
+input_model_cache = InputModelCache()
+
+
 class MCPToolWrapper(Tool):
     """
     Wrapper that adapts MCP tools to the SimaCode tool interface.
@@ -87,7 +143,7 @@ class MCPToolWrapper(Tool):
         self.permission_manager = permission_manager or PermissionManager()
         self.namespace = namespace
         
-        # Create dynamic input schema
+        # Create dynamic input schema (shared with other wrappers of the same schema)
         self._input_schema = self._create_input_schema()
         
         # MCP-specific metadata
@@ -113,6 +169,12 @@ class MCPToolWrapper(Tool):
                 logger.warning(f"Invalid schema for tool {self.mcp_tool.name}, using base input")
                 return MCPToolInput
             
+            dynamic_class_name = f"{self.mcp_tool.name.title()}Input"
+            cache_key = (input_model_cache.schema_hash(schema), dynamic_class_name)
+            cached_model = input_model_cache.get(cache_key)
+            if cached_model is not None:
+                return cached_model
+            
             # Extract properties from JSON schema
             properties = schema.get("properties", {})
             required_fields = schema.get("required", [])
@@ -135,14 +197,15 @@ class MCPToolWrapper(Tool):
                     )
             
             # Create dynamic model class
-            dynamic_class_name = f"{self.mcp_tool.name.title()}Input"
-            
-            return create_model(
+            model = create_model(
                 dynamic_class_name,
                 __base__=MCPToolInput,
                 **field_definitions
             )
             
+            input_model_cache.put(cache_key, model)
+            return model
+            
         except Exception as e:
             logger.warning(f"Failed to create schema for tool {self.mcp_tool.name}: {str(e)}")
             return MCPToolInput
@@ -185,8 +248,10 @@ class MCPToolWrapper(Tool):
             ToolInput: Validated input object
         """
         try:
+            # model_validate hands the dict straight to the model's compiled
+            # validator, skipping the keyword-argument round trip of __init__
             schema_class = self.get_input_schema()
-            return schema_class(**input_data)
+            return schema_class.model_validate(input_data)
         except Exception as e:
             logger.error(f"Input validation failed for MCP tool {self.name}: {str(e)}")
             raise ValueError(f"Invalid input for {self.name}: {str(e)}")
@@ -5,13 +5,15 @@ This module provides a comprehensive permission system for controlling
 access to system resources, files, and operations.
 """
 
-from .manager import PermissionManager, PermissionResult, PermissionLevel
-from .validators import PathValidator, CommandValidator
+from .manager import PermissionManager, PermissionResult, PermissionLevel, PermissionCache
+from .validators import PathValidator, CommandValidator, PathTrie
 
 __all__ = [
     "PermissionManager",
     "PermissionResult", 
     "PermissionLevel",
+    "PermissionCache",
     "PathValidator",
     "CommandValidator",
+    "PathTrie",
 ]
\ No newline at end of file
@@ -5,15 +5,21 @@ This module implements a comprehensive permission system that controls
 access to files, system commands, and other resources.
 """
 
+import logging
 import os
 import re
 import time
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Callable, Dict, List, Optional, Set, Tuple, Union
 
 from ..config import Config
+from .validators import PathTrie, normalize_path
+
+logger = logging.getLogger(__name__)
 
 
 class PermissionLevel(Enum):
@@ -37,6 +43,79 @@ class PermissionResult:
             self.restrictions = []
 
 
+class PermissionCache:
+    """
+    Bounded LRU cache of permission decisions with a TTL.
+    
+    Each entry remembers the target it was computed for, so decisions for
+    a directory and everything below it can be dropped together.
+    """
+    
+    def __init__(self, max_entries: int = 4096, ttl: float = 300):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, str, PermissionResult]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key: str) -> Optional[PermissionResult]:
+        """Return a cached decision if it has not expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        
+        created_at, _, result = entry
+        if time.monotonic() - created_at >= self.ttl:
+            del self._entries[key]
+            self.misses += 1
+            return None
+        
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return result
+    
+    def set(self, key: str, target: str, result: PermissionResult) -> None:
+        """Store a decision, evicting the least recently used one when full."""
+        self._entries[key] = (time.monotonic(), target, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def invalidate_path(self, path: str) -> int:
+        """
+        Drop decisions for a path and everything below it.
+        
+        Args:
+            path: File or directory whose decisions are stale
+            
+        Returns:
+            int: Number of dropped entries
+        """
+        root = PathTrie([path])
+        stale = [
+            key for key, (_, target, _) in self._entries.items()
+            if target and root.match(target) is not None
+        ]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+    
+    def clear(self) -> None:
+        """Drop all decisions."""
+        self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def count_valid(self) -> int:
+        """Number of entries that have not expired yet."""
+        now = time.monotonic()
+        return sum(1 for created_at, _, _ in self._entries.values() if now - created_at < self.ttl)
+
+
 class PermissionManager:
     """
     Manages permissions for tool operations.
@@ -52,9 +131,13 @@ class PermissionManager:
             self.config = Config.load()
         else:
             self.config = config
-        self._permission_cache: Dict[str, PermissionResult] = {}
         self._cache_timeout = 300  # 5 minutes
-        self._cache_timestamps: Dict[str, float] = {}
+        self._cache_max_entries = 4096
+        self._permission_cache = PermissionCache(self._cache_max_entries, self._cache_timeout)
+        
+        # Called with this manager after the security config is reloaded;
+        # bound methods are held as weak references
+        self._reload_listeners: List[Union[Callable[["PermissionManager"], None], weakref.WeakMethod]] = []
         
         # Load security configuration
         self._load_security_config()
@@ -118,6 +201,96 @@ class PermissionManager:
         
         # File size limits (in bytes)
         self.max_file_size = 10 * 1024 * 1024  # 10MB
+        
+        self._build_path_tries()
+    
+    def _build_path_tries(self) -> None:
+        """Normalize the allowed and forbidden roots once into lookup tries."""
+        self._allowed_trie = PathTrie(self.allowed_paths)
+        # Relative forbidden entries (and Windows drive paths on POSIX) never
+        # match an absolute path, so they are not resolved against the cwd
+        self._forbidden_trie = PathTrie(self.forbidden_paths, absolute_only=True)
+    
+    def reload_security_config(self, config: Optional[Config] = None) -> None:
+        """
+        Re-read the security settings and drop every cached decision.
+        
+        Args:
+            config: New configuration; by default the current one is re-read
+        """
+        if config is not None:
+            self.config = config
+        
+        self._load_security_config()
+        self.clear_cache()
+        
+        for listener in self._live_reload_listeners():
+            try:
+                listener(self)
+            except Exception as e:
+                logger.error(f"Permission reload listener failed: {str(e)}")
+    
+    def _live_reload_listeners(self) -> List[Callable[["PermissionManager"], None]]:
+        """Resolve the registered listeners, dropping those whose object was collected."""
+        live = []
+        registered = []
+        for entry in self._reload_listeners:
+            listener = entry() if isinstance(entry, weakref.WeakMethod) else entry
+            if listener is not None:
+                live.append(listener)
+                registered.append(entry)
+        self._reload_listeners = registered
+        return live
+    
+    def add_reload_listener(self, listener: Callable[["PermissionManager"], None]) -> None:
+        """
+        Register a callback run after the security config is reloaded.
+        
+        Bound methods are held weakly, so registering one does not keep its
+        object (e.g. a tool instance) alive; other callables are held strongly.
+        """
+        if hasattr(listener, "__self__") and hasattr(listener, "__func__"):
+            self._reload_listeners.append(weakref.WeakMethod(listener))
+        else:
+            self._reload_listeners.append(listener)
+    
+    def remove_reload_listener(self, listener: Callable[["PermissionManager"], None]) -> None:
+        """Unregister a reload callback."""
+        self._reload_listeners = [
+            entry for entry in self._reload_listeners
+            if (entry() if isinstance(entry, weakref.WeakMethod) else entry) != listener
+        ]
+    
+    def invalidate_path(self, path: str) -> int:
+        """
+        Drop cached decisions for a path and everything below it.
+        
+        Args:
+            path: File or directory whose decisions are stale
+            
+        Returns:
+            int: Number of dropped decisions
+        """
+        return self._permission_cache.invalidate_path(path)
+    
+    def _check_path_roots(self, normalized_path: str) -> Optional[PermissionResult]:
+        """Deny paths under a forbidden root or outside every allowed root."""
+        forbidden = self._forbidden_trie.match(normalized_path)
+        if forbidden is not None:
+            return PermissionResult(
+                granted=False,
+                level=PermissionLevel.DENIED,
+                reason=f"Access to {forbidden} is forbidden"
+            )
+        
+        if self._allowed_trie.match(normalized_path) is None:
+            return PermissionResult(
+                granted=False,
+                level=PermissionLevel.DENIED,
+                reason=f"Path {normalized_path} is not in allowed paths"
+            )
+        
+        return None
     
     def _get_cache_key(self, operation: str, target: str, **kwargs) -> str:
         """Generate cache key for permission check."""
@@ -128,20 +301,11 @@ class PermissionManager:
     
     def _get_cached_permission(self, cache_key: str) -> Optional[PermissionResult]:
         """Get cached permission result if still valid."""
-        if cache_key in self._permission_cache:
-            timestamp = self._cache_timestamps.get(cache_key, 0)
-            if time.time() - timestamp < self._cache_timeout:
-                return self._permission_cache[cache_key]
-            else:
-                # Cache expired
-                del self._permission_cache[cache_key]
-                del self._cache_timestamps[cache_key]
-        return None
+        return self._permission_cache.get(cache_key)
     
-    def _cache_permission(self, cache_key: str, result: PermissionResult) -> None:
-        """Cache permission result."""
-        self._permission_cache[cache_key] = result
-        self._cache_timestamps[cache_key] = time.time()
+    def _cache_permission(self, cache_key: str, result: PermissionResult, target: str = "") -> None:
+        """Cache permission result for a target path (empty for non-path checks)."""
+        self._permission_cache.set(cache_key, target, result)
     
     def check_file_permission(
         self, 
@@ -175,7 +339,7 @@ class PermissionManager:
         
         # Normalize path
         try:
-            normalized_path = os.path.abspath(file_path)
+            normalized_path = normalize_path(file_path)
         except (OSError, ValueError) as e:
             result = PermissionResult(
                 granted=False,
@@ -185,34 +349,11 @@ class PermissionManager:
             self._cache_permission(cache_key, result)
             return result
         
-        # Check against forbidden paths
-        for forbidden in self.forbidden_paths:
-            if normalized_path.startswith(forbidden):
-                result = PermissionResult(
-                    granted=False,
-                    level=PermissionLevel.DENIED,
-                    reason=f"Access to {forbidden} is forbidden"
-                )
-                self._cache_permission(cache_key, result)
-                return result
-        
-        # Check against allowed paths
-        path_allowed = False
-        for allowed in self.allowed_paths:
-            # Expand user path and normalize
-            expanded_allowed = os.path.abspath(os.path.expanduser(allowed))
-            if normalized_path.startswith(expanded_allowed):
-                path_allowed = True
-                break
-        
-        if not path_allowed:
-            result = PermissionResult(
-                granted=False,
-                level=PermissionLevel.DENIED,
-                reason=f"Path {normalized_path} is not in allowed paths"
-            )
-            self._cache_permission(cache_key, result)
-            return result
+        # Check against forbidden and allowed roots
+        denied = self._check_path_roots(normalized_path)
+        if denied:
+            self._cache_permission(cache_key, denied, normalized_path)
+            return denied
         
         # Check file size for read operations
         if operation == "read" and os.path.exists(normalized_path):
@@ -224,7 +365,7 @@ class PermissionManager:
                         level=PermissionLevel.DENIED,
                         reason=f"File size ({file_size} bytes) exceeds limit ({self.max_file_size} bytes)"
                     )
-                    self._cache_permission(cache_key, result)
+                    self._cache_permission(cache_key, result, normalized_path)
                     return result
             except OSError:
                 pass  # File might not exist, that's ok for write operations
@@ -250,7 +391,7 @@ class PermissionManager:
             restrictions=restrictions
         )
         
-        self._cache_permission(cache_key, result)
+        self._cache_permission(cache_key, result, normalized_path)
         return result
     
     def check_command_permission(self, command: str) -> PermissionResult:
@@ -332,7 +473,7 @@ class PermissionManager:
             return cached_result
         
         try:
-            normalized_path = os.path.abspath(path)
+            normalized_path = normalize_path(path)
         except (OSError, ValueError) as e:
             result = PermissionResult(
                 granted=False,
@@ -342,34 +483,11 @@ class PermissionManager:
             self._cache_permission(cache_key, result)
             return result
         
-        # Check against forbidden paths
-        for forbidden in self.forbidden_paths:
-            if normalized_path.startswith(forbidden):
-                result = PermissionResult(
-                    granted=False,
-                    level=PermissionLevel.DENIED,
-                    reason=f"Access to {forbidden} is forbidden"
-                )
-                self._cache_permission(cache_key, result)
-                return result
-        
-        # Check against allowed paths
-        path_allowed = False
-        for allowed in self.allowed_paths:
-            # Expand user path and normalize
-            expanded_allowed = os.path.abspath(os.path.expanduser(allowed))
-            if normalized_path.startswith(expanded_allowed):
-                path_allowed = True
-                break
-        
-        if not path_allowed:
-            result = PermissionResult(
-                granted=False,
-                level=PermissionLevel.DENIED,
-                reason=f"Path {normalized_path} is not in allowed paths"
-            )
-            self._cache_permission(cache_key, result)
-            return result
+        # Check against forbidden and allowed roots
+        denied = self._check_path_roots(normalized_path)
+        if denied:
+            self._cache_permission(cache_key, denied, normalized_path)
+            return denied
         
         # Grant permission
         result = PermissionResult(
@@ -378,7 +496,7 @@ class PermissionManager:
             reason=f"Path {operation} operation permitted"
         )
         
-        self._cache_permission(cache_key, result)
+        self._cache_permission(cache_key, result, normalized_path)
         return result
     
     async def check_tool_permission(self, tool_name: str, input_data: Dict) -> bool:
@@ -417,18 +535,18 @@ class PermissionManager:
     def clear_cache(self) -> None:
         """Clear permission cache."""
         self._permission_cache.clear()
-        self._cache_timestamps.clear()
     
     def get_cache_stats(self) -> Dict[str, int]:
         """Get cache statistics."""
-        current_time = time.time()
-        valid_entries = sum(
-            1 for timestamp in self._cache_timestamps.values()
-            if current_time - timestamp < self._cache_timeout
-        )
+        total_entries = len(self._permission_cache)
+        valid_entries = self._permission_cache.count_valid()
         
         return {
-            "total_entries": len(self._permission_cache),
+            "total_entries": total_entries,
             "valid_entries": valid_entries,
-            "expired_entries": len(self._permission_cache) - valid_entries
+            "expired_entries": total_entries - valid_entries,
+            "max_entries": self._permission_cache.max_entries,
+            "hits": self._permission_cache.hits,
+            "misses": self._permission_cache.misses,
+            "evictions": self._permission_cache.evictions
         }
\ No newline at end of file
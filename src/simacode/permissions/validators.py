@@ -8,7 +8,89 @@ and resources.
 import os
 import re
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+def normalize_path(path: str) -> str:
+    """Return the absolute, case-normalized form of a path."""
+    return os.path.normcase(os.path.abspath(path))
+
+
+def path_components(normalized_path: str) -> Tuple[str, ...]:
+    """Split a normalized absolute path into its components (drive first on Windows)."""
+    drive, rest = os.path.splitdrive(normalized_path)
+    parts = [part for part in rest.split(os.sep) if part]
+    return (drive, *parts) if drive else tuple(parts)
+
+
+class PathTrie:
+    """
+    Path-component trie of directory roots.
+    
+    Roots are normalized once when the trie is built, and a lookup walks the
+    components of the queried path, so it costs O(depth) regardless of how
+    many roots there are. A root covers itself and every path below it, at
+    component boundaries: ``/tmp`` covers ``/tmp/a.txt`` but not ``/tmpfiles``.
+    """
+    
+    _ROOT_KEY = "\0root"
+    
+    def __init__(self, roots: Iterable[str] = (), absolute_only: bool = False):
+        """
+        Build the trie.
+        
+        Args:
+            roots: Directory roots; ``~`` is expanded
+            absolute_only: Skip roots that are relative after ``~`` expansion
+                instead of resolving them against the working directory
+        """
+        self._children: Dict[str, dict] = {}
+        self.roots: List[str] = []
+        
+        for root in roots:
+            root = str(root)
+            if absolute_only and not os.path.isabs(os.path.expanduser(root)):
+                continue
+            self._insert(root)
+    
+    def _insert(self, root: str) -> None:
+        node = self._children
+        for component in path_components(normalize_path(os.path.expanduser(root))):
+            node = node.setdefault(component, {})
+        # Keep the first spelling of a root for messages
+        node.setdefault(self._ROOT_KEY, root)
+        self.roots.append(root)
+    
+    def match(self, normalized_path: str) -> Optional[str]:
+        """
+        Find the outermost root that covers a path.
+        
+        Args:
+            normalized_path: Path as returned by ``normalize_path``
+            
+        Returns:
+            Optional[str]: The covering root as originally given, or None
+        """
+        node = self._children
+        root = node.get(self._ROOT_KEY)
+        if root is not None:
+            return root
+        
+        for component in path_components(normalized_path):
+            node = node.get(component)
+            if node is None:
+                return None
+            root = node.get(self._ROOT_KEY)
+            if root is not None:
+                return root
+        
+        return None
+    
+    def __contains__(self, normalized_path: str) -> bool:
+        return self.match(normalized_path) is not None
+    
+    def __len__(self) -> int:
+        return len(self.roots)
 
 
 class PathValidator:
@@ -52,6 +134,21 @@ class PathValidator:
             for pattern in self.DANGEROUS_PATH_PATTERNS
         ]
     
+    @property
+    def allowed_paths(self) -> List[str]:
+        """Directories under which paths are allowed."""
+        return self._allowed_paths
+    
+    @allowed_paths.setter
+    def allowed_paths(self, allowed_paths: List[str]) -> None:
+        self._allowed_paths = allowed_paths
+        # Built on first use from the new roots
+        self._allowed_trie: Optional[PathTrie] = None
+    
+    def set_allowed_paths(self, allowed_paths: List[str]) -> None:
+        """Replace the allowed directories, e.g. after the security config is reloaded."""
+        self.allowed_paths = list(allowed_paths) or [str(Path.cwd())]
+    
     def is_path_safe(self, path: str) -> bool:
         """
         Check if a path is safe to access.
@@ -85,16 +182,14 @@ class PathValidator:
             bool: True if path is allowed, False otherwise
         """
         try:
-            normalized_path = os.path.abspath(path)
+            normalized_path = normalize_path(path)
         except (OSError, ValueError):
             return False
         
-        for allowed in self.allowed_paths:
-            allowed_abs = os.path.abspath(allowed)
-            if normalized_path.startswith(allowed_abs):
-                return True
+        if self._allowed_trie is None:
+            self._allowed_trie = PathTrie(self.allowed_paths)
         
-        return False
+        return normalized_path in self._allowed_trie
     
     def is_extension_risky(self, path: str) -> bool:
         """
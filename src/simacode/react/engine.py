@@ -14,7 +14,7 @@ import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional, Set
 
 from ..ai.base import AIClient, Role
 from ..ai.conversation import Message
@@ -68,6 +68,36 @@ class ReActSession:
     updated_at: datetime = field(default_factory=datetime.now)
     retry_count: int = 0
     max_retries: int = 3
+    # Change counter: bumped by every field assignment and mutating method
+    version: int = field(default=1, init=False, repr=False, compare=False)
+    # Version that was last persisted (new sessions start dirty)
+    saved_version: int = field(default=0, init=False, repr=False, compare=False)
+    # Version at which each task's results were last stored
+    results_versions: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Per-task completion events that dependent tasks wait on (not persisted)
+    _task_events: Dict[str, asyncio.Event] = field(default_factory=dict, init=False, repr=False, compare=False)
+    
+    # Fields whose assignment does not change the persisted session
+    _UNTRACKED_FIELDS = frozenset({"version", "saved_version", "results_versions", "_task_events"})
+    
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        # "_task_events" is assigned last, so it is absent while __init__ is running
+        if name not in self._UNTRACKED_FIELDS and "_task_events" in self.__dict__:
+            self.mark_dirty()
+    
+    @property
+    def dirty(self) -> bool:
+        """Whether the session changed since it was last persisted."""
+        return self.version != self.saved_version
+    
+    def mark_dirty(self):
+        """Mark the session as changed since the last save."""
+        object.__setattr__(self, "version", self.version + 1)
+    
+    def mark_clean(self):
+        """Mark the session as persisted."""
+        object.__setattr__(self, "saved_version", self.version)
     
     def add_log_entry(self, message: str, level: str = "INFO"):
         """Add entry to execution log."""
@@ -76,6 +106,81 @@ class ReActSession:
         self.execution_log.append(log_entry)
         self.updated_at = datetime.now()
     
+    def add_message(self, message: Message):
+        """Append a message to the conversation history."""
+        self.conversation_history.append(message)
+        self.mark_dirty()
+    
+    def update_metadata(self, values: Dict[str, Any]):
+        """Merge values into the session metadata."""
+        self.metadata.update(values)
+        self.mark_dirty()
+    
+    def pop_metadata(self, key: str, default: Any = None) -> Any:
+        """Remove a metadata key and return its value."""
+        value = self.metadata.pop(key, default)
+        self.mark_dirty()
+        return value
+    
+    def set_task_results(self, task_id: str, results: List[ToolResult]):
+        """Store the tool results of a task."""
+        self.task_results[task_id] = results
+        self.updated_at = datetime.now()
+        self.results_versions[task_id] = self.version
+    
+    def set_evaluation(self, task_id: str, evaluation: EvaluationResult):
+        """Store the evaluation of a task."""
+        self.evaluations[task_id] = evaluation
+        self.mark_dirty()
+    
+    def _task_event(self, task_id: str) -> asyncio.Event:
+        """Get the completion event of a task."""
+        event = self._task_events.get(task_id)
+        if event is None:
+            event = self._task_events[task_id] = asyncio.Event()
+        return event
+    
+    def mark_task_finished(self, task_id: str):
+        """Signal that a task has finished and its results are stored."""
+        self._task_event(task_id).set()
+    
+    def is_task_finished(self, task_id: str) -> bool:
+        """Check whether a task has finished (in this run or a restored one)."""
+        if self._task_event(task_id).is_set():
+            return True
+        return any(
+            task.id == task_id and task.status in (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED)
+            for task in self.tasks
+        )
+    
+    async def wait_for_tasks(self, task_ids: List[str], timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all given tasks have finished.
+        
+        Args:
+            task_ids: IDs of the tasks to wait for
+            timeout: Maximum seconds to wait (None waits indefinitely)
+            
+        Returns:
+            bool: True if every task finished, False on timeout
+        """
+        pending = [self._task_event(task_id).wait() for task_id in task_ids if not self.is_task_finished(task_id)]
+        if not pending:
+            return True
+        
+        try:
+            await asyncio.wait_for(asyncio.gather(*pending), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
+    def record_dependency_wait(self, task_id: str, seconds: float):
+        """Add time a task spent waiting on its dependencies to the session metrics."""
+        metrics = self.metadata.setdefault("dependency_wait", {"total_seconds": 0.0, "tasks": {}})
+        metrics["tasks"][task_id] = metrics["tasks"].get(task_id, 0.0) + seconds
+        metrics["total_seconds"] += seconds
+        self.mark_dirty()
+    
     def update_state(self, new_state: ReActState):
         """Update session state and log the change."""
         old_state = self.state
@@ -96,22 +201,32 @@ class ReActSession:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert session to dictionary format."""
+        data = self.to_checkpoint_dict()
+        data["task_results"] = {
+            task_id: [result.to_dict() for result in results]
+            for task_id, results in self.task_results.items()
+        }
+        data["execution_log"] = self.execution_log
+        return data
+    
+    def to_checkpoint_dict(self) -> Dict[str, Any]:
+        """
+        Convert session to dictionary format without task results and execution log.
+        
+        Those two grow with the session's history and are persisted
+        incrementally through the session journal instead.
+        """
         return {
             "id": self.id,
             "user_input": self.user_input,
             "state": self.state.value,
             "tasks": [task.to_dict() for task in self.tasks],
             "current_task_index": self.current_task_index,
-            "task_results": {
-                task_id: [result.to_dict() for result in results]
-                for task_id, results in self.task_results.items()
-            },
             "evaluations": {
                 task_id: eval_result.to_dict()
                 for task_id, eval_result in self.evaluations.items()
             },
             "conversation_history": [msg.to_dict() for msg in self.conversation_history],
-            "execution_log": self.execution_log,
             "metadata": self.metadata,
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
@@ -145,8 +260,10 @@ class ReActEngine:
         """
         self.ai_client = ai_client
         self.execution_mode = execution_mode
-        self.task_planner = TaskPlanner(ai_client)
-        self.result_evaluator = ResultEvaluator(ai_client)
+        # Planner and evaluator prompts repeat often, so they may share a response cache
+        self.planning_client = self._create_planning_client(ai_client, config)
+        self.task_planner = TaskPlanner(self.planning_client)
+        self.result_evaluator = ResultEvaluator(self.planning_client)
         self.tool_registry = ToolRegistry()
         self.config = config
         self.api_mode = api_mode  # 🆕 明确的模式标识
@@ -167,6 +284,21 @@ class ReActEngine:
         
         logger.info(f"ReAct engine initialized with {execution_mode.value} execution mode")
     
+    def _create_planning_client(self, ai_client: AIClient, config: Optional[Any]) -> AIClient:
+        """Wrap the AI client with the configured response cache for planning and evaluation."""
+        from ..config import AIResponseCacheConfig
+        
+        cache_config = getattr(getattr(config, "ai", None), "response_cache", None)
+        if not isinstance(cache_config, AIResponseCacheConfig) or not cache_config.enabled:
+            return ai_client
+        
+        try:
+            from ..ai.factory import AIClientFactory
+            return AIClientFactory.create_cached_client(ai_client, cache_config.model_dump())
+        except Exception as e:
+            logger.warning(f"Failed to initialize AI response cache, continuing without it: {e}")
+            return ai_client
+    
     @property
     def confirmation_manager(self):
         """Lazy initialization of confirmation manager"""
@@ -198,7 +330,7 @@ class ReActEngine:
             session = ReActSession(user_input=user_input)
             # Add initial user input to conversation history for new sessions
             from ..ai.conversation import Message
-            session.conversation_history.append(Message(role="user", content=user_input))
+            session.add_message(Message(role="user", content=user_input))
         else:
             # Update existing session with new input
             session.user_input = user_input
@@ -206,10 +338,10 @@ class ReActEngine:
             
             # Add new user input to conversation history for context continuity
             from ..ai.conversation import Message
-            session.conversation_history.append(Message(role="user", content=user_input))
+            session.add_message(Message(role="user", content=user_input))
         
         if context:
-            session.metadata.update({"context":context})
+            session.update_metadata({"context":context})
         
         try:
             session.add_log_entry(f"Starting ReAct processing for input: {user_input[:100]}...")
@@ -243,7 +375,7 @@ class ReActEngine:
             if session.conversation_history and len(session.conversation_history) > 0:
                 from ..ai.conversation import Message
                 ai_response_content = final_result.get("content", "Task completed")
-                session.conversation_history.append(Message(role="assistant", content=ai_response_content))
+                session.add_message(Message(role="assistant", content=ai_response_content))
             
             yield final_result
             
@@ -308,9 +440,9 @@ class ReActEngine:
                 session.tasks = tasks
                 
                 # Store planning context in session metadata for later use
-                session.metadata["planning_context"] = {
+                session.update_metadata({"planning_context": {
                     "constraints": planning_context.constraints
-                }
+                }})
                 
                 session.add_log_entry(f"Successfully planned {len(tasks)} tasks")
                 
@@ -440,7 +572,7 @@ class ReActEngine:
             # Add conversational response to conversation history
             if session.conversation_history:
                 from ..ai.conversation import Message
-                session.conversation_history.append(Message(role="assistant", content=response))
+                session.add_message(Message(role="assistant", content=response))
             
             yield {
                 "type": "conversational_response",
@@ -486,65 +618,231 @@ class ReActEngine:
                     break
     
     async def _execute_tasks_in_parallel(self, session: ReActSession) -> AsyncGenerator[Dict[str, Any], None]:
-        """Execute independent tasks in parallel."""
-        # Group tasks by dependencies
-        independent_tasks = [task for task in session.tasks if not task.dependencies]
-        dependent_tasks = [task for task in session.tasks if task.dependencies]
-        
-        # Execute independent tasks in parallel
-        if independent_tasks:
-            yield self._create_status_update(session, f"Executing {len(independent_tasks)} independent tasks in parallel")
-            
-            # Limit concurrent tasks
-            semaphore = asyncio.Semaphore(self.parallel_task_limit)
-            
-            async def execute_with_semaphore(task: Task):
-                async with semaphore:
-                    task_results = []
-                    async for update in self._execute_single_task(session, task):
-                        if update.get("type") == "sub_task_result":
-                            task_results.append(update)
-                    return task_results
-            
-            # Execute tasks concurrently
-            task_coroutines = [execute_with_semaphore(task) for task in independent_tasks]
-            results = await asyncio.gather(*task_coroutines, return_exceptions=True)
-            
-            # Process results
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    session.add_log_entry(f"Parallel task {independent_tasks[i].id} failed: {str(result)}", "ERROR")
-                else:
-                    yield self._create_status_update(session, f"Parallel task {independent_tasks[i].id} completed")
-        
-        # Execute dependent tasks sequentially
-        for task in dependent_tasks:
-            yield self._create_status_update(session, f"Executing dependent task: {task.description}")
-            async for update in self._execute_single_task(session, task):
-                yield update
+        """Execute tasks in parallel wherever their dependencies allow."""
+        async for update in self._execute_task_graph(session):
+            yield update
     
     async def _execute_tasks_adaptively(self, session: ReActSession) -> AsyncGenerator[Dict[str, Any], None]:
         """Adaptively choose execution strategy based on task dependencies."""
-        # Analyze task dependencies to determine best execution strategy
-        has_dependencies = any(task.dependencies for task in session.tasks)
-        
-        # Check if any task contains placeholders that suggest dependency on previous results
-        has_placeholders = any(
-            self._task_contains_placeholders(task) for task in session.tasks
-        )
-        
-        if not has_dependencies and not has_placeholders and len(session.tasks) > 1:
-            # Use parallel execution for truly independent tasks
-            session.add_log_entry("Using parallel execution for independent tasks", "INFO")
-            async for update in self._execute_tasks_in_parallel(session):
+        if len(session.tasks) > 1:
+            # The dependency graph runs independent branches concurrently and
+            # degenerates to plan order for fully chained plans
+            session.add_log_entry("Using dependency graph execution", "INFO")
+            async for update in self._execute_task_graph(session):
                 yield update
         else:
-            # Use sequential execution for dependent tasks or tasks with placeholders
-            reason = "task dependencies" if has_dependencies else "placeholder dependencies"
-            session.add_log_entry(f"Using sequential execution due to {reason}", "INFO")
+            session.add_log_entry("Using sequential execution for a single task", "INFO")
             async for update in self._execute_tasks_sequentially(session):
                 yield update
     
+    def _build_task_graph(self, session: ReActSession) -> Dict[str, Set[str]]:
+        """
+        Build the task dependency graph.
+        
+        Dependencies are resolved like placeholder substitution resolves
+        them. A dependency that cannot be resolved, or a task that uses
+        result placeholders without declaring dependencies, waits for every
+        earlier task. If the resolved graph has a cycle, only edges to
+        earlier tasks are kept.
+        
+        Returns:
+            Dict mapping each task ID to the IDs it depends on
+        """
+        task_ids = [task.id for task in session.tasks]
+        position = {task_id: i for i, task_id in enumerate(task_ids)}
+        graph = {task.id: self._resolve_task_dependencies(session, task) for task in session.tasks}
+        
+        if self._topological_order(graph, task_ids) is None:
+            session.add_log_entry("Task dependencies contain a cycle; falling back to plan order", "WARNING")
+            graph = {
+                task_id: {dep for dep in deps if position[dep] < position[task_id]}
+                for task_id, deps in graph.items()
+            }
+        
+        return graph
+    
+    def _resolve_task_dependencies(self, session: ReActSession, task: Task) -> Set[str]:
+        """Resolve the IDs of the tasks a task has to wait for (see _build_task_graph)."""
+        task_ids = [session_task.id for session_task in session.tasks]
+        position = task_ids.index(task.id) if task.id in task_ids else len(task_ids)
+        earlier = set(task_ids[:position])
+        candidates = [task_id for task_id in task_ids if task_id != task.id]
+        dependencies: Set[str] = set()
+        
+        if task.dependencies:
+            for dependency in task.dependencies:
+                matching_task_id = self._match_dependency(session, dependency, candidates)
+                if matching_task_id:
+                    dependencies.add(matching_task_id)
+                else:
+                    session.add_log_entry(
+                        f"Unresolved dependency '{dependency}' of task {task.id}; waiting for all earlier tasks",
+                        "WARNING"
+                    )
+                    dependencies |= earlier
+        elif self._task_contains_placeholders(task):
+            dependencies = earlier
+        
+        return dependencies
+    
+    @staticmethod
+    def _topological_order(graph: Dict[str, Set[str]], task_ids: List[str]) -> Optional[List[str]]:
+        """Order tasks so dependencies come first (plan order breaks ties); None on a cycle."""
+        remaining = {task_id: set(graph[task_id]) for task_id in task_ids}
+        order = []
+        while remaining:
+            ready = [task_id for task_id in task_ids if task_id in remaining and not remaining[task_id]]
+            if not ready:
+                return None
+            for task_id in ready:
+                order.append(task_id)
+                del remaining[task_id]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        return order
+    
+    async def _execute_task_graph(self, session: ReActSession) -> AsyncGenerator[Dict[str, Any], None]:
+        """
+        Execute tasks as a dependency graph.
+        
+        Each task starts as soon as all of its dependencies have finished,
+        with at most ``parallel_task_limit`` tasks running at once. Updates
+        are streamed in the order they are produced. A critical failure stops
+        new tasks from starting; an execution error does the same and is
+        re-raised once running tasks finish. Per-task and critical-path
+        timing is stored in ``session.metadata["execution_timing"]``.
+        """
+        graph = self._build_task_graph(session)
+        tasks_by_id = {task.id: task for task in session.tasks}
+        task_ids = [task.id for task in session.tasks]
+        position = {task_id: i for i, task_id in enumerate(task_ids)}
+        
+        waiting_on = {task_id: set(deps) for task_id, deps in graph.items()}
+        dependents: Dict[str, List[str]] = {task_id: [] for task_id in task_ids}
+        for task_id, deps in graph.items():
+            for dep in deps:
+                dependents[dep].append(task_id)
+        
+        loop = asyncio.get_running_loop()
+        graph_start = loop.time()
+        timings: Dict[str, Dict[str, float]] = {}
+        updates: asyncio.Queue = asyncio.Queue()
+        
+        async def run_task(task: Task):
+            """Run one task, forwarding its updates and a final (task_id, None, error) marker."""
+            started = loop.time()
+            error = None
+            try:
+                async for update in self._execute_single_task(session, task):
+                    await updates.put((task.id, update, None))
+                session.mark_task_finished(task.id)
+                await self._ensure_task_fully_completed(session, task)
+            except Exception as e:
+                error = e
+            finally:
+                session.mark_task_finished(task.id)
+                finished = loop.time()
+                timings[task.id] = {
+                    "start": started - graph_start,
+                    "end": finished - graph_start,
+                    "duration": finished - started,
+                    "dependency_wait": ready_at[task.id] - graph_start
+                }
+            await updates.put((task.id, None, error))
+        
+        ready = [task_id for task_id in task_ids if not waiting_on[task_id]]
+        ready_at = {task_id: graph_start for task_id in ready}
+        running: Dict[str, asyncio.Task] = {}
+        stop_scheduling = False
+        execution_error: Optional[Exception] = None
+        
+        try:
+            while ready or running:
+                while ready and len(running) < self.parallel_task_limit and not stop_scheduling:
+                    task = tasks_by_id[ready.pop(0)]
+                    if graph[task.id]:
+                        session.record_dependency_wait(task.id, ready_at[task.id] - graph_start)
+                    session.current_task_index = position[task.id]
+                    yield self._create_status_update(
+                        session,
+                        f"Executing task {position[task.id] + 1}/{len(task_ids)}: {task.description}"
+                    )
+                    running[task.id] = asyncio.create_task(run_task(task))
+                
+                if not running:
+                    break
+                
+                task_id, update, error = await updates.get()
+                if update is not None:
+                    yield update
+                    continue
+                
+                # Task finished
+                running.pop(task_id)
+                if error is not None:
+                    session.add_log_entry(f"Task {task_id} failed: {str(error)}", "ERROR")
+                    execution_error = execution_error or error
+                    stop_scheduling = True
+                    continue
+                
+                evaluation = session.evaluations.get(task_id)
+                if evaluation and evaluation.outcome == EvaluationOutcome.FAILURE:
+                    if any("critical" in rec.lower() for rec in evaluation.recommendations):
+                        session.add_log_entry(f"Stopping execution due to critical failure in task {task_id}", "WARNING")
+                        stop_scheduling = True
+                
+                for dependent_id in dependents[task_id]:
+                    waiting_on[dependent_id].discard(task_id)
+                    if not waiting_on[dependent_id]:
+                        ready.append(dependent_id)
+                        ready_at[dependent_id] = loop.time()
+                ready.sort(key=position.__getitem__)
+        
+        finally:
+            for running_task in running.values():
+                running_task.cancel()
+            
+            session.update_metadata({"execution_timing": self._summarize_execution_timing(
+                graph, timings, loop.time() - graph_start
+            )})
+        
+        if execution_error is not None:
+            raise execution_error
+    
+    @staticmethod
+    def _summarize_execution_timing(
+        graph: Dict[str, Set[str]],
+        timings: Dict[str, Dict[str, float]],
+        wall_time: float
+    ) -> Dict[str, Any]:
+        """Compute the critical path (longest chain of task durations) of an executed graph."""
+        path_time: Dict[str, float] = {}
+        previous: Dict[str, Optional[str]] = {}
+        
+        # Tasks finish after their dependencies, so end time is a valid topological order
+        for task_id in sorted(timings, key=lambda t: timings[t]["end"]):
+            ran_deps = [dep for dep in graph.get(task_id, ()) if dep in path_time]
+            best = max(ran_deps, key=path_time.__getitem__, default=None)
+            previous[task_id] = best
+            path_time[task_id] = timings[task_id]["duration"] + (path_time[best] if best else 0.0)
+        
+        critical_path: List[str] = []
+        node = max(path_time, key=path_time.__getitem__, default=None)
+        while node is not None:
+            critical_path.append(node)
+            node = previous[node]
+        critical_path.reverse()
+        
+        total_task_time = sum(t["duration"] for t in timings.values())
+        return {
+            "wall_time": wall_time,
+            "total_task_time": total_task_time,
+            "critical_path": critical_path,
+            "critical_path_time": path_time[critical_path[-1]] if critical_path else 0.0,
+            "parallelism": total_task_time / wall_time if wall_time > 0 else 0.0,
+            "tasks": timings
+        }
+    
     def _task_contains_placeholders(self, task) -> bool:
         """Check if a task contains placeholders that suggest dependency on previous results."""
         import re
@@ -567,6 +865,58 @@ class ReActEngine:
         # Check task input for placeholders
         return check_value(task.tool_input)
     
+    def _match_dependency(self, session: ReActSession, dependency: Any, candidate_ids: List[str]) -> Optional[str]:
+        """
+        Resolve a planner dependency (task ID or task description) to a task ID.
+        
+        Args:
+            session: Current session
+            dependency: Dependency entry from Task.dependencies
+            candidate_ids: IDs of the tasks the dependency may refer to
+            
+        Returns:
+            Matching task ID, or None if nothing matches
+        """
+        session.add_log_entry(f"DEBUG: Looking for dependency: '{str(dependency)}'", "DEBUG")
+        
+        # Strategy 1: Direct task ID match (if dependency is already a task ID)
+        if str(dependency) in candidate_ids:
+            session.add_log_entry(f"DEBUG: Direct task ID match: {dependency}", "DEBUG")
+            return str(dependency)
+        
+        # Strategy 2: Find task by description matching
+        dep_str = str(dependency) if dependency is not None else ""
+        tasks_by_id = {session_task.id: session_task for session_task in session.tasks}
+        
+        for task_id in candidate_ids:
+            matching_session_task = tasks_by_id.get(task_id)
+            if not matching_session_task:
+                continue
+            
+            task_desc = str(matching_session_task.description) if matching_session_task.description else ""
+            session.add_log_entry(f"DEBUG: Comparing '{dep_str}' with task '{task_desc}'", "DEBUG")
+            
+            # Enhanced matching logic
+            if (task_desc == dep_str or  # Exact match
+                (dep_str and dep_str in task_desc) or  # Substring match
+                (dep_str and task_desc.startswith(dep_str)) or  # Prefix match
+                (task_desc and dep_str in task_desc.lower()) or  # Case-insensitive substring
+                # Handle common OCR description patterns
+                (dep_str and "识别" in dep_str and "识别" in task_desc) or
+                (dep_str and "ocr" in dep_str.lower() and matching_session_task.tool_name == "universal_ocr")):
+                session.add_log_entry(f"DEBUG: Found matching task ID: {task_id}", "DEBUG")
+                return task_id
+        
+        # Strategy 3: Fallback - if only one OCR task exists and dependency mentions OCR/识别
+        if "识别" in dep_str or "ocr" in dep_str.lower():
+            ocr_tasks = [task_id for task_id in candidate_ids
+                         if task_id in tasks_by_id and tasks_by_id[task_id].tool_name == "universal_ocr"]
+            if len(ocr_tasks) == 1:
+                session.add_log_entry(f"DEBUG: Fallback OCR task match: {ocr_tasks[0]}", "DEBUG")
+                return ocr_tasks[0]
+        
+        return None
+    
     def _substitute_task_placeholders(self, session: ReActSession, task: Task) -> Task:
         """Replace placeholders in task input with results from previous tasks."""
         import re
@@ -611,51 +961,7 @@ class ReActEngine:
             # Dependencies might be task descriptions or task IDs
             # Enhanced matching: try multiple strategies to find the right task
             for dep_description in task.dependencies:
-                matching_task_id = None
-                
-                session.add_log_entry(f"DEBUG: Looking for dependency: '{str(dep_description)}'", "DEBUG")
-                
-                # Strategy 1: Direct task ID match (if dependency is already a task ID)
-                if str(dep_description) in session.task_results:
-                    matching_task_id = str(dep_description)
-                    session.add_log_entry(f"DEBUG: Direct task ID match: {matching_task_id}", "DEBUG")
-                else:
-                    # Strategy 2: Find task by description matching
-                    dep_str = str(dep_description) if dep_description is not None else ""
-                    
-                    # Look through all tasks with results
-                    for task_id, results in session.task_results.items():
-                        # Find the corresponding task object
-                        matching_session_task = None
-                        for session_task in session.tasks:
-                            if session_task.id == task_id:
-                                matching_session_task = session_task
-                                break
-                        
-                        if matching_session_task:
-                            task_desc = str(matching_session_task.description) if matching_session_task.description else ""
-                            session.add_log_entry(f"DEBUG: Comparing '{dep_str}' with task '{task_desc}'", "DEBUG")
-                            
-                            # Enhanced matching logic
-                            if (task_desc == dep_str or  # Exact match
-                                (dep_str and dep_str in task_desc) or  # Substring match
-                                (dep_str and task_desc.startswith(dep_str)) or  # Prefix match
-                                (task_desc and dep_str in task_desc.lower()) or  # Case-insensitive substring
-                                # Handle common OCR description patterns
-                                (dep_str and "识别" in dep_str and "识别" in task_desc) or
-                                (dep_str and "ocr" in dep_str.lower() and matching_session_task.tool_name == "universal_ocr")):
-                                matching_task_id = task_id
-                                session.add_log_entry(f"DEBUG: Found matching task ID: {matching_task_id}", "DEBUG")
-                                break
-                    
-                    # Strategy 3: Fallback - if only one OCR task exists and dependency mentions OCR/识别
-                    if not matching_task_id and ("识别" in dep_str or "ocr" in dep_str.lower()):
-                        ocr_tasks = [(tid, task) for tid, task in [(tid, next((t for t in session.tasks if t.id == tid), None)) 
-                                                                   for tid in session.task_results.keys()]
-                                    if task and task.tool_name == "universal_ocr"]
-                        if len(ocr_tasks) == 1:
-                            matching_task_id = ocr_tasks[0][0]
-                            session.add_log_entry(f"DEBUG: Fallback OCR task match: {matching_task_id}", "DEBUG")
+                matching_task_id = self._match_dependency(session, dep_description, list(session.task_results.keys()))
                 
                 if matching_task_id and matching_task_id in session.task_results:
                     results = session.task_results[matching_task_id]
@@ -806,39 +1112,26 @@ class ReActEngine:
     async def _ensure_task_fully_completed(self, session: ReActSession, task: Task) -> None:
         """
         方案1: 增强任务完成验证
-        确保任务完全完成，包括结果存储和评估，特别是OUTPUT类型结果
+        等待任务的完成事件，并确认结果和评估都已存储
         """
-        max_wait = 5.0  # 最大等待5秒
-        wait_interval = 0.1  # 100ms检查间隔
-        elapsed = 0.0
-        
         session.add_log_entry(f"Verifying task {task.id} completion", "DEBUG")
         
-        while elapsed < max_wait:
-            # 检查三个关键完成条件
-            has_results = task.id in session.task_results
-            has_evaluation = task.id in session.evaluations
-            has_output_result = False
-            
-            if has_results:
-                results = session.task_results[task.id]
-                # 检查是否有OUTPUT类型的结果且内容不为空
-                has_output_result = any(
-                    r.type.value == 'output' and r.content and r.content.strip()
-                    for r in results
-                )
-            
-            if has_results and has_evaluation and has_output_result:
-                session.add_log_entry(f"Task {task.id} fully completed with all required data", "DEBUG")
-                return
-                
-            await asyncio.sleep(wait_interval)
-            elapsed += wait_interval
+        if not await session.wait_for_tasks([task.id], timeout=5.0):
+            # 超时警告但不阻塞执行
+            session.add_log_entry(f"Warning: Task {task.id} completion verification timeout after 5.0s", "WARNING")
         
-        # 超时警告但不阻塞执行
-        session.add_log_entry(f"Warning: Task {task.id} completion verification timeout after {max_wait}s", "WARNING")
         if task.id not in session.task_results:
             session.add_log_entry(f"Critical: Task {task.id} has no stored results", "ERROR")
+            return
+        
+        has_output_result = any(
+            r.type.value == 'output' and r.content and r.content.strip()
+            for r in session.task_results[task.id]
+        )
+        if task.id in session.evaluations and has_output_result:
+            session.add_log_entry(f"Task {task.id} fully completed with all required data", "DEBUG")
+        else:
+            session.add_log_entry(f"Task {task.id} completed without evaluated OUTPUT results", "DEBUG")
 
     async def _substitute_task_placeholders_with_wait(self, session: ReActSession, task: Task) -> Task:
         """
@@ -852,8 +1145,8 @@ class ReActEngine:
         if self._still_has_placeholders(processed_task):
             session.add_log_entry(f"Task {task.id} still has placeholders, waiting for dependencies", "DEBUG")
             
-            # 等待前序任务的OUTPUT结果可用
-            await self._wait_for_output_results(session, task)
+            # 等待依赖任务完成（事件驱动，无轮询）
+            await self._wait_for_dependencies(session, task)
             
             # 重新替换占位符
             processed_task = self._substitute_task_placeholders(session, task)
@@ -887,28 +1180,23 @@ class ReActEngine:
         
         return check_value(task.tool_input)
     
-    async def _wait_for_output_results(self, session: ReActSession, task: Task) -> None:
-        """等待前序任务产生OUTPUT类型的结果"""
-        max_wait = 3.0  # 最大等待3秒
-        wait_interval = 0.05  # 50ms检查间隔
-        elapsed = 0.0
-        
-        while elapsed < max_wait:
-            # 检查是否有任何任务产生了OUTPUT结果
-            has_output = False
-            for task_id, results in session.task_results.items():
-                if any(r.type.value == 'output' and r.content and r.content.strip() for r in results):
-                    has_output = True
-                    break
-            
-            if has_output:
-                session.add_log_entry(f"OUTPUT results available for task {task.id} placeholder substitution", "DEBUG")
-                return
-                
-            await asyncio.sleep(wait_interval)
-            elapsed += wait_interval
+    async def _wait_for_dependencies(self, session: ReActSession, task: Task, timeout: float = 3.0) -> None:
+        """等待依赖任务的完成事件，并记录等待时长"""
+        dependency_ids = self._resolve_task_dependencies(session, task)
+        if all(session.is_task_finished(task_id) for task_id in dependency_ids):
+            # Already accounted for by the scheduler (or nothing to wait for)
+            return
+        
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        finished = await session.wait_for_tasks(list(dependency_ids), timeout=timeout)
+        waited = loop.time() - started
+        session.record_dependency_wait(task.id, waited)
         
-        session.add_log_entry(f"Timeout waiting for OUTPUT results for task {task.id}", "WARNING")
+        if finished:
+            session.add_log_entry(f"Dependencies of task {task.id} finished after {waited:.3f}s", "DEBUG")
+        else:
+            session.add_log_entry(f"Timeout waiting for dependencies of task {task.id}", "WARNING")
 
     async def _execute_single_task(self, session: ReActSession, task: Task) -> AsyncGenerator[Dict[str, Any], None]:
         """Execute a single task with error handling and evaluation."""
@@ -940,6 +1228,15 @@ class ReActEngine:
         processed_task.update_status(TaskStatus.EXECUTING)
         session.add_log_entry(f"Starting execution of task {processed_task.id}: {processed_task.description}")
         
+        try:
+            async for update in self._run_task_attempts(session, processed_task):
+                yield update
+        finally:
+            # Wake dependents whether the task succeeded, failed or was abandoned
+            session.mark_task_finished(processed_task.id)
+    
+    async def _run_task_attempts(self, session: ReActSession, processed_task: Task) -> AsyncGenerator[Dict[str, Any], None]:
+        """Execute a task's tool with retries, storing and evaluating its results."""
         execution_attempts = 0
         while execution_attempts < self.max_execution_retries:
             try:
@@ -968,7 +1265,7 @@ class ReActEngine:
                     }
                 
                 # Store results
-                session.task_results[processed_task.id] = tool_results
+                session.set_task_results(processed_task.id, tool_results)
                 
                 # Evaluate results
                 session.update_state(ReActState.EVALUATING)
@@ -981,7 +1278,7 @@ class ReActEngine:
                 )
                 
                 evaluation = await self.result_evaluator.evaluate_task_result(processed_task, tool_results, evaluation_context)
-                session.evaluations[processed_task.id] = evaluation
+                session.set_evaluation(processed_task.id, evaluation)
                 
                 # Update task status based on evaluation - also update the original task in session
                 if evaluation.outcome == EvaluationOutcome.SUCCESS:
@@ -1082,7 +1379,7 @@ class ReActEngine:
             session.tasks, session.evaluations
         )
         
-        session.metadata["overall_evaluation"] = overall_evaluation.to_dict()
+        session.update_metadata({"overall_evaluation": overall_evaluation.to_dict()})
         session.add_log_entry(f"Overall assessment: {overall_evaluation.outcome.value} with {overall_evaluation.confidence.value} confidence")
         
         yield {
@@ -1180,7 +1477,8 @@ class ReActEngine:
                 "failed_tasks": failed_tasks,
                 "execution_time": (session.updated_at - session.created_at).total_seconds(),
                 "overall_success": overall_success,
-                "task_results": task_results
+                "task_results": task_results,
+                "execution_timing": session.metadata.get("execution_timing")
             }
         }
     
@@ -1265,7 +1563,7 @@ class ReActEngine:
                 
                 # 🆕 检查是否需要跳过确认（修改计划后的情况）
                 if session.metadata.get("skip_next_confirmation", False):
-                    session.metadata.pop("skip_next_confirmation", None)  # 清除标志，确保只跳过一次
+                    session.pop_metadata("skip_next_confirmation")  # 清除标志，确保只跳过一次
                     session.add_log_entry(f"Skipping confirmation for replanned tasks (round {confirmation_round})")
                     session.update_state(ReActState.EXECUTING)
                     
@@ -1450,7 +1748,7 @@ class ReActEngine:
                     # 将状态重置为等待确认，以便再次请求确认
                     session.update_state(ReActState.AWAITING_CONFIRMATION)
                     # 🆕 设置跳过下次确认的标志，修改计划后直接执行
-                    session.metadata["skip_next_confirmation"] = True
+                    session.update_metadata({"skip_next_confirmation": True})
                     raise ReplanningRequiresConfirmationError("Tasks replanned, confirmation required for new plan")
             else:
                 session.add_log_entry("User requested modification but no modification details provided")
@@ -91,10 +91,15 @@ class MCPReActIntegration:
                     # The ToolRegistry uses class methods, so we register the original tool
                     if hasattr(self.react_engine, 'tool_registry'):
                         # Check if tool is already registered to avoid duplicates
-                        if tool_name not in self.react_engine.tool_registry._tools:
+                        existing = self.react_engine.tool_registry._tools.get(tool_name)
+                        if existing is None:
                             self.react_engine.tool_registry.register(tool)
                             registered_count += 1
                             logger.debug(f"Registered tool '{tool_name}' with ReAct engine")
+                        elif existing is not tool:
+                            # Tool was re-discovered (e.g. schema changed); replace it
+                            self.react_engine.tool_registry.update(tool)
+                            logger.debug(f"Updated tool '{tool_name}' in ReAct engine")
                         else:
                             logger.debug(f"Tool '{tool_name}' already registered, skipping")
             
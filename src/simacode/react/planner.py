@@ -12,12 +12,13 @@ import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, AsyncGenerator
+from typing import Any, Dict, List, Optional, AsyncGenerator, Tuple
 
 from pydantic import BaseModel, Field
 
 from ..ai.base import AIClient, Role
 from ..ai.conversation import Message
+from ..ai.tokenizer import TokenCounter, get_token_counter
 from ..tools import ToolRegistry
 from .exceptions import PlanningError, InvalidTaskError
 
@@ -130,11 +131,27 @@ class TaskPlanner:
     and creating executable task plans using available tools.
     """
     
+    # Tokens added per formatted message for its role label and separator
+    MESSAGE_OVERHEAD_TOKENS = 4
+    
+    # Message tag -> conversation topic label
+    TOPIC_LABELS = {
+        "code": "代码开发",
+        "problem": "问题解决",
+        "implementation": "功能实现",
+        "config": "系统配置",
+    }
+    
     def __init__(self, ai_client: AIClient):
         """Initialize the task planner."""
         self.ai_client = ai_client
         self.tool_registry = ToolRegistry()
         
+        # Tool catalog cache, invalidated by the tool registry version
+        self._tool_descriptions: Dict[str, Tuple[int, str]] = {}  # tool -> (tool version, description)
+        self._tools_description_cache: Optional[Tuple[int, str]] = None
+        self._system_prompt_cache: Optional[Tuple[int, str, str]] = None  # (version, template, prompt)
+        
         # Planning prompts
         self.PLANNING_SYSTEM_PROMPT = """
 You are a task planning expert for an AI programming assistant. Your role is to:
@@ -420,13 +437,8 @@ Always classify the input type first, then respond appropriately.
             PlanningError: If task planning fails
         """
         try:
-            # Get available tools
-            available_tools = self._get_available_tools_description()
-            
-            # Prepare planning prompt
-            system_prompt = self.PLANNING_SYSTEM_PROMPT.format(
-                available_tools=available_tools
-            )
+            # Prepare planning prompt with available tools
+            system_prompt = self._get_planning_system_prompt()
             
             # Create planning messages
             messages = [
@@ -443,7 +455,12 @@ Always classify the input type first, then respond appropriately.
             response = await self.ai_client.chat(messages)
             
             # Parse response - could be tasks or conversational
-            result = await self._parse_planning_response(response.content, context)
+            try:
+                result = await self._parse_planning_response(response.content, context)
+            except Exception:
+                # Don't let a cached unparseable response poison planning retries
+                await self._discard_cached_response(messages)
+                raise
             
             if result["type"] == "conversational_response":
                 # Store conversational response in context for the engine to use
@@ -514,9 +531,7 @@ Respond with a JSON array of alternative task objects.
 """
             
             messages = [
-                Message(role=Role.SYSTEM, content=self.PLANNING_SYSTEM_PROMPT.format(
-                    available_tools=self._get_available_tools_description()
-                )),
+                Message(role=Role.SYSTEM, content=self._get_planning_system_prompt()),
                 Message(role=Role.USER, content=replan_prompt)
             ]
             
@@ -531,22 +546,67 @@ Respond with a JSON array of alternative task objects.
                 context={"failed_task_id": failed_task.id, "error_info": error_info}
             )
     
+    async def _discard_cached_response(self, messages: List[Message]) -> None:
+        """Drop a response from the AI client's response cache, if it has one."""
+        invalidate = getattr(self.ai_client, "invalidate", None)
+        if invalidate is None:
+            return
+        try:
+            await invalidate(messages)
+        except Exception as e:
+            logger.debug(f"Failed to invalidate cached planning response: {str(e)}")
+    
+    def _get_planning_system_prompt(self) -> str:
+        """Get the rendered planning system prompt, re-rendering only when tools change."""
+        version = self.tool_registry.get_version()
+        cached = self._system_prompt_cache
+        if cached and cached[0] == version and cached[1] is self.PLANNING_SYSTEM_PROMPT:
+            return cached[2]
+        
+        prompt = self.PLANNING_SYSTEM_PROMPT.format(
+            available_tools=self._get_available_tools_description()
+        )
+        self._system_prompt_cache = (version, self.PLANNING_SYSTEM_PROMPT, prompt)
+        return prompt
+    
     def _get_available_tools_description(self) -> str:
-        """Get formatted description of available tools with parameter information."""
+        """
+        Get formatted description of available tools with parameter information.
+        
+        The catalog is cached against the tool registry version. When the
+        version changes only tools that were added or updated since the last
+        build are re-described; unchanged tools reuse their cached entry.
+        """
+        version = self.tool_registry.get_version()
+        if self._tools_description_cache and self._tools_description_cache[0] == version:
+            return self._tools_description_cache[1]
+        
         tools = self.tool_registry.get_all_tools()
+        tool_descriptions: Dict[str, Tuple[int, str]] = {}
         descriptions = []
         
         for tool_name, tool in tools.items():
-            description = f"- {tool_name}: {tool.description}"
+            tool_version = self.tool_registry.get_tool_version(tool_name)
+            cached = self._tool_descriptions.get(tool_name)
             
-            # Try to get dynamic parameter information from MCP tools
-            param_info = self._get_tool_parameter_info(tool_name, tool)
-            if param_info:
-                description += f"\n  Parameters: {param_info}"
+            if cached and tool_version is not None and cached[0] == tool_version:
+                description = cached[1]
+            else:
+                description = f"- {tool_name}: {tool.description}"
+                
+                # Try to get dynamic parameter information from MCP tools
+                param_info = self._get_tool_parameter_info(tool_name, tool)
+                if param_info:
+                    description += f"\n  Parameters: {param_info}"
             
+            tool_descriptions[tool_name] = (tool_version, description)
             descriptions.append(description)
         
-        return "\n".join(descriptions)
+        # Dropping the old dict also forgets unregistered tools
+        self._tool_descriptions = tool_descriptions
+        catalog = "\n".join(descriptions)
+        self._tools_description_cache = (version, catalog)
+        return catalog
     
     def _get_tool_parameter_info(self, tool_name: str, tool: Any) -> str:
         """
@@ -656,19 +716,27 @@ Respond with a JSON array of alternative task objects.
             # 保留所有消息
             return self._format_all_messages(history)
         
-        # 按消息数量限制截断
-        if len(history) > config.max_messages:
-            # 保留最近的N条消息
-            recent_history = history[-config.max_messages:]
-            truncated_count = len(history) - config.max_messages
+        # 按消息数量限制截断，保留最近的N条消息
+        recent_history = history[-config.max_messages:]
+        
+        # 按token预算保留最近的消息（使用每条消息缓存的token数）
+        counter = self._get_token_counter(config)
+        kept_history = self._fit_messages_to_budget(recent_history, config.max_tokens, counter)
+        oversized = not kept_history
+        if oversized:
+            # 最新一条消息本身超出预算，保留它并截断其内容
+            kept_history = recent_history[-1:]
+        
+        truncated_count = len(history) - len(kept_history)
+        if truncated_count:
             context = f"[Earlier conversation truncated: {truncated_count} messages]\n\n"
-            context += self._format_all_messages(recent_history)
-            
-            # 检查token限制
-            return self._ensure_token_limit(context, config.max_tokens)
+            context += self._format_all_messages(kept_history)
+        else:
+            context = self._format_all_messages(kept_history)
         
-        formatted_context = self._format_all_messages(history)
-        return self._ensure_token_limit(formatted_context, config.max_tokens)
+        if oversized:
+            return self._ensure_token_limit(context, config.max_tokens, counter)
+        return context
     
     def _get_compressed_conversation_context(self, history: List[Message], config) -> str:
         """智能分层压缩：根据重要性和token预算智能分层处理对话历史"""
@@ -691,6 +759,7 @@ Respond with a JSON array of alternative task objects.
         context_parts = []
         used_tokens = 0
         token_budget = getattr(config, 'token_budget', 4000)  # 默认4000
+        counter = self._get_token_counter(config)
         
         # 优先级1: 最近3条消息（完整保留）
         for msg in layers['critical'][-3:]:
@@ -698,14 +767,16 @@ Respond with a JSON array of alternative task objects.
                 role_label = "User" if msg.role == "user" else "Assistant"
                 formatted_msg = f"{role_label}: {msg.content}"
                 context_parts.append(formatted_msg)
-                used_tokens += len(msg.content) // 4  # 粗略token估算
+                used_tokens += msg.count_tokens(counter) + self.MESSAGE_OVERHEAD_TOKENS
         
         # 优先级2: 重要决策点和关键信息
         for msg in layers['important']:
             if used_tokens < token_budget * 0.9:  # 90%预算
-                compressed = self._compress_message(msg, compression_level=0.5)
+                compression_level = 0.5
+                compressed = self._compress_message(msg, compression_level=compression_level)
                 context_parts.append(compressed)
-                used_tokens += len(compressed) // 4
+                # 按压缩比例缩放缓存的token数，避免每次重新计算
+                used_tokens += int(msg.count_tokens(counter) * compression_level) + self.MESSAGE_OVERHEAD_TOKENS
         
         # 优先级3: 话题摘要
         if used_tokens < token_budget:
@@ -727,11 +798,8 @@ Respond with a JSON array of alternative task objects.
             # 最近的消息标记为关键
             if i >= len(history) - 5:
                 layers['critical'].append(msg)
-            # 包含特定关键词的消息标记为重要
-            elif any(keyword in msg.content.lower() for keyword in [
-                'decision', 'important', 'error', 'problem', 'solution', 
-                '决定', '重要', '错误', '问题', '解决'
-            ]):
+            # 包含关键决策词的消息标记为重要（标签按消息缓存）
+            elif "important" in msg.get_tags():
                 layers['important'].append(msg)
             else:
                 layers['background'].append(msg)
@@ -770,17 +838,11 @@ Respond with a JSON array of alternative task objects.
         topics = set()
         
         for msg in messages:
-            content = msg.content.lower()
-            
-            # 简化的话题识别
-            if any(keyword in content for keyword in ["code", "function", "class", "代码", "函数"]):
-                topics.add("代码开发")
-            if any(keyword in content for keyword in ["error", "problem", "fix", "错误", "问题", "修复"]):
-                topics.add("问题解决")
-            if any(keyword in content for keyword in ["create", "build", "implement", "创建", "构建", "实现"]):
-                topics.add("功能实现")
-            if any(keyword in content for keyword in ["config", "setup", "install", "配置", "设置", "安装"]):
-                topics.add("系统配置")
+            # 简化的话题识别（标签按消息缓存）
+            for tag in msg.get_tags():
+                topic = self.TOPIC_LABELS.get(tag)
+                if topic:
+                    topics.add(topic)
         
         return topics
     
@@ -793,16 +855,37 @@ Respond with a JSON array of alternative task objects.
             formatted.append(f"[{i}] {role_label}: {msg.content}")
         return "\n".join(formatted)
     
-    def _ensure_token_limit(self, context: str, max_tokens: int) -> str:
+    def _get_token_counter(self, config) -> TokenCounter:
+        """获取配置的token计数器（与启动时安装的默认计数器相同，消息缓存的token数可直接复用）"""
+        return get_token_counter(getattr(config, 'tokenizer_vocab', None))
+    
+    def _fit_messages_to_budget(
+        self, messages: List[Message], max_tokens: int, counter: TokenCounter
+    ) -> List[Message]:
+        """从最新消息开始保留不超过token预算的消息"""
+        used_tokens = 0
+        start = len(messages)
+        
+        while start > 0:
+            cost = messages[start - 1].count_tokens(counter) + self.MESSAGE_OVERHEAD_TOKENS
+            if used_tokens + cost > max_tokens:
+                break
+            used_tokens += cost
+            start -= 1
+        
+        return messages[start:]
+    
+    def _ensure_token_limit(self, context: str, max_tokens: int, counter: Optional[TokenCounter] = None) -> str:
         """确保上下文不超过token限制"""
-        # 粗略估算：1 token ≈ 4 characters
-        estimated_tokens = len(context) // 4
+        counter = counter or get_token_counter()
+        estimated_tokens = counter.count(context)
         
         if estimated_tokens <= max_tokens:
             return context
         
-        # 截断到安全长度（保留90%安全边际）
-        safe_length = int(max_tokens * 4 * 0.9)
+        # 按实际的字符/token比例截断到安全长度（保留90%安全边际）
+        chars_per_token = len(context) / max(estimated_tokens, 1)
+        safe_length = int(max_tokens * chars_per_token * 0.9)
         truncated_context = context[:safe_length]
         
         # 在合适的位置截断（避免在消息中间截断）
@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import Any, AsyncGenerator, Dict, List, Optional
 
 from ..ai.factory import AIClientFactory
+from ..ai.tokenizer import configure_token_counter
 from ..config import Config
 from ..react.engine import ReActEngine, ExecutionMode
 from ..session.manager import SessionManager, SessionConfig
@@ -44,6 +45,9 @@ class ReActService:
         self.config = config
         self.api_mode = api_mode
         
+        # Count message tokens with the configured vocab everywhere, not only in the planner
+        configure_token_counter(config.conversation_context.tokenizer_vocab)
+        
         # Initialize AI client
         self.ai_client = AIClientFactory.create_client(config.ai.model_dump())
         
@@ -54,7 +58,8 @@ class ReActService:
             sessions_directory=sessions_dir,
             auto_save_interval=30,
             max_session_age=7,
-            max_sessions_to_keep=max_sessions
+            max_sessions_to_keep=max_sessions,
+            storage_backend=config.session.storage_backend
         )
         self.session_manager = SessionManager(session_config)
         logger.info(f"Session manager configured with max_sessions: {max_sessions}")
@@ -109,6 +114,12 @@ class ReActService:
             active_sessions = list(self.session_manager.active_sessions.keys())
             for session_id in active_sessions:
                 await self.session_manager.save_session(session_id)
+            await self.session_manager.close()
+            
+            # Release the AI client's HTTP connection pool and response cache
+            if self.react_engine.planning_client is not self.ai_client:
+                await self.react_engine.planning_client.close()
+            await self.ai_client.close()
             
             self.is_running = False
             logger.info("ReAct service stopped")
@@ -152,7 +163,7 @@ class ReActService:
                     # Update existing session with new input
                     session.user_input = user_input
                     if context:
-                        session.metadata.update({"context":context})
+                        session.update_metadata({"context":context})
             else:
                 session = await self.session_manager.create_session(user_input, context)
             
@@ -169,7 +180,7 @@ class ReActService:
             
             # Set skip_confirmation in session metadata if provided
             if skip_confirmation:
-                session.metadata["skip_confirmation"] = True
+                session.update_metadata({"skip_confirmation": True})
             
             # Process through ReAct engine with existing session
             session_id = session.id
@@ -183,7 +194,7 @@ class ReActService:
                 # Auto-save session on significant updates
                 update_type = update.get("type")
                 if update_type in auto_save_types:
-                    await self.session_manager.save_session(session_id)
+                    await self.session_manager.checkpoint_session(session_id)
                     needs_final_save = False
                 
                 yield update
@@ -247,18 +258,19 @@ class ReActService:
             from ..utils.task_summary import DEFAULT_TASK_SUCCESS_MESSAGE
             return DEFAULT_TASK_SUCCESS_MESSAGE
     
-    async def list_sessions(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    async def list_sessions(self, limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
         """
         List available sessions.
         
         Args:
             limit: Maximum number of sessions to return
+            offset: Number of sessions to skip
             
         Returns:
             List[Dict[str, Any]]: List of session metadata
         """
         try:
-            return await self.session_manager.list_sessions(limit)
+            return await self.session_manager.list_sessions(limit, offset)
         except Exception as e:
             logger.error(f"Error listing sessions: {str(e)}")
             return []
@@ -7,8 +7,20 @@ session lifecycle operations.
 """
 
 from .manager import SessionManager, SessionConfig
+from .store import (
+    SessionStore,
+    SQLiteSessionStore,
+    JSONSessionStore,
+    create_session_store,
+    migrate_json_sessions,
+)
 
 __all__ = [
     "SessionManager",
     "SessionConfig",
+    "SessionStore",
+    "SQLiteSessionStore",
+    "JSONSessionStore",
+    "create_session_store",
+    "migrate_json_sessions",
 ]
\ No newline at end of file
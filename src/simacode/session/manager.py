@@ -17,6 +17,7 @@ from pydantic import BaseModel, Field
 
 from ..react.engine import ReActSession, ReActState
 from ..react.planner import Task, TaskStatus
+from .store import SessionStore, create_session_store, migrate_json_sessions
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +29,9 @@ class SessionConfig(BaseModel):
     max_session_age: int = Field(default=7, description="Maximum session age in days")
     compression_enabled: bool = Field(default=True)
     max_sessions_to_keep: int = Field(default=100)
+    storage_backend: str = Field(default="sqlite", description="Session storage backend: sqlite or json")
+    database_path: Optional[Path] = Field(default=None, description="SQLite database path (default: sessions.db in sessions_directory)")
+    journal_compaction_threshold: int = Field(default=200, description="Journal entries per session before a checkpoint is folded into a full save")
 
 
 class SessionManager:
@@ -52,6 +56,16 @@ class SessionManager:
         self.config = config
         self.active_sessions: Dict[str, ReActSession] = {}
         self.auto_save_task: Optional[asyncio.Task] = None
+        self.store: SessionStore = create_session_store(
+            config.storage_backend, config.sessions_directory, config.database_path
+        )
+        
+        # What has been persisted per session, so checkpoints only write the delta:
+        # {"log_count": int, "results": {task_id: session version when the results were stored}}
+        self._persisted: Dict[str, Dict[str, Any]] = {}
+        
+        # Legacy JSON session files are imported into the index once per process
+        self._legacy_sessions_imported = config.storage_backend == "json"
         
         # Directory will be created only when needed (on first session creation)
         logger.info(f"Session manager initialized with directory: {self.config.sessions_directory}")
@@ -77,10 +91,10 @@ class SessionManager:
         session = session_id and ReActSession(id=session_id, user_input=user_input) or ReActSession(user_input=user_input)
         
         if context:
-            session.metadata.update({"context":context})
+            session.update_metadata({"context":context})
         
         # Add session metadata
-        session.metadata.update({
+        session.update_metadata({
             "session_manager_version": "1.0.0",
             "created_by": "session_manager",
             "session_type": "react"
@@ -139,22 +153,88 @@ class SessionManager:
             # Ensure directory exists before saving
             self._ensure_sessions_directory()
             
-            session_file = self.config.sessions_directory / f"{session_id}.json"
+            # Mark clean before serializing so changes made during the write stay dirty
+            session.mark_clean()
+            persisted = self._capture_persisted_state(session)
             
-            # Save session data
-            session_data = session.to_dict()
+            # No execution log entry here: it would make every save dirty the session again
+            await self.store.save(session.to_dict())
+            self._persisted[session_id] = persisted
             
-            async with aiofiles.open(session_file, 'w', encoding='utf-8') as f:
-                await f.write(json.dumps(session_data, indent=2, ensure_ascii=False))
-            
-            session.add_log_entry(f"Session saved to {session_file}")
             logger.debug(f"Session saved: {session_id}")
             return True
             
         except Exception as e:
+            session.mark_dirty()
             logger.error(f"Failed to save session {session_id}: {str(e)}")
             return False
     
+    async def checkpoint_session(self, session_id: str) -> bool:
+        """
+        Persist only what changed in a session since it was last saved.
+        
+        Clean sessions are skipped. For dirty sessions, new execution log
+        entries and changed task results are appended to the session journal
+        and only the remaining (small) session fields are rewritten. Once the
+        journal grows past ``journal_compaction_threshold`` entries, or if the
+        store has no journal, a full save is done instead.
+        
+        Args:
+            session_id: Session identifier
+            
+        Returns:
+            bool: True if anything was written, False otherwise
+        """
+        session = self.active_sessions.get(session_id)
+        if not session or not session.dirty:
+            return False
+        
+        persisted = self._persisted.get(session_id)
+        if not self.store.supports_journal or persisted is None \
+                or len(session.execution_log) < persisted["log_count"]:
+            return await self.save_session(session_id)
+        
+        try:
+            session.mark_clean()
+            current = self._capture_persisted_state(session)
+            
+            journal: List[Dict[str, Any]] = []
+            new_log_entries = session.execution_log[persisted["log_count"]:]
+            if new_log_entries:
+                journal.append({"type": "log", "entries": new_log_entries})
+            
+            for task_id, results in session.task_results.items():
+                if persisted["results"].get(task_id) != current["results"].get(task_id):
+                    journal.append({
+                        "type": "task_results",
+                        "task_id": task_id,
+                        "results": [result.to_dict() for result in results]
+                    })
+            
+            journal_size = await self.store.checkpoint(session.to_checkpoint_dict(), journal)
+            self._persisted[session_id] = current
+            
+            logger.debug(f"Session checkpointed: {session_id} ({len(journal)} journal entries)")
+            
+        except Exception as e:
+            session.mark_dirty()
+            logger.error(f"Failed to checkpoint session {session_id}: {str(e)}")
+            return False
+        
+        if journal_size >= self.config.journal_compaction_threshold:
+            # Fold the journal back into the session document
+            session.mark_dirty()
+            return await self.save_session(session_id)
+        
+        return True
+    
+    def _capture_persisted_state(self, session: ReActSession) -> Dict[str, Any]:
+        """Snapshot the parts of a session that are journaled incrementally."""
+        return {
+            "log_count": len(session.execution_log),
+            "results": dict(session.results_versions)
+        }
+    
     async def load_session(self, session_id: str) -> Optional[ReActSession]:
         """
         Load a session from disk.
@@ -166,16 +246,17 @@ class SessionManager:
             Optional[ReActSession]: Loaded session or None if not found
         """
         try:
-            session_file = self.config.sessions_directory / f"{session_id}.json"
-            
-            if not session_file.exists():
-                return None
+            session_data = await self.store.load(session_id)
             
-            async with aiofiles.open(session_file, 'r', encoding='utf-8') as f:
-                session_data = json.loads(await f.read())
+            if session_data is None:
+                session_data = await self._import_legacy_session(session_id)
+                if session_data is None:
+                    return None
             
             # Reconstruct session from data
             session = await self._reconstruct_session_from_data(session_data)
+            session.mark_clean()
+            self._persisted[session.id] = self._capture_persisted_state(session)
             
             logger.debug(f"Session loaded: {session_id}")
             return session
@@ -184,6 +265,39 @@ class SessionManager:
             logger.error(f"Failed to load session {session_id}: {str(e)}")
             return None
     
+    async def _import_legacy_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Import a session saved as a legacy JSON file into the current store."""
+        session_file = self.config.sessions_directory / f"{session_id}.json"
+        if self.config.storage_backend == "json" or not session_file.exists():
+            return None
+        
+        async with aiofiles.open(session_file, 'r', encoding='utf-8') as f:
+            session_data = json.loads(await f.read())
+        session_data.setdefault("id", session_id)
+        
+        await self.store.save(session_data)
+        logger.info(f"Imported legacy session file into {self.config.storage_backend} store: {session_id}")
+        return session_data
+    
+    async def _import_legacy_sessions(self) -> None:
+        """
+        Import legacy JSON session files into the store's index.
+        
+        Runs before the first listing, count or cleanup, so sessions saved by
+        the JSON backend keep showing up after upgrading without running
+        ``simacode session migrate``. Sessions already in the store are skipped.
+        """
+        if self._legacy_sessions_imported:
+            return
+        self._legacy_sessions_imported = True
+        
+        if not any(self.config.sessions_directory.glob("*.json")):
+            return
+        try:
+            await migrate_json_sessions(self.config.sessions_directory, self.store)
+        except Exception as e:
+            logger.error(f"Failed to import legacy session files: {str(e)}")
+    
     async def _reconstruct_session_from_data(self, session_data: Dict[str, Any]) -> ReActSession:
         """Reconstruct a ReActSession from serialized data."""
         session = ReActSession()
@@ -240,8 +354,10 @@ class SessionManager:
             # Remove from active sessions
             if session_id in self.active_sessions:
                 del self.active_sessions[session_id]
+            self._persisted.pop(session_id, None)
             
-            # Delete from disk
+            # Delete from disk, including any legacy JSON file
+            await self.store.delete(session_id)
             session_file = self.config.sessions_directory / f"{session_id}.json"
             if session_file.exists():
                 session_file.unlink()
@@ -253,54 +369,46 @@ class SessionManager:
             logger.error(f"Failed to delete session {session_id}: {str(e)}")
             return False
     
-    async def list_sessions(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    async def list_sessions(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        state: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """
-        List available sessions with metadata.
+        List available sessions with metadata, newest first.
         
         Args:
             limit: Maximum number of sessions to return
+            offset: Number of sessions to skip (for pagination)
+            state: Only return sessions in this state
             
         Returns:
             List[Dict[str, Any]]: List of session metadata
         """
-        sessions = []
-        
-        # If directory doesn't exist, return empty list (no sessions)
-        if not self.config.sessions_directory.exists():
-            return sessions
-        
         try:
-            session_files = list(self.config.sessions_directory.glob("*.json"))
-            
-            # Sort by modification time (newest first)
-            session_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-            
-            if limit:
-                session_files = session_files[:limit]
-            
-            for session_file in session_files:
-                try:
-                    async with aiofiles.open(session_file, 'r', encoding='utf-8') as f:
-                        session_data = json.loads(await f.read())
-                    
-                    sessions.append({
-                        "id": session_data.get("id", session_file.stem),
-                        "user_input": session_data.get("user_input", "")[:100],
-                        "state": session_data.get("state", "unknown"),
-                        "created_at": session_data.get("created_at"),
-                        "updated_at": session_data.get("updated_at"),
-                        "task_count": len(session_data.get("tasks", [])),
-                        "file_size": session_file.stat().st_size
-                    })
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to read session metadata from {session_file}: {str(e)}")
-                    continue
-            
+            await self._import_legacy_sessions()
+            return await self.store.list_sessions(limit=limit, offset=offset, state=state)
         except Exception as e:
             logger.error(f"Failed to list sessions: {str(e)}")
+            return []
+    
+    async def count_sessions(self, state: Optional[str] = None) -> int:
+        """
+        Count stored sessions.
         
-        return sessions
+        Args:
+            state: Only count sessions in this state
+            
+        Returns:
+            int: Number of sessions
+        """
+        try:
+            await self._import_legacy_sessions()
+            return await self.store.count(state)
+        except Exception as e:
+            logger.error(f"Failed to count sessions: {str(e)}")
+            return 0
     
     async def cleanup_old_sessions(self) -> int:
         """
@@ -368,9 +476,9 @@ class SessionManager:
             try:
                 await asyncio.sleep(self.config.auto_save_interval)
                 
-                # Save all active sessions
+                # Checkpoint active sessions that changed since the last tick
                 for session_id in list(self.active_sessions.keys()):
-                    await self.save_session(session_id)
+                    await self.checkpoint_session(session_id)
                 
                 # Periodic cleanup
                 if datetime.now().hour == 2:  # Run cleanup at 2 AM
@@ -385,29 +493,22 @@ class SessionManager:
     async def get_session_statistics(self) -> Dict[str, Any]:
         """Get session management statistics."""
         try:
-            sessions = await self.list_sessions()
-            
-            # Calculate statistics
-            total_sessions = len(sessions)
-            active_sessions = len(self.active_sessions)
-            
-            states = {}
-            for session_info in sessions:
-                state = session_info.get("state", "unknown")
-                states[state] = states.get(state, 0) + 1
-            
-            # Disk usage
-            total_size = sum(session_info.get("file_size", 0) for session_info in sessions)
+            await self._import_legacy_sessions()
+            stats = await self.store.get_statistics()
             
             return {
-                "total_sessions": total_sessions,
-                "active_sessions": active_sessions,
-                "state_distribution": states,
-                "total_disk_usage": total_size,
+                **stats,
+                "active_sessions": len(self.active_sessions),
+                "storage_backend": self.config.storage_backend,
                 "sessions_directory": str(self.config.sessions_directory),
                 "auto_save_enabled": self.auto_save_task is not None and not self.auto_save_task.done()
             }
             
         except Exception as e:
             logger.error(f"Failed to get session statistics: {str(e)}")
-            return {}
\ No newline at end of file
+            return {}
+    
+    async def close(self) -> None:
+        """Stop auto-save and release the session store."""
+        await self.stop_auto_save()
+        await self.store.close()
@@ -0,0 +1,626 @@
+"""
+Session storage backends.
+
+This module provides the persistence layer used by SessionManager. The
+default SQLite backend keeps a small metadata index (id, state, timestamps,
+task count) separate from the session payload, so listing sessions never has
+to read full session documents. Payloads are split into sections and only
+sections whose content changed are rewritten on save. Between full saves,
+new execution log entries and task results are appended to a per-session
+journal (checkpoints) and folded back into the sections on the next full save.
+
+The legacy one-JSON-file-per-session layout is still available as
+JSONSessionStore, and migrate_json_sessions imports existing JSON files into
+any store.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import aiofiles
+
+logger = logging.getLogger(__name__)
+
+# Payload sections stored separately by SQLiteSessionStore
+SESSION_SECTIONS = (
+    "tasks",
+    "task_results",
+    "evaluations",
+    "conversation_history",
+    "execution_log",
+    "metadata",
+)
+
+PREVIEW_LENGTH = 100
+
+
+def build_index_entry(session_data: Dict[str, Any], size: int = 0) -> Dict[str, Any]:
+    """
+    Build the index entry (listing metadata) for a serialized session.
+
+    Args:
+        session_data: Session dictionary as produced by ReActSession.to_dict()
+        size: Serialized payload size in bytes
+
+    Returns:
+        Dict[str, Any]: Session metadata used for listing
+    """
+    return {
+        "id": session_data.get("id"),
+        "user_input": (session_data.get("user_input") or "")[:PREVIEW_LENGTH],
+        "state": session_data.get("state", "unknown"),
+        "created_at": session_data.get("created_at"),
+        "updated_at": session_data.get("updated_at"),
+        "task_count": len(session_data.get("tasks", [])),
+        "file_size": size,
+    }
+
+
+class SessionStore(ABC):
+    """Abstract storage backend for serialized ReAct sessions."""
+
+    @abstractmethod
+    async def save(self, session_data: Dict[str, Any]) -> bool:
+        """
+        Persist a serialized session.
+
+        Returns:
+            bool: True if the session was saved
+        """
+        pass
+
+    @abstractmethod
+    async def load(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Load a serialized session, or None if it does not exist."""
+        pass
+
+    # Whether checkpoint() is supported; otherwise callers fall back to save()
+    supports_journal = False
+
+    async def checkpoint(self, session_data: Dict[str, Any], journal: List[Dict[str, Any]]) -> int:
+        """
+        Persist a partial session plus journal entries without a full rewrite.
+
+        Args:
+            session_data: Session dictionary without ``task_results`` and
+                ``execution_log`` (see ReActSession.to_checkpoint_dict())
+            journal: Entries to append, either ``{"type": "log", "entries": [...]}``
+                or ``{"type": "task_results", "task_id": ..., "results": [...]}``
+
+        Returns:
+            int: Number of journal entries now pending for the session
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support journaling")
+
+    @abstractmethod
+    async def delete(self, session_id: str) -> bool:
+        """Delete a session. Returns True if it existed."""
+        pass
+
+    @abstractmethod
+    async def exists(self, session_id: str) -> bool:
+        """Check whether a session is stored."""
+        pass
+
+    @abstractmethod
+    async def list_sessions(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        state: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """List session metadata, newest first."""
+        pass
+
+    @abstractmethod
+    async def count(self, state: Optional[str] = None) -> int:
+        """Count stored sessions, optionally filtered by state."""
+        pass
+
+    async def get_statistics(self) -> Dict[str, Any]:
+        """Get storage statistics."""
+        sessions = await self.list_sessions()
+        states: Dict[str, int] = {}
+        for session_info in sessions:
+            state = session_info.get("state", "unknown")
+            states[state] = states.get(state, 0) + 1
+
+        return {
+            "total_sessions": len(sessions),
+            "state_distribution": states,
+            "total_disk_usage": sum(info.get("file_size", 0) for info in sessions),
+        }
+
+    async def close(self) -> None:
+        """Release backend resources."""
+        pass
+
+
+class JSONSessionStore(SessionStore):
+    """
+    Legacy store with one pretty-printed JSON file per session.
+
+    Listing has to open every file, so prefer SQLiteSessionStore for large
+    session histories.
+    """
+
+    def __init__(self, sessions_directory: Path):
+        self.sessions_directory = Path(sessions_directory)
+
+    def _session_file(self, session_id: str) -> Path:
+        return self.sessions_directory / f"{session_id}.json"
+
+    async def save(self, session_data: Dict[str, Any]) -> bool:
+        self.sessions_directory.mkdir(parents=True, exist_ok=True)
+
+        async with aiofiles.open(self._session_file(session_data["id"]), 'w', encoding='utf-8') as f:
+            await f.write(json.dumps(session_data, indent=2, ensure_ascii=False))
+        return True
+
+    async def load(self, session_id: str) -> Optional[Dict[str, Any]]:
+        session_file = self._session_file(session_id)
+        if not session_file.exists():
+            return None
+
+        async with aiofiles.open(session_file, 'r', encoding='utf-8') as f:
+            return json.loads(await f.read())
+
+    async def delete(self, session_id: str) -> bool:
+        session_file = self._session_file(session_id)
+        if session_file.exists():
+            session_file.unlink()
+            return True
+        return False
+
+    async def exists(self, session_id: str) -> bool:
+        return self._session_file(session_id).exists()
+
+    async def list_sessions(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        state: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        sessions = []
+
+        # If directory doesn't exist, return empty list (no sessions)
+        if not self.sessions_directory.exists():
+            return sessions
+
+        session_files = list(self.sessions_directory.glob("*.json"))
+
+        # Sort by modification time (newest first)
+        session_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
+
+        for session_file in session_files:
+            try:
+                async with aiofiles.open(session_file, 'r', encoding='utf-8') as f:
+                    session_data = json.loads(await f.read())
+            except Exception as e:
+                logger.warning(f"Failed to read session metadata from {session_file}: {str(e)}")
+                continue
+
+            session_data.setdefault("id", session_file.stem)
+            if state and session_data.get("state") != state:
+                continue
+            sessions.append(build_index_entry(session_data, session_file.stat().st_size))
+
+        end = offset + limit if limit else None
+        return sessions[offset:end]
+
+    async def count(self, state: Optional[str] = None) -> int:
+        if state is None:
+            if not self.sessions_directory.exists():
+                return 0
+            return len(list(self.sessions_directory.glob("*.json")))
+        return len(await self.list_sessions(state=state))
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    Session store backed by a SQLite database.
+
+    The ``sessions`` table is the metadata index used for listing; payload
+    sections live in ``session_sections`` and are only rewritten when their
+    content hash changes. Database access runs in a worker thread to keep the
+    event loop responsive. The database file is created on first write.
+    """
+
+    SCHEMA_VERSION = 2
+
+    supports_journal = True
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path).expanduser()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+        # Hash of the last stored content per session and section
+        self._section_hashes: Dict[str, Dict[str, str]] = {}
+        # Number of journal entries not yet folded into the sections
+        self._journal_sizes: Dict[str, int] = {}
+
+    def _get_connection(self, create: bool) -> Optional[sqlite3.Connection]:
+        """Open the database, creating it only if `create` is True."""
+        if self._conn is not None:
+            return self._conn
+        if not create and not self.db_path.exists():
+            return None
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        self._migrate_schema(conn)
+        self._conn = conn
+        return conn
+
+    def _migrate_schema(self, conn: sqlite3.Connection) -> None:
+        """Create or upgrade the database schema."""
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+
+        if version < 1:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS sessions (
+                    id TEXT PRIMARY KEY,
+                    user_input TEXT NOT NULL DEFAULT '',
+                    state TEXT NOT NULL,
+                    created_at TEXT,
+                    updated_at TEXT,
+                    task_count INTEGER NOT NULL DEFAULT 0,
+                    payload_size INTEGER NOT NULL DEFAULT 0,
+                    core TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_sessions_updated ON sessions (updated_at);
+                CREATE INDEX IF NOT EXISTS idx_sessions_state ON sessions (state, updated_at);
+                CREATE TABLE IF NOT EXISTS session_sections (
+                    session_id TEXT NOT NULL,
+                    section TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (session_id, section)
+                );
+                """
+            )
+
+        if version < 2:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS session_journal (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    session_id TEXT NOT NULL,
+                    entry TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_session_journal_session ON session_journal (session_id, seq);
+                """
+            )
+
+        conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        conn.commit()
+
+    @staticmethod
+    def _dumps(value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str)
+
+    @staticmethod
+    def _hash(data: str) -> str:
+        return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+    def _load_section_hashes(self, conn: sqlite3.Connection, session_id: str) -> Dict[str, str]:
+        """Get stored section hashes, reading them from disk if not cached."""
+        hashes = self._section_hashes.get(session_id)
+        if hashes is None:
+            rows = conn.execute(
+                "SELECT section, data FROM session_sections WHERE session_id = ?", (session_id,)
+            ).fetchall()
+            hashes = {section: self._hash(data) for section, data in rows}
+            self._section_hashes[session_id] = hashes
+        return hashes
+
+    def _write_sync(self, session_data: Dict[str, Any], journal: Optional[List[Dict[str, Any]]]) -> int:
+        """
+        Write the index row, changed sections and, for checkpoints, journal entries.
+
+        A full save (``journal`` is None) also folds the journal into the
+        sections by deleting the session's journal entries.
+        """
+        session_id = session_data["id"]
+        sections = {
+            name: self._dumps(session_data[name]) for name in SESSION_SECTIONS if name in session_data
+        }
+        core = self._dumps({k: v for k, v in session_data.items() if k not in SESSION_SECTIONS})
+        index = build_index_entry(session_data)
+        journal_rows = [(session_id, self._dumps(entry)) for entry in journal or []]
+
+        with self._lock:
+            conn = self._get_connection(create=True)
+            hashes = self._load_section_hashes(conn, session_id)
+
+            changed = {
+                name: data for name, data in sections.items()
+                if hashes.get(name) != self._hash(data)
+            }
+
+            if journal is None:
+                payload_size = len(core) + sum(len(data) for data in sections.values())
+                size_update = "payload_size = excluded.payload_size"
+            else:
+                payload_size = len(core) + sum(len(data) for data in changed.values()) \
+                    + sum(len(row[1]) for row in journal_rows)
+                size_update = "payload_size = sessions.payload_size + excluded.payload_size"
+
+            conn.execute(
+                "INSERT INTO sessions (id, user_input, state, created_at, updated_at, task_count, payload_size, core) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(id) DO UPDATE SET user_input = excluded.user_input, state = excluded.state, "
+                "created_at = excluded.created_at, updated_at = excluded.updated_at, "
+                f"task_count = excluded.task_count, {size_update}, core = excluded.core",
+                (
+                    session_id, session_data.get("user_input") or "", index["state"],
+                    index["created_at"], index["updated_at"], index["task_count"], payload_size, core
+                )
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO session_sections (session_id, section, data) VALUES (?, ?, ?)",
+                [(session_id, name, data) for name, data in changed.items()]
+            )
+
+            if journal is None:
+                conn.execute("DELETE FROM session_journal WHERE session_id = ?", (session_id,))
+                journal_size = 0
+            else:
+                journal_size = self._get_journal_size(conn, session_id) + len(journal_rows)
+                conn.executemany("INSERT INTO session_journal (session_id, entry) VALUES (?, ?)", journal_rows)
+
+            conn.commit()
+
+            for name, data in changed.items():
+                hashes[name] = self._hash(data)
+            self._journal_sizes[session_id] = journal_size
+
+        logger.debug(
+            f"Session {session_id} {'saved' if journal is None else 'checkpointed'} "
+            f"({len(changed)} sections changed, {len(journal_rows)} journal entries)"
+        )
+        return journal_size
+
+    def _get_journal_size(self, conn: sqlite3.Connection, session_id: str) -> int:
+        """Get the number of stored journal entries, reading it from disk if not cached."""
+        if session_id not in self._journal_sizes:
+            self._journal_sizes[session_id] = conn.execute(
+                "SELECT COUNT(*) FROM session_journal WHERE session_id = ?", (session_id,)
+            ).fetchone()[0]
+        return self._journal_sizes[session_id]
+
+    @staticmethod
+    def _apply_journal(session_data: Dict[str, Any], entries: List[Dict[str, Any]]) -> None:
+        """Replay journal entries on top of the stored sections."""
+        execution_log = session_data.setdefault("execution_log", [])
+        task_results = session_data.setdefault("task_results", {})
+
+        for entry in entries:
+            if entry.get("type") == "log":
+                execution_log.extend(entry.get("entries", []))
+            elif entry.get("type") == "task_results":
+                task_results[entry["task_id"]] = entry.get("results", [])
+
+    def _load_sync(self, session_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            conn = self._get_connection(create=False)
+            if conn is None:
+                return None
+
+            row = conn.execute("SELECT core FROM sessions WHERE id = ?", (session_id,)).fetchone()
+            if row is None:
+                return None
+
+            rows = conn.execute(
+                "SELECT section, data FROM session_sections WHERE session_id = ?", (session_id,)
+            ).fetchall()
+            journal_rows = conn.execute(
+                "SELECT entry FROM session_journal WHERE session_id = ? ORDER BY seq", (session_id,)
+            ).fetchall()
+
+            session_data = json.loads(row[0])
+            hashes = {}
+            for section, data in rows:
+                session_data[section] = json.loads(data)
+                hashes[section] = self._hash(data)
+            self._section_hashes[session_id] = hashes
+            self._journal_sizes[session_id] = len(journal_rows)
+
+        self._apply_journal(session_data, [json.loads(entry) for (entry,) in journal_rows])
+        return session_data
+
+    def _delete_sync(self, session_id: str) -> bool:
+        with self._lock:
+            conn = self._get_connection(create=False)
+            if conn is None:
+                return False
+
+            cursor = conn.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
+            conn.execute("DELETE FROM session_sections WHERE session_id = ?", (session_id,))
+            conn.execute("DELETE FROM session_journal WHERE session_id = ?", (session_id,))
+            conn.commit()
+            self._section_hashes.pop(session_id, None)
+            self._journal_sizes.pop(session_id, None)
+            return cursor.rowcount > 0
+
+    def _exists_sync(self, session_id: str) -> bool:
+        with self._lock:
+            conn = self._get_connection(create=False)
+            if conn is None:
+                return False
+            return conn.execute("SELECT 1 FROM sessions WHERE id = ?", (session_id,)).fetchone() is not None
+
+    def _list_sync(self, limit: Optional[int], offset: int, state: Optional[str]) -> List[Dict[str, Any]]:
+        query = (
+            "SELECT id, substr(user_input, 1, ?), state, created_at, updated_at, task_count, payload_size "
+            "FROM sessions"
+        )
+        params: List[Any] = [PREVIEW_LENGTH]
+        if state:
+            query += " WHERE state = ?"
+            params.append(state)
+        query += " ORDER BY updated_at DESC LIMIT ? OFFSET ?"
+        params.extend([limit if limit else -1, offset])
+
+        with self._lock:
+            conn = self._get_connection(create=False)
+            if conn is None:
+                return []
+            rows = conn.execute(query, params).fetchall()
+
+        return [
+            {
+                "id": row[0],
+                "user_input": row[1],
+                "state": row[2],
+                "created_at": row[3],
+                "updated_at": row[4],
+                "task_count": row[5],
+                "file_size": row[6],
+            }
+            for row in rows
+        ]
+
+    def _count_sync(self, state: Optional[str]) -> int:
+        with self._lock:
+            conn = self._get_connection(create=False)
+            if conn is None:
+                return 0
+            if state:
+                return conn.execute("SELECT COUNT(*) FROM sessions WHERE state = ?", (state,)).fetchone()[0]
+            return conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+    def _statistics_sync(self) -> Dict[str, Any]:
+        with self._lock:
+            conn = self._get_connection(create=False)
+            if conn is None:
+                return {"total_sessions": 0, "state_distribution": {}, "total_disk_usage": 0}
+            rows = conn.execute("SELECT state, COUNT(*) FROM sessions GROUP BY state").fetchall()
+
+        states = {state: count for state, count in rows}
+        return {
+            "total_sessions": sum(states.values()),
+            "state_distribution": states,
+            "total_disk_usage": self.db_path.stat().st_size if self.db_path.exists() else 0,
+        }
+
+    async def save(self, session_data: Dict[str, Any]) -> bool:
+        await asyncio.to_thread(self._write_sync, session_data, None)
+        return True
+
+    async def checkpoint(self, session_data: Dict[str, Any], journal: List[Dict[str, Any]]) -> int:
+        return await asyncio.to_thread(self._write_sync, session_data, journal)
+
+    async def load(self, session_id: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self._load_sync, session_id)
+
+    async def delete(self, session_id: str) -> bool:
+        return await asyncio.to_thread(self._delete_sync, session_id)
+
+    async def exists(self, session_id: str) -> bool:
+        return await asyncio.to_thread(self._exists_sync, session_id)
+
+    async def list_sessions(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        state: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self._list_sync, limit, offset, state)
+
+    async def count(self, state: Optional[str] = None) -> int:
+        return await asyncio.to_thread(self._count_sync, state)
+
+    async def get_statistics(self) -> Dict[str, Any]:
+        return await asyncio.to_thread(self._statistics_sync)
+
+    async def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+            self._section_hashes.clear()
+            self._journal_sizes.clear()
+
+
+async def migrate_json_sessions(
+    source_directory: Path,
+    store: SessionStore,
+    overwrite: bool = False,
+    delete_source: bool = False
+) -> Dict[str, int]:
+    """
+    Import legacy one-file-per-session JSON sessions into a store.
+
+    Args:
+        source_directory: Directory containing ``<session_id>.json`` files
+        store: Destination store
+        overwrite: Replace sessions that already exist in the store
+        delete_source: Delete each JSON file after it was imported
+
+    Returns:
+        Dict[str, int]: Counts of imported, skipped and failed sessions
+    """
+    source = JSONSessionStore(source_directory)
+    results = {"imported": 0, "skipped": 0, "failed": 0}
+
+    if not source.sessions_directory.exists():
+        return results
+
+    for session_file in sorted(source.sessions_directory.glob("*.json")):
+        session_id = session_file.stem
+        try:
+            if not overwrite and await store.exists(session_id):
+                results["skipped"] += 1
+                continue
+
+            session_data = await source.load(session_id)
+            session_data.setdefault("id", session_id)
+            await store.save(session_data)
+
+            if delete_source:
+                session_file.unlink()
+            results["imported"] += 1
+
+        except Exception as e:
+            logger.warning(f"Failed to migrate session file {session_file}: {str(e)}")
+            results["failed"] += 1
+
+    logger.info(
+        f"Session migration from {source_directory}: {results['imported']} imported, "
+        f"{results['skipped']} skipped, {results['failed']} failed"
+    )
+    return results
+
+
+def create_session_store(backend: str, sessions_directory: Path, database_path: Optional[Path] = None) -> SessionStore:
+    """
+    Create a session store.
+
+    Args:
+        backend: "sqlite" or "json"
+        sessions_directory: Directory for session data
+        database_path: SQLite database path (defaults to sessions.db in sessions_directory)
+
+    Returns:
+        SessionStore instance
+
+    Raises:
+        ValueError: If the backend type is not supported
+    """
+    if backend == "sqlite":
+        return SQLiteSessionStore(database_path or Path(sessions_directory) / "sessions.db")
+    if backend == "json":
+        return JSONSessionStore(sessions_directory)
+
+    raise ValueError(f"Unsupported session storage backend: {backend}")
@@ -334,6 +334,8 @@ class ToolRegistry:
     
     _instance: Optional["ToolRegistry"] = None
     _tools: Dict[str, Tool] = {}
+    _version: int = 0  # Bumped on every change so consumers can cache derived data
+    _tool_versions: Dict[str, int] = {}  # Registry version at which each tool last changed
     
     def __new__(cls) -> "ToolRegistry":
         """Ensure singleton pattern."""
@@ -356,6 +358,20 @@ class ToolRegistry:
             raise ValueError(f"Tool '{tool.name}' is already registered")
         
         cls._tools[tool.name] = tool
+        cls._version += 1
+        cls._tool_versions[tool.name] = cls._version
+    
+    @classmethod
+    def update(cls, tool: Tool) -> None:
+        """
+        Register a tool, replacing any existing tool with the same name.
+        
+        Args:
+            tool: Tool instance to register or replace
+        """
+        cls._tools[tool.name] = tool
+        cls._version += 1
+        cls._tool_versions[tool.name] = cls._version
     
     @classmethod
     def unregister(cls, tool_name: str) -> bool:
@@ -370,6 +386,8 @@ class ToolRegistry:
         """
         if tool_name in cls._tools:
             del cls._tools[tool_name]
+            cls._tool_versions.pop(tool_name, None)
+            cls._version += 1
             return True
         return False
     
@@ -424,6 +442,34 @@ class ToolRegistry:
     def clear(cls) -> None:
         """Clear all registered tools (mainly for testing)."""
         cls._tools.clear()
+        cls._tool_versions.clear()
+        cls._version += 1
+    
+    @classmethod
+    def get_version(cls) -> int:
+        """
+        Get the registry version.
+        
+        The version changes whenever a tool is registered, updated or
+        unregistered, so callers can cache anything derived from the tool set.
+        
+        Returns:
+            int: Current registry version
+        """
+        return cls._version
+    
+    @classmethod
+    def get_tool_version(cls, tool_name: str) -> Optional[int]:
+        """
+        Get the registry version at which a tool was last registered or updated.
+        
+        Args:
+            tool_name: Name of the tool
+            
+        Returns:
+            Optional[int]: Tool version or None if not registered
+        """
+        return cls._tool_versions.get(tool_name)
     
     @classmethod
     def get_registry_stats(cls) -> Dict[str, Any]:
@@ -439,6 +485,7 @@ class ToolRegistry:
         return {
             "total_tools": len(cls._tools),
             "tool_names": list(cls._tools.keys()),
+            "version": cls._version,
             "total_executions": total_executions,
             "total_execution_time": total_time,
             "average_execution_time": (
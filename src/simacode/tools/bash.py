@@ -6,10 +6,13 @@ safety checks, output streaming, and permission validation.
 """
 
 import asyncio
+import codecs
 import shlex
 import signal
+import tempfile
 import time
-from typing import Any, AsyncGenerator, Dict, List, Optional, Type
+from collections import deque
+from typing import Any, AsyncGenerator, Deque, Dict, List, Optional, Tuple, Type
 
 from pydantic import BaseModel, Field, validator
 
@@ -69,6 +72,173 @@ class BashInput(ToolInput):
         return v
 
 
+class OutputCoalescer:
+    """
+    Groups raw process output into chunked OUTPUT results.
+    
+    stdout and stderr are buffered separately and emitted at line boundaries
+    where possible. Only ``max_output_bytes`` of output is kept in results:
+    the first half as it streams and the last half at the end, separated by
+    a truncation marker. Once truncation starts the complete output is
+    written to a log file whose path is reported with the marker.
+    """
+    
+    STREAMS = ("stdout", "stderr")
+    
+    def __init__(self, execution_id: str, chunk_bytes: int, max_output_bytes: int):
+        self.execution_id = execution_id
+        self.chunk_bytes = chunk_bytes
+        self.head_budget = max_output_bytes // 2
+        self.tail_budget = max_output_bytes - self.head_budget
+        
+        self._buffers = {name: bytearray() for name in self.STREAMS}
+        self._decoders = {name: codecs.getincrementaldecoder("utf-8")(errors="replace") for name in self.STREAMS}
+        self._emitted = 0
+        self._log = bytearray()  # Everything received until truncation starts
+        self._tail: Deque[Tuple[str, bytes]] = deque()
+        self._tail_size = 0
+        self._omitted = 0
+        self._spill = None
+        self.spill_path: Optional[str] = None
+    
+    @property
+    def pending(self) -> bool:
+        """Whether any output is waiting to be flushed."""
+        return any(self._buffers.values())
+    
+    @property
+    def truncated(self) -> bool:
+        """Whether output beyond the retained budget was dropped from results."""
+        return self._spill is not None
+    
+    def feed(self, stream_name: str, data: bytes) -> List[ToolResult]:
+        """Buffer output and return any chunks that filled the byte budget."""
+        if self._spill is not None:
+            self._spill.write(data)
+        else:
+            self._log.extend(data)
+        
+        buffer = self._buffers[stream_name]
+        buffer.extend(data)
+        if len(buffer) < self.chunk_bytes:
+            return []
+        
+        # Emit whole lines and keep a trailing partial line buffered
+        cut = buffer.rfind(b"\n") + 1 or len(buffer)
+        chunk = bytes(buffer[:cut])
+        del buffer[:cut]
+        return self._emit(stream_name, chunk)
+    
+    def flush(self) -> List[ToolResult]:
+        """Emit everything buffered on both streams."""
+        results = []
+        for stream_name, buffer in self._buffers.items():
+            if buffer:
+                chunk = bytes(buffer)
+                buffer.clear()
+                results.extend(self._emit(stream_name, chunk))
+        return results
+    
+    def finish(self) -> List[ToolResult]:
+        """Flush remaining output and append the truncation marker and tail."""
+        results = self.flush()
+        if self._spill is None:
+            return results
+        
+        self._spill.close()
+        results.append(ToolResult(
+            type=ToolResultType.OUTPUT,
+            content=(
+                f"... [{self._omitted} bytes of output truncated; "
+                f"full output saved to {self.spill_path}] ..."
+            ),
+            execution_id=self.execution_id,
+            metadata={
+                "truncated": True,
+                "omitted_bytes": self._omitted,
+                "log_file": self.spill_path
+            }
+        ))
+        
+        # Merge adjacent tail pieces of the same stream into one result each
+        merged: List[Tuple[str, bytearray]] = []
+        for stream_name, data in self._tail:
+            if merged and merged[-1][0] == stream_name:
+                merged[-1][1].extend(data)
+            else:
+                merged.append((stream_name, bytearray(data)))
+        for stream_name, data in merged:
+            result = self._make_result(stream_name, bytes(data).decode("utf-8", errors="replace"), len(data))
+            if result:
+                results.append(result)
+        return results
+    
+    def close(self) -> None:
+        """Close the spill file if it is still open."""
+        if self._spill is not None and not self._spill.closed:
+            self._spill.close()
+    
+    def _emit(self, stream_name: str, chunk: bytes) -> List[ToolResult]:
+        """Turn a chunk into results, moving to head/tail retention past the budget."""
+        if self._spill is not None:
+            self._append_tail(stream_name, chunk)
+            return []
+        
+        room = self.head_budget - self._emitted
+        if len(chunk) <= room:
+            self._emitted += len(chunk)
+            result = self._make_result(stream_name, self._decoders[stream_name].decode(chunk), len(chunk))
+            return [result] if result else []
+        
+        # Budget exhausted: keep what fits (at a line boundary if possible) and start spilling
+        cut = chunk.rfind(b"\n", 0, room) + 1 or room
+        head, rest = chunk[:cut], chunk[cut:]
+        self._emitted += len(head)
+        self._start_spill()
+        self._append_tail(stream_name, rest)
+        
+        result = self._make_result(stream_name, self._decoders[stream_name].decode(head), len(head))
+        return [result] if result else []
+    
+    def _append_tail(self, stream_name: str, data: bytes) -> None:
+        """Keep only the last tail_budget bytes of output."""
+        self._tail.append((stream_name, data))
+        self._tail_size += len(data)
+        
+        while self._tail_size > self.tail_budget:
+            first_stream, first = self._tail[0]
+            excess = self._tail_size - self.tail_budget
+            if len(first) <= excess:
+                self._tail.popleft()
+                self._tail_size -= len(first)
+                self._omitted += len(first)
+            else:
+                self._tail[0] = (first_stream, first[excess:])
+                self._tail_size -= excess
+                self._omitted += excess
+    
+    def _start_spill(self) -> None:
+        """Open the full-output log file and write everything received so far."""
+        self._spill = tempfile.NamedTemporaryFile(
+            prefix="simacode_bash_", suffix=".log", delete=False
+        )
+        self.spill_path = self._spill.name
+        self._spill.write(self._log)
+        self._log = bytearray()
+    
+    def _make_result(self, stream_name: str, text: str, size: int) -> Optional[ToolResult]:
+        """Build an OUTPUT result, skipping chunks that are only whitespace."""
+        text = text.rstrip("\r\n")
+        if not text.strip():
+            return None
+        return ToolResult(
+            type=ToolResultType.OUTPUT,
+            content=text,
+            execution_id=self.execution_id,
+            metadata={"stream": stream_name, "bytes": size, "lines": text.count("\n") + 1}
+        )
+
+
 class BashTool(Tool):
     """
     Tool for executing system commands safely.
@@ -77,8 +247,26 @@ class BashTool(Tool):
     comprehensive permission checking, output streaming, and error handling.
     """
     
-    def __init__(self, permission_manager: Optional[PermissionManager] = None, session_manager=None):
-        """Initialize Bash tool."""
+    READ_BLOCK_SIZE = 64 * 1024
+    
+    def __init__(
+        self,
+        permission_manager: Optional[PermissionManager] = None,
+        session_manager=None,
+        output_chunk_bytes: int = 16 * 1024,
+        output_flush_interval: float = 0.1,
+        max_output_bytes: int = 256 * 1024
+    ):
+        """
+        Initialize Bash tool.
+        
+        Args:
+            permission_manager: Permission manager for command and path checks
+            session_manager: Optional session manager for session context
+            output_chunk_bytes: Buffered bytes per stream that trigger an output chunk
+            output_flush_interval: Seconds buffered output may wait before it is flushed
+            max_output_bytes: Output retained in results (head and tail); the rest is spilled to a log file
+        """
         super().__init__(
             name="bash",
             description="Execute system commands safely with permission controls",
@@ -88,6 +276,9 @@ class BashTool(Tool):
         self.permission_manager = permission_manager or PermissionManager()
         self.command_validator = CommandValidator()
         self._active_processes: Dict[str, asyncio.subprocess.Process] = {}
+        self.output_chunk_bytes = output_chunk_bytes
+        self.output_flush_interval = output_flush_interval
+        self.max_output_bytes = max_output_bytes
     
     def get_input_schema(self) -> Type[ToolInput]:
         """Return the input schema for this tool."""
@@ -206,112 +397,26 @@ class BashTool(Tool):
             self._active_processes[execution_id] = process
             
             try:
-                # Create tasks for process completion and timeout
-                process_task = asyncio.create_task(process.wait())
-                timeout_task = asyncio.create_task(asyncio.sleep(input_data.timeout))
+                loop = asyncio.get_running_loop()
+                deadline = loop.time() + input_data.timeout
                 
-                # Stream output if capturing, with concurrent timeout monitoring
-                if input_data.capture_output:
-                    # Create a task to handle streaming
-                    async def stream_with_monitoring():
-                        try:
-                            async for output_result in self._stream_process_output(process, execution_id):
-                                yield output_result
-                        except Exception as e:
-                            yield ToolResult(
-                                type=ToolResultType.WARNING,
-                                content=f"Error during output streaming: {str(e)}",
-                                execution_id=execution_id
-                            )
-                    
-                    # Monitor both streaming and timeout
-                    streaming_generator = stream_with_monitoring()
-                    timeout_occurred = False
-                    
-                    try:
-                        while not process_task.done() and not timeout_task.done():
-                            # Try to get the next output with a short timeout to allow checking process/timeout status
-                            try:
-                                output_result = await asyncio.wait_for(
-                                    streaming_generator.__anext__(), 
-                                    timeout=0.1  # Short timeout to check status frequently
-                                )
-                                yield output_result
-                            except asyncio.TimeoutError:
-                                # No output available, continue monitoring
-                                continue
-                            except StopAsyncIteration:
-                                # Streaming finished
-                                break
-                    except Exception as e:
-                        yield ToolResult(
-                            type=ToolResultType.WARNING,
-                            content=f"Error during output monitoring: {str(e)}",
-                            execution_id=execution_id
-                        )
-                    
-                    # Check if timeout occurred
-                    if timeout_task.done() and not process_task.done():
-                        timeout_occurred = True
+                try:
+                    # Stream output if capturing; the stream ends when both pipes close
+                    if input_data.capture_output:
+                        async for output_result in self._stream_process_output(process, execution_id, deadline):
+                            yield output_result
                     
-                    if timeout_occurred:
-                        # Timeout occurred during streaming
-                        process.terminate()
-                        try:
-                            await asyncio.wait_for(process.wait(), timeout=5)
-                        except asyncio.TimeoutError:
-                            process.kill()
-                            await process.wait()
-                        
-                        yield ToolResult(
-                            type=ToolResultType.ERROR,
-                            content=f"Command timed out after {input_data.timeout} seconds",
-                            execution_id=execution_id,
-                            metadata={"timeout": input_data.timeout}
-                        )
-                        return
+                    await asyncio.wait_for(process.wait(), timeout=max(0.0, deadline - loop.time()))
                 
-                # Wait for process completion or timeout (for processes without output or after streaming)
-                if not process_task.done():
-                    done, pending = await asyncio.wait(
-                        [process_task, timeout_task],
-                        return_when=asyncio.FIRST_COMPLETED
+                except asyncio.TimeoutError:
+                    await self._terminate_process(process)
+                    yield ToolResult(
+                        type=ToolResultType.ERROR,
+                        content=f"Command timed out after {input_data.timeout} seconds",
+                        execution_id=execution_id,
+                        metadata={"timeout": input_data.timeout}
                     )
-                    
-                    # Cancel pending tasks
-                    for task in pending:
-                        task.cancel()
-                        try:
-                            await task
-                        except asyncio.CancelledError:
-                            pass
-                    
-                    # Check if timeout occurred
-                    if timeout_task in done:
-                        # Timeout occurred
-                        process.terminate()
-                        try:
-                            await asyncio.wait_for(process.wait(), timeout=5)
-                        except asyncio.TimeoutError:
-                            process.kill()
-                            await process.wait()
-                        
-                        yield ToolResult(
-                            type=ToolResultType.ERROR,
-                            content=f"Command timed out after {input_data.timeout} seconds",
-                            execution_id=execution_id,
-                            metadata={"timeout": input_data.timeout}
-                        )
-                        return
-                        
-            except Exception as e:
-                yield ToolResult(
-                    type=ToolResultType.ERROR,
-                    content=f"Error during command execution: {str(e)}",
-                    execution_id=execution_id,
-                    metadata={"error_type": type(e).__name__}
-                )
-                return
+                    return
                 
                 execution_time = time.time() - start_time
                 
@@ -336,8 +441,20 @@ class BashTool(Tool):
                             "execution_time": execution_time
                         }
                     )
+            
+            except Exception as e:
+                yield ToolResult(
+                    type=ToolResultType.ERROR,
+                    content=f"Error during command execution: {str(e)}",
+                    execution_id=execution_id,
+                    metadata={"error_type": type(e).__name__}
+                )
                 
             finally:
+                # Never leave a child running behind an abandoned stream
+                if process.returncode is None:
+                    await self._terminate_process(process)
+                
                 # Clean up process reference
                 if execution_id in self._active_processes:
                     del self._active_processes[execution_id]
@@ -367,94 +484,96 @@ class BashTool(Tool):
     async def _stream_process_output(
         self, 
         process: asyncio.subprocess.Process, 
-        execution_id: str
+        execution_id: str,
+        deadline: Optional[float] = None
     ) -> AsyncGenerator[ToolResult, None]:
-        """Stream process output in real-time."""
+        """
+        Stream process output as coalesced chunks.
+        
+        Both pipes are read in large blocks into one queue. Output is flushed
+        per stream once ``output_chunk_bytes`` are buffered or
+        ``output_flush_interval`` seconds after the first unflushed byte, so
+        a chatty command produces a handful of results instead of one per
+        line. Raises asyncio.TimeoutError once ``deadline`` (event loop time)
+        passes.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=64)
+        
         async def read_stream(stream, stream_name):
-            """Read from a stream and yield results."""
-            if stream is None:
-                return
-            
+            """Pump a pipe into the queue, ending with a None sentinel."""
             try:
                 while True:
-                    line = await stream.readline()
-                    if not line:
+                    data = await stream.read(self.READ_BLOCK_SIZE)
+                    if not data:
                         break
-                    
-                    line_text = line.decode('utf-8', errors='replace').rstrip()
-                    if line_text:
-                        yield ToolResult(
-                            type=ToolResultType.OUTPUT,
-                            content=line_text,
-                            execution_id=execution_id,
-                            metadata={"stream": stream_name}
-                        )
+                    await queue.put((stream_name, data))
             except Exception as e:
-                yield ToolResult(
-                    type=ToolResultType.WARNING,
-                    content=f"Error reading {stream_name}: {str(e)}",
-                    execution_id=execution_id
-                )
-        
-        # Create tasks for both stdout and stderr
-        tasks = []
-        
-        if process.stdout:
-            tasks.append(read_stream(process.stdout, "stdout"))
-        
-        if process.stderr:
-            tasks.append(read_stream(process.stderr, "stderr"))
-        
-        # Process all streams concurrently
-        if tasks:
-            async for result in self._merge_async_generators(*tasks):
-                yield result
-    
-    async def _merge_async_generators(self, *generators):
-        """Merge multiple async generators into one."""
-        queue = asyncio.Queue()
-        tasks = []
-        
-        async def pump_generator(gen):
-            """Pump generator items into queue."""
-            try:
-                async for item in gen:
-                    await queue.put(item)
-            except Exception as e:
-                await queue.put(ToolResult(
-                    type=ToolResultType.ERROR,
-                    content=f"Generator error: {str(e)}"
-                ))
+                await queue.put((stream_name, e))
             finally:
-                await queue.put(None)  # Sentinel
-        
-        # Start all generator tasks
-        for gen in generators:
-            task = asyncio.create_task(pump_generator(gen))
-            tasks.append(task)
+                await queue.put((stream_name, None))
         
-        # Read from queue until all generators are done
-        finished_count = 0
-        while finished_count < len(generators):
-            try:
-                item = await asyncio.wait_for(queue.get(), timeout=1.0)
-                if item is None:
-                    finished_count += 1
-                else:
-                    yield item
-            except asyncio.TimeoutError:
-                # Check if any tasks are still running
-                if all(task.done() for task in tasks):
-                    break
+        readers = [
+            asyncio.create_task(read_stream(stream, stream_name))
+            for stream, stream_name in ((process.stdout, "stdout"), (process.stderr, "stderr"))
+            if stream is not None
+        ]
+        coalescer = OutputCoalescer(execution_id, self.output_chunk_bytes, self.max_output_bytes)
+        loop = asyncio.get_running_loop()
+        open_streams = len(readers)
+        flush_at = None
         
-        # Cancel any remaining tasks
-        for task in tasks:
-            if not task.done():
-                task.cancel()
+        try:
+            while open_streams:
+                # Sleep until the next item, flush or deadline; never poll
+                wake_at = min((t for t in (flush_at, deadline) if t is not None), default=None)
                 try:
-                    await task
-                except asyncio.CancelledError:
-                    pass
+                    if wake_at is None:
+                        stream_name, data = await queue.get()
+                    else:
+                        stream_name, data = await asyncio.wait_for(queue.get(), max(0.0, wake_at - loop.time()))
+                except asyncio.TimeoutError:
+                    if deadline is not None and loop.time() >= deadline:
+                        raise
+                    stream_name, data = None, None
+                
+                if isinstance(data, Exception):
+                    yield ToolResult(
+                        type=ToolResultType.WARNING,
+                        content=f"Error reading {stream_name}: {str(data)}",
+                        execution_id=execution_id
+                    )
+                elif data is not None:
+                    for result in coalescer.feed(stream_name, data):
+                        yield result
+                elif stream_name is not None:
+                    open_streams -= 1
+                
+                if flush_at is not None and loop.time() >= flush_at:
+                    for result in coalescer.flush():
+                        yield result
+                    flush_at = None
+                
+                if flush_at is None and coalescer.pending:
+                    flush_at = loop.time() + self.output_flush_interval
+            
+            for result in coalescer.finish():
+                yield result
+        
+        finally:
+            for reader in readers:
+                reader.cancel()
+            coalescer.close()
+    
+    async def _terminate_process(self, process: asyncio.subprocess.Process) -> None:
+        """Terminate a process, killing it if it does not exit promptly."""
+        try:
+            process.terminate()
+            await asyncio.wait_for(process.wait(), timeout=5)
+        except ProcessLookupError:
+            pass
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
     
     async def cancel_execution(self, execution_id: str) -> bool:
         """
@@ -100,6 +100,8 @@ class FileReadTool(Tool):
         )
         self.permission_manager = permission_manager or PermissionManager()
         self.path_validator = PathValidator(self.permission_manager.get_allowed_paths())
+        # Held weakly by the manager, so the tool can still be garbage-collected
+        self.permission_manager.add_reload_listener(self._on_permissions_reloaded)
         
         # Common text encodings to try
         self.common_encodings = [
@@ -107,6 +109,10 @@ class FileReadTool(Tool):
             'utf-16', 'utf-16le', 'utf-16be', 'utf-32'
         ]
     
+    def _on_permissions_reloaded(self, manager: PermissionManager) -> None:
+        """Pick up the allowed paths of a reloaded security config."""
+        self.path_validator.set_allowed_paths(manager.get_allowed_paths())
+    
     def get_input_schema(self) -> Type[ToolInput]:
         """Return the input schema for this tool."""
         return FileReadInput
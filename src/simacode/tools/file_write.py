@@ -100,6 +100,12 @@ class FileWriteTool(Tool):
         self.permission_manager = permission_manager or PermissionManager()
         # Initialize PathValidator with the allowed paths from permission manager
         self.path_validator = PathValidator(self.permission_manager.get_allowed_paths())
+        # Held weakly by the manager, so the tool can still be garbage-collected
+        self.permission_manager.add_reload_listener(self._on_permissions_reloaded)
+    
+    def _on_permissions_reloaded(self, manager: PermissionManager) -> None:
+        """Pick up the allowed paths of a reloaded security config."""
+        self.path_validator.set_allowed_paths(manager.get_allowed_paths())
     
     def get_input_schema(self) -> Type[ToolInput]:
         """Return the input schema for this tool."""
@@ -0,0 +1,274 @@
+"""
+Result cache for Universal OCR Tool.
+
+Extraction results are stored in a small SQLite database keyed by the
+content hash of the input file together with everything else that
+influences the result (engine, prompt, template and output format), so
+re-running OCR on an unchanged document costs a hash instead of a
+rasterization and a vision model call.
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from .engines.base import ExtractionResult, ExtractionStatus
+
+
+class OCRResultCache:
+    """
+    Persistent cache of OCR extraction results.
+
+    Each document key holds one combined result (page 0) and one result per
+    page, so a document whose extraction partially failed only needs the
+    missing pages redone. Entries expire after ``ttl`` seconds and the cache
+    is trimmed to ``max_size`` entries, evicting the least recently used
+    ("lru") or oldest ("fifo") entries first.
+
+    Lookups and writes are synchronous SQLite calls; async callers should use
+    the ``*_async`` variants, which run them on a worker thread.
+    """
+
+    DOCUMENT_PAGE = 0
+    EVICTION_POLICIES = ("lru", "fifo")
+
+    def __init__(
+        self,
+        db_path: Union[str, Path] = ":memory:",
+        max_size: int = 1000,
+        ttl: int = 0,
+        eviction: str = "lru"
+    ):
+        """
+        Initialize the result cache.
+
+        Args:
+            db_path: SQLite database path (":memory:" for a process-local cache)
+            max_size: Maximum number of cached entries (documents and pages)
+            ttl: Entry lifetime in seconds (0 = never expire)
+            eviction: Eviction policy, "lru" or "fifo"
+        """
+        if eviction not in self.EVICTION_POLICIES:
+            raise ValueError(f"Unknown eviction policy: {eviction}. Valid policies: {', '.join(self.EVICTION_POLICIES)}")
+
+        self.db_path = str(db_path)
+        self.max_size = max_size
+        self.ttl = ttl
+        self.eviction = eviction
+        self.stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @staticmethod
+    def make_key(
+        file_hash: str,
+        engine_name: str,
+        engine_version: str,
+        prompt: Optional[str] = None,
+        template: Optional[str] = None,
+        output_format: str = "json",
+        **options: Any
+    ) -> str:
+        """
+        Build the cache key for a document.
+
+        Args:
+            file_hash: Content hash of the input file
+            engine_name: OCR engine name
+            engine_version: OCR engine version
+            prompt: Extraction prompt (None for the engine default)
+            template: Template or schema identifier
+            output_format: Requested output format
+            **options: Other processing options that affect the result
+
+        Returns:
+            str: Hex digest identifying the document extraction
+        """
+        material = json.dumps(
+            [file_hash, engine_name, engine_version, prompt, template, output_format, options],
+            sort_keys=True
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use"""
+        if self._conn is None:
+            if self.db_path != ":memory:":
+                Path(self.db_path).expanduser().parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            if self.db_path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ocr_results (
+                    key TEXT NOT NULL,
+                    page INTEGER NOT NULL,
+                    result TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    PRIMARY KEY (key, page)
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_ocr_results_accessed ON ocr_results (accessed_at)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_ocr_results_created ON ocr_results (created_at)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str, page: int = DOCUMENT_PAGE) -> Optional[ExtractionResult]:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Document key from make_key
+            page: Page number (0 for the combined document result)
+
+        Returns:
+            ExtractionResult or None if missing or expired
+        """
+        return self.get_pages(key, [page]).get(page)
+
+    def get_pages(self, key: str, pages: List[int]) -> Dict[int, ExtractionResult]:
+        """
+        Look up several cached page results of a document.
+
+        Args:
+            key: Document key from make_key
+            pages: Page numbers to look up
+
+        Returns:
+            Dict mapping page number to its cached result
+        """
+        if not pages:
+            return {}
+
+        found: Dict[int, ExtractionResult] = {}
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            placeholders = ",".join("?" * len(pages))
+            rows = conn.execute(
+                f"SELECT page, result, created_at FROM ocr_results WHERE key = ? AND page IN ({placeholders})",
+                (key, *pages)
+            ).fetchall()
+
+            expired = []
+            for page, result, created_at in rows:
+                if self.ttl and now - created_at > self.ttl:
+                    expired.append(page)
+                    continue
+                found[page] = ExtractionResult.from_dict(json.loads(result))
+
+            if expired:
+                conn.executemany(
+                    "DELETE FROM ocr_results WHERE key = ? AND page = ?", [(key, page) for page in expired]
+                )
+            if found:
+                conn.executemany(
+                    "UPDATE ocr_results SET accessed_at = ? WHERE key = ? AND page = ?",
+                    [(now, key, page) for page in found]
+                )
+            if expired or found:
+                conn.commit()
+
+            self.stats["hits"] += len(found)
+            self.stats["misses"] += len(pages) - len(found)
+        return found
+
+    def put(self, key: str, result: ExtractionResult, page: int = DOCUMENT_PAGE) -> None:
+        """
+        Store a result; failed extractions are never cached.
+
+        Args:
+            key: Document key from make_key
+            result: Extraction result to store
+            page: Page number (0 for the combined document result)
+        """
+        if result.status == ExtractionStatus.FAILED:
+            return
+
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO ocr_results (key, page, result, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, page, json.dumps(result.to_dict(), ensure_ascii=False, default=str), now, now)
+            )
+            self.stats["writes"] += 1
+            self._evict(conn)
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Drop expired entries and trim the cache to max_size"""
+        if self.ttl:
+            cursor = conn.execute("DELETE FROM ocr_results WHERE created_at < ?", (time.time() - self.ttl,))
+            self.stats["evictions"] += cursor.rowcount
+
+        excess = conn.execute("SELECT COUNT(*) FROM ocr_results").fetchone()[0] - self.max_size
+        if self.max_size and excess > 0:
+            order_column = "accessed_at" if self.eviction == "lru" else "created_at"
+            cursor = conn.execute(
+                f"DELETE FROM ocr_results WHERE rowid IN "
+                f"(SELECT rowid FROM ocr_results ORDER BY {order_column} LIMIT ?)",
+                (excess,)
+            )
+            self.stats["evictions"] += cursor.rowcount
+
+    async def get_async(self, key: str, page: int = DOCUMENT_PAGE) -> Optional[ExtractionResult]:
+        """Look up a cached result without blocking the event loop"""
+        return await asyncio.to_thread(self.get, key, page)
+
+    async def get_pages_async(self, key: str, pages: List[int]) -> Dict[int, ExtractionResult]:
+        """Look up several cached page results without blocking the event loop"""
+        return await asyncio.to_thread(self.get_pages, key, pages)
+
+    async def put_async(self, key: str, result: ExtractionResult, page: int = DOCUMENT_PAGE) -> None:
+        """Store a result without blocking the event loop"""
+        await asyncio.to_thread(self.put, key, result, page)
+
+    def invalidate(self, key: str) -> None:
+        """Remove a document and all of its pages"""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM ocr_results WHERE key = ?", (key,))
+            conn.commit()
+
+    def clear(self) -> None:
+        """Remove every cached result"""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM ocr_results")
+            conn.commit()
+
+    def size(self) -> int:
+        """Number of cached entries"""
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM ocr_results").fetchone()[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "entries": self.size(),
+            "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+            "path": self.db_path
+        }
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -45,11 +45,13 @@ class OCREngineConfig:
 
 @dataclass
 class CacheConfig:
-    """Cache configuration"""
+    """Extraction result cache configuration"""
     enabled: bool = True
-    backend: str = "memory"  # memory, redis
-    ttl: int = 3600
-    max_size: int = 1000
+    backend: str = "disk"  # disk, memory
+    ttl: int = 7 * 24 * 3600  # seconds, 0 = never expire
+    max_size: int = 1000  # cached document and page results
+    eviction: str = "lru"  # lru, fifo
+    path: str = ".simacode/cache/ocr_results.db"
 
 
 @dataclass
@@ -61,6 +63,23 @@ class TemplateConfig:
     auto_learning: bool = True
 
 
+@dataclass
+class ConcurrencyConfig:
+    """Per-page extraction concurrency configuration"""
+    max_concurrent_pages: int = 4
+    requests_per_minute: int = 0  # 0 = unlimited
+    page_retries: int = 2
+    retry_backoff: float = 1.0  # seconds, doubled after every failed attempt
+
+
+@dataclass
+class ProcessingConfig:
+    """File rasterization and enhancement configuration"""
+    process_pool_size: int = 2  # 0 = run in a thread instead
+    scratch_dir: Optional[str] = None  # None = private temp directory
+    dpi: int = 300
+
+
 @dataclass
 class OCRConfig:
     """Main OCR configuration class"""
@@ -69,6 +88,8 @@ class OCRConfig:
     engines: Dict[str, OCREngineConfig] = field(default_factory=dict)
     cache: CacheConfig = field(default_factory=CacheConfig)
     templates: TemplateConfig = field(default_factory=TemplateConfig)
+    concurrency: ConcurrencyConfig = field(default_factory=ConcurrencyConfig)
+    processing: ProcessingConfig = field(default_factory=ProcessingConfig)
     
     # File processing limits
     supported_formats: list = field(default_factory=lambda: ['.jpg', '.jpeg', '.png', '.pdf', '.gif', '.webp'])
@@ -209,13 +230,7 @@ class ConfigManager:
         
         # Parse cache configuration
         if "cache" in config_data:
-            cache_data = config_data["cache"]
-            config.cache = CacheConfig(
-                enabled=cache_data.get("enabled", True),
-                backend=cache_data.get("backend", "memory"),
-                ttl=cache_data.get("ttl", 3600),
-                max_size=cache_data.get("max_size", 1000)
-            )
+            config.cache = self._parse_cache_config(config_data["cache"] or {}, config.cache)
         
         # Parse template configuration
         if "templates" in config_data:
@@ -227,8 +242,36 @@ class ConfigManager:
                 auto_learning=template_data.get("auto_learning", True)
             )
         
+        # Parse universal OCR tool settings
+        if "universal_ocr" in config_data:
+            ocr_data = config_data["universal_ocr"] or {}
+            config.concurrency = ConcurrencyConfig(
+                max_concurrent_pages=ocr_data.get("max_concurrent_pages", 4),
+                requests_per_minute=ocr_data.get("requests_per_minute", 0),
+                page_retries=ocr_data.get("page_retries", 2),
+                retry_backoff=ocr_data.get("retry_backoff", 1.0)
+            )
+            config.processing = ProcessingConfig(
+                process_pool_size=ocr_data.get("process_pool_size", 2),
+                scratch_dir=ocr_data.get("scratch_dir"),
+                dpi=ocr_data.get("dpi", 300)
+            )
+            if "cache" in ocr_data:
+                config.cache = self._parse_cache_config(ocr_data["cache"] or {}, config.cache)
+        
         return config
     
+    def _parse_cache_config(self, cache_data: Dict[str, Any], base: CacheConfig) -> CacheConfig:
+        """Parse a cache section, falling back to the values in base"""
+        return CacheConfig(
+            enabled=cache_data.get("enabled", base.enabled),
+            backend=cache_data.get("backend", base.backend),
+            ttl=cache_data.get("ttl", base.ttl),
+            max_size=cache_data.get("max_size", base.max_size),
+            eviction=cache_data.get("eviction", base.eviction),
+            path=cache_data.get("path", base.path)
+        )
+    
     def get_claude_config(self) -> ClaudeConfig:
         """Get Claude configuration"""
         config = self.load_config()
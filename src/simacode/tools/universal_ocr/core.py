@@ -5,19 +5,43 @@ The main UniversalOCRTool class that orchestrates OCR operations
 using different engines and provides a unified interface.
 """
 
+import asyncio
 import json
 import time
 import hashlib
 from pathlib import Path
-from typing import Dict, Any, AsyncGenerator, Optional, Type, List
+from typing import Dict, Any, AsyncGenerator, Optional, Type, List, Tuple
 
 from ..base import Tool, ToolResult, ToolResultType
 from .input_models import UniversalOCRInput
 from .engines import ClaudeEngine, ExtractionResult, ExtractionStatus
 from .config import get_config
+from .cache import OCRResultCache
 from .file_processor import FileProcessor, FileProcessorError
 
 
+class _RateLimiter:
+    """Spaces out engine calls so at most ``per_minute`` start in any minute"""
+    
+    def __init__(self, per_minute: int):
+        self.interval = 60.0 / per_minute if per_minute and per_minute > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait for the next free call slot"""
+        if not self.interval:
+            return
+        
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
 class UniversalOCRTool(Tool):
     """
     Universal OCR Tool main class.
@@ -41,7 +65,12 @@ class UniversalOCRTool(Tool):
         self._initialize_engines()
         
         # Initialize file processor
-        self.file_processor = FileProcessor()
+        processing = self.config.processing
+        self.file_processor = FileProcessor(
+            max_workers=processing.process_pool_size,
+            scratch_dir=processing.scratch_dir,
+            dpi=processing.dpi
+        )
         
         # Statistics tracking
         self.stats = {
@@ -50,8 +79,25 @@ class UniversalOCRTool(Tool):
             "failed_extractions": 0,
             "total_processing_time": 0.0,
             "engine_usage": {},
-            "file_format_usage": {}
+            "file_format_usage": {},
+            "cache_hits": 0
         }
+        
+        # Persistent cache of extraction results
+        self.result_cache = self._create_result_cache()
+    
+    def _create_result_cache(self) -> Optional[OCRResultCache]:
+        """Create the extraction result cache from configuration"""
+        cache_config = self.config.cache
+        if not cache_config.enabled:
+            return None
+        
+        return OCRResultCache(
+            ":memory:" if cache_config.backend == "memory" else cache_config.path,
+            max_size=cache_config.max_size,
+            ttl=cache_config.ttl,
+            eviction=cache_config.eviction
+        )
     
     def _initialize_engines(self):
         """Initialize available OCR engines"""
@@ -109,16 +155,50 @@ class UniversalOCRTool(Tool):
                 metadata=input_data.get_file_info()
             )
             
-            try:
-                processed_images = await self.file_processor.process_file(
-                    input_data.file_path,
-                    enhance_quality=input_data.quality_enhancement
+            # Determine OCR engine to use
+            engine_name = self._select_engine(input_data)
+            if engine_name not in self.engines:
+                yield ToolResult(
+                    type=ToolResultType.ERROR,
+                    content=f"OCR engine '{engine_name}' not available",
+                    execution_id=execution_id
                 )
+                return
+            
+            engine = self.engines[engine_name]
+            
+            prompt = self._get_extraction_prompt(input_data)
+            
+            # Reuse the result of an identical earlier extraction
+            cache_key = None
+            if self.result_cache is not None and input_data.use_cache:
+                cache_key = await self._get_cache_key(input_data, engine, prompt)
+            
+            if cache_key:
+                cached_result = await self.result_cache.get_async(cache_key)
+                if cached_result is not None:
+                    self.stats["cache_hits"] += 1
+                    cached_result.metadata["cached"] = True
+                    yield ToolResult(
+                        type=ToolResultType.INFO,
+                        content="Using cached OCR result",
+                        execution_id=execution_id,
+                        metadata={"cache_key": cache_key}
+                    )
+                    async for result in self._process_extraction_result(
+                        cached_result, input_data, execution_id, start_time
+                    ):
+                        yield result
+                    return
+            
+            # Pages are rasterized lazily, one at a time, as extraction reaches them
+            try:
+                total_pages = await self.file_processor.get_page_count(input_data.file_path)
                 
-                if len(processed_images) > 1:
+                if total_pages > 1:
                     yield ToolResult(
                         type=ToolResultType.INFO,
-                        content=f"Document converted to {len(processed_images)} page(s)",
+                        content=f"Document has {total_pages} page(s)",
                         execution_id=execution_id
                     )
             
@@ -136,23 +216,11 @@ class UniversalOCRTool(Tool):
                 content="Starting OCR extraction",
                 execution_id=execution_id,
                 metadata={
-                    "total_pages": len(processed_images),
+                    "total_pages": total_pages,
                     "file_info": input_data.get_file_info()
                 }
             )
             
-            # Determine OCR engine to use
-            engine_name = self._select_engine(input_data)
-            if engine_name not in self.engines:
-                yield ToolResult(
-                    type=ToolResultType.ERROR,
-                    content=f"OCR engine '{engine_name}' not available",
-                    execution_id=execution_id
-                )
-                return
-            
-            engine = self.engines[engine_name]
-            
             # Update engine usage statistics
             self.stats["engine_usage"][engine_name] = \
                 self.stats["engine_usage"].get(engine_name, 0) + 1
@@ -171,42 +239,50 @@ class UniversalOCRTool(Tool):
                     execution_id=execution_id
                 )
             
-            # Perform OCR extraction on processed images
+            # Perform OCR extraction, several pages at a time
             all_extractions = []
             
-            for i, image_path in enumerate(processed_images):
-                try:
-                    if len(processed_images) > 1:
-                        yield ToolResult(
-                            type=ToolResultType.INFO,
-                            content=f"Processing page {i+1} of {len(processed_images)}",
-                            execution_id=execution_id
-                        )
-                    
-                    if input_data.custom_prompt or input_data.scene_hint:
-                        # Use custom or scene-specific prompt
-                        prompt = input_data.custom_prompt or self._create_scene_prompt(input_data.scene_hint)
-                        extraction_result = await engine.extract_text(image_path, prompt)
-                    else:
-                        # Use default extraction
-                        extraction_result = await engine.extract_text(image_path)
-                    
-                    # Add page information to metadata
-                    if len(processed_images) > 1:
-                        extraction_result.metadata["page_number"] = i + 1
-                        extraction_result.metadata["total_pages"] = len(processed_images)
-                    
-                    all_extractions.append(extraction_result)
+            # Pages that succeeded in an earlier, partially failed run are not redone
+            cached_pages = {}
+            if cache_key and total_pages > 1:
+                cached_pages = await self.result_cache.get_pages_async(cache_key, list(range(1, total_pages + 1)))
+                if cached_pages:
+                    yield ToolResult(
+                        type=ToolResultType.INFO,
+                        content=f"Reusing {len(cached_pages)} cached page(s)",
+                        execution_id=execution_id
+                    )
+            
+            async for page_number, extraction_result in self._extract_pages(
+                engine, input_data, total_pages, prompt, cached_pages
+            ):
+                if cache_key and total_pages > 1 and page_number not in cached_pages:
+                    await self.result_cache.put_async(cache_key, extraction_result, page=page_number)
                 
-                except Exception as e:
+                # Add page information to metadata
+                if total_pages > 1:
+                    extraction_result.metadata["page_number"] = page_number
+                    extraction_result.metadata["total_pages"] = total_pages
+                    
+                    page_failed = extraction_result.status == ExtractionStatus.FAILED
                     yield ToolResult(
-                        type=ToolResultType.ERROR,
-                        content=f"OCR extraction failed for page {i+1}: {str(e)}",
+                        type=ToolResultType.WARNING if page_failed else ToolResultType.PROGRESS,
+                        content=(
+                            f"OCR extraction failed for page {page_number}: {'; '.join(extraction_result.errors)}"
+                            if page_failed else f"Extracted page {page_number} of {total_pages}"
+                        ),
                         execution_id=execution_id,
-                        metadata={"error_type": type(e).__name__, "engine": engine_name, "page": i+1}
+                        metadata={
+                            "page": page_number,
+                            "total_pages": total_pages,
+                            "status": extraction_result.status.value,
+                            "attempts": extraction_result.metadata.get("attempts", 1),
+                            "cached": page_number in cached_pages,
+                            "raw_text": extraction_result.raw_text
+                        }
                     )
-                    self.stats["failed_extractions"] += 1
-                    return
+                
+                all_extractions.append(extraction_result)
             
             # Combine results if multiple pages
             if len(all_extractions) == 1:
@@ -215,7 +291,10 @@ class UniversalOCRTool(Tool):
             else:
                 # Multiple pages - combine results
                 extraction_result = self._combine_extraction_results(all_extractions)
-                
+            
+            if cache_key and extraction_result.status == ExtractionStatus.SUCCESS:
+                await self.result_cache.put_async(cache_key, extraction_result)
+            
             # Process final extraction result
             async for result in self._process_extraction_result(
                 extraction_result, input_data, execution_id, start_time
@@ -239,6 +318,127 @@ class UniversalOCRTool(Tool):
             processing_time = time.time() - start_time
             self.stats["total_processing_time"] += processing_time
     
+    async def _get_cache_key(self, input_data: UniversalOCRInput, engine, prompt: Optional[str]) -> Optional[str]:
+        """Build the result cache key for this request (None if the file cannot be hashed)"""
+        try:
+            file_hash = await asyncio.to_thread(self.file_processor.calculate_file_hash, input_data.file_path)
+        except FileProcessorError:
+            return None
+        
+        return OCRResultCache.make_key(
+            file_hash,
+            engine.name,
+            engine.version,
+            prompt=prompt,
+            template=input_data.template_override,
+            output_format=input_data.output_format,
+            quality_enhancement=input_data.quality_enhancement
+        )
+    
+    def _get_extraction_prompt(self, input_data: UniversalOCRInput) -> Optional[str]:
+        """Get the custom or scene-specific prompt (None for the engine default)"""
+        if input_data.custom_prompt or input_data.scene_hint:
+            return input_data.custom_prompt or self._create_scene_prompt(input_data.scene_hint)
+        return None
+    
+    async def _extract_page(
+        self,
+        engine,
+        input_data: UniversalOCRInput,
+        page_number: int,
+        prompt: Optional[str],
+        semaphore: asyncio.Semaphore,
+        rate_limiter: "_RateLimiter"
+    ) -> ExtractionResult:
+        """
+        Render one page, then extract it, retrying failed attempts with exponential backoff.
+        
+        A single concurrency slot is held for the whole page, so a rendered
+        image never waits on disk for a second slot to open, and the image
+        is deleted after the page's last extraction attempt.
+        """
+        concurrency = self.config.concurrency
+        attempts = 1 + max(0, concurrency.page_retries)
+        
+        async with semaphore:
+            try:
+                image_path = await self.file_processor.render_page(
+                    input_data.file_path, page_number, enhance_quality=input_data.quality_enhancement
+                )
+            except FileProcessorError as e:
+                return ExtractionResult(
+                    status=ExtractionStatus.FAILED,
+                    errors=[f"File processing failed: {str(e)}"],
+                    engine_name=engine.name,
+                    engine_version=engine.version,
+                    metadata={"error_type": type(e).__name__, "attempts": 0}
+                )
+            
+            try:
+                for attempt in range(1, attempts + 1):
+                    await rate_limiter.acquire()
+                    try:
+                        if prompt:
+                            extraction_result = await engine.extract_text(image_path, prompt)
+                        else:
+                            extraction_result = await engine.extract_text(image_path)
+                    except Exception as e:
+                        extraction_result = ExtractionResult(
+                            status=ExtractionStatus.FAILED,
+                            errors=[str(e)],
+                            engine_name=engine.name,
+                            engine_version=engine.version,
+                            metadata={"error_type": type(e).__name__}
+                        )
+                    
+                    if extraction_result.status != ExtractionStatus.FAILED or attempt == attempts:
+                        extraction_result.metadata["attempts"] = attempt
+                        return extraction_result
+                    
+                    await asyncio.sleep(concurrency.retry_backoff * (2 ** (attempt - 1)))
+            finally:
+                # Only the pages currently being extracted stay on disk
+                self.file_processor.release_page(image_path, input_data.file_path)
+    
+    async def _extract_pages(
+        self,
+        engine,
+        input_data: UniversalOCRInput,
+        total_pages: int,
+        prompt: Optional[str],
+        cached_pages: Optional[Dict[int, ExtractionResult]] = None
+    ) -> AsyncGenerator[Tuple[int, ExtractionResult], None]:
+        """
+        Extract all pages concurrently and yield (page_number, result) in page order.
+        
+        Up to ``max_concurrent_pages`` pages are rendered and extracted at once and engine
+        calls are spaced to respect ``requests_per_minute``. A page is yielded
+        as soon as it and every earlier page are done; pages found in
+        ``cached_pages`` are yielded without calling the engine. Pending
+        extractions are cancelled if the consumer stops early.
+        """
+        cached_pages = cached_pages or {}
+        concurrency = self.config.concurrency
+        semaphore = asyncio.Semaphore(max(1, concurrency.max_concurrent_pages))
+        rate_limiter = _RateLimiter(concurrency.requests_per_minute)
+        
+        tasks = {
+            page_number: asyncio.create_task(
+                self._extract_page(engine, input_data, page_number, prompt, semaphore, rate_limiter)
+            )
+            for page_number in range(1, total_pages + 1)
+            if page_number not in cached_pages
+        }
+        try:
+            for page_number in range(1, total_pages + 1):
+                if page_number in cached_pages:
+                    yield page_number, cached_pages[page_number]
+                else:
+                    yield page_number, await tasks[page_number]
+        finally:
+            for task in tasks.values():
+                task.cancel()
+    
     def _select_engine(self, input_data: UniversalOCRInput) -> str:
         """Select the best OCR engine for the given input"""
         # For Phase 1, always use Claude engine
@@ -584,7 +784,9 @@ Organize the extracted information clearly."""
             "success_rate": f"{success_rate:.1%}",
             "average_processing_time": f"{avg_processing_time:.2f}s",
             "engine_usage": self.stats["engine_usage"],
-            "file_format_usage": self.stats["file_format_usage"]
+            "file_format_usage": self.stats["file_format_usage"],
+            "cache_hits": self.stats["cache_hits"],
+            "result_cache": self.result_cache.get_stats() if self.result_cache else None
         }
     
     async def health_check(self) -> Dict[str, Any]:
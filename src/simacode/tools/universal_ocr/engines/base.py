@@ -48,7 +48,23 @@ class ExtractionResult:
             "errors": self.errors,
             "timestamp": self.timestamp.isoformat()
         }
-    
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ExtractionResult":
+        """Create result from a dictionary produced by to_dict"""
+        return cls(
+            status=ExtractionStatus(data["status"]),
+            extracted_data=data.get("extracted_data", {}),
+            raw_text=data.get("raw_text", ""),
+            confidence_score=data.get("confidence_score", 0.0),
+            processing_time=data.get("processing_time", 0.0),
+            engine_name=data.get("engine_name", ""),
+            engine_version=data.get("engine_version", ""),
+            metadata=data.get("metadata", {}),
+            errors=data.get("errors", []),
+            timestamp=datetime.fromisoformat(data["timestamp"]) if data.get("timestamp") else datetime.now()
+        )
+
     def is_successful(self) -> bool:
         """Check if extraction was successful"""
         return self.status == ExtractionStatus.SUCCESS
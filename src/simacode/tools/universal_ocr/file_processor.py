@@ -5,8 +5,14 @@ This module handles file processing, format conversion, and image preprocessing
 for the Universal OCR tool.
 """
 
+import asyncio
+import logging
 import os
+import shutil
 import tempfile
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import List, Optional, Tuple, Union
 import hashlib
@@ -23,6 +29,8 @@ try:
 except ImportError:
     PIL_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
 
 class FileProcessorError(Exception):
     """Custom exception for file processing errors"""
@@ -37,10 +45,24 @@ class FileProcessor:
     and file validation operations.
     """
     
-    def __init__(self):
+    def __init__(self, max_workers: int = 2, scratch_dir: Optional[str] = None, dpi: int = 300):
+        """
+        Initialize the file processor.
+        
+        Args:
+            max_workers: Process pool size for rasterization and enhancement (0 = use a thread)
+            scratch_dir: Directory for page images (a private temp directory if None)
+            dpi: PDF rasterization resolution
+        """
         self.supported_image_formats = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp', '.tiff'}
         self.supported_document_formats = {'.pdf'}
         self.temp_files = []  # Track temporary files for cleanup
+        self.max_workers = max_workers
+        self.dpi = dpi
+        
+        self._configured_scratch_dir = scratch_dir
+        self._scratch_dir: Optional[Path] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
     
     def is_supported_format(self, file_path: str) -> bool:
         """Check if file format is supported"""
@@ -182,26 +204,73 @@ class FileProcessor:
         Returns:
             List of image file paths ready for OCR
         """
+        page_count = await self.get_page_count(file_path)
+        return list(await asyncio.gather(*(
+            self.render_page(file_path, page_number, enhance_quality)
+            for page_number in range(1, page_count + 1)
+        )))
+    
+    async def get_page_count(self, file_path: str) -> int:
+        """
+        Get the number of pages render_page can produce for a file.
+        
+        Args:
+            file_path: Path to input file
+            
+        Returns:
+            Page count (1 for image files)
+        """
         file_type = self.get_file_type(file_path)
         
         if file_type == "image":
-            # Process image file
-            processed_path = await self._process_image_file(file_path, enhance_quality)
-            return [processed_path]
+            return 1
         
         elif file_type == "document":
-            # Convert document to images
-            image_paths = await self._convert_document_to_images(file_path)
+            self._require_pdf2image()
+            try:
+                info = await asyncio.to_thread(pdf2image.pdfinfo_from_path, file_path)
+            except Exception as e:
+                raise self._pdf_error(e)
             
-            if enhance_quality:
-                # Enhance each converted image
-                enhanced_paths = []
-                for img_path in image_paths:
-                    enhanced_path = await self._enhance_image_quality(img_path)
-                    enhanced_paths.append(enhanced_path)
-                return enhanced_paths
+            page_count = int(info.get("Pages", 0))
+            if page_count == 0:
+                raise FileProcessorError("PDF file appears to be empty")
+            return page_count
+        
+        else:
+            raise FileProcessorError(f"Unsupported file type: {file_type}")
+    
+    async def render_page(self, file_path: str, page_number: int, enhance_quality: bool = True) -> str:
+        """
+        Produce the OCR-ready image of one page.
+        
+        Rasterization and enhancement run in the process pool so the event
+        loop stays responsive; only the requested page is ever decoded.
+        
+        Args:
+            file_path: Path to input file
+            page_number: 1-based page number
+            enhance_quality: Whether to apply quality enhancement
             
-            return image_paths
+        Returns:
+            Path of the page image (the input itself for unenhanced images)
+        """
+        file_type = self.get_file_type(file_path)
+        
+        if file_type == "image":
+            return await self._process_image_file(file_path, enhance_quality)
+        
+        elif file_type == "document":
+            self._require_pdf2image()
+            output_path = self._scratch_path(file_path, f"page_{page_number}")
+            try:
+                await self._run_in_pool(
+                    _rasterize_pdf_page, file_path, page_number, output_path, self.dpi,
+                    enhance_quality and PIL_AVAILABLE
+                )
+            except Exception as e:
+                raise self._pdf_error(e)
+            return output_path
         
         else:
             raise FileProcessorError(f"Unsupported file type: {file_type}")
@@ -213,104 +282,79 @@ class FileProcessor:
         else:
             return file_path  # Return original path if no enhancement needed
     
-    async def _convert_document_to_images(self, file_path: str) -> List[str]:
-        """Convert document (PDF) to image files"""
-        if not PDF2IMAGE_AVAILABLE:
-            raise FileProcessorError(
-                "pdf2image package not available. Install with: pip install pdf2image. Also need system dependency: brew install poppler (macOS) or apt-get install poppler-utils (Ubuntu)"
-            )
-        
-        try:
-            # Convert PDF to images
-            images = pdf2image.convert_from_path(
-                file_path,
-                dpi=300,  # High DPI for better OCR quality
-                fmt='PNG',
-                thread_count=2
-            )
-            
-            image_paths = []
-            base_name = Path(file_path).stem
-            
-            for i, image in enumerate(images):
-                # Create temporary file for each page
-                temp_file = tempfile.NamedTemporaryFile(
-                    suffix=f"_{base_name}_page_{i+1}.png",
-                    delete=False,
-                    dir=tempfile.gettempdir()
-                )
-                temp_path = temp_file.name
-                temp_file.close()
-                
-                # Save image
-                image.save(temp_path, 'PNG', optimize=True)
-                image_paths.append(temp_path)
-                self.temp_files.append(temp_path)
-            
-            return image_paths
-            
-        except Exception as e:
-            error_msg = str(e).lower()
-            if 'poppler' in error_msg or 'pdftoppm' in error_msg:
-                raise FileProcessorError(f"Poppler system dependency missing. Install with: brew install poppler (macOS) or apt-get install poppler-utils (Ubuntu). Original error: {str(e)}")
-            else:
-                raise FileProcessorError(f"Failed to convert PDF to images: {str(e)}")
-    
     async def _enhance_image_quality(self, image_path: str) -> str:
         """Enhance image quality for better OCR results"""
         if not PIL_AVAILABLE:
             return image_path  # Return original if PIL not available
         
+        output_path = self._scratch_path(image_path, "enhanced")
         try:
-            with Image.open(image_path) as img:
-                # Convert to RGB if necessary
-                if img.mode != 'RGB':
-                    img = img.convert('RGB')
-                
-                # Apply enhancement filters
-                enhanced_img = img
-                
-                # Sharpen the image
-                enhanced_img = enhanced_img.filter(ImageFilter.UnsharpMask(radius=1, percent=150, threshold=3))
-                
-                # Enhance contrast
-                enhancer = ImageEnhance.Contrast(enhanced_img)
-                enhanced_img = enhancer.enhance(1.2)
-                
-                # Enhance sharpness
-                enhancer = ImageEnhance.Sharpness(enhanced_img)
-                enhanced_img = enhancer.enhance(1.1)
-                
-                # If image is very large, resize for better processing speed
-                width, height = enhanced_img.size
-                max_dimension = 3000
-                
-                if width > max_dimension or height > max_dimension:
-                    ratio = min(max_dimension / width, max_dimension / height)
-                    new_width = int(width * ratio)
-                    new_height = int(height * ratio)
-                    enhanced_img = enhanced_img.resize((new_width, new_height), Image.LANCZOS)
-                
-                # Save enhanced image to temporary file
-                base_name = Path(image_path).stem
-                temp_file = tempfile.NamedTemporaryFile(
-                    suffix=f"_{base_name}_enhanced.png",
-                    delete=False,
-                    dir=tempfile.gettempdir()
-                )
-                temp_path = temp_file.name
-                temp_file.close()
-                
-                enhanced_img.save(temp_path, 'PNG', optimize=True, quality=95)
-                self.temp_files.append(temp_path)
-                
-                return temp_path
+            await self._run_in_pool(_enhance_image_file, image_path, output_path)
+            return output_path
         
         except Exception as e:
             # If enhancement fails, return original image
-            print(f"Warning: Image enhancement failed: {e}")
+            logger.warning(f"Image enhancement failed: {e}")
             return image_path
     
+    async def _run_in_pool(self, func, *args):
+        """Run a CPU-bound function in the process pool (or a thread if disabled)"""
+        if self.max_workers <= 0:
+            return await asyncio.to_thread(func, *args)
+        
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._executor, func, *args)
+        except BrokenProcessPool:
+            # A crashed worker poisons the pool; start a fresh one for later calls
+            self._executor = None
+            raise
+    
+    def _scratch_path(self, source_path: str, suffix: str) -> str:
+        """Reserve a unique file name in the scratch directory"""
+        if self._scratch_dir is None:
+            if self._configured_scratch_dir:
+                self._scratch_dir = Path(self._configured_scratch_dir).expanduser()
+                self._scratch_dir.mkdir(parents=True, exist_ok=True)
+            else:
+                self._scratch_dir = Path(tempfile.mkdtemp(prefix="simacode_ocr_"))
+        
+        path = str(self._scratch_dir / f"{Path(source_path).stem}_{uuid.uuid4().hex[:8]}_{suffix}.png")
+        self.temp_files.append(path)
+        return path
+    
+    def _require_pdf2image(self):
+        """Raise if PDF support is not installed"""
+        if not PDF2IMAGE_AVAILABLE:
+            raise FileProcessorError(
+                "pdf2image package not available. Install with: pip install pdf2image. Also need system dependency: brew install poppler (macOS) or apt-get install poppler-utils (Ubuntu)"
+            )
+    
+    @staticmethod
+    def _pdf_error(error: Exception) -> FileProcessorError:
+        """Wrap a pdf2image failure"""
+        if isinstance(error, FileProcessorError):
+            return error
+        error_msg = str(error).lower()
+        if 'poppler' in error_msg or 'pdftoppm' in error_msg or 'pdfinfo' in error_msg:
+            return FileProcessorError(f"Poppler system dependency missing. Install with: brew install poppler (macOS) or apt-get install poppler-utils (Ubuntu). Original error: {str(error)}")
+        return FileProcessorError(f"Failed to convert PDF to images: {str(error)}")
+    
+    def release_page(self, image_path: str, source_path: str):
+        """Delete a page image once its extraction is done; the input file itself is kept"""
+        if image_path == source_path or image_path not in self.temp_files:
+            return
+        
+        self.temp_files.remove(image_path)
+        try:
+            if os.path.exists(image_path):
+                os.unlink(image_path)
+        except Exception as e:
+            logger.warning(f"Failed to delete temporary file {image_path}: {e}")
+    
     def cleanup_temp_files(self):
         """Clean up temporary files created during processing"""
         for temp_file in self.temp_files:
@@ -318,10 +362,23 @@ class FileProcessor:
                 if os.path.exists(temp_file):
                     os.unlink(temp_file)
             except Exception as e:
-                print(f"Warning: Failed to delete temporary file {temp_file}: {e}")
+                logger.warning(f"Failed to delete temporary file {temp_file}: {e}")
         
         self.temp_files.clear()
     
+    def shutdown(self):
+        """Clean up temporary files, the scratch directory and the process pool"""
+        self.cleanup_temp_files()
+        
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        
+        # Only remove scratch directories this processor created itself
+        if self._scratch_dir is not None and not self._configured_scratch_dir:
+            shutil.rmtree(self._scratch_dir, ignore_errors=True)
+        self._scratch_dir = None
+    
     def get_image_info(self, image_path: str) -> dict:
         """Get information about an image file"""
         if not PIL_AVAILABLE:
@@ -342,4 +399,56 @@ class FileProcessor:
     
     def __del__(self):
         """Cleanup temporary files when object is destroyed"""
-        self.cleanup_temp_files()
\ No newline at end of file
+        self.shutdown()
+
+
+def _enhance_image(img: "Image.Image") -> "Image.Image":
+    """Apply the OCR enhancement filter chain to an image in memory"""
+    # Convert to RGB if necessary
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+    
+    # Sharpen the image
+    enhanced_img = img.filter(ImageFilter.UnsharpMask(radius=1, percent=150, threshold=3))
+    
+    # Enhance contrast
+    enhanced_img = ImageEnhance.Contrast(enhanced_img).enhance(1.2)
+    
+    # Enhance sharpness
+    enhanced_img = ImageEnhance.Sharpness(enhanced_img).enhance(1.1)
+    
+    # If image is very large, resize for better processing speed
+    width, height = enhanced_img.size
+    max_dimension = 3000
+    
+    if width > max_dimension or height > max_dimension:
+        ratio = min(max_dimension / width, max_dimension / height)
+        enhanced_img = enhanced_img.resize((int(width * ratio), int(height * ratio)), Image.LANCZOS)
+    
+    return enhanced_img
+
+
+def _enhance_image_file(image_path: str, output_path: str) -> str:
+    """Process pool worker: enhance an image file into output_path"""
+    with Image.open(image_path) as img:
+        _enhance_image(img).save(output_path, 'PNG', optimize=True)
+    return output_path
+
+
+def _rasterize_pdf_page(file_path: str, page_number: int, output_path: str, dpi: int, enhance: bool) -> str:
+    """Process pool worker: render one PDF page (optionally enhanced) into output_path"""
+    images = pdf2image.convert_from_path(
+        file_path,
+        dpi=dpi,
+        fmt='PNG',
+        first_page=page_number,
+        last_page=page_number
+    )
+    if not images:
+        raise FileProcessorError(f"PDF page {page_number} could not be rendered")
+    
+    image = images[0]
+    if enhance:
+        image = _enhance_image(image)
+    image.save(output_path, 'PNG', optimize=True)
+    return output_path
\ No newline at end of file
@@ -0,0 +1,305 @@
+"""
+Tests for progress fan-out in the MCP async task manager.
+"""
+
+import asyncio
+import sqlite3
+import pytest
+
+from simacode.core.service import ChatRequest
+from simacode.mcp.async_integration import MCPAsyncTaskManager, ProgressChannel, TaskStatus, TaskType
+from simacode.mcp.job_store import SQLiteJobStore
+
+
+def progress(i):
+    return {"type": "progress", "progress": i}
+
+
+class TestProgressChannel:
+    """Test broadcast, replay and backpressure of a task's progress channel."""
+
+    @pytest.mark.asyncio
+    async def test_every_subscriber_gets_every_event(self):
+        channel = ProgressChannel()
+        first = channel.subscribe()
+        second = channel.subscribe()
+        reads = [asyncio.create_task(anext(first)), asyncio.create_task(anext(second))]
+        await asyncio.sleep(0)
+
+        channel.publish(progress(1))
+
+        assert await asyncio.gather(*reads) == [progress(1), progress(1)]
+        assert len(channel.subscribers) == 2
+        channel.publish({"type": "final_result"})
+        assert [e async for e in first] == [{"type": "final_result"}]
+        assert [e async for e in second] == [{"type": "final_result"}]
+        assert not channel.subscribers
+
+    @pytest.mark.asyncio
+    async def test_late_subscriber_replays_recent_events(self):
+        channel = ProgressChannel(replay_size=3)
+        for i in range(5):
+            channel.publish(progress(i))
+        channel.publish({"type": "error", "error": "boom"})
+        channel.publish(progress(99))
+
+        events = [e async for e in channel.subscribe()]
+
+        assert events == [progress(3), progress(4), {"type": "error", "error": "boom"}]
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_drops_intermediate_progress(self):
+        channel = ProgressChannel(subscriber_buffer=3)
+        stream = channel.subscribe(replay=False)
+        read = asyncio.create_task(anext(stream))
+        await asyncio.sleep(0)
+
+        channel.publish({"type": "started"})
+        for i in range(5):
+            channel.publish(progress(i))
+        channel.publish({"type": "final_result", "result": "done"})
+
+        events = [await read] + [e async for e in stream]
+        # Milestones survive; only the latest intermediate progress is kept
+        assert events == [{"type": "started"}, progress(4), {"type": "final_result", "result": "done"}]
+        assert channel.dropped == 4
+
+
+class TestTaskManagerProgressStream:
+    """Test get_task_progress_stream on top of the channel."""
+
+    @pytest.fixture
+    def manager(self, monkeypatch):
+        manager = MCPAsyncTaskManager()
+        manager.release = asyncio.Event()
+
+        async def execute_chat_task(task):
+            await manager.release.wait()
+            await manager._report_progress(task.task_id, progress(50))
+            task.result = {"content": "done"}
+
+        monkeypatch.setattr(manager, "_execute_chat_task", execute_chat_task)
+        return manager
+
+    @pytest.mark.asyncio
+    async def test_streams_end_as_soon_as_task_completes(self, manager):
+        task_id = await manager.submit_task(TaskType.CHAT, request={"message": "hi"})
+
+        async def collect():
+            return [e["type"] async for e in manager.get_task_progress_stream(task_id)]
+
+        subscribers = [asyncio.create_task(collect()) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        assert manager.get_stats()["progress_subscribers"] == 3
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        manager.release.set()
+        results = await asyncio.gather(*subscribers)
+
+        assert loop.time() - start < 0.5
+        assert results == [["started", "progress", "final_result"]] * 3
+        late = [e["type"] async for e in manager.get_task_progress_stream(task_id)]
+        assert late == ["started", "progress", "final_result"]
+
+    @pytest.mark.asyncio
+    async def test_failed_task_ends_stream_without_polling(self, manager, monkeypatch):
+        async def fail(task):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(manager, "_execute_chat_task", fail)
+        task_id = await manager.submit_task(TaskType.CHAT, request={"message": "hi"})
+
+        async def collect():
+            return [e async for e in manager.get_task_progress_stream(task_id)]
+
+        events = await asyncio.wait_for(collect(), timeout=0.5)
+
+        assert events[-1]["type"] == "error"
+        assert events[-1]["error"] == "boom"
+
+    @pytest.mark.asyncio
+    async def test_unknown_task(self, manager):
+        with pytest.raises(ValueError):
+            [e async for e in manager.get_task_progress_stream("missing")]
+
+
+class TestDurableJobQueue:
+    """Test the SQLite-backed queue: restarts, leases, retries and shared workers."""
+
+    @staticmethod
+    def make_manager(path, runs, gate=None, failures=None, **kwargs):
+        options = {"max_concurrent_tasks": 2, "lease_seconds": 0.3, "poll_interval": 0.05}
+        options.update(kwargs)
+        manager = MCPAsyncTaskManager(store=SQLiteJobStore(path), **options)
+
+        async def execute_chat_task(task):
+            runs.append((manager.worker_id, task.task_id))
+            if gate is not None:
+                await gate.wait()
+            if failures and failures.get(task.task_id, 0) > 0:
+                failures[task.task_id] -= 1
+                raise RuntimeError("flaky")
+            await manager._report_progress(task.task_id, progress(50))
+            task.result = {"content": f"reply to {task.request.message}"}
+
+        manager._execute_chat_task = execute_chat_task
+        return manager
+
+    @staticmethod
+    async def wait_for_status(manager, task_id, status, timeout=3.0):
+        async def poll():
+            while (await manager.get_task_status(task_id)).status != status:
+                await asyncio.sleep(0.02)
+        await asyncio.wait_for(poll(), timeout)
+
+    @pytest.mark.asyncio
+    async def test_status_and_progress_come_from_the_store(self, temp_directory):
+        runs = []
+        manager = self.make_manager(temp_directory / "jobs.db", runs)
+
+        task_id = await manager.submit_task(TaskType.CHAT, ChatRequest(message="hi", session_id="s1"))
+        events = [e["type"] async for e in manager.get_task_progress_stream(task_id)]
+
+        assert events == ["started", "progress", "final_result"]
+        manager.active_tasks.clear()
+        task = await manager.get_task_status(task_id)
+        assert task.status == TaskStatus.COMPLETED
+        assert task.result == {"content": "reply to hi"}
+        assert task.metadata["attempts"] == 1
+        assert manager.get_stats()["task_breakdown"] == {"completed": 1}
+        await manager.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_jobs_survive_a_restart(self, temp_directory):
+        path = temp_directory / "jobs.db"
+        runs = []
+        first = self.make_manager(path, runs, gate=asyncio.Event(), max_concurrent_tasks=1)
+        running = await first.submit_task(TaskType.CHAT, ChatRequest(message="one"))
+        queued = await first.submit_task(TaskType.CHAT, ChatRequest(message="two"))
+        await self.wait_for_status(first, running, TaskStatus.RUNNING)
+        await first.shutdown()
+
+        second = self.make_manager(path, runs)
+        await second.start()
+        await self.wait_for_status(second, queued, TaskStatus.COMPLETED)
+        await self.wait_for_status(second, running, TaskStatus.COMPLETED)
+
+        task = await second.get_task_status(running)
+        assert task.result == {"content": "reply to one"}
+        assert task.metadata["attempts"] == 1
+        await second.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_is_taken_over(self, temp_directory):
+        path = temp_directory / "jobs.db"
+        runs = []
+        crashed = self.make_manager(path, runs, gate=asyncio.Event())
+        task_id = await crashed.submit_task(TaskType.CHAT, ChatRequest(message="hi"))
+        while not runs:
+            await asyncio.sleep(0.01)
+        # Simulate a killed process: its workers stop without releasing the job
+        crashed.store.release = lambda *args: asyncio.sleep(0)
+        await crashed.stop()
+
+        survivor = self.make_manager(path, runs)
+        await survivor.start()
+        await self.wait_for_status(survivor, task_id, TaskStatus.COMPLETED)
+
+        assert [worker for worker, _ in runs] == [crashed.worker_id, survivor.worker_id]
+        assert (await survivor.get_task_status(task_id)).metadata["attempts"] == 2
+        await survivor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_failed_job_is_retried(self, temp_directory):
+        runs, failures, gate = [], {}, asyncio.Event()
+        manager = self.make_manager(temp_directory / "jobs.db", runs, gate=gate, failures=failures, max_attempts=2)
+
+        task_id = await manager.submit_task(TaskType.CHAT, ChatRequest(message="hi"))
+        failures[task_id] = 1
+        gate.set()
+        events = [e["type"] async for e in manager.get_task_progress_stream(task_id)]
+
+        assert events == ["started", "retrying", "started", "progress", "final_result"]
+        assert (await manager.get_task_status(task_id)).metadata["attempts"] == 2
+
+        failing_id = await manager.submit_task(TaskType.CHAT, ChatRequest(message="never"))
+        failures[failing_id] = 99
+        events = [e["type"] async for e in manager.get_task_progress_stream(failing_id)]
+
+        assert events[-1] == "error"
+        assert events.count("retrying") == 1
+        assert (await manager.get_task_status(failing_id)).status == TaskStatus.FAILED
+        await manager.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_workers_share_one_queue(self, temp_directory):
+        path = temp_directory / "jobs.db"
+        runs = []
+        managers = [self.make_manager(path, runs), self.make_manager(path, runs)]
+        for manager in managers:
+            await manager.start()
+
+        task_ids = [
+            await managers[i % 2].submit_task(TaskType.CHAT, ChatRequest(message=str(i))) for i in range(8)
+        ]
+        for task_id in task_ids:
+            await self.wait_for_status(managers[0], task_id, TaskStatus.COMPLETED)
+
+        executed = [task_id for _, task_id in runs]
+        assert sorted(executed) == sorted(task_ids)
+        # Progress of a job run elsewhere is readable from any process
+        events = [e["type"] async for e in managers[1].get_task_progress_stream(task_ids[0])]
+        assert events == ["started", "progress", "final_result"]
+        for manager in managers:
+            await manager.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_cancel_pending_job(self, temp_directory):
+        runs = []
+        manager = self.make_manager(temp_directory / "jobs.db", runs, gate=asyncio.Event(), max_concurrent_tasks=1)
+        await manager.submit_task(TaskType.CHAT, ChatRequest(message="busy"))
+        task_id = await manager.submit_task(TaskType.CHAT, ChatRequest(message="later"))
+
+        assert await manager.cancel_task(task_id)
+        events = [e["type"] async for e in manager.get_task_progress_stream(task_id)]
+
+        assert events == ["cancelled"]
+        assert (await manager.get_task_status(task_id)).status == TaskStatus.CANCELLED
+        assert not await manager.cancel_task(task_id)
+        await manager.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_failed_write_rolls_back_its_transaction(self, temp_directory, monkeypatch):
+        store = SQLiteJobStore(temp_directory / "jobs.db")
+        await store.enqueue({"job_id": "j1", "task_type": "chat", "request": {}})
+        await store.claim("w1", lease_seconds=60)
+
+        def fail(*args):
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(store, "_append_progress_locked", fail)
+        with pytest.raises(sqlite3.OperationalError):
+            await store.finish("j1", "w1", TaskStatus.COMPLETED.value, progress={"type": "final_result"})
+        monkeypatch.undo()
+
+        # The failed write left no open transaction behind
+        assert (await store.get("j1"))["status"] == "running"
+        assert await store.finish("j1", "w1", TaskStatus.COMPLETED.value, progress={"type": "final_result"})
+        assert await store.cancel("j1") is False
+        store.close()
+
+    @pytest.mark.asyncio
+    async def test_finished_jobs_are_purged_after_retention(self, temp_directory):
+        runs = []
+        manager = self.make_manager(temp_directory / "jobs.db", runs, job_retention=0.2, purge_interval=0.05)
+        task_id = await manager.submit_task(TaskType.CHAT, ChatRequest(message="hi"))
+        await self.wait_for_status(manager, task_id, TaskStatus.COMPLETED)
+
+        async def purged():
+            while await manager.store.get(task_id) is not None:
+                await asyncio.sleep(0.02)
+        await asyncio.wait_for(purged(), 3.0)
+
+        assert await manager.store.get_progress(task_id) == []
+        await manager.shutdown()
@@ -0,0 +1,184 @@
+"""
+Tests for MCP client pool (replicated stdio servers).
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from simacode.mcp.client import MCPClientState
+from simacode.mcp.client_pool import MCPClientPool
+from simacode.mcp.config import MCPServerConfig
+from simacode.mcp.protocol import MCPTool, MCPResult
+from simacode.mcp.server_manager import MCPServerManager
+
+
+class FakeClient:
+    """Stand-in for MCPClient that records calls instead of spawning processes."""
+
+    instances = []
+
+    def __init__(self, server_config, discover_capabilities=True):
+        self.server_config = server_config
+        self.server_name = server_config.name
+        self.discover_capabilities = discover_capabilities
+        self.tools_cache = {}
+        self.resources_cache = {}
+        self.prompts_cache = {}
+        self.connected = False
+        self.calls = 0
+        self.call_delay = 0.05
+        FakeClient.instances.append(self)
+
+    async def connect(self):
+        self.connected = True
+        if self.discover_capabilities:
+            self.tools_cache["echo"] = MCPTool(name="echo", description="Echo", server_name=self.server_name)
+        return True
+
+    async def disconnect(self):
+        self.connected = False
+        self.tools_cache.clear()
+
+    def is_connected(self):
+        return self.connected
+
+    def get_state(self):
+        return MCPClientState.READY if self.connected else MCPClientState.DISCONNECTED
+
+    def get_last_error(self):
+        return None
+
+    async def list_tools(self):
+        return list(self.tools_cache.values())
+
+    async def call_tool(self, tool_name, arguments):
+        self.calls += 1
+        await asyncio.sleep(self.call_delay)
+        return MCPResult(success=True, content=arguments, metadata={})
+
+    async def ping(self):
+        return self.connected
+
+
+@pytest.fixture(autouse=True)
+def fake_client():
+    FakeClient.instances = []
+    with patch("simacode.mcp.client_pool.MCPClient", FakeClient):
+        yield FakeClient
+
+
+def make_config(**kwargs):
+    return MCPServerConfig(name="ticmaker", command=["python", "server.py"], **kwargs)
+
+
+class TestMCPClientPool:
+    """Test replica pooling and least-loaded dispatch."""
+
+    async def test_connect_starts_replicas_with_shared_discovery(self):
+        pool = MCPClientPool(make_config(pool_size=3))
+
+        assert await pool.connect() is True
+        assert len(pool.replicas) == 3
+        assert pool.is_connected()
+
+        # Only the primary discovers; secondaries share its catalog
+        assert [r.discover_capabilities for r in pool.replicas] == [True, False, False]
+        assert all(r.tools_cache is pool.primary.tools_cache for r in pool.replicas)
+        assert list(pool.tools_cache) == ["echo"]
+
+    async def test_calls_spread_across_least_loaded_replicas(self):
+        pool = MCPClientPool(make_config(pool_size=3))
+        await pool.connect()
+
+        results = await asyncio.gather(*[pool.call_tool("echo", {"i": i}) for i in range(6)])
+
+        assert all(r.success for r in results)
+        assert [r.calls for r in pool.replicas] == [2, 2, 2]
+        assert pool.get_queue_depth() == 0
+
+    async def test_unhealthy_replica_is_skipped(self):
+        pool = MCPClientPool(make_config(pool_size=2))
+        await pool.connect()
+        pool.replicas[1].connected = False
+
+        await asyncio.gather(*[pool.call_tool("echo", {}) for _ in range(3)])
+
+        assert pool.replicas[0].calls == 3
+        assert pool.replicas[1].calls == 0
+
+    async def test_scale_up_on_queue_depth(self):
+        pool = MCPClientPool(make_config(pool_size=1, pool_max_size=3, pool_scale_up_threshold=2))
+        await pool.connect()
+
+        await asyncio.gather(*[pool.call_tool("echo", {}) for _ in range(4)])
+        await pool._scale_task
+
+        assert len(pool.replicas) == 2
+        assert pool.scale_ups == 1
+        assert pool.replicas[1].tools_cache is pool.primary.tools_cache
+
+    async def test_scale_down_idle_replicas(self):
+        pool = MCPClientPool(make_config(pool_size=2, pool_min_size=1, pool_idle_timeout=1.0))
+        await pool.connect()
+        secondary = pool.replicas[1]
+        pool._last_used[id(secondary)] -= 10
+
+        await pool.call_tool("echo", {})
+        await pool._scale_task
+
+        assert pool.replicas == [pool.primary]
+        assert pool.scale_downs == 1
+        # Stopping a secondary must not clear the shared catalog
+        assert list(pool.tools_cache) == ["echo"]
+
+    async def test_idle_pool_scales_down_without_further_calls(self):
+        pool = MCPClientPool(make_config(pool_size=1, pool_max_size=3, pool_scale_up_threshold=2))
+        pool.idle_timeout = 0.2
+        await pool.connect()
+
+        await asyncio.gather(*[pool.call_tool("echo", {}) for _ in range(4)])
+        await pool._scale_task
+        assert len(pool.replicas) == 2
+
+        await asyncio.sleep(0.7)
+
+        assert pool.replicas == [pool.primary]
+        assert pool.scale_downs == 1
+
+        await pool.disconnect()
+        assert pool._idle_check_task is None
+
+    async def test_disconnect_stops_all_replicas(self):
+        pool = MCPClientPool(make_config(pool_size=2))
+        await pool.connect()
+
+        await pool.disconnect()
+
+        assert pool.replicas == []
+        assert not pool.is_connected()
+        assert pool.get_state() == MCPClientState.DISCONNECTED
+
+
+class TestPoolConfig:
+    """Test pool options on MCPServerConfig."""
+
+    def test_defaults_are_not_pooled(self):
+        assert make_config().is_pooled() is False
+
+    def test_pool_size_enables_pooling(self):
+        assert make_config(pool_size=2).is_pooled() is True
+        assert make_config(pool_max_size=4).is_pooled() is True
+
+    def test_invalid_pool_bounds(self):
+        with pytest.raises(ValueError):
+            make_config(pool_size=2, pool_min_size=3)
+        with pytest.raises(ValueError):
+            make_config(pool_size=3, pool_max_size=2)
+
+    def test_manager_creates_pool_for_stdio_only(self):
+        manager = MCPServerManager()
+
+        assert isinstance(manager._create_client(make_config(pool_size=2)), MCPClientPool)
+        websocket = MCPServerConfig(name="ws", type="websocket", url="ws://localhost:1", pool_size=2)
+        assert not isinstance(manager._create_client(websocket), MCPClientPool)
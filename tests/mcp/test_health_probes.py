@@ -0,0 +1,176 @@
+"""
+Tests for transport-level health probes and adaptive check intervals.
+"""
+
+import asyncio
+import json
+import sys
+import time
+
+import pytest
+
+from simacode.mcp.connection import StdioTransport, WebSocketTransport
+from simacode.mcp.health import HealthMetrics, HealthStatus, MCPHealthMonitor
+from simacode.mcp.protocol import MCPMessage, MCPProtocol
+
+
+class ProbeClient:
+    """Client stand-in that records how the monitor checks it."""
+
+    def __init__(self, alive=True):
+        self.alive = alive
+        self.probes = 0
+        self.last_activity = None
+
+    def is_connected(self):
+        return True
+
+    async def probe(self, timeout=5.0):
+        self.probes += 1
+        return self.alive
+
+    async def list_tools(self):
+        raise AssertionError("health checks must not list tools")
+
+    def get_state(self):
+        return "ready"
+
+    def get_last_error(self):
+        return None
+
+    def get_stats(self):
+        return {}
+
+
+class FakeWebSocket:
+    closed = False
+
+    def __init__(self, answer=True):
+        self.answer = answer
+
+    async def ping(self):
+        pong = asyncio.get_running_loop().create_future()
+        if self.answer:
+            pong.set_result(0.001)
+        return pong
+
+
+class EchoTransport:
+    """Answers every request with an empty result."""
+
+    def __init__(self):
+        self._incoming = asyncio.Queue()
+
+    def is_connected(self):
+        return True
+
+    async def send(self, data):
+        request = json.loads(data.decode("utf-8"))
+        self._incoming.put_nowait(MCPMessage(id=request["id"], result={}).to_json().encode("utf-8"))
+
+    async def receive(self):
+        return await self._incoming.get()
+
+
+class TestTransportProbes:
+    """Test the cheap liveness checks of each transport."""
+
+    @pytest.mark.asyncio
+    async def test_stdio_probe_checks_process_and_stdin(self):
+        transport = StdioTransport([sys.executable, "-c", "import sys; sys.stdin.read()"])
+        await transport.connect()
+
+        assert await transport.probe()
+        transport.process.stdin.close()
+        assert not await transport.probe()
+
+        await transport.disconnect()
+        assert not await transport.probe()
+
+    @pytest.mark.asyncio
+    async def test_websocket_probe_uses_ping_frames(self):
+        transport = WebSocketTransport("ws://localhost:1")
+        transport._connected = True
+
+        transport.websocket = FakeWebSocket(answer=True)
+        assert await transport.probe(timeout=0.1)
+
+        transport.websocket = FakeWebSocket(answer=False)
+        assert not await transport.probe(timeout=0.05)
+
+    @pytest.mark.asyncio
+    async def test_protocol_records_last_activity(self):
+        protocol = MCPProtocol(EchoTransport())
+        assert protocol.last_activity is None
+
+        before = time.monotonic()
+        await protocol.call_method("ping")
+
+        assert protocol.last_activity >= before
+        await protocol.shutdown()
+
+
+class TestAdaptiveHealthChecks:
+    """Test passive checks and interval back-off in MCPHealthMonitor."""
+
+    @pytest.fixture
+    def monitor(self):
+        monitor = MCPHealthMonitor(check_interval=10, min_check_interval=2, max_check_interval=30)
+        monitor.health_metrics["files"] = HealthMetrics("files")
+        monitor.check_intervals["files"] = monitor.check_interval
+        return monitor
+
+    @pytest.mark.asyncio
+    async def test_recent_traffic_skips_the_probe(self, monitor):
+        client = ProbeClient()
+        client.last_activity = time.monotonic()
+
+        await monitor._perform_health_check("files", client)
+
+        metrics = monitor.get_server_health("files")
+        assert client.probes == 0
+        assert metrics.passive_checks == 1
+        assert metrics.status == HealthStatus.HEALTHY
+        assert monitor.get_monitoring_stats()["passive_checks"] == 1
+
+        client.last_activity = time.monotonic() - 60
+        await monitor._perform_health_check("files", client)
+        assert client.probes == 1
+
+    @pytest.mark.asyncio
+    async def test_interval_backs_off_and_tightens_after_failure(self, monitor):
+        client = ProbeClient()
+
+        intervals = []
+        for _ in range(5):
+            await monitor._perform_health_check("files", client)
+            intervals.append(monitor.check_intervals["files"])
+
+        assert intervals == [15.0, 22.5, 30, 30, 30]
+        assert client.probes == 5
+
+        client.alive = False
+        await monitor._perform_health_check("files", client)
+
+        metrics = monitor.get_server_health("files")
+        assert monitor.check_intervals["files"] == 2
+        assert metrics.consecutive_failures == 1
+        assert "probe failed" in metrics.last_error
+
+        # Recovery restarts the back-off from the configured interval
+        client.alive = True
+        await monitor._perform_health_check("files", client)
+        assert monitor.check_intervals["files"] == 15.0
+
+    @pytest.mark.asyncio
+    async def test_hung_probe_times_out(self, monitor):
+        class HungClient(ProbeClient):
+            async def probe(self, timeout=5.0):
+                await asyncio.sleep(10)
+
+        monitor.probe_timeout = 0.05
+        await monitor._perform_health_check("files", HungClient())
+
+        metrics = monitor.get_server_health("files")
+        assert metrics.last_error == "Health check timeout"
+        assert monitor.check_intervals["files"] == 2
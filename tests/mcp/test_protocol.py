@@ -359,6 +359,87 @@ class TestMCPProtocol:
         assert id2.startswith("req_")
 
 
+class _DelayedEchoTransport:
+    """In-memory transport that answers every request after a fixed delay."""
+
+    def __init__(self, delay: float = 0.1):
+        self.delay = delay
+        self.sent = []
+        self._responses = asyncio.Queue()
+
+    def is_connected(self):
+        return True
+
+    async def send(self, data):
+        request = json.loads(data.decode('utf-8'))
+        self.sent.append(request)
+        asyncio.get_running_loop().call_later(
+            self.delay,
+            self._responses.put_nowait,
+            MCPMessage(id=request["id"], result={"echo": request.get("params")}).to_json().encode('utf-8')
+        )
+
+    async def receive(self):
+        return await self._responses.get()
+
+
+class TestMCPProtocolPipelining:
+    """Test in-flight request multiplexing in MCPProtocol."""
+
+    async def test_concurrent_calls_share_one_round_trip(self):
+        """Concurrent calls are pipelined instead of serialized."""
+        transport = _DelayedEchoTransport(delay=0.2)
+        protocol = MCPProtocol(transport, max_in_flight=10)
+
+        start = asyncio.get_running_loop().time()
+        results = await asyncio.gather(*[
+            protocol.call_method(MCPMethods.TOOLS_CALL, {"i": i}) for i in range(10)
+        ])
+        elapsed = asyncio.get_running_loop().time() - start
+
+        assert [r["echo"]["i"] for r in results] == list(range(10))
+        assert elapsed < 1.0  # Serialized calls would take ~2s
+        assert protocol.get_in_flight_count() == 0
+        await protocol.shutdown()
+
+    async def test_max_in_flight_limits_outstanding_requests(self):
+        """No more than max_in_flight requests are outstanding at once."""
+        transport = _DelayedEchoTransport(delay=0.1)
+        protocol = MCPProtocol(transport, max_in_flight=2)
+        peak = 0
+
+        async def observe():
+            nonlocal peak
+            while True:
+                peak = max(peak, protocol.get_in_flight_count())
+                await asyncio.sleep(0.01)
+
+        observer = asyncio.create_task(observe())
+        await asyncio.gather(*[protocol.call_method("test", {"i": i}) for i in range(6)])
+        observer.cancel()
+
+        assert peak == 2
+        assert len(transport.sent) == 6
+        await protocol.shutdown()
+
+    async def test_per_call_timeout(self):
+        """A per-call timeout overrides the protocol default."""
+        transport = _DelayedEchoTransport(delay=1.0)
+        protocol = MCPProtocol(transport, request_timeout=30.0)
+
+        with pytest.raises(MCPProtocolError) as exc_info:
+            await protocol.call_method("slow_method", timeout=0.05)
+
+        assert "Method call timeout: slow_method" in str(exc_info.value)
+        assert protocol.get_in_flight_count() == 0
+        await protocol.shutdown()
+
+    def test_invalid_max_in_flight(self):
+        """max_in_flight must be positive."""
+        with pytest.raises(ValueError):
+            MCPProtocol(_DelayedEchoTransport(), max_in_flight=0)
+
+
 class TestMCPConstants:
     """Test MCP constants."""
     
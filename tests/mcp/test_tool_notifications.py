@@ -0,0 +1,236 @@
+"""
+Tests for tool catalog updates driven by notifications/tools/list_changed.
+"""
+
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+
+from simacode.mcp.auto_discovery import MCPAutoDiscovery
+from simacode.mcp.client import MCPClient, MCPClientState
+from simacode.mcp.config import MCPServerConfig
+from simacode.mcp.dynamic_updates import DynamicUpdateManager, UpdateType
+from simacode.mcp.health import HealthMetrics, HealthStatus
+from simacode.mcp.protocol import MCPMessage, MCPMethods, MCPProtocol
+from simacode.mcp.server_manager import MCPServerManager
+from simacode.mcp.tool_registry import MCPToolRegistry
+
+
+def tool(name, description="", **properties):
+    return {"name": name, "description": description, "input_schema": {"type": "object", "properties": properties}}
+
+
+class CatalogTransport:
+    """In-memory server that answers tools/list and can push list_changed."""
+
+    def __init__(self, tools):
+        self.tools = list(tools)
+        self.list_calls = 0
+        self._incoming = asyncio.Queue()
+
+    def is_connected(self):
+        return True
+
+    async def send(self, data):
+        request = json.loads(data.decode("utf-8"))
+        if request.get("id") is None:
+            return
+        if request["method"] == MCPMethods.TOOLS_LIST:
+            self.list_calls += 1
+            await asyncio.sleep(0.01)
+            result = {"tools": list(self.tools)}
+        else:
+            result = {}
+        self._incoming.put_nowait(MCPMessage(id=request["id"], result=result).to_json().encode("utf-8"))
+
+    async def receive(self):
+        return await self._incoming.get()
+
+    def push_list_changed(self):
+        message = MCPMessage(method=MCPMethods.NOTIFICATIONS_TOOLS_LIST_CHANGED)
+        self._incoming.put_nowait(message.to_json().encode("utf-8"))
+
+
+class _Connection:
+    def is_connected(self):
+        return True
+
+
+async def make_client(name, tools, list_changed=True):
+    """A ready MCPClient talking to a CatalogTransport."""
+    client = MCPClient(MCPServerConfig(name=name, command=["python", "server.py"]))
+    client.transport = CatalogTransport(tools)
+    client.protocol = MCPProtocol(client.transport)
+    client.connection = _Connection()
+    client.state = MCPClientState.READY
+    client.server_capabilities = {"tools": {"listChanged": list_changed}}
+    client._subscribe_to_notifications()
+    await client._discover_tools()
+    return client
+
+
+def add_client(manager, client):
+    """Attach a connected client to the manager the way add_server does."""
+    manager.servers[client.server_name] = client
+    client.add_tools_changed_callback(manager._on_server_tools_changed)
+
+
+@pytest.fixture
+def server_manager(monkeypatch):
+    manager = MCPServerManager()
+    healthy = HealthMetrics(server_name="any", status=HealthStatus.HEALTHY, last_check=datetime.now())
+    monkeypatch.setattr(manager, "get_server_health", lambda name: healthy)
+    return manager
+
+
+async def wait_for(predicate, timeout=2.0):
+    async def poll():
+        while not predicate():
+            await asyncio.sleep(0.01)
+    await asyncio.wait_for(poll(), timeout)
+
+
+class TestListChangedNotifications:
+    """Test that clients re-list tools only when the server says so."""
+
+    @pytest.mark.asyncio
+    async def test_notification_refreshes_catalog_and_notifies(self):
+        client = await make_client("files", [tool("read")])
+        changes = []
+
+        async def on_change(server_name, tools):
+            changes.append((server_name, sorted(t.name for t in tools)))
+
+        client.add_tools_changed_callback(on_change)
+        client.transport.tools.append(tool("write"))
+        client.transport.push_list_changed()
+
+        await wait_for(lambda: changes)
+        assert changes == [("files", ["read", "write"])]
+        assert client.transport.list_calls == 2
+        assert set(client.tools_cache) == {"read", "write"}
+        await client.protocol.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_burst_of_notifications_is_coalesced(self):
+        client = await make_client("files", [tool("read")])
+        changes = []
+
+        async def on_change(server_name, tools):
+            changes.append(len(tools))
+
+        client.add_tools_changed_callback(on_change)
+        client.transport.tools.append(tool("write"))
+        for _ in range(10):
+            client.transport.push_list_changed()
+
+        await wait_for(lambda: changes)
+        await asyncio.sleep(0.1)
+        # One refresh for the burst plus at most one for notifications that arrived during it
+        assert client.transport.list_calls <= 3
+        assert changes == [2]
+        await client.protocol.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_catalog_does_not_notify(self):
+        client = await make_client("files", [tool("read")])
+        changes = []
+
+        async def on_change(server_name, tools):
+            changes.append(tools)
+
+        client.add_tools_changed_callback(on_change)
+
+        assert await client.refresh_tools() is False
+        assert changes == []
+        assert client.supports_list_changed()
+        await client.protocol.shutdown()
+
+    def test_signature_is_computed_once_per_tool(self):
+        from simacode.mcp.protocol import MCPTool
+
+        mcp_tool = MCPTool(name="read", description="Read a file", server_name="files", input_schema={"type": "object"})
+        same = MCPTool(name="read", description="Read a file", server_name="files", input_schema={"type": "object"})
+
+        assert mcp_tool.signature == same.signature
+        assert mcp_tool.__dict__["signature"] == mcp_tool.signature
+        assert MCPTool(name="read", description="Read files", server_name="files").signature != mcp_tool.signature
+
+
+class TestServerManagerFanOut:
+    """Test that one detected change reaches the registry, auto-discovery and update manager."""
+
+    @pytest.mark.asyncio
+    async def test_pushed_change_is_applied_by_every_subsystem(self, server_manager):
+        client = await make_client("files", [tool("read", path={"type": "string"}), tool("stat")])
+        add_client(server_manager, client)
+
+        registry = MCPToolRegistry(server_manager)
+        discovery = MCPAutoDiscovery(server_manager, registry)
+        discovery.policy.initial_delay = 0
+        updates = DynamicUpdateManager(server_manager, registry)
+        await registry.start()
+        await discovery.start()
+        await updates.start()
+        stat_wrapper = registry.get_registered_tool("files:stat")
+        queued = []
+        updates.queue_update = lambda update: queued.append(update) or asyncio.sleep(0)
+
+        client.transport.tools = [
+            tool("read", "Now with encoding", path={"type": "string"}, encoding={"type": "string"}),
+            tool("stat"),
+            tool("write"),
+        ]
+        client.transport.push_list_changed()
+        await wait_for(lambda: "files:write" in registry.registered_tools and queued)
+
+        assert sorted(registry.list_registered_tools()) == ["files:read", "files:stat", "files:write"]
+        assert registry.get_registered_tool("files:stat") is stat_wrapper
+        read = client.tools_cache["read"]
+        assert registry.get_registered_tool("files:read").mcp_tool is read
+        assert discovery.tool_signatures["files:read"] == read.signature
+        assert updates.tool_versions["files:read"] == read.signature
+        assert {(u.update_type, u.tool_name) for u in queued} == {
+            (UpdateType.MODIFICATION, "read"), (UpdateType.ADDITION, "write")
+        }
+        assert discovery.stats["failed_registrations"] == 0
+        # The discovery index is refreshed without another tools/list
+        assert {t.name for t in (await server_manager.get_all_tools())["files"]} == {"read", "stat", "write"}
+        assert client.transport.list_calls == 2
+
+        client.transport.tools = [tool("stat"), tool("write")]
+        client.transport.push_list_changed()
+        await wait_for(lambda: "files:read" not in registry.registered_tools)
+        assert registry.list_server_tools("files") == ["files:stat", "files:write"]
+
+        await updates.stop()
+        await discovery.stop()
+        await registry.stop()
+        assert server_manager.tools_changed_listeners == []
+        await client.protocol.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_fallback_poll_skips_servers_with_list_changed(self, server_manager):
+        pushing = await make_client("pushing", [tool("a")], list_changed=True)
+        silent = await make_client("silent", [tool("b")], list_changed=False)
+        add_client(server_manager, pushing)
+        add_client(server_manager, silent)
+        seen = []
+
+        async def listener(server_name, tools):
+            seen.append(server_name)
+
+        server_manager.add_tools_changed_listener(listener)
+        silent.transport.tools.append(tool("c"))
+
+        assert await server_manager.poll_tool_changes() == ["silent"]
+        assert await server_manager.poll_tool_changes() == []
+        assert seen == ["silent"]
+        assert pushing.transport.list_calls == 1
+        assert silent.transport.list_calls == 3
+        assert server_manager.get_manager_stats()["list_changed_servers"] == ["pushing"]
+
+        await pushing.protocol.shutdown()
+        await silent.protocol.shutdown()
@@ -0,0 +1,94 @@
+"""
+Tests for the shared input models of MCP tool wrappers.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from simacode.mcp.protocol import MCPTool
+from simacode.mcp.tool_wrapper import InputModelCache, MCPToolInput, MCPToolWrapper, input_model_cache
+
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "path": {"type": "string", "description": "File path"},
+        "limit": {"type": "integer", "default": 10},
+    },
+    "required": ["path"],
+}
+
+
+def wrap(name="read", server_name="files", schema=SCHEMA, description=""):
+    tool = MCPTool(name=name, description=description, server_name=server_name, input_schema=schema)
+    return MCPToolWrapper(tool, server_manager=Mock(), permission_manager=Mock())
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    input_model_cache.clear()
+    yield
+    input_model_cache.clear()
+
+
+class TestInputModelCache:
+    """Test reuse of generated input models across wrappers."""
+
+    def test_rewrapping_reuses_the_model(self):
+        first = wrap()
+        # A refreshed tool object from another replica, with an equal schema
+        again = wrap(server_name="files", schema=dict(SCHEMA), description="Updated docs")
+
+        assert again.get_input_schema() is first.get_input_schema()
+        assert input_model_cache.get_stats()["hits"] == 1
+
+    def test_schema_change_builds_a_new_model(self):
+        first = wrap()
+        changed = wrap(schema={**SCHEMA, "required": ["path", "limit"]})
+        other_tool = wrap(name="stat")
+
+        assert changed.get_input_schema() is not first.get_input_schema()
+        assert other_tool.get_input_schema().__name__ == "StatInput"
+        assert input_model_cache.get_stats()["size"] == 3
+
+    def test_least_recently_used_model_is_evicted(self):
+        cache = InputModelCache(max_size=2)
+        cache.put(("a", "A"), MCPToolInput)
+        cache.put(("b", "B"), MCPToolInput)
+        cache.get(("a", "A"))
+        cache.put(("c", "C"), MCPToolInput)
+
+        assert cache.get(("b", "B")) is None
+        assert cache.get(("a", "A")) is MCPToolInput
+        assert cache.get_stats()["size"] == 2
+
+    def test_tool_without_schema_uses_base_input(self):
+        wrapper = wrap(schema={})
+
+        assert wrapper.get_input_schema() is MCPToolInput
+        assert input_model_cache.get_stats()["size"] == 0
+
+
+class TestValidateInput:
+    """Test that validation through the cached model keeps its semantics."""
+
+    @pytest.mark.asyncio
+    async def test_valid_input_with_coercion_and_extras(self):
+        wrapper = wrap()
+
+        validated = await wrapper.validate_input({"path": "a.txt", "limit": "5", "mode": "r"})
+
+        assert isinstance(validated, wrapper.get_input_schema())
+        assert validated.path == "a.txt"
+        assert validated.limit == 5
+        assert validated.mode == "r"
+        assert validated.execution_id
+
+    @pytest.mark.asyncio
+    async def test_defaults_and_missing_required_field(self):
+        wrapper = wrap()
+
+        assert (await wrapper.validate_input({"path": "a.txt"})).limit == 10
+        with pytest.raises(ValueError, match="Invalid input for"):
+            await wrapper.validate_input({"limit": 1})
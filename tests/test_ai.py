@@ -159,6 +159,8 @@ class TestConversationManager:
             assert len(conversations) == 2
             # Should be sorted by updated_at descending
             assert conversations[0].title == "Second"
+            assert conversations[0] is conv2
+            assert [s.id for s in manager.list_conversation_summaries()] == [conv2.id, conv1.id]
     
     def test_delete_conversation(self):
         """Test deleting conversation."""
@@ -187,6 +189,82 @@ class TestConversationManager:
             loaded = manager2.get_conversation(conversation.id)
             assert loaded.title == "Test Save"
             assert len(loaded.messages) == 1
+    
+    def test_conversations_loaded_lazily_from_index(self):
+        """Test listing is served from the index without loading bodies."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            storage_path = Path(tmp_dir)
+            manager1 = ConversationManager(storage_path)
+            conversation = manager1.create_conversation("Indexed")
+            conversation.add_user_message("Hello")
+            manager1.save_all_conversations()
+            
+            manager2 = ConversationManager(storage_path)
+            summaries = manager2.list_conversation_summaries()
+            assert summaries[0].title == "Indexed"
+            assert summaries[0].message_count == 1
+            assert manager2.conversations.loaded() == []
+            
+            loaded = manager2.get_conversation(conversation.id)
+            assert loaded.messages[0].content == "Hello"
+            assert manager2.conversations.is_loaded(conversation.id)
+    
+    def test_messages_are_appended(self):
+        """Test saving appends new messages instead of rewriting the file."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            manager = ConversationManager(Path(tmp_dir))
+            conversation = manager.create_conversation("Append")
+            conversation.add_user_message("one")
+            manager.save_all_conversations()
+            file_path = manager._get_conversation_file_path(conversation.id)
+            first_content = file_path.read_text()
+            
+            conversation.add_assistant_message("two")
+            manager.save_all_conversations()
+            
+            content = file_path.read_text()
+            assert content.startswith(first_content)
+            assert json.loads(content.splitlines()[-1])["content"] == "two"
+            
+            conversation.clear_messages()
+            manager.save_all_conversations()
+            assert len(file_path.read_text().splitlines()) == 1
+    
+    def test_lru_eviction_saves_conversations(self):
+        """Test evicted conversations are saved and reloaded on access."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            manager = ConversationManager(Path(tmp_dir), cache_size=2)
+            first = manager.create_conversation("First")
+            first.add_user_message("kept")
+            manager.set_current_conversation(first.id)
+            for i in range(3):
+                manager.create_conversation(f"Other {i}")
+            
+            assert len(manager.conversations) == 4
+            assert len(manager.conversations.loaded()) == 2
+            
+            manager.create_conversation("Another")
+            evicted = manager.list_conversation_summaries()[-1]
+            assert evicted.title == "First"
+            assert not manager.conversations.is_loaded(first.id)
+            assert manager.get_conversation(first.id).messages[0].content == "kept"
+    
+    def test_legacy_json_conversations_are_converted(self):
+        """Test legacy one-file-per-conversation storage is imported."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            storage_path = Path(tmp_dir)
+            conversation = Conversation(title="Legacy")
+            conversation.add_user_message("old message")
+            (storage_path / f"{conversation.id}.json").write_text(json.dumps(conversation.to_dict()))
+            (storage_path / "session.json").write_text(json.dumps({"id": "s1", "user_input": "x"}))
+            
+            manager = ConversationManager(storage_path)
+            
+            assert len(manager.conversations) == 1
+            assert manager.get_conversation(conversation.id).messages[0].content == "old message"
+            assert not (storage_path / f"{conversation.id}.json").exists()
+            assert (storage_path / "session.json").exists()
+            assert ConversationManager(storage_path)._ignored_files.keys() == {"session.json"}
 
 
 class TestOpenAIClient:
@@ -262,6 +340,56 @@ class TestOpenAIClient:
         
         # Skip these tests for now as they require complex async mocking
         assert True  # Placeholder to pass for now
+    
+    @pytest.mark.asyncio
+    async def test_shared_session_reuses_connections(self):
+        """Test that consecutive requests reuse one keep-alive connection."""
+        from aiohttp import web
+        
+        async def completions(request):
+            return web.json_response({
+                "id": "resp-1",
+                "choices": [{"message": {"content": "pong"}, "finish_reason": "stop"}]
+            })
+        
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", completions)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        
+        client = OpenAIClient({"api_key": "test-key", "base_url": f"http://127.0.0.1:{port}/v1"})
+        messages = [Message(role=Role.USER, content="ping")]
+        try:
+            first = await client.chat(messages)
+            session = client._session
+            second = await client.chat(messages)
+            
+            assert first.content == second.content == "pong"
+            assert client._session is session
+            
+            stats = client.get_pool_stats()
+            assert stats["requests"] == 2
+            assert stats["connections_created"] == 1
+            assert stats["connections_reused"] == 1
+            assert stats["reuse_ratio"] == 0.5
+            assert stats["open_connections"] == 1
+            assert stats["waiters"] == 0
+        finally:
+            await client.close()
+            await runner.cleanup()
+        
+        assert session.closed
+        assert client.get_pool_stats()["session_open"] is False
+    
+    @pytest.mark.asyncio
+    async def test_close_without_session(self):
+        """Test closing a client that never sent a request."""
+        client = OpenAIClient({"api_key": "test-key"})
+        await client.close()
+        assert client.get_pool_stats()["open_connections"] == 0
 
 
 class TestAIClientFactory:
@@ -0,0 +1,200 @@
+"""
+Tests for the AI response cache.
+"""
+
+import time
+
+import pytest
+
+from simacode.ai.base import AIClient, AIResponse, Message, Role
+from simacode.ai.cache import (
+    CachedAIClient, MemoryCacheBackend, SQLiteCacheBackend, create_cache_backend
+)
+from simacode.ai.factory import AIClientFactory
+from simacode.config import AIResponseCacheConfig, Config
+
+
+class CountingClient(AIClient):
+    """AI client that returns a numbered response for every call."""
+
+    def __init__(self, model="gpt-4", temperature=0.1):
+        super().__init__({})
+        self.model = model
+        self.temperature = temperature
+        self.calls = 0
+
+    async def chat(self, messages):
+        self.calls += 1
+        return AIResponse(content=f"response {self.calls}", model=self.model, usage={"total_tokens": 10})
+
+    async def chat_stream(self, messages):
+        yield "chunk"
+
+    def validate_config(self):
+        return True
+
+    @property
+    def provider_name(self):
+        return "counting"
+
+
+def make_messages(user_text="plan this"):
+    return [
+        Message(role=Role.SYSTEM, content="You are a planner."),
+        Message(role=Role.USER, content=user_text),
+    ]
+
+
+class TestCachedAIClient:
+    """Test cache hits, misses and opt-out."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_prompt_hits_cache(self):
+        inner = CountingClient()
+        client = CachedAIClient(inner, MemoryCacheBackend())
+
+        first = await client.chat(make_messages())
+        second = await client.chat(make_messages())
+
+        assert first.content == second.content == "response 1"
+        assert inner.calls == 1
+        stats = client.get_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_whitespace_is_normalized(self):
+        client = CachedAIClient(CountingClient(), MemoryCacheBackend())
+
+        key_a = client.make_cache_key(make_messages("plan   this\n"))
+        key_b = client.make_cache_key(make_messages("plan this"))
+
+        assert key_a == key_b
+
+    @pytest.mark.asyncio
+    async def test_model_and_temperature_are_part_of_key(self):
+        messages = make_messages()
+        key = CachedAIClient(CountingClient(), MemoryCacheBackend()).make_cache_key(messages)
+
+        assert key != CachedAIClient(CountingClient(model="gpt-4o"), MemoryCacheBackend()).make_cache_key(messages)
+        assert key != CachedAIClient(CountingClient(temperature=0.7), MemoryCacheBackend()).make_cache_key(messages)
+
+    @pytest.mark.asyncio
+    async def test_per_call_opt_out(self):
+        inner = CountingClient()
+        client = CachedAIClient(inner, MemoryCacheBackend())
+
+        await client.chat(make_messages())
+        response = await client.chat(make_messages(), use_cache=False)
+
+        assert response.content == "response 2"
+        assert client.get_cache_stats()["bypassed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self):
+        inner = CountingClient()
+        client = CachedAIClient(inner, MemoryCacheBackend())
+
+        await client.chat(make_messages())
+        await client.invalidate(make_messages())
+        response = await client.chat(make_messages())
+
+        assert response.content == "response 2"
+
+    def test_delegates_attributes(self):
+        client = CachedAIClient(CountingClient(), MemoryCacheBackend())
+
+        assert client.model == "gpt-4"
+        assert client.provider_name == "counting"
+
+
+class TestMemoryCacheBackend:
+    """Test LRU and TTL eviction."""
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        backend = MemoryCacheBackend(max_entries=2, ttl=None)
+        await backend.set("a", AIResponse(content="a"))
+        await backend.set("b", AIResponse(content="b"))
+        await backend.get("a")  # "b" becomes least recently used
+        await backend.set("c", AIResponse(content="c"))
+
+        assert await backend.get("b") is None
+        assert (await backend.get("a")).content == "a"
+        assert backend.size() == 2
+        assert backend.evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self):
+        backend = MemoryCacheBackend(ttl=10)
+        await backend.set("a", AIResponse(content="a"))
+        backend._entries["a"] = (time.time() - 20, backend._entries["a"][1])
+
+        assert await backend.get("a") is None
+        assert backend.size() == 0
+
+
+class TestSQLiteCacheBackend:
+    """Test the on-disk backend."""
+
+    @pytest.mark.asyncio
+    async def test_persists_across_instances(self, temp_directory):
+        db_path = temp_directory / "cache.db"
+        backend = SQLiteCacheBackend(db_path)
+        await backend.set("key", AIResponse(content="cached", usage={"total_tokens": 5}))
+        await backend.close()
+
+        reopened = SQLiteCacheBackend(db_path)
+        response = await reopened.get("key")
+        await reopened.close()
+
+        assert response.content == "cached"
+        assert response.usage == {"total_tokens": 5}
+
+    @pytest.mark.asyncio
+    async def test_size_eviction(self, temp_directory):
+        backend = SQLiteCacheBackend(temp_directory / "cache.db", max_entries=2, ttl=None)
+        for key in ("a", "b", "c"):
+            await backend.set(key, AIResponse(content=key))
+            time.sleep(0.01)
+
+        assert backend.size() == 2
+        assert await backend.get("a") is None
+        assert backend.evictions == 1
+        await backend.close()
+
+
+class TestCacheConfiguration:
+    """Test cache wiring from configuration."""
+
+    def test_factory_returns_plain_client_when_disabled(self):
+        inner = CountingClient()
+        assert AIClientFactory.create_cached_client(inner, {"enabled": False}) is inner
+
+    def test_factory_wraps_when_enabled(self, temp_directory):
+        client = AIClientFactory.create_cached_client(
+            CountingClient(),
+            {"enabled": True, "backend": "sqlite", "db_path": temp_directory / "c.db"}
+        )
+        assert isinstance(client, CachedAIClient)
+        assert isinstance(client.backend, SQLiteCacheBackend)
+
+    def test_invalid_backend(self):
+        with pytest.raises(ValueError):
+            create_cache_backend({"backend": "redis"})
+        with pytest.raises(ValueError):
+            AIResponseCacheConfig(backend="redis")
+
+    def test_engine_uses_cache_for_planner_and_evaluator(self):
+        from simacode.react.engine import ReActEngine
+
+        config = Config()
+        config.ai.response_cache.enabled = True
+        inner = CountingClient()
+        engine = ReActEngine(inner, config=config)
+
+        assert isinstance(engine.planning_client, CachedAIClient)
+        assert engine.task_planner.ai_client is engine.planning_client
+        assert engine.result_evaluator.ai_client is engine.planning_client
+        assert engine.ai_client is inner
@@ -0,0 +1,160 @@
+"""
+Tests for token counting and per-message token budgeting of planner context.
+"""
+
+import base64
+from unittest.mock import Mock
+
+import pytest
+
+from simacode.ai.base import Message, Role
+from simacode.ai.conversation import Conversation
+from simacode.ai.tokenizer import (
+    BPETokenCounter, HeuristicTokenCounter, configure_token_counter, get_token_counter,
+    set_default_token_counter
+)
+from simacode.config import ConversationContextConfig
+from simacode.react.planner import TaskPlanner
+
+
+class CountingCounter(HeuristicTokenCounter):
+    """Heuristic counter that records how much text it was asked to count."""
+
+    name = "counting"
+
+    def __init__(self):
+        self.calls = 0
+
+    def count(self, text):
+        self.calls += 1
+        return super().count(text)
+
+
+@pytest.fixture
+def vocab_file(temp_directory):
+    tokens = [bytes([i]) for i in range(256)] + [b"he", b"ll", b"hell"]
+    path = temp_directory / "tiny.tiktoken"
+    path.write_text("".join(
+        f"{base64.b64encode(token).decode()} {rank}\n" for rank, token in enumerate(tokens)
+    ))
+    return path
+
+
+@pytest.fixture
+def counter():
+    counter = CountingCounter()
+    set_default_token_counter(counter)
+    yield counter
+    set_default_token_counter(None)
+
+
+class TestTokenCounters:
+    """Test BPE counting and the fallback to the heuristic."""
+
+    def test_bpe_merges_by_rank(self, vocab_file):
+        bpe = BPETokenCounter.from_file(vocab_file)
+
+        # "hello" -> hell + o, " world" has no merges
+        assert bpe.count("hello world") == 8
+        assert bpe.count("") == 0
+        assert bpe.name == "bpe:tiny"
+
+    def test_vocab_is_loaded_once_and_missing_vocab_falls_back(self, vocab_file, temp_directory):
+        assert get_token_counter(str(vocab_file)) is get_token_counter(vocab_file)
+        assert isinstance(get_token_counter(temp_directory / "missing.tiktoken"), HeuristicTokenCounter)
+
+    def test_invalid_vocab_line(self, temp_directory):
+        path = temp_directory / "broken.tiktoken"
+        path.write_text("aGk= 0\nnot-a-rank\n")
+
+        with pytest.raises(ValueError, match="line 2"):
+            BPETokenCounter.from_file(path)
+
+
+class TestMessageCaches:
+    """Test that token counts and tags are computed once per content."""
+
+    def test_counts_are_cached_until_content_changes(self, counter):
+        message = Message(role=Role.USER, content="fix the config error")
+
+        assert message.count_tokens() == 5
+        assert message.count_tokens() == 5
+        assert counter.calls == 1
+        assert message.get_tags() == {"important", "problem", "config"}
+
+        message.content = "write a function"
+        assert message.count_tokens() == 4
+        assert counter.calls == 2
+        assert message.get_tags() == {"code"}
+
+    def test_add_message_warms_the_caches(self, counter):
+        conversation = Conversation()
+        message = conversation.add_message(Role.USER, "hello there")
+
+        assert counter.calls == 1
+        assert message._tags_cache is not None
+        # Caches stay out of equality and serialization
+        assert message == Message(role=Role.USER, content="hello there")
+        assert message.to_dict() == {"role": "user", "content": "hello there"}
+
+    def test_configured_vocab_counts_reuse_the_warmed_cache(self, vocab_file):
+        bpe = configure_token_counter(str(vocab_file))
+        try:
+            message = Conversation().add_message(Role.USER, "hello")
+            config = ConversationContextConfig(tokenizer_vocab=str(vocab_file))
+
+            assert TaskPlanner(Mock())._get_token_counter(config) is bpe
+            assert message._token_cache[1] is bpe
+        finally:
+            set_default_token_counter(None)
+
+
+class TestPlannerContextBudget:
+    """Test planner context built from cached per-message counts."""
+
+    @pytest.fixture
+    def planner(self):
+        return TaskPlanner(Mock())
+
+    def test_full_context_keeps_newest_messages_within_budget(self, planner, counter):
+        history = [Message(role=Role.USER, content=f"message {i} " + "x" * 40) for i in range(10)]
+        config = ConversationContextConfig(strategy="full", max_tokens=50)
+
+        context = planner._get_full_conversation_context(history, config)
+
+        # Each message costs 12 tokens plus 4 for its label
+        assert context.startswith("[Earlier conversation truncated: 7 messages]")
+        assert "message 9" in context and "message 7" in context
+        assert "message 6" not in context
+
+        calls = counter.calls
+        planner._get_full_conversation_context(history, config)
+        assert counter.calls == calls
+
+    def test_oversized_newest_message_is_truncated(self, planner, counter):
+        history = [
+            Message(role=Role.USER, content="short"),
+            Message(role=Role.ASSISTANT, content="y" * 2000),
+        ]
+        config = ConversationContextConfig(strategy="full", max_tokens=100)
+
+        context = planner._get_full_conversation_context(history, config)
+
+        assert context.startswith("[Earlier conversation truncated: 1 messages]")
+        assert context.endswith("[Context truncated due to token limit]")
+        assert len(context) < 400
+
+    def test_compressed_context_uses_cached_tags(self, planner, counter):
+        history = [Message(role=Role.USER, content="we made an important decision")]
+        history += [Message(role=Role.USER, content=f"chat {i}") for i in range(8)]
+        for message in history:
+            message.get_tags()
+
+        layers = planner._categorize_messages_by_importance(history)
+        topics = planner._extract_topics_from_messages(
+            [Message(role=Role.USER, content="install and configure the code")]
+        )
+
+        assert layers["important"] == history[:1]
+        assert len(layers["critical"]) == 5
+        assert topics == {"代码开发", "系统配置"}
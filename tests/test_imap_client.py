@@ -0,0 +1,334 @@
+"""
+Tests for the IMAP client used by the email IMAP MCP server.
+
+The client is exercised against a small in-process fake IMAP server that
+records every command it receives.
+"""
+
+import asyncio
+import socketserver
+import sys
+import threading
+import time
+from email.message import EmailMessage as MIMEMessage
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tools.mcp_imap_receive_email import (
+    EmailConfig, EmailIMAPMCPServer, IMAPEmailClient, IMAPMessageCache
+)
+
+TEXT_BODYSTRUCTURE = '("TEXT" "PLAIN" ("CHARSET" "utf-8") NIL NIL "7BIT" 20 1 NIL NIL NIL NIL)'
+ATTACHMENT_BODYSTRUCTURE = (
+    '(("TEXT" "PLAIN" ("CHARSET" "utf-8") NIL NIL "7BIT" 20 1 NIL NIL NIL NIL)'
+    '("APPLICATION" "PDF" ("NAME" "report.pdf") NIL NIL "BASE64" 400 NIL '
+    '("ATTACHMENT" ("FILENAME" "report.pdf")) NIL NIL) "MIXED" ("BOUNDARY" "b1") NIL NIL NIL)'
+)
+
+
+def make_message(uid, attachment=False):
+    message = MIMEMessage()
+    message["Subject"] = f"Message {uid}"
+    message["From"] = f"Sender {uid} <sender{uid}@example.com>"
+    message["To"] = "me@example.com"
+    message["Date"] = "Mon, 06 Jan 2025 10:00:00 +0000"
+    message.set_content(f"Body of message {uid}")
+    if attachment:
+        message.add_attachment(b"%PDF" * 75, maintype="application", subtype="pdf", filename="report.pdf")
+    return message.as_bytes()
+
+
+class FakeIMAPHandler(socketserver.StreamRequestHandler):
+    """Speaks just enough IMAP4rev1 for IMAPEmailClient."""
+
+    def send(self, data):
+        self.wfile.write(data if isinstance(data, bytes) else data.encode())
+
+    def handle(self):
+        server = self.server
+        self.send("* OK [CAPABILITY IMAP4rev1] fake server ready\r\n")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                break
+            tag, command, *rest = line.decode().rstrip("\r\n").split(" ", 2)
+            command = command.upper()
+            args = rest[0] if rest else ""
+            if command == "UID":
+                command, _, args = args.partition(" ")
+                command = f"UID {command.upper()}"
+            server.commands.append(command)
+            if server.delay:
+                time.sleep(server.delay)
+
+            if command == "SELECT":
+                server.selected.append(args)
+                self.send(f"* {len(server.messages)} EXISTS\r\n* OK [UIDVALIDITY {server.uidvalidity}] UIDs valid\r\n"
+                          f"{tag} OK [READ-WRITE] SELECT completed\r\n")
+            elif command == "UID SEARCH":
+                self.send(f"* SEARCH {' '.join(str(uid) for uid in server.messages)}\r\n{tag} OK SEARCH completed\r\n")
+            elif command == "UID FETCH":
+                uid_set, _, items = args.partition(" ")
+                for seq, uid in enumerate(int(u) for u in uid_set.split(",")):
+                    if uid not in server.messages:
+                        continue
+                    raw = server.messages[uid]
+                    prefix = f"* {seq + 1} FETCH (UID {uid} FLAGS (\\Seen)"
+                    if "BODY" not in items:
+                        self.send(prefix + ")\r\n")
+                        continue
+                    if "BODYSTRUCTURE" in items:
+                        prefix += f" BODYSTRUCTURE {server.bodystructures.get(uid, TEXT_BODYSTRUCTURE)}"
+                    if "HEADER" in items:
+                        section = items[items.index("BODY.PEEK[") + 10:items.rindex("]")]
+                        data = raw.split(b"\n\n", 1)[0] + b"\n\n"
+                    else:
+                        section, data = "", raw
+                    server.downloaded.append(uid)
+                    self.send(f"{prefix} RFC822.SIZE {len(raw)} BODY[{section}] {{{len(data)}}}\r\n")
+                    self.send(data + b")\r\n")
+                self.send(f"{tag} OK FETCH completed\r\n")
+            elif command == "LOGOUT":
+                self.send(f"* BYE logging out\r\n{tag} OK LOGOUT completed\r\n")
+                break
+            else:
+                # LOGIN, NOOP, CLOSE
+                self.send(f"{tag} OK {command} completed\r\n")
+
+
+class FakeIMAPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, messages):
+        super().__init__(("127.0.0.1", 0), FakeIMAPHandler)
+        self.messages = messages
+        self.bodystructures = {}
+        self.commands = []
+        self.selected = []
+        self.downloaded = []
+        self.uidvalidity = 42
+        self.delay = 0.0
+
+
+@pytest.fixture
+def imap_server():
+    server = FakeIMAPServer({uid: make_message(uid) for uid in range(1, 61)})
+    server.messages[61] = make_message(61, attachment=True)
+    server.bodystructures[61] = ATTACHMENT_BODYSTRUCTURE
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def imap_config(imap_server):
+    return EmailConfig(
+        server="127.0.0.1",
+        port=imap_server.server_address[1],
+        username="me@example.com",
+        password="secret",
+        use_ssl=False,
+        timeout=5,
+        cache_path=None,
+    )
+
+
+class TestIMAPEmailClient:
+    """Test pooled, batched IMAP access."""
+
+    @pytest.mark.asyncio
+    async def test_batch_fetch_uses_one_round_trip(self, imap_server, imap_config):
+        client = IMAPEmailClient(imap_config)
+        await client.select_folder("INBOX")
+        uids = await client.search_emails("ALL", limit=50)
+
+        imap_server.commands.clear()
+        messages = await client.fetch_emails(uids)
+
+        assert [m.uid for m in messages] == uids
+        assert messages[0].subject == "Message 61"
+        assert messages[0].sender == "sender61@example.com"
+        assert "Body of message 61" in messages[0].body_text
+        assert messages[0].flags == ["\\Seen"]
+        assert imap_server.commands == ["UID FETCH"]
+
+        # Fetching one at a time costs a round-trip per message
+        client.cache = None
+        imap_server.commands.clear()
+        for uid in uids:
+            await client.fetch_email(uid)
+        assert imap_server.commands.count("UID FETCH") == 50
+        await client.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_headers_only_fetch(self, imap_server, imap_config):
+        client = IMAPEmailClient(imap_config)
+        await client.select_folder("INBOX")
+
+        messages = await client.fetch_emails(["7"], headers_only=True)
+
+        assert messages[0].subject == "Message 7"
+        assert messages[0].body_text == ""
+        assert messages[0].size == len(imap_server.messages[7])
+        await client.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_connections_are_pooled(self, imap_server, imap_config):
+        client = IMAPEmailClient(imap_config)
+
+        await client.select_folder("INBOX")
+        await client.search_emails("ALL")
+        await client.fetch_email("1")
+
+        assert client.stats["connections_opened"] == 1
+        assert imap_server.commands.count("LOGIN") == 1
+        assert imap_server.commands.count("SELECT") == 1
+
+        await client.disconnect()
+        assert "LOGOUT" in imap_server.commands
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_keep_their_folder(self, imap_server, imap_config):
+        client = IMAPEmailClient(imap_config)
+        imap_server.delay = 0.05
+
+        # Another request switches the shared default folder mid-flight
+        await asyncio.gather(
+            client.fetch_emails(["1", "2"], folder="Archive"),
+            client.select_folder("INBOX"),
+        )
+        await client.search_emails("ALL", folder="Archive")
+
+        assert "Archive" in imap_server.selected
+        assert imap_server.selected.count("INBOX") == 1
+        assert client.current_folder == "INBOX"
+        assert client.stats["round_trips"] == len([c for c in imap_server.commands if c != "CAPABILITY"])
+        await client.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_event_loop_is_not_blocked(self, imap_server, imap_config):
+        client = IMAPEmailClient(imap_config)
+        await client.connect()
+        imap_server.delay = 0.3
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        await client.select_folder("INBOX")
+        task.cancel()
+
+        assert ticks >= 10
+        imap_server.delay = 0.0
+        await client.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_get_recent_emails_tool(self, imap_server, imap_config):
+        server = EmailIMAPMCPServer(imap_config)
+
+        result = await server._get_recent_emails({"limit": 50})
+
+        assert len(result["result"]) == 50
+        assert result["result"][0]["subject"] == "Message 61"
+        assert imap_server.commands.count("UID FETCH") == 1
+        assert imap_server.commands.count("LOGIN") == 1
+        await server.email_client.disconnect()
+
+
+class TestIMAPHeaderModeAndCache:
+    """Test header-only listings and the UIDVALIDITY+UID message cache."""
+
+    @pytest.mark.asyncio
+    async def test_headers_mode_lists_attachment_metadata(self, imap_server, imap_config):
+        server = EmailIMAPMCPServer(imap_config)
+
+        result = await server._get_recent_emails({"limit": 2, "mode": "headers"})
+
+        latest = result["result"][0]
+        assert latest["subject"] == "Message 61"
+        assert "body_text" not in latest
+        assert latest["attachments"] == [{"filename": "report.pdf", "content_type": "application/pdf", "size": 300}]
+        assert imap_server.commands[-1] == "UID FETCH"
+        await server.email_client.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_repeated_polls_do_not_redownload(self, imap_server, imap_config):
+        server = EmailIMAPMCPServer(imap_config)
+
+        await server._get_recent_emails({"limit": 10, "mode": "headers"})
+        assert len(imap_server.downloaded) == 10
+
+        second = await server._get_recent_emails({"limit": 10, "mode": "headers"})
+        assert len(imap_server.downloaded) == 10
+        assert second["result"][0]["flags"] == ["\\Seen"]
+        assert second["result"][0]["attachments"][0]["filename"] == "report.pdf"
+
+        # Bodies are downloaded once, on explicit request
+        await server._get_recent_emails({"limit": 10})
+        await server._get_recent_emails({"limit": 10})
+        assert len(imap_server.downloaded) == 20
+
+        email_result = await server._get_email({"uid": "61"})
+        assert email_result["attachments"][0]["content_base64"]
+        assert len(imap_server.downloaded) == 20
+        await server.email_client.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_uidvalidity_change_invalidates_cache(self, imap_server, imap_config):
+        client = IMAPEmailClient(imap_config)
+        await client.select_folder("INBOX")
+        await client.fetch_emails(["1", "2"])
+
+        imap_server.uidvalidity = 43
+        await client.select_folder("INBOX")
+        await client.fetch_emails(["1", "2"])
+
+        assert imap_server.downloaded == [1, 2, 1, 2]
+        assert client.cache.size() == 2
+        await client.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_cache_persists_across_clients(self, imap_server, imap_config, temp_directory):
+        imap_config.cache_path = str(temp_directory / "imap.db")
+        for _ in range(2):
+            client = IMAPEmailClient(imap_config)
+            await client.select_folder("INBOX")
+            messages = await client.fetch_emails(["5"])
+            await client.disconnect()
+            client.cache.close()
+
+        assert messages[0].subject == "Message 5"
+        assert imap_server.downloaded == [5]
+
+    def test_cache_eviction(self):
+        cache = IMAPMessageCache(max_messages=2)
+        for uid in ("1", "2", "3"):
+            cache.put_many("INBOX", "1", {uid: {"header": b"Subject: x\r\n\r\n", "attachments": [], "size": 1}})
+            time.sleep(0.01)
+
+        assert cache.size() == 2
+        assert set(cache.get_many("INBOX", "1", ["1", "2", "3"])) == {"2", "3"}
+        assert cache.get_many("INBOX", "1", ["2"], need_body=True) == {}
+
+    def test_cache_caps_body_bytes(self):
+        cache = IMAPMessageCache(max_bytes=250, max_message_bytes=150)
+        header = b"Subject: x\r\n\r\n"
+        cache.put_many("INBOX", "1", {"1": {"header": header, "attachments": [], "size": 200, "raw": b"x" * 200}})
+        for uid in ("2", "3", "4"):
+            time.sleep(0.01)
+            cache.put_many("INBOX", "1", {uid: {"header": header, "attachments": [], "size": 100, "raw": b"x" * 100}})
+
+        # The oversized body was never stored and the oldest body was evicted by size
+        assert cache.size() == 4
+        assert set(cache.get_many("INBOX", "1", ["1", "2", "3", "4"], need_body=True)) == {"3", "4"}
+        assert cache.get_many("INBOX", "1", ["1"])["1"]["raw"] is None
@@ -0,0 +1,149 @@
+"""
+Tests for path roots, the decision cache and reloads of PermissionManager.
+"""
+
+import gc
+import os
+import time
+import weakref
+from types import SimpleNamespace
+
+import pytest
+
+from simacode.permissions import (
+    PathTrie, PathValidator, PermissionCache, PermissionLevel, PermissionManager, PermissionResult
+)
+from simacode.tools import FileReadTool
+
+
+def make_config(allowed, forbidden=()):
+    security = SimpleNamespace(
+        allowed_paths=list(allowed), forbidden_paths=list(forbidden), max_command_execution_time=30
+    )
+    return SimpleNamespace(security=security)
+
+
+@pytest.fixture
+def workspace(temp_directory):
+    (temp_directory / "project" / "secrets").mkdir(parents=True)
+    return temp_directory
+
+
+class TestPathTrie:
+    """Test component-wise matching of roots."""
+
+    def test_roots_match_at_component_boundaries(self, workspace):
+        trie = PathTrie([str(workspace / "project"), "~/notes"])
+
+        assert trie.match(str(workspace / "project" / "a" / "b.txt")) == str(workspace / "project")
+        assert trie.match(str(workspace / "project")) == str(workspace / "project")
+        assert trie.match(str(workspace / "projectile")) is None
+        assert str(workspace) not in trie
+        assert os.path.join(os.path.expanduser("~"), "notes", "x.md") in trie
+
+    def test_outermost_root_wins_and_relative_roots_can_be_skipped(self, workspace):
+        trie = PathTrie([str(workspace / "project" / "secrets"), str(workspace), "C:\\Windows"], absolute_only=True)
+
+        assert trie.match(str(workspace / "project" / "secrets" / "k")) == str(workspace)
+        assert len(trie) == (3 if os.name == "nt" else 2)
+
+
+class TestPermissionCache:
+    """Test size cap, TTL and subtree invalidation of cached decisions."""
+
+    def test_least_recently_used_decision_is_evicted(self):
+        cache = PermissionCache(max_entries=2)
+        allowed = PermissionResult(granted=True, level=PermissionLevel.ALLOWED)
+        cache.set("a", "/a", allowed)
+        cache.set("b", "/b", allowed)
+        cache.get("a")
+        cache.set("c", "/c", allowed)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is allowed
+        assert cache.evictions == 1
+
+    def test_expired_decision_is_dropped(self):
+        cache = PermissionCache(ttl=0.01)
+        cache.set("a", "/a", PermissionResult(granted=True, level=PermissionLevel.ALLOWED))
+        time.sleep(0.02)
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+
+class TestPermissionManagerRoots:
+    """Test PermissionManager decisions backed by the tries."""
+
+    def test_forbidden_subtree_inside_allowed_root(self, workspace):
+        project = workspace / "project"
+        manager = PermissionManager(make_config([str(project)], [str(project / "secrets")]))
+
+        assert manager.check_path_access(str(project / "src" / "main.py")).granted
+        denied = manager.check_file_permission(str(project / "secrets" / "key.txt"), "read")
+        assert not denied.granted
+        assert "forbidden" in denied.reason
+        # A sibling that shares the string prefix is outside the allowed root
+        assert not manager.check_path_access(str(workspace / "project-old")).granted
+
+    def test_cache_is_bounded_and_invalidated_by_directory(self, workspace):
+        project = workspace / "project"
+        manager = PermissionManager(make_config([str(project)]))
+        manager._permission_cache.max_entries = 10
+
+        for i in range(25):
+            manager.check_path_access(str(project / "src" / f"file_{i}.py"))
+        manager.check_path_access(str(project / "README.md"))
+
+        stats = manager.get_cache_stats()
+        assert stats["total_entries"] == 10
+        assert stats["evictions"] == 16
+        assert manager.invalidate_path(str(project / "src")) == 9
+        assert manager.get_cache_stats()["total_entries"] == 1
+
+    def test_reload_rebuilds_roots_and_notifies_listeners(self, workspace):
+        project = workspace / "project"
+        manager = PermissionManager(make_config([str(project)]))
+        tool = FileReadTool(manager)
+        target = str(workspace / "other" / "data.txt")
+
+        assert not manager.check_file_permission(target, "read").granted
+        assert not tool.path_validator.is_path_allowed(target)
+
+        manager.reload_security_config(make_config([str(project), str(workspace / "other")]))
+
+        assert manager.get_cache_stats()["total_entries"] == 0
+        assert manager.check_file_permission(target, "read").granted
+        assert tool.path_validator.is_path_allowed(target)
+
+    def test_reload_listener_does_not_keep_tool_alive(self, workspace):
+        project = workspace / "project"
+        manager = PermissionManager(make_config([str(project)]))
+        tool = FileReadTool(manager)
+        tool_ref = weakref.ref(tool)
+        calls = []
+        manager.add_reload_listener(calls.append)
+
+        del tool
+        gc.collect()
+
+        assert tool_ref() is None
+        manager.reload_security_config(make_config([str(workspace)]))
+        assert calls == [manager]
+        assert len(manager._reload_listeners) == 1
+
+        manager.remove_reload_listener(calls.append)
+        manager.reload_security_config(make_config([str(project)]))
+        assert calls == [manager]
+
+
+class TestPathValidator:
+    """Test that PathValidator rebuilds its trie when roots change."""
+
+    def test_set_allowed_paths(self, workspace):
+        validator = PathValidator([str(workspace / "project")])
+
+        assert validator.is_path_allowed(str(workspace / "project" / "a.txt"))
+        validator.set_allowed_paths([str(workspace / "elsewhere")])
+        assert not validator.is_path_allowed(str(workspace / "project" / "a.txt"))
+        assert validator.is_path_allowed(str(workspace / "elsewhere" / "a.txt"))
@@ -146,6 +146,38 @@ class TestTaskPlanner:
         assert len(alternative_tasks) >= 1
         assert all(isinstance(task, Task) for task in alternative_tasks)
 
+    def test_tool_catalog_is_memoized(self, mock_ai_client):
+        """Test that the tool catalog is only rebuilt for tools that changed."""
+        planner = TaskPlanner(mock_ai_client)
+        tool = MagicMock(description="Catalog test tool", mcp_schema=None)
+        tool.name = "catalog_test_tool"
+
+        try:
+            planner.tool_registry.register(tool)
+
+            with patch.object(planner, '_get_tool_parameter_info', wraps=planner._get_tool_parameter_info) as spy:
+                first = planner._get_planning_system_prompt()
+                built = spy.call_count
+                second = planner._get_planning_system_prompt()
+
+                # Unchanged registry: nothing is re-described
+                assert second is first
+                assert spy.call_count == built
+                assert "- catalog_test_tool: Catalog test tool" in first
+
+                # Updating one tool only re-describes that tool
+                updated = MagicMock(description="Updated catalog tool", mcp_schema=None)
+                updated.name = "catalog_test_tool"
+                planner.tool_registry.update(updated)
+                third = planner._get_planning_system_prompt()
+
+                assert spy.call_count == built + 1
+                assert "- catalog_test_tool: Updated catalog tool" in third
+        finally:
+            planner.tool_registry.unregister("catalog_test_tool")
+
+        assert "catalog_test_tool" not in planner._get_available_tools_description()
+
 
 class TestResultEvaluator:
     """Test cases for ResultEvaluator."""
@@ -332,6 +364,188 @@ class TestReActEngine:
         assert len(error_updates) > 0
 
 
+
+class TestTaskGraphExecution:
+    """Test dependency-graph scheduling of tasks."""
+    
+    @pytest.fixture
+    def engine(self, mock_ai_client):
+        engine = ReActEngine(mock_ai_client, ExecutionMode.ADAPTIVE)
+        engine.events = []
+        
+        async def fake_execute_single_task(session, task):
+            loop = asyncio.get_running_loop()
+            engine.events.append(("start", task.id, loop.time()))
+            await asyncio.sleep(task.metadata.get("duration", 0.1))
+            if task.metadata.get("raise"):
+                raise ExecutionError("tool crashed")
+            session.task_results[task.id] = [ToolResult(type=ToolResultType.OUTPUT, content=f"output of {task.id}")]
+            session.evaluations[task.id] = EvaluationResult(
+                outcome=task.metadata.get("outcome", EvaluationOutcome.SUCCESS),
+                confidence=ConfidenceLevel.HIGH,
+                success_score=1.0,
+                recommendations=task.metadata.get("recommendations", [])
+            )
+            engine.events.append(("end", task.id, loop.time()))
+            yield {"type": "sub_task_result", "task_id": task.id}
+        
+        engine._execute_single_task = fake_execute_single_task
+        return engine
+    
+    def make_session(self, *specs):
+        session = ReActSession(user_input="Run the plan")
+        for task_id, dependencies, metadata in specs:
+            session.tasks.append(Task(
+                id=task_id, description=f"Step {task_id}", tool_name="bash",
+                dependencies=dependencies, metadata=metadata
+            ))
+        return session
+    
+    def times(self, engine, kind):
+        return {task_id: t for event, task_id, t in engine.events if event == kind}
+    
+    @pytest.mark.asyncio
+    async def test_tasks_start_when_dependencies_finish(self, engine):
+        # A -> C, B -> D (slow), (C, D) -> E; dependencies by ID and by description
+        session = self.make_session(
+            ("A", [], {}),
+            ("B", [], {}),
+            ("C", ["A"], {}),
+            ("D", ["Step B"], {"duration": 0.3}),
+            ("E", ["C", "D"], {}),
+        )
+        
+        updates = [u async for u in engine._execute_tasks_adaptively(session)]
+        
+        start, end = self.times(engine, "start"), self.times(engine, "end")
+        assert start["B"] - start["A"] < 0.05
+        assert start["C"] >= end["A"] and start["C"] < end["B"] + 0.05
+        assert start["D"] >= end["B"]
+        assert start["E"] >= max(end["C"], end["D"])
+        
+        completed = [u["task_id"] for u in updates if u.get("type") == "sub_task_result"]
+        assert completed.index("C") < completed.index("D")
+        
+        timing = session.metadata["execution_timing"]
+        assert timing["critical_path"] == ["B", "D", "E"]
+        assert timing["critical_path_time"] == pytest.approx(0.5, abs=0.1)
+        assert timing["wall_time"] < 0.7
+        assert engine._create_final_result(session)["summary"]["execution_timing"] is timing
+    
+    @pytest.mark.asyncio
+    async def test_parallel_task_limit(self, engine):
+        engine.parallel_task_limit = 2
+        session = self.make_session(*[(f"T{i}", [], {}) for i in range(5)])
+        
+        [u async for u in engine._execute_tasks_adaptively(session)]
+        
+        start, end = self.times(engine, "start"), self.times(engine, "end")
+        for t in start.values():
+            running = sum(1 for task_id in start if start[task_id] <= t < end[task_id])
+            assert running <= 2
+    
+    @pytest.mark.asyncio
+    async def test_placeholder_tasks_wait_for_earlier_tasks(self, engine):
+        session = self.make_session(("A", [], {}), ("B", [], {}))
+        session.tasks[1].tool_input = {"command": "echo <previous_result>"}
+        
+        [u async for u in engine._execute_tasks_adaptively(session)]
+        
+        assert self.times(engine, "start")["B"] >= self.times(engine, "end")["A"]
+    
+    @pytest.mark.asyncio
+    async def test_critical_failure_stops_scheduling(self, engine):
+        session = self.make_session(
+            ("A", [], {"outcome": EvaluationOutcome.FAILURE, "recommendations": ["Critical: abort"]}),
+            ("B", ["A"], {}),
+        )
+        
+        [u async for u in engine._execute_tasks_adaptively(session)]
+        
+        assert "B" not in self.times(engine, "start")
+    
+    @pytest.mark.asyncio
+    async def test_execution_error_is_raised_after_running_tasks_finish(self, engine):
+        session = self.make_session(
+            ("A", [], {"raise": True, "duration": 0.05}),
+            ("B", [], {"duration": 0.2}),
+            ("C", ["A"], {}),
+        )
+        
+        with pytest.raises(ExecutionError):
+            [u async for u in engine._execute_tasks_adaptively(session)]
+        
+        assert "B" in self.times(engine, "end")
+        assert "C" not in self.times(engine, "start")
+    
+    def test_dependency_cycle_falls_back_to_plan_order(self, engine):
+        session = self.make_session(("A", ["B"], {}), ("B", ["A"], {}))
+        
+        assert engine._build_task_graph(session) == {"A": set(), "B": {"A"}}
+    
+    @pytest.mark.asyncio
+    async def test_dependency_wait_is_recorded(self, engine):
+        session = self.make_session(("A", [], {"duration": 0.2}), ("B", [], {}), ("C", ["A"], {}))
+        
+        [u async for u in engine._execute_tasks_adaptively(session)]
+        
+        waits = session.metadata["dependency_wait"]
+        assert set(waits["tasks"]) == {"C"}
+        assert waits["total_seconds"] == pytest.approx(0.2, abs=0.1)
+        assert session.metadata["execution_timing"]["tasks"]["C"]["dependency_wait"] == pytest.approx(0.2, abs=0.1)
+
+
+class TestTaskCompletionEvents:
+    """Test event-driven waiting on task results."""
+    
+    @pytest.fixture
+    def session(self):
+        session = ReActSession(user_input="Run the plan")
+        session.tasks = [
+            Task(id="A", description="Step A", tool_name="bash"),
+            Task(id="B", description="Step B", tool_name="bash", dependencies=["A"]),
+        ]
+        return session
+    
+    @pytest.mark.asyncio
+    async def test_waiter_wakes_when_task_finishes(self, session):
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.05, session.mark_task_finished, "A")
+        start = loop.time()
+        
+        assert await session.wait_for_tasks(["A"], timeout=2.0)
+        assert loop.time() - start < 0.5
+        assert not await session.wait_for_tasks(["B"], timeout=0.01)
+    
+    @pytest.mark.asyncio
+    async def test_restored_finished_tasks_do_not_block(self, session):
+        session.tasks[0].update_status(TaskStatus.COMPLETED)
+        
+        assert await session.wait_for_tasks(["A"], timeout=0)
+    
+    @pytest.mark.asyncio
+    async def test_dependent_waits_for_dependency_event(self, mock_ai_client, session):
+        engine = ReActEngine(mock_ai_client, ExecutionMode.ADAPTIVE)
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.1, session.mark_task_finished, "A")
+        
+        await engine._wait_for_dependencies(session, session.tasks[1])
+        
+        assert session.is_task_finished("A")
+        assert session.metadata["dependency_wait"]["tasks"]["B"] == pytest.approx(0.1, abs=0.05)
+    
+    @pytest.mark.asyncio
+    async def test_completion_check_does_not_poll_without_output(self, mock_ai_client, session):
+        engine = ReActEngine(mock_ai_client, ExecutionMode.ADAPTIVE)
+        session.task_results["A"] = [ToolResult(type=ToolResultType.SUCCESS, content="done")]
+        session.mark_task_finished("A")
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        
+        await engine._ensure_task_fully_completed(session, session.tasks[0])
+        
+        assert loop.time() - start < 0.1
+
 @pytest.mark.asyncio
 async def test_integration_simple_workflow(mock_ai_client, sample_planning_response, sample_evaluation_response):
     """Test a simple end-to-end workflow."""
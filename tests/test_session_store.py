@@ -0,0 +1,293 @@
+"""
+Tests for session storage backends and the SessionManager persistence layer.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from simacode.react.engine import ReActSession, ReActState
+from simacode.react.planner import Task, TaskType
+from simacode.tools.base import ToolResult, ToolResultType
+from simacode.session import (
+    JSONSessionStore, SessionConfig, SessionManager, SQLiteSessionStore, migrate_json_sessions
+)
+
+
+def make_session_data(session_id, state="completed", updated_at="2025-01-01T00:00:00", user_input="do work"):
+    return {
+        "id": session_id,
+        "user_input": user_input,
+        "state": state,
+        "tasks": [{"id": "t1"}, {"id": "t2"}],
+        "current_task_index": 0,
+        "task_results": {},
+        "evaluations": {},
+        "conversation_history": [],
+        "execution_log": ["[2025-01-01T00:00:00] INFO: started"],
+        "metadata": {"session_type": "react"},
+        "created_at": "2025-01-01T00:00:00",
+        "updated_at": updated_at,
+        "retry_count": 0,
+        "max_retries": 3,
+    }
+
+
+class TestSQLiteSessionStore:
+    """Test the indexed SQLite session store."""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, temp_directory):
+        store = SQLiteSessionStore(temp_directory / "sessions.db")
+        data = make_session_data("s1")
+
+        await store.save(data)
+        loaded = await store.load("s1")
+        await store.close()
+
+        assert loaded == data
+
+    @pytest.mark.asyncio
+    async def test_database_created_lazily(self, temp_directory):
+        store = SQLiteSessionStore(temp_directory / "sessions.db")
+
+        assert await store.list_sessions() == []
+        assert await store.load("missing") is None
+        assert not (temp_directory / "sessions.db").exists()
+
+    @pytest.mark.asyncio
+    async def test_list_is_paginated_from_index(self, temp_directory):
+        store = SQLiteSessionStore(temp_directory / "sessions.db")
+        for i in range(5):
+            state = "failed" if i == 2 else "completed"
+            await store.save(make_session_data(f"s{i}", state=state, updated_at=f"2025-01-0{i + 1}T00:00:00",
+                                               user_input="x" * 300))
+
+        page = await store.list_sessions(limit=2, offset=1)
+        assert [s["id"] for s in page] == ["s3", "s2"]
+        assert len(page[0]["user_input"]) == 100
+        assert page[0]["task_count"] == 2
+
+        assert [s["id"] for s in await store.list_sessions(state="failed")] == ["s2"]
+        assert await store.count() == 5
+        assert await store.count("completed") == 4
+
+        stats = await store.get_statistics()
+        assert stats["state_distribution"] == {"completed": 4, "failed": 1}
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_save_only_writes_changed_sections(self, temp_directory):
+        store = SQLiteSessionStore(temp_directory / "sessions.db")
+        data = make_session_data("s1")
+        await store.save(data)
+
+        statements = []
+        store._conn.set_trace_callback(statements.append)
+
+        data["execution_log"].append("[2025-01-01T00:00:01] INFO: next")
+        await store.save(data)
+
+        section_writes = [s for s in statements if "session_sections" in s and "INSERT" in s]
+        assert len(section_writes) == 1
+        assert "execution_log" in section_writes[0]
+        assert (await store.load("s1"))["execution_log"] == data["execution_log"]
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_delete(self, temp_directory):
+        store = SQLiteSessionStore(temp_directory / "sessions.db")
+        await store.save(make_session_data("s1"))
+
+        assert await store.delete("s1") is True
+        assert await store.delete("s1") is False
+        assert await store.load("s1") is None
+        await store.close()
+
+
+class TestSessionMigration:
+    """Test importing legacy JSON session files."""
+
+    @pytest.mark.asyncio
+    async def test_migrate_json_sessions(self, temp_directory):
+        legacy = JSONSessionStore(temp_directory)
+        await legacy.save(make_session_data("s1"))
+        await legacy.save(make_session_data("s2"))
+        (temp_directory / "broken.json").write_text("{not json")
+
+        store = SQLiteSessionStore(temp_directory / "sessions.db")
+        results = await migrate_json_sessions(temp_directory, store)
+        assert results == {"imported": 2, "skipped": 0, "failed": 1}
+
+        # Re-running skips sessions that are already imported
+        results = await migrate_json_sessions(temp_directory, store, delete_source=True)
+        assert results == {"imported": 0, "skipped": 2, "failed": 1}
+
+        assert await store.load("s1") == make_session_data("s1")
+        await store.close()
+
+
+class TestSessionManagerStorage:
+    """Test SessionManager on top of the session store."""
+
+    @pytest.mark.asyncio
+    async def test_save_and_reload_session(self, temp_directory):
+        manager = SessionManager(SessionConfig(sessions_directory=temp_directory))
+        session = await manager.create_session("Read the file")
+        session.tasks.append(Task(type=TaskType.FILE_OPERATION, description="Read", tool_name="file_read"))
+        session.update_state(ReActState.COMPLETED)
+        await manager.save_session(session.id)
+
+        manager.active_sessions.clear()
+        loaded = await manager.get_session(session.id)
+
+        assert loaded.state == ReActState.COMPLETED
+        assert loaded.tasks[0].tool_name == "file_read"
+        assert (temp_directory / "sessions.db").exists()
+        assert not list(temp_directory.glob("*.json"))
+
+        sessions = await manager.list_sessions(limit=10)
+        assert sessions[0]["id"] == session.id
+        assert sessions[0]["task_count"] == 1
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_legacy_json_session_is_imported_on_load(self, temp_directory):
+        (temp_directory / "old.json").write_text(json.dumps(make_session_data("old")))
+        manager = SessionManager(SessionConfig(sessions_directory=temp_directory))
+
+        session = await manager.get_session("old")
+
+        assert session.user_input == "do work"
+        assert await manager.store.exists("old")
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_legacy_json_sessions_are_listed_after_upgrade(self, temp_directory):
+        for session_id in ("old1", "old2"):
+            (temp_directory / f"{session_id}.json").write_text(json.dumps(make_session_data(session_id)))
+        manager = SessionManager(SessionConfig(sessions_directory=temp_directory))
+
+        assert sorted(s["id"] for s in await manager.list_sessions()) == ["old1", "old2"]
+        assert await manager.count_sessions() == 2
+        assert await manager.delete_session("old1")
+        assert not (temp_directory / "old1.json").exists()
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_json_backend(self, temp_directory):
+        manager = SessionManager(SessionConfig(sessions_directory=temp_directory, storage_backend="json"))
+        session = await manager.create_session("Hello")
+
+        assert (temp_directory / f"{session.id}.json").exists()
+        assert [s["id"] for s in await manager.list_sessions()] == [session.id]
+        assert await manager.delete_session(session.id)
+        assert await manager.count_sessions() == 0
+
+
+class TestSessionCheckpointing:
+    """Test dirty tracking and journal checkpoints."""
+
+    def test_session_dirty_tracking(self):
+        session = ReActSession(user_input="Test")
+        assert session.dirty
+
+        session.mark_clean()
+        session.add_log_entry("step")
+        assert session.dirty
+
+        session.mark_clean()
+        session.update_state(ReActState.EXECUTING)
+        assert session.dirty
+
+        session.mark_clean()
+        session.set_task_results("t1", [ToolResult(type=ToolResultType.SUCCESS, content="ok")])
+        assert session.dirty
+
+        session.mark_clean()
+        session.tasks = [Task(type=TaskType.FILE_OPERATION, description="Read", tool_name="file_read")]
+        assert session.dirty
+
+        session.mark_clean()
+        session.update_metadata({"planning_context": {}})
+        assert session.dirty
+
+        session.mark_clean()
+        session.current_task_index += 1
+        assert session.dirty
+        session.mark_clean()
+        assert not session.dirty
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_journals_replaced_results(self, temp_directory):
+        manager = SessionManager(SessionConfig(sessions_directory=temp_directory))
+        session = await manager.create_session("Hello")
+        session.set_task_results("t1", [ToolResult(type=ToolResultType.SUCCESS, content="first")])
+        await manager.checkpoint_session(session.id)
+
+        # Same length as before: only the version tells the results apart
+        session.set_task_results("t1", [ToolResult(type=ToolResultType.SUCCESS, content="second")])
+        assert await manager.checkpoint_session(session.id) is True
+
+        data = await manager.store.load(session.id)
+        assert data["task_results"]["t1"][0]["content"] == "second"
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_skips_clean_sessions(self, temp_directory):
+        manager = SessionManager(SessionConfig(sessions_directory=temp_directory))
+        session = await manager.create_session("Hello")
+
+        assert not session.dirty
+        assert await manager.checkpoint_session(session.id) is False
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_appends_journal(self, temp_directory):
+        manager = SessionManager(SessionConfig(sessions_directory=temp_directory))
+        session = await manager.create_session("Hello")
+
+        session.add_log_entry("first step")
+        session.set_task_results("t1", [ToolResult(type=ToolResultType.SUCCESS, content="done")])
+        with patch.object(manager.store, "save", wraps=manager.store.save) as full_save:
+            assert await manager.checkpoint_session(session.id) is True
+            full_save.assert_not_called()
+
+        session.add_log_entry("second step")
+        assert await manager.checkpoint_session(session.id) is True
+
+        journal = manager.store._conn.execute(
+            "SELECT entry FROM session_journal WHERE session_id = ?", (session.id,)
+        ).fetchall()
+        assert [json.loads(entry)["type"] for (entry,) in journal] == ["log", "task_results", "log"]
+
+        data = await manager.store.load(session.id)
+        assert data["execution_log"] == session.execution_log
+        assert data["task_results"]["t1"][0]["content"] == "done"
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_journal_compaction(self, temp_directory):
+        manager = SessionManager(SessionConfig(sessions_directory=temp_directory, journal_compaction_threshold=3))
+        session = await manager.create_session("Hello")
+
+        for i in range(3):
+            session.add_log_entry(f"step {i}")
+            await manager.checkpoint_session(session.id)
+
+        journal_count = manager.store._conn.execute("SELECT COUNT(*) FROM session_journal").fetchone()[0]
+        assert journal_count == 0
+        assert (await manager.store.load(session.id))["execution_log"] == session.execution_log
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_json_backend_falls_back_to_full_save(self, temp_directory):
+        manager = SessionManager(SessionConfig(sessions_directory=temp_directory, storage_backend="json"))
+        session = await manager.create_session("Hello")
+
+        session.add_log_entry("step")
+        assert await manager.checkpoint_session(session.id) is True
+
+        data = json.loads((temp_directory / f"{session.id}.json").read_text())
+        assert data["execution_log"] == session.execution_log
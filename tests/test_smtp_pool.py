@@ -0,0 +1,230 @@
+"""
+Tests for pooled SMTP sending in the SMTP MCP server.
+
+Messages are delivered to a local aiosmtpd sink that records logins,
+NOOPs and received messages.
+"""
+
+import asyncio
+import socket
+import sys
+import time
+from pathlib import Path
+
+import aiosmtplib
+import pytest
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import tools.mcp_smtp_send_email as smtp_module
+from tools.mcp_smtp_send_email import EmailSMTPMCPServer, SMTPConfig, SMTPEmailClient
+
+
+class SinkHandler:
+    """Collects delivered messages."""
+
+    def __init__(self):
+        self.messages = []
+        self.logins = 0
+        self.noops = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append((envelope.mail_from, list(envelope.rcpt_tos), envelope.content))
+        return "250 OK"
+
+    async def handle_NOOP(self, server, session, envelope, arg):
+        self.noops += 1
+        return "250 OK"
+
+    def authenticate(self, server, session, envelope, mechanism, auth_data):
+        self.logins += 1
+        return AuthResult(success=True)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture(autouse=True)
+def offline_address_validation(monkeypatch):
+    """Validate address syntax only; the sink domains have no DNS records."""
+    validate = smtp_module.validate_email
+    monkeypatch.setattr(
+        smtp_module, "validate_email", lambda address, **kwargs: validate(address, check_deliverability=False)
+    )
+
+
+@pytest.fixture
+def smtp_sink():
+    handler = SinkHandler()
+    controller = Controller(
+        handler,
+        hostname="127.0.0.1",
+        port=free_port(),
+        authenticator=handler.authenticate,
+        auth_require_tls=False,
+    )
+    controller.start()
+    yield controller, handler
+    controller.stop()
+
+
+@pytest.fixture
+def smtp_config(smtp_sink):
+    controller, _ = smtp_sink
+    return SMTPConfig(
+        server=controller.hostname,
+        port=controller.port,
+        username="bot@example.com",
+        password="secret",
+        use_ssl=False,
+        use_tls=False,
+        timeout=5,
+        pool_size=2,
+        from_email="bot@example.com",
+    )
+
+
+def make_spec(i, to=None):
+    return {"to": to or [f"user{i}@example.com"], "subject": f"Notice {i}", "body": f"Hello {i}"}
+
+
+class TestSMTPConnectionPool:
+    """Test session reuse, keep-alive and reconnects."""
+
+    @pytest.mark.asyncio
+    async def test_sessions_are_reused(self, smtp_sink, smtp_config):
+        _, handler = smtp_sink
+        client = SMTPEmailClient(smtp_config)
+
+        for i in range(3):
+            result = await client.send_email(**make_spec(i))
+            assert result.success, result.error
+
+        assert len(handler.messages) == 3
+        assert handler.logins == 1
+        assert client.pool.stats["connections_reused"] == 2
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_idle_session_is_checked_with_noop(self, smtp_sink, smtp_config):
+        _, handler = smtp_sink
+        client = SMTPEmailClient(smtp_config)
+        await client.send_email(**make_spec(0))
+
+        client.pool._idle[0].last_used = time.monotonic() - smtp_config.pool_keepalive - 1
+        await client.send_email(**make_spec(1))
+
+        assert handler.noops == 1
+        assert handler.logins == 1
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_reconnects_after_dropped_session(self, smtp_sink, smtp_config):
+        _, handler = smtp_sink
+        client = SMTPEmailClient(smtp_config)
+        await client.send_email(**make_spec(0))
+
+        # Simulate the server silently dropping the idle connection
+        client.pool._idle[0].smtp.close()
+        result = await client.send_email(**make_spec(1))
+
+        assert result.success, result.error
+        assert len(handler.messages) == 2
+        assert handler.logins == 2
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_after_data_is_not_retried(self, smtp_sink, smtp_config, monkeypatch):
+        _, handler = smtp_sink
+        client = SMTPEmailClient(smtp_config)
+        data = aiosmtplib.SMTP.data
+
+        async def data_then_drop(self, *args, **kwargs):
+            await data(self, *args, **kwargs)
+            raise aiosmtplib.SMTPServerDisconnected("Connection lost")
+
+        monkeypatch.setattr(aiosmtplib.SMTP, "data", data_then_drop)
+        result = await client.send_email(**make_spec(0))
+
+        assert not result.success
+        assert len(handler.messages) == 1
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_idle_sessions_are_reaped(self, smtp_sink, smtp_config):
+        smtp_config.pool_max_idle = 0.1
+        client = SMTPEmailClient(smtp_config)
+        await client.send_email(**make_spec(0))
+        assert len(client.pool._idle) == 1
+
+        await asyncio.sleep(0.3)
+
+        assert client.pool._idle == []
+        assert client.pool.stats["connections_discarded"] == 1
+        await client.close()
+
+
+class TestSendEmailBatch:
+    """Test the send_email_batch tool."""
+
+    @pytest.mark.asyncio
+    async def test_batch_reports_per_message_results(self, smtp_sink, smtp_config):
+        _, handler = smtp_sink
+        server = EmailSMTPMCPServer(smtp_config)
+        specs = [make_spec(i) for i in range(10)]
+        specs[4] = make_spec(4, to="not-an-address")
+
+        result = await server._send_email_batch({"messages": specs})
+
+        assert not result.success
+        assert result.metadata["sent"] == 9
+        assert result.metadata["failed"] == 1
+        assert result.metadata["results"][4]["success"] is False
+        assert "Invalid recipient" in result.metadata["results"][4]["error"]
+        assert len(handler.messages) == 9
+        assert handler.logins <= smtp_config.pool_size
+        await server.email_client.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sends_respect_rate_limit(self, smtp_sink, smtp_config):
+        _, handler = smtp_sink
+        smtp_config.max_emails_per_hour = 3
+        server = EmailSMTPMCPServer(smtp_config)
+        specs = [make_spec(i) for i in range(6)]
+        specs[0] = make_spec(0, to="bad")
+
+        result = await server._send_email_batch({"messages": specs})
+
+        # The rejected message gives its slot back
+        assert result.metadata["sent"] == 3
+        assert len(handler.messages) == 3
+        assert sum("Hourly rate limit" in (r.get("error") or "") for r in result.metadata["results"]) == 2
+        await server.email_client.close()
+
+    @pytest.mark.asyncio
+    async def test_stop_on_error(self, smtp_sink, smtp_config):
+        _, handler = smtp_sink
+        smtp_config.pool_size = 1
+        server = EmailSMTPMCPServer(smtp_config)
+        specs = [make_spec(0), make_spec(1, to="bad"), make_spec(2)]
+
+        result = await server._send_email_batch({"messages": specs, "stop_on_error": True})
+
+        assert [r["success"] for r in result.metadata["results"]] == [True, False, False]
+        assert result.metadata["results"][2]["error"] == "Skipped after an earlier failure"
+        assert len(handler.messages) == 1
+        await server.email_client.close()
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_is_rejected(self, smtp_config):
+        server = EmailSMTPMCPServer(smtp_config)
+
+        result = await server._send_email_batch({"messages": []})
+
+        assert not result.success
+        assert "messages" in result.error
@@ -0,0 +1,151 @@
+"""
+Tests for the typed chat event stream between SimaCodeService and the API.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from simacode.api.models import StreamingChatChunk
+from simacode.core.events import StreamEvent, batch_frames, dumps, sse_frame
+from simacode.core.service import ReActRequest, SimaCodeService
+
+
+def parse_frames(body):
+    return [json.loads(frame[len("data: "):]) for frame in body.split("\n\n") if frame]
+
+
+@pytest.fixture
+def service():
+    """A service whose ReAct stream is replaced by canned updates."""
+    service = SimaCodeService.__new__(SimaCodeService)
+    service.updates = []
+
+    async def process_react(request, stream=False):
+        async def generate():
+            for update in service.updates:
+                yield update
+        return generate()
+
+    service.process_react = process_react
+    return service
+
+
+class TestStreamEvents:
+    """Test conversion of ReAct updates into typed events."""
+
+    @pytest.mark.asyncio
+    async def test_updates_become_typed_events(self, service):
+        service.updates = [
+            {"type": "task_init", "content": "Planning"},
+            {"type": "tool_execution", "content": "ls"},
+            {"type": "status_update", "content": "Running"},
+            {"type": "sub_task_result", "content": "internal"},
+            {"type": "error", "content": "boom"},
+            {
+                "type": "confirmation_request",
+                "content": "Confirm",
+                "confirmation_request": {"tasks": [{"index": 1, "description": "Back up"}], "timeout_seconds": 60},
+                "tasks_summary": {"risk_level": "low"},
+            },
+        ]
+
+        events = [e async for e in service._stream_task_response(ReActRequest(task="do it"))]
+
+        assert [(e.type, e.content) for e in events[:4]] == [
+            ("task_init", "Planning"), ("tool_output", "ls"), ("status", "Running"), ("error", "❌ boom")
+        ]
+        confirmation = events[4]
+        assert confirmation.type == "confirmation_request"
+        assert confirmation.content == "请确认执行以下1个任务：\n1 Back up"
+        assert confirmation.confirmation_data["tasks"][0]["description"] == "Back up"
+        assert confirmation.metadata["risk_level"] == "low"
+        assert confirmation.metadata["timeout_seconds"] == 60
+
+    def test_chunk_matches_streaming_chat_chunk(self):
+        event = StreamEvent("status", "进行中", metadata={"step": 1})
+
+        payload = json.loads(dumps(event.to_chunk("s1")))
+
+        assert payload == json.loads(StreamingChatChunk(**event.to_chunk("s1")).model_dump_json())
+        assert sse_frame({"a": "é"}) == 'data: {"a":"é"}\n\n'.encode("utf-8")
+
+    @pytest.mark.asyncio
+    async def test_queued_frames_are_batched(self):
+        release = asyncio.Event()
+
+        async def frames():
+            yield b"first"
+            await release.wait()
+            for i in range(5):
+                yield f"-{i}".encode()
+
+        writes = []
+        async for write in batch_frames(frames()):
+            writes.append(write)
+            release.set()
+            await asyncio.sleep(0.01)
+
+        assert writes == [b"first", b"-0-1-2-3-4"]
+
+    @pytest.mark.asyncio
+    async def test_slow_client_applies_backpressure(self):
+        produced = 0
+
+        async def frames():
+            nonlocal produced
+            for i in range(1000):
+                produced += 1
+                yield b"x"
+
+        writes = batch_frames(frames(), max_batch_bytes=1, max_pending=8)
+        assert await anext(writes) == b"x"
+        await asyncio.sleep(0.05)
+
+        # The source is only read a bounded distance ahead of the client
+        assert produced <= 10
+        await writes.aclose()
+
+    @pytest.mark.asyncio
+    async def test_batching_propagates_errors(self):
+        async def frames():
+            yield b"ok"
+            raise RuntimeError("source failed")
+
+        writes = []
+        with pytest.raises(RuntimeError, match="source failed"):
+            async for write in batch_frames(frames()):
+                writes.append(write)
+
+        assert b"".join(writes) == b"ok"
+
+
+class TestChatStreamEndpoint:
+    """Test the SSE writer of /chat/stream."""
+
+    def test_events_are_written_without_reparsing(self, service):
+        fastapi = pytest.importorskip("fastapi")
+        from fastapi.testclient import TestClient
+        from simacode.api.dependencies import get_simacode_service
+        from simacode.api.routes.chat import router
+
+        async def process_chat(request):
+            async def generate():
+                yield StreamEvent("task_init", "[status_update] literal text")
+                yield StreamEvent("content", "hello")
+            return generate()
+
+        service.process_chat = process_chat
+        app = fastapi.FastAPI()
+        app.include_router(router, prefix="/chat")
+        app.dependency_overrides[get_simacode_service] = lambda: service
+
+        response = TestClient(app).post("/chat/stream", json={"message": "hi", "session_id": "s1"})
+
+        chunks = parse_frames(response.text)
+        assert [(c["chunk_type"], c["chunk"]) for c in chunks[:2]] == [
+            ("task_init", "[status_update] literal text"), ("content", "hello")
+        ]
+        assert chunks[-1]["finished"] is True
+        assert all(c["session_id"] == "s1" for c in chunks)
@@ -114,6 +114,31 @@ class TestToolBase:
         stats = ToolRegistry.get_registry_stats()
         assert stats["total_tools"] == 0
         assert stats["total_executions"] == 0
+
+    def test_tool_registry_version(self):
+        """Test that registry changes bump the version."""
+        mock_tool = Mock(spec=Tool)
+        mock_tool.name = "test_tool"
+
+        version = ToolRegistry.get_version()
+        ToolRegistry.register(mock_tool)
+        assert ToolRegistry.get_version() > version
+        assert ToolRegistry.get_tool_version("test_tool") == ToolRegistry.get_version()
+
+        version = ToolRegistry.get_version()
+        ToolRegistry.update(mock_tool)
+        assert ToolRegistry.get_version() > version
+        assert ToolRegistry.get_tool_version("test_tool") == ToolRegistry.get_version()
+
+        version = ToolRegistry.get_version()
+        ToolRegistry.unregister("test_tool")
+        assert ToolRegistry.get_version() > version
+        assert ToolRegistry.get_tool_version("test_tool") is None
+
+        # Failed operations leave the version unchanged
+        version = ToolRegistry.get_version()
+        ToolRegistry.unregister("test_tool")
+        assert ToolRegistry.get_version() == version
     
     @pytest.mark.asyncio
     async def test_discover_tools(self):
@@ -326,6 +351,77 @@ class TestBashTool:
         error_results = [r for r in results if r.type == ToolResultType.ERROR]
         timeout_errors = [r for r in error_results if "timeout" in r.content.lower()]
         assert len(timeout_errors) > 0
+    
+    @pytest.mark.asyncio
+    async def test_bash_tool_coalesces_output(self):
+        """Test that many output lines are delivered as a few chunks."""
+        input_data = await self.bash_tool.validate_input({
+            "command": "seq 1 20000; echo oops >&2; exit 3",
+            "timeout": 10
+        })
+        
+        results = [result async for result in self.bash_tool.execute(input_data)]
+        
+        stdout = [r for r in results if r.type == ToolResultType.OUTPUT and r.metadata["stream"] == "stdout"]
+        stderr = [r for r in results if r.type == ToolResultType.OUTPUT and r.metadata["stream"] == "stderr"]
+        assert len(stdout) < 20
+        assert "\n".join(r.content for r in stdout).split("\n") == [str(i) for i in range(1, 20001)]
+        assert [r.content for r in stderr] == ["oops"]
+        assert results[-1].type == ToolResultType.ERROR
+        assert results[-1].metadata["exit_code"] == 3
+    
+    @pytest.mark.asyncio
+    async def test_bash_tool_truncates_large_output(self):
+        """Test head/tail retention with the full output spilled to a log file."""
+        bash_tool = BashTool(self.permission_manager, output_chunk_bytes=1024, max_output_bytes=4096)
+        input_data = await bash_tool.validate_input({"command": "seq 1 100000", "timeout": 10})
+        
+        results = [result async for result in bash_tool.execute(input_data)]
+        
+        outputs = [r for r in results if r.type == ToolResultType.OUTPUT]
+        marker = [r for r in outputs if r.metadata.get("truncated")][0]
+        text = "\n".join(r.content for r in outputs if r is not marker)
+        assert sum(len(r.content) for r in outputs if r is not marker) <= 4096
+        assert text.startswith("1\n2\n3\n")
+        assert text.endswith("99999\n100000")
+        
+        log_file = Path(marker.metadata["log_file"])
+        try:
+            assert log_file.read_text().split() == [str(i) for i in range(1, 100001)]
+        finally:
+            log_file.unlink()
+        assert results[-1].type == ToolResultType.SUCCESS
+    
+    @pytest.mark.asyncio
+    async def test_bash_tool_timeout_while_streaming(self):
+        """Test that a command producing output is still stopped at its timeout."""
+        input_data = await self.bash_tool.validate_input({
+            "command": "echo started; sleep 10",
+            "timeout": 1
+        })
+        
+        results = [result async for result in self.bash_tool.execute(input_data)]
+        
+        assert [r.content for r in results if r.type == ToolResultType.OUTPUT] == ["started"]
+        assert results[-1].type == ToolResultType.ERROR
+        assert results[-1].metadata == {"timeout": 1}
+        assert self.bash_tool.get_active_executions() == []
+    
+    @pytest.mark.asyncio
+    async def test_bash_tool_flushes_slow_output(self):
+        """Test that buffered output is flushed by the time window."""
+        input_data = await self.bash_tool.validate_input({
+            "command": "echo first; sleep 0.5; echo second",
+            "timeout": 10
+        })
+        
+        received = []
+        async for result in self.bash_tool.execute(input_data):
+            if result.type == ToolResultType.OUTPUT:
+                received.append((result.content, asyncio.get_running_loop().time()))
+        
+        assert [content for content, _ in received] == ["first", "second"]
+        assert received[1][1] - received[0][1] >= 0.3
 
 
 class TestFileReadTool:
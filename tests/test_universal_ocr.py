@@ -0,0 +1,353 @@
+"""
+Tests for concurrent page extraction and result caching in the universal OCR tool.
+
+Pages are handled by a fake engine that records how many extractions run
+at the same time.
+"""
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from simacode.tools.base import ToolResultType
+from simacode.tools.universal_ocr.cache import OCRResultCache
+from simacode.tools.universal_ocr.core import UniversalOCRTool, _RateLimiter
+from simacode.tools.universal_ocr.file_processor import FileProcessor
+from simacode.tools.universal_ocr.engines.base import (
+    EngineInfo, ExtractionResult, ExtractionStatus, OCREngine
+)
+from simacode.tools.universal_ocr.input_models import UniversalOCRInput
+
+
+class FakeEngine(OCREngine):
+    """Returns the page name as text after a short, page-dependent delay."""
+
+    def __init__(self, fail_pages=None):
+        super().__init__("fake", "1.0.0")
+        self.fail_pages = dict(fail_pages or {})
+        self.calls = []
+        self.running = 0
+        self.max_running = 0
+
+    async def extract_text(self, image_path, prompt=None):
+        self.calls.append(image_path)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            # Later pages finish first so ordering is actually exercised
+            await asyncio.sleep(0.05 / (int(Path(image_path).stem.split("-")[-1]) + 1))
+            if self.fail_pages.get(image_path, 0) > 0:
+                self.fail_pages[image_path] -= 1
+                raise RuntimeError(f"engine unavailable for {image_path}")
+            return ExtractionResult(status=ExtractionStatus.SUCCESS, raw_text=f"text of {image_path}", confidence_score=0.9)
+        finally:
+            self.running -= 1
+
+    async def extract_structured_data(self, image_path, template, prompt=None):
+        return await self.extract_text(image_path, prompt)
+
+    def get_engine_info(self):
+        return EngineInfo(name=self.name, version=self.version, description="fake", supported_formats=[], capabilities=[])
+
+    async def health_check(self):
+        return True
+
+
+@pytest.fixture
+def ocr_tool(temp_directory, monkeypatch):
+    tool = UniversalOCRTool()
+    tool.config.concurrency.max_concurrent_pages = 2
+    tool.config.concurrency.retry_backoff = 0.0
+    tool.result_cache = None
+    tool.rendered = []
+
+    async def get_page_count(file_path):
+        return 6
+
+    async def render_page(file_path, page_number, enhance_quality=True):
+        tool.rendered.append(page_number)
+        return f"page-{page_number - 1}"
+
+    monkeypatch.setattr(tool.file_processor, "get_page_count", get_page_count)
+    monkeypatch.setattr(tool.file_processor, "render_page", render_page)
+    return tool
+
+
+@pytest.fixture
+def ocr_input(temp_directory):
+    document = temp_directory / "scan.pdf"
+    document.write_bytes(b"%PDF-1.4")
+    return UniversalOCRInput(file_path=str(document), engines=["claude"], output_format="raw")
+
+
+class TestConcurrentPageExtraction:
+    """Test bounded, ordered per-page extraction."""
+
+    @pytest.mark.asyncio
+    async def test_pages_are_extracted_concurrently_in_order(self, ocr_tool, ocr_input):
+        engine = FakeEngine()
+        ocr_tool.engines = {"claude": engine}
+
+        results = [result async for result in ocr_tool.execute(ocr_input)]
+
+        progress = [r for r in results if r.type == ToolResultType.PROGRESS]
+        assert [r.metadata["page"] for r in progress] == [1, 2, 3, 4, 5, 6]
+        assert engine.max_running == 2
+        output = [r for r in results if r.type == ToolResultType.OUTPUT][0]
+        assert output.content.index("text of page-0") < output.content.index("text of page-5")
+        assert results[-1].type == ToolResultType.SUCCESS
+
+    @pytest.mark.asyncio
+    async def test_rendered_pages_are_bounded_by_concurrency(self, ocr_tool, ocr_input, monkeypatch):
+        engine = FakeEngine()
+        ocr_tool.engines = {"claude": engine}
+        outstanding = []
+        max_outstanding = 0
+        extract_text = engine.extract_text
+
+        async def render_page(file_path, page_number, enhance_quality=True):
+            nonlocal max_outstanding
+            await asyncio.sleep(0)
+            outstanding.append(f"page-{page_number - 1}")
+            max_outstanding = max(max_outstanding, len(outstanding))
+            return f"page-{page_number - 1}"
+
+        async def tracked_extract_text(image_path, prompt=None):
+            result = await extract_text(image_path, prompt)
+            outstanding.remove(image_path)
+            return result
+
+        monkeypatch.setattr(ocr_tool.file_processor, "render_page", render_page)
+        monkeypatch.setattr(engine, "extract_text", tracked_extract_text)
+
+        results = [result async for result in ocr_tool.execute(ocr_input)]
+
+        assert results[-1].type == ToolResultType.SUCCESS
+        assert max_outstanding == ocr_tool.config.concurrency.max_concurrent_pages
+        assert outstanding == []
+
+    @pytest.mark.asyncio
+    async def test_page_images_are_deleted_after_extraction(self, ocr_tool, ocr_input, monkeypatch):
+        engine = FakeEngine()
+        ocr_tool.engines = {"claude": engine}
+        processor = ocr_tool.file_processor
+        rendered = []
+        on_disk = []
+
+        async def render_page(file_path, page_number, enhance_quality=True):
+            path = processor._scratch_path(file_path, f"page-{page_number - 1}")
+            Path(path).write_bytes(b"png")
+            rendered.append(path)
+            on_disk.append(sum(Path(p).exists() for p in rendered))
+            return path
+
+        monkeypatch.setattr(processor, "render_page", render_page)
+        monkeypatch.setattr(processor, "cleanup_temp_files", lambda: None)
+
+        results = [result async for result in ocr_tool.execute(ocr_input)]
+
+        assert results[-1].type == ToolResultType.SUCCESS
+        assert max(on_disk) <= ocr_tool.config.concurrency.max_concurrent_pages
+        assert not any(Path(p).exists() for p in rendered)
+        assert processor.temp_files == []
+
+    def test_release_page_keeps_the_input_file(self, temp_directory):
+        processor = FileProcessor(max_workers=0)
+        image = temp_directory / "photo.png"
+        image.write_bytes(b"png")
+        processor.temp_files.append(str(image))
+
+        processor.release_page(str(image), str(image))
+
+        assert image.exists()
+
+    @pytest.mark.asyncio
+    async def test_failed_page_is_retried(self, ocr_tool, ocr_input):
+        engine = FakeEngine(fail_pages={"page-3": 1})
+        ocr_tool.engines = {"claude": engine}
+
+        results = [result async for result in ocr_tool.execute(ocr_input)]
+
+        assert engine.calls.count("page-3") == 2
+        assert engine.calls.count("page-0") == 1
+        page_4 = [r for r in results if r.metadata.get("page") == 4][0]
+        assert page_4.type == ToolResultType.PROGRESS
+        assert page_4.metadata["attempts"] == 2
+        assert results[-1].type == ToolResultType.SUCCESS
+
+    @pytest.mark.asyncio
+    async def test_failing_page_does_not_abort_document(self, ocr_tool, ocr_input):
+        engine = FakeEngine(fail_pages={"page-1": 99})
+        ocr_tool.engines = {"claude": engine}
+
+        results = [result async for result in ocr_tool.execute(ocr_input)]
+
+        warnings = [r for r in results if r.type == ToolResultType.WARNING and "page" in r.metadata]
+        assert [r.metadata["page"] for r in warnings] == [2]
+        assert "engine unavailable" in warnings[0].content
+        assert engine.calls.count("page-1") == 1 + ocr_tool.config.concurrency.page_retries
+        output = [r for r in results if r.type == ToolResultType.OUTPUT][0]
+        assert output.metadata["partial_extraction"] is True
+        assert "text of page-5" in output.content
+        assert not any(r.type == ToolResultType.ERROR for r in results)
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_spaces_calls(self):
+        limiter = _RateLimiter(per_minute=1200)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        for _ in range(4):
+            await limiter.acquire()
+
+        assert loop.time() - start >= 3 * 0.05 - 0.01
+
+
+class TestOCRResultCache:
+    """Test the content-addressed extraction result cache."""
+
+    @pytest.mark.asyncio
+    async def test_identical_request_is_served_from_cache(self, ocr_tool, ocr_input):
+        engine = FakeEngine()
+        ocr_tool.engines = {"claude": engine}
+        ocr_tool.result_cache = OCRResultCache()
+
+        first = [r async for r in ocr_tool.execute(ocr_input)]
+        second = [r async for r in ocr_tool.execute(ocr_input)]
+
+        assert len(engine.calls) == 6
+        assert len(ocr_tool.rendered) == 6
+        assert any(r.content == "Using cached OCR result" for r in second)
+        outputs = [[r.content for r in results if r.type == ToolResultType.OUTPUT] for results in (first, second)]
+        assert outputs[0] == outputs[1]
+        assert ocr_tool.get_statistics()["cache_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_request_misses_cache(self, ocr_tool, ocr_input, temp_directory):
+        engine = FakeEngine()
+        ocr_tool.engines = {"claude": engine}
+        ocr_tool.result_cache = OCRResultCache()
+
+        [r async for r in ocr_tool.execute(ocr_input)]
+        [r async for r in ocr_tool.execute(ocr_input.model_copy(update={"custom_prompt": "Only totals"}))]
+        (temp_directory / "scan.pdf").write_bytes(b"%PDF-1.5")
+        [r async for r in ocr_tool.execute(ocr_input)]
+
+        assert len(engine.calls) == 18
+
+    @pytest.mark.asyncio
+    async def test_partially_failed_document_only_redoes_missing_pages(self, ocr_tool, ocr_input):
+        ocr_tool.result_cache = OCRResultCache()
+        ocr_tool.engines = {"claude": FakeEngine(fail_pages={"page-2": 99})}
+        [r async for r in ocr_tool.execute(ocr_input)]
+
+        engine = FakeEngine()
+        ocr_tool.engines = {"claude": engine}
+        results = [r async for r in ocr_tool.execute(ocr_input)]
+
+        assert engine.calls == ["page-2"]
+        assert ocr_tool.rendered[6:] == [3]
+        assert any(r.content == "Reusing 5 cached page(s)" for r in results)
+        assert results[-1].type == ToolResultType.SUCCESS
+
+    @pytest.mark.asyncio
+    async def test_cache_is_accessed_off_the_event_loop(self, ocr_tool, ocr_input, monkeypatch):
+        ocr_tool.engines = {"claude": FakeEngine()}
+        cache = ocr_tool.result_cache = OCRResultCache()
+        threads = []
+        for name in ("get_pages", "put"):
+            method = getattr(cache, name)
+
+            def record(*args, _method=method, **kwargs):
+                threads.append(threading.get_ident())
+                return _method(*args, **kwargs)
+
+            monkeypatch.setattr(cache, name, record)
+
+        [r async for r in ocr_tool.execute(ocr_input)]
+        [r async for r in ocr_tool.execute(ocr_input)]
+
+        # Two lookups and seven writes on the first run, one lookup on the second
+        assert len(threads) == 10
+        assert threading.get_ident() not in threads
+
+    def test_cache_persists_to_disk(self, temp_directory):
+        key = OCRResultCache.make_key("abc", "claude", "1.0.0", output_format="raw")
+        cache = OCRResultCache(temp_directory / "ocr.db")
+        cache.put(key, ExtractionResult(status=ExtractionStatus.SUCCESS, raw_text="hello"))
+        cache.close()
+
+        cache = OCRResultCache(temp_directory / "ocr.db")
+        assert cache.get(key).raw_text == "hello"
+        assert cache.get(key, page=1) is None
+        cache.close()
+
+    def test_ttl_and_eviction(self):
+        result = ExtractionResult(status=ExtractionStatus.SUCCESS, raw_text="x")
+        cache = OCRResultCache(max_size=2)
+        for key in ("a", "b"):
+            cache.put(key, result)
+            time.sleep(0.01)
+        cache.get("a")
+        cache.put("c", result)
+
+        assert cache.size() == 2
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+
+        cache.ttl = 60
+        cache._connect().execute("UPDATE ocr_results SET created_at = created_at - 120 WHERE key = 'a'")
+        assert cache.get("a") is None
+        assert cache.get("c") is not None
+
+    def test_failed_results_are_not_cached(self):
+        cache = OCRResultCache()
+        cache.put("a", ExtractionResult(status=ExtractionStatus.FAILED, errors=["boom"]))
+
+        assert cache.size() == 0
+
+
+class TestFileProcessor:
+    """Test off-loop image processing and the scratch directory."""
+
+    @pytest.fixture
+    def image_file(self, temp_directory):
+        Image = pytest.importorskip("PIL.Image")
+        path = temp_directory / "receipt.png"
+        Image.new("L", (120, 80), color=200).save(path)
+        return path
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_workers", [0, 1])
+    async def test_enhanced_image_is_written_to_scratch_dir(self, image_file, temp_directory, max_workers):
+        from PIL import Image
+
+        scratch_dir = temp_directory / "scratch"
+        processor = FileProcessor(max_workers=max_workers, scratch_dir=str(scratch_dir))
+
+        assert await processor.get_page_count(str(image_file)) == 1
+        enhanced = await processor.render_page(str(image_file), 1)
+
+        assert enhanced.startswith(str(scratch_dir))
+        with Image.open(enhanced) as img:
+            assert img.mode == "RGB"
+            assert img.size == (120, 80)
+
+        processor.shutdown()
+        assert not Path(enhanced).exists()
+        assert scratch_dir.exists()
+
+    @pytest.mark.asyncio
+    async def test_private_scratch_dir_is_removed(self, image_file):
+        processor = FileProcessor(max_workers=0)
+
+        paths = await processor.process_file(str(image_file))
+        scratch_dir = Path(paths[0]).parent
+        assert await processor.process_file(str(image_file), enhance_quality=False) == [str(image_file)]
+
+        processor.shutdown()
+        assert not scratch_dir.exists()
+        assert image_file.exists()
@@ -13,21 +13,30 @@ Features:
 - Attachment handling with base64 encoding
 - Configuration via .env.mcp file
 - Health monitoring and auto-reconnection
+- Non-blocking IMAP access through a pooled connection executor
+- Header-only listing and a local message cache keyed by UIDVALIDITY+UID
 """
 
 import asyncio
 import email
 import email.header
+import functools
 import imaplib
 import json
 import logging
 import os
+import re
+import sqlite3
 import sys
+import threading
+import time
 import base64
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, AsyncGenerator
-from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, AsyncGenerator, AsyncIterator, Union
+from dataclasses import dataclass, field
 
 # Environment configuration support
 try:
@@ -65,6 +74,12 @@ class EmailConfig:
     password: str = ""
     use_ssl: bool = True
     timeout: int = 60
+    pool_size: int = 2
+    cache_enabled: bool = True
+    cache_path: Optional[str] = ".simacode/cache/imap_messages.db"
+    cache_max_messages: int = 5000
+    cache_max_bytes: int = 256 * 1024 * 1024
+    cache_max_message_bytes: int = 10 * 1024 * 1024
     
     @classmethod
     def from_simacode_config(cls, config: Config) -> 'EmailConfig':
@@ -78,7 +93,13 @@ class EmailConfig:
             username=imap_config.username or '',
             password=imap_config.password or '',
             use_ssl=imap_config.use_ssl,
-            timeout=imap_config.timeout
+            timeout=imap_config.timeout,
+            pool_size=imap_config.pool_size,
+            cache_enabled=imap_config.cache_enabled,
+            cache_path=str(imap_config.cache_path) if imap_config.cache_path else None,
+            cache_max_messages=imap_config.cache_max_messages,
+            cache_max_bytes=imap_config.cache_max_bytes,
+            cache_max_message_bytes=imap_config.cache_max_message_bytes
         )
 
 
@@ -108,23 +129,268 @@ class EmailOperationResult:
     operation: str = ""
 
 
+class IMAPMessageCache:
+    """
+    Local cache of downloaded messages keyed by folder, UIDVALIDITY and UID.
+    
+    IMAP guarantees a UID names the same immutable message for as long as the
+    folder's UIDVALIDITY is unchanged, so cached headers and bodies never need
+    to be downloaded again. Flags are mutable and are therefore not cached.
+    Entries are evicted least recently used first beyond ``max_messages``.
+    Full messages are also capped by size: bodies larger than
+    ``max_message_bytes`` are not cached (only their header and attachment
+    metadata are), and once all cached bodies exceed ``max_bytes`` the least
+    recently used bodies are dropped.
+    """
+    
+    def __init__(self, db_path: Union[str, Path] = ":memory:", max_messages: int = 5000,
+                 max_bytes: int = 256 * 1024 * 1024, max_message_bytes: int = 10 * 1024 * 1024):
+        """
+        Initialize the message cache.
+        
+        Args:
+            db_path: SQLite database path (":memory:" for a process-local cache)
+            max_messages: Maximum number of cached messages
+            max_bytes: Maximum total size of cached full messages
+            max_message_bytes: Largest full message whose body is cached
+        """
+        self.db_path = str(db_path)
+        if self.db_path != ":memory:":
+            Path(self.db_path).expanduser().parent.mkdir(parents=True, exist_ok=True)
+        self.max_messages = max_messages
+        self.max_bytes = max_bytes
+        self.max_message_bytes = min(max_message_bytes, max_bytes)
+        self.hits = 0
+        self.misses = 0
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        if self.db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS imap_messages (
+                folder TEXT NOT NULL,
+                uidvalidity TEXT NOT NULL,
+                uid TEXT NOT NULL,
+                header BLOB NOT NULL,
+                attachments TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                raw BLOB,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (folder, uidvalidity, uid)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_imap_messages_accessed ON imap_messages (accessed_at)"
+        )
+        self._conn.commit()
+    
+    def get_many(self, folder: str, uidvalidity: str, uids: List[str],
+                 need_body: bool = False) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up cached messages.
+        
+        Args:
+            folder: Folder name
+            uidvalidity: Folder UIDVALIDITY
+            uids: UIDs to look up
+            need_body: Only return entries that include the full message
+            
+        Returns:
+            Dict mapping UID to {"header", "attachments", "size", "raw"}
+        """
+        found: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for i in range(0, len(uids), 500):
+                chunk = uids[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT uid, header, attachments, size, raw FROM imap_messages "
+                    f"WHERE folder = ? AND uidvalidity = ? AND uid IN ({placeholders})",
+                    (folder, uidvalidity, *chunk)
+                ).fetchall()
+                for uid, header, attachments, size, raw in rows:
+                    if need_body and raw is None:
+                        continue
+                    found[uid] = {
+                        "header": header,
+                        "attachments": json.loads(attachments),
+                        "size": size,
+                        "raw": raw
+                    }
+            
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE imap_messages SET accessed_at = ? WHERE folder = ? AND uidvalidity = ? AND uid = ?",
+                    [(now, folder, uidvalidity, uid) for uid in found]
+                )
+                self._conn.commit()
+        
+        self.hits += len(found)
+        self.misses += len(uids) - len(found)
+        return found
+    
+    def put_many(self, folder: str, uidvalidity: str, records: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Store messages; entries without a body keep any body already cached.
+        
+        Args:
+            folder: Folder name
+            uidvalidity: Folder UIDVALIDITY
+            records: Dict mapping UID to {"header", "attachments", "size", "raw"}
+        """
+        if not records:
+            return
+        
+        def cacheable_raw(record: Dict[str, Any]) -> Optional[bytes]:
+            raw = record.get("raw")
+            return raw if raw is not None and len(raw) <= self.max_message_bytes else None
+        
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                """
+                INSERT INTO imap_messages (folder, uidvalidity, uid, header, attachments, size, raw, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (folder, uidvalidity, uid) DO UPDATE SET
+                    header = excluded.header,
+                    attachments = excluded.attachments,
+                    size = excluded.size,
+                    raw = COALESCE(excluded.raw, imap_messages.raw),
+                    accessed_at = excluded.accessed_at
+                """,
+                [
+                    (folder, uidvalidity, uid, record["header"], json.dumps(record["attachments"]),
+                     record["size"], cacheable_raw(record), now)
+                    for uid, record in records.items()
+                ]
+            )
+            
+            count = self._conn.execute("SELECT COUNT(*) FROM imap_messages").fetchone()[0]
+            if count > self.max_messages:
+                self._conn.execute(
+                    "DELETE FROM imap_messages WHERE rowid IN "
+                    "(SELECT rowid FROM imap_messages ORDER BY accessed_at LIMIT ?)",
+                    (count - self.max_messages,)
+                )
+            self._evict_bodies()
+            self._conn.commit()
+    
+    def _evict_bodies(self) -> None:
+        """Drop least recently used bodies until they fit in ``max_bytes``; call with the lock held."""
+        total = self._conn.execute("SELECT COALESCE(SUM(LENGTH(raw)), 0) FROM imap_messages").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        
+        evicted = []
+        for rowid, length in self._conn.execute(
+            "SELECT rowid, LENGTH(raw) FROM imap_messages WHERE raw IS NOT NULL ORDER BY accessed_at"
+        ):
+            if total <= self.max_bytes:
+                break
+            evicted.append((rowid,))
+            total -= length
+        self._conn.executemany("UPDATE imap_messages SET raw = NULL WHERE rowid = ?", evicted)
+    
+    def invalidate_folder(self, folder: str, uidvalidity: str) -> None:
+        """Drop cached messages of ``folder`` that belong to another UIDVALIDITY."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM imap_messages WHERE folder = ? AND uidvalidity != ?", (folder, uidvalidity)
+            )
+            self._conn.commit()
+    
+    def size(self) -> int:
+        """Get the number of cached messages."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM imap_messages").fetchone()[0]
+    
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            self._conn.close()
+
+
+@dataclass
+class PooledIMAPConnection:
+    """An authenticated IMAP connection owned by the client's pool."""
+    imap: imaplib.IMAP4
+    selected_folder: Optional[str] = None
+    uidvalidity: Optional[str] = None
+    last_used: float = field(default_factory=time.monotonic)
+
+
 class IMAPEmailClient:
     """
     IMAP email client for connecting to email servers and retrieving messages.
+    
+    imaplib is blocking, so every IMAP command runs on a dedicated thread pool
+    instead of the event loop. Authenticated connections are kept in a small
+    pool and reused across operations; each connection remembers its selected
+    folder so it is only re-selected when needed. Searches and fetches take
+    the folder as an argument because concurrent requests share the pool;
+    ``current_folder`` is only the default for callers that omit it. Messages are fetched with
+    batched ``UID FETCH`` commands (one round-trip per batch) rather than one
+    command per message.
+    
+    Listings can fetch only selected header fields, BODYSTRUCTURE and size;
+    downloaded messages are kept in an IMAPMessageCache so repeated polls of
+    the same mailbox only fetch flags for messages already seen.
     """
     
-    def __init__(self, config: EmailConfig):
+    # Idle connections older than this are checked with NOOP before reuse
+    IDLE_CHECK_SECONDS = 30.0
+    # Maximum number of UIDs per FETCH command
+    FETCH_BATCH_SIZE = 100
+    
+    # Header fields fetched for listings
+    SUMMARY_HEADER_FIELDS = "SUBJECT FROM TO CC DATE MESSAGE-ID"
+    SUMMARY_FETCH_ITEMS = f"(UID FLAGS RFC822.SIZE BODYSTRUCTURE BODY.PEEK[HEADER.FIELDS ({SUMMARY_HEADER_FIELDS})])"
+    FULL_FETCH_ITEMS = "(UID FLAGS RFC822.SIZE BODY[])"
+    FLAGS_FETCH_ITEMS = "(UID FLAGS)"
+    
+    _FETCH_START_RE = re.compile(rb'^\d+ \(')
+    _FETCH_UID_RE = re.compile(rb'[( ]UID (\d+)')
+    _FETCH_FLAGS_RE = re.compile(rb'FLAGS \(([^)]*)\)')
+    _FETCH_SIZE_RE = re.compile(rb'RFC822\.SIZE (\d+)')
+    
+    def __init__(self, config: EmailConfig, cache: Optional[IMAPMessageCache] = None):
         """
         Initialize IMAP email client.
         
         Args:
             config: Email configuration containing server details
+            cache: Message cache (created from the configuration if not given)
         """
         self.config = config
-        self.connection: Optional[imaplib.IMAP4_SSL] = None
         self.current_folder: str = "INBOX"
         self.last_connect_time: Optional[datetime] = None
         
+        # Connection pool
+        self.pool_size = max(1, config.pool_size)
+        self._executor = ThreadPoolExecutor(max_workers=self.pool_size, thread_name_prefix="imap")
+        self._idle: List[PooledIMAPConnection] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+        
+        # Message cache
+        if cache is None and config.cache_enabled:
+            try:
+                cache = IMAPMessageCache(
+                    config.cache_path or ":memory:", config.cache_max_messages,
+                    config.cache_max_bytes, config.cache_max_message_bytes
+                )
+            except Exception as e:
+                logger.warning(f"[IMAP_CONFIG] Message cache unavailable, continuing without it: {str(e)}")
+        self.cache = cache
+        self._uidvalidity: Dict[str, str] = {}
+        
+        # Statistics (updated from IMAP worker threads)
+        self.stats = {"connections_opened": 0, "round_trips": 0}
+        self._stats_lock = threading.Lock()
+        
         # Log IMAP configuration parameters
         logger.info(f"[IMAP_CONFIG] IMAP Client initialized with:")
         logger.info(f"[IMAP_CONFIG]   Server: {self.config.server}")
@@ -133,7 +399,125 @@ class IMAPEmailClient:
         logger.info(f"[IMAP_CONFIG]   Password: {'*' * len(self.config.password) if self.config.password else 'NOT SET'}")
         logger.info(f"[IMAP_CONFIG]   Use SSL: {self.config.use_ssl}")
         logger.info(f"[IMAP_CONFIG]   Timeout: {self.config.timeout}s")
+        logger.info(f"[IMAP_CONFIG]   Pool size: {self.pool_size}")
+    
+    async def _run(self, func, *args):
+        """Run a blocking imaplib call on the IMAP thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args))
+    
+    def _count(self, stat: str) -> None:
+        """Increment a statistics counter (thread-safe)."""
+        with self._stats_lock:
+            self.stats[stat] += 1
+    
+    def _command(self, conn: PooledIMAPConnection, name: str, *args) -> List[Any]:
+        """Execute one IMAP command (blocking) and return its data, raising if it is not OK."""
+        self._count("round_trips")
+        if name.startswith("UID "):
+            result, data = conn.imap.uid(name[4:], *args)
+        else:
+            result, data = getattr(conn.imap, name.lower())(*args)
+        
+        if result != 'OK':
+            raise Exception(f"IMAP {name} failed: {data}")
+        return data
+    
+    def _open_connection(self) -> PooledIMAPConnection:
+        """Open and authenticate a new IMAP connection (blocking)."""
+        if self.config.use_ssl:
+            imap = imaplib.IMAP4_SSL(self.config.server, self.config.port, timeout=self.config.timeout)
+        else:
+            imap = imaplib.IMAP4(self.config.server, self.config.port, timeout=self.config.timeout)
+        
+        try:
+            result, data = imap.login(self.config.username, self.config.password)
+            self._count("round_trips")
+            if result != 'OK':
+                raise Exception(f"Failed to authenticate: {data}")
+        except Exception:
+            try:
+                imap.shutdown()
+            except Exception:
+                pass
+            raise
+        
+        return PooledIMAPConnection(imap=imap)
+    
+    def _close_connection(self, conn: PooledIMAPConnection) -> None:
+        """Log out of an IMAP connection (blocking), ignoring errors."""
+        try:
+            if conn.selected_folder:
+                conn.imap.close()
+            conn.imap.logout()
+        except Exception as e:
+            logger.debug(f"[DISCONNECT] Error closing IMAP connection: {str(e)}")
+    
+    def _select(self, conn: PooledIMAPConnection, folder: str) -> int:
+        """Select a folder on a connection (blocking) and return its message count."""
+        conn.selected_folder = None
+        conn.uidvalidity = None
+        data = self._command(conn, "SELECT", folder)
+        conn.selected_folder = folder
+        
+        _, validity = conn.imap.response("UIDVALIDITY")
+        if validity and validity[0]:
+            conn.uidvalidity = validity[0].decode('utf-8') if isinstance(validity[0], bytes) else str(validity[0])
+            if self.cache is not None and self._uidvalidity.get(folder) != conn.uidvalidity:
+                # The folder was recreated or renumbered: cached UIDs are meaningless now
+                self.cache.invalidate_folder(folder, conn.uidvalidity)
+                self._uidvalidity[folder] = conn.uidvalidity
+        return int(data[0])
+    
+    async def _checkout(self) -> PooledIMAPConnection:
+        """Take a healthy connection from the pool, opening a new one if needed."""
+        while self._idle:
+            conn = self._idle.pop()
+            if time.monotonic() - conn.last_used < self.IDLE_CHECK_SECONDS:
+                return conn
+            try:
+                await self._run(self._command, conn, "NOOP")
+                return conn
+            except Exception as e:
+                logger.warning(f"[ENSURE_CONN] NOOP failed, dropping pooled connection: {str(e)}")
+                await self._run(self._close_connection, conn)
+        
+        connect_start = datetime.now()
+        logger.info(f"[CONNECT] Opening connection to IMAP server: {self.config.server}:{self.config.port} (timeout={self.config.timeout}s)")
+        conn = await self._run(self._open_connection)
+        self._count("connections_opened")
+        self.last_connect_time = datetime.now()
+        logger.info(f"[CONNECT] Connected and authenticated in {(self.last_connect_time - connect_start).total_seconds():.2f}s")
+        return conn
+    
+    @asynccontextmanager
+    async def _connection(self, folder: Optional[str] = None) -> AsyncIterator[PooledIMAPConnection]:
+        """
+        Borrow a pooled connection, optionally with ``folder`` selected.
+        
+        Connections that fail with a protocol or socket error are discarded
+        instead of being returned to the pool.
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.pool_size)
         
+        async with self._slots:
+            conn = await self._checkout()
+            healthy = True
+            try:
+                if folder and conn.selected_folder != folder:
+                    await self._run(self._select, conn, folder)
+                yield conn
+            except (imaplib.IMAP4.abort, OSError):
+                healthy = False
+                raise
+            finally:
+                if healthy:
+                    conn.last_used = time.monotonic()
+                    self._idle.append(conn)
+                else:
+                    await self._run(self._close_connection, conn)
+    
     async def connect(self) -> bool:
         """
         Connect to IMAP server.
@@ -141,94 +525,24 @@ class IMAPEmailClient:
         Returns:
             bool: True if connection successful, False otherwise
         """
-        start_time = datetime.now()
         try:
-            logger.info(f"[CONNECT] Starting connection to IMAP server: {self.config.server}:{self.config.port} (timeout={self.config.timeout}s)")
-            
-            # Create connection
-            connection_start = datetime.now()
-            if self.config.use_ssl:
-                logger.debug(f"[CONNECT] Creating SSL connection...")
-                self.connection = imaplib.IMAP4_SSL(
-                    self.config.server, 
-                    self.config.port,
-                    timeout=self.config.timeout
-                )
-            else:
-                logger.debug(f"[CONNECT] Creating non-SSL connection...")
-                self.connection = imaplib.IMAP4(
-                    self.config.server,
-                    self.config.port,
-                    timeout=self.config.timeout
-                )
-            
-            connection_time = (datetime.now() - connection_start).total_seconds()
-            logger.debug(f"[CONNECT] Socket connection established in {connection_time:.2f}s")
-            
-            # Login
-            login_start = datetime.now()
-            logger.debug(f"[CONNECT] Attempting login for user: {self.config.username}")
-            result = self.connection.login(self.config.username, self.config.password)
-            login_time = (datetime.now() - login_start).total_seconds()
-            logger.debug(f"[CONNECT] Login attempt completed in {login_time:.2f}s")
-            
-            if result[0] == 'OK':
-                self.last_connect_time = datetime.now()
-                total_time = (self.last_connect_time - start_time).total_seconds()
-                logger.info(f"[CONNECT] Successfully connected and authenticated to IMAP server in {total_time:.2f}s")
+            async with self._connection():
                 return True
-            else:
-                logger.error(f"[CONNECT] Failed to authenticate: {result[1]}")
-                return False
-                
         except Exception as e:
-            total_time = (datetime.now() - start_time).total_seconds()
-            logger.error(f"[CONNECT] Failed to connect to IMAP server after {total_time:.2f}s: {str(e)}")
+            logger.error(f"[CONNECT] Failed to connect to IMAP server: {str(e)}")
             return False
     
     async def disconnect(self):
-        """Disconnect from IMAP server."""
-        if self.connection:
-            try:
-                self.connection.close()
-                self.connection.logout()
-                logger.info("Disconnected from IMAP server")
-            except Exception as e:
-                logger.error(f"Error disconnecting: {str(e)}")
-            finally:
-                self.connection = None
-                self.last_connect_time = None
+        """Disconnect all pooled connections from the IMAP server."""
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            await self._run(self._close_connection, conn)
+        if idle:
+            logger.info(f"Disconnected {len(idle)} pooled connection(s) from IMAP server")
+        self.last_connect_time = None
     
     async def ensure_connection(self) -> bool:
-        """Ensure IMAP connection is established and healthy."""
-        logger.debug(f"[ENSURE_CONN] Checking connection health...")
-        
-        # Check if we have a connection and it's recent
-        if self.connection and self.last_connect_time:
-            time_since_connect = datetime.now() - self.last_connect_time
-            logger.debug(f"[ENSURE_CONN] Time since last connect: {time_since_connect.total_seconds():.1f}s")
-            
-            if time_since_connect.total_seconds() < 300:  # 5 minutes
-                try:
-                    # Test connection with NOOP
-                    noop_start = datetime.now()
-                    logger.debug(f"[ENSURE_CONN] Testing connection with NOOP...")
-                    result = self.connection.noop()
-                    noop_time = (datetime.now() - noop_start).total_seconds()
-                    
-                    if result[0] == 'OK':
-                        logger.debug(f"[ENSURE_CONN] NOOP successful in {noop_time:.2f}s - connection healthy")
-                        return True
-                    else:
-                        logger.warning(f"[ENSURE_CONN] NOOP failed in {noop_time:.2f}s: {result[1]}")
-                except Exception as e:
-                    logger.warning(f"[ENSURE_CONN] NOOP exception: {str(e)}")
-        else:
-            logger.debug(f"[ENSURE_CONN] No existing connection or connection too old")
-        
-        # Reconnect if needed
-        logger.info(f"[ENSURE_CONN] Reconnecting...")
-        await self.disconnect()
+        """Ensure an authenticated IMAP connection is available."""
         return await self.connect()
     
     async def list_folders(self) -> List[str]:
@@ -238,13 +552,9 @@ class IMAPEmailClient:
         Returns:
             List of folder names
         """
-        if not await self.ensure_connection():
-            raise Exception("Failed to connect to IMAP server")
-        
         try:
-            result, folders = self.connection.list()
-            if result != 'OK':
-                raise Exception(f"Failed to list folders: {folders}")
+            async with self._connection() as conn:
+                folders = await self._run(self._command, conn, "LIST")
             
             folder_names = []
             for folder in folders:
@@ -263,6 +573,11 @@ class IMAPEmailClient:
         """
         Select a folder/mailbox.
         
+        The folder becomes the default for searches and fetches that do not
+        name one; pooled connections select it lazily. Concurrent callers
+        should pass the folder to those methods instead of relying on this
+        shared default.
+        
         Args:
             folder: Folder name to select
             
@@ -272,20 +587,12 @@ class IMAPEmailClient:
         select_start = datetime.now()
         logger.debug(f"[SELECT] Selecting folder: {folder}")
         
-        if not await self.ensure_connection():
-            raise Exception("Failed to connect to IMAP server")
-        
         try:
-            logger.debug(f"[SELECT] Executing IMAP SELECT command for folder: {folder}")
-            result, data = self.connection.select(folder)
+            async with self._connection() as conn:
+                message_count = await self._run(self._select, conn, folder)
             select_time = (datetime.now() - select_start).total_seconds()
             
-            if result != 'OK':
-                logger.error(f"[SELECT] Failed to select folder '{folder}' in {select_time:.2f}s: {data}")
-                raise Exception(f"Failed to select folder '{folder}': {data}")
-            
             self.current_folder = folder
-            message_count = int(data[0])
             
             logger.info(f"[SELECT] Successfully selected folder '{folder}' with {message_count} messages in {select_time:.2f}s")
             
@@ -303,7 +610,8 @@ class IMAPEmailClient:
     async def search_emails(
         self, 
         criteria: str = "ALL", 
-        limit: int = 10
+        limit: int = 10,
+        folder: Optional[str] = None
     ) -> List[str]:
         """
         Search for emails based on criteria.
@@ -311,25 +619,19 @@ class IMAPEmailClient:
         Args:
             criteria: IMAP search criteria
             limit: Maximum number of emails to return
+            folder: Folder to search (defaults to ``current_folder``)
             
         Returns:
-            List of email UIDs
+            List of email UIDs, newest first
         """
         search_start = datetime.now()
         logger.debug(f"[SEARCH] Starting email search with criteria: '{criteria}', limit: {limit}")
         
-        if not await self.ensure_connection():
-            raise Exception("Failed to connect to IMAP server")
-        
         try:
-            logger.debug(f"[SEARCH] Executing IMAP SEARCH command...")
-            result, data = self.connection.search(None, criteria)
+            async with self._connection(folder or self.current_folder) as conn:
+                data = await self._run(self._command, conn, "UID SEARCH", None, criteria)
             search_time = (datetime.now() - search_start).total_seconds()
             
-            if result != 'OK':
-                logger.error(f"[SEARCH] Search failed in {search_time:.2f}s: {data}")
-                raise Exception(f"Search failed: {data}")
-            
             uids = data[0].split()
             total_found = len(uids)
             uids = uids[-limit:] if len(uids) > limit else uids
@@ -391,111 +693,334 @@ class IMAPEmailClient:
             logger.error(f"Error extracting email address: {str(e)}")
             return str(header_value)
     
-    async def fetch_email(self, uid: str) -> EmailMessage:
+    def _parse_fetch_response(self, data: List[Any]) -> Dict[str, Dict[str, Any]]:
         """
-        Fetch email message by UID.
+        Parse a ``UID FETCH`` response into ``{uid: {"flags", "size", "raw", "meta"}}``.
+        
+        ``raw`` is the message literal (empty when none was requested) and
+        ``meta`` the non-literal part of the response. Servers may send items
+        such as FLAGS after the literal, so the bytes following each literal
+        are parsed together with its prefix.
+        """
+        records = []
+        for item in data:
+            if isinstance(item, tuple):
+                records.append([item[0], item[1]])
+            elif isinstance(item, bytes):
+                if self._FETCH_START_RE.match(item):
+                    records.append([item, b""])
+                elif records:
+                    records[-1][0] += item
+        
+        parsed = {}
+        for meta, raw in records:
+            uid_match = self._FETCH_UID_RE.search(meta)
+            if not uid_match:
+                continue
+            flags_match = self._FETCH_FLAGS_RE.search(meta)
+            size_match = self._FETCH_SIZE_RE.search(meta)
+            parsed[uid_match.group(1).decode('utf-8')] = {
+                "flags": flags_match.group(1).decode('utf-8').split() if flags_match else [],
+                "size": int(size_match.group(1)) if size_match else len(raw or b""),
+                "raw": raw or b"",
+                "meta": meta
+            }
+        return parsed
+    
+    _SEXP_TOKEN_RE = re.compile(rb'\(|\)|"(?:[^"\\]|\\.)*"|[^\s()"]+')
+    
+    def _parse_bodystructure(self, meta: bytes) -> Optional[list]:
+        """Parse the BODYSTRUCTURE item of a FETCH response into nested lists."""
+        start = meta.find(b"BODYSTRUCTURE (")
+        if start == -1:
+            return None
+        
+        stack: List[list] = []
+        for match in self._SEXP_TOKEN_RE.finditer(meta, start + len(b"BODYSTRUCTURE ")):
+            token = match.group(0)
+            if token == b"(":
+                stack.append([])
+            elif token == b")":
+                node = stack.pop()
+                if not stack:
+                    return node
+                stack[-1].append(node)
+            elif stack:
+                if token.startswith(b'"'):
+                    value = re.sub(rb'\\(.)', rb'\1', token[1:-1]).decode('utf-8', errors='replace')
+                elif token.upper() == b"NIL":
+                    value = None
+                else:
+                    value = token.decode('utf-8', errors='replace')
+                stack[-1].append(value)
+        return None
+    
+    def _bodystructure_attachments(self, node: Optional[list]) -> List[Dict[str, Any]]:
+        """
+        List attachment metadata (filename, content type, approximate size) from a BODYSTRUCTURE.
+        
+        Only parts with an ``attachment`` disposition and a filename are
+        reported, mirroring how full messages are parsed.
+        """
+        attachments: List[Dict[str, Any]] = []
+        if not node:
+            return attachments
+        
+        if isinstance(node[0], list):
+            # Multipart: child parts come first, then the subtype and extensions
+            for child in node:
+                if not isinstance(child, list):
+                    break
+                attachments.extend(self._bodystructure_attachments(child))
+            return attachments
+        
+        try:
+            content_type = f"{node[0]}/{node[1]}".lower()
+            params = self._pairs_to_dict(node[2])
+            encoding = (node[5] or "").lower()
+            size = int(node[6] or 0)
+            
+            # Extension fields follow the type-specific fields
+            extension = 7
+            if content_type.startswith("text/"):
+                extension = 8
+            elif content_type == "message/rfc822":
+                extension = 10
+            disposition = node[extension + 1] if len(node) > extension + 1 else None
+        except (IndexError, TypeError, ValueError):
+            return attachments
+        
+        if isinstance(disposition, list) and disposition and str(disposition[0]).lower() == "attachment":
+            disposition_params = self._pairs_to_dict(disposition[1] if len(disposition) > 1 else None)
+            filename = disposition_params.get("filename") or params.get("name")
+            if filename:
+                attachments.append({
+                    "filename": self._decode_header(filename),
+                    "content_type": content_type,
+                    # BODYSTRUCTURE reports the encoded size
+                    "size": size * 3 // 4 if encoding == "base64" else size
+                })
+        return attachments
+    
+    @staticmethod
+    def _pairs_to_dict(pairs: Optional[list]) -> Dict[str, str]:
+        """Convert a BODYSTRUCTURE parameter list ``(key value ...)`` to a dict."""
+        if not isinstance(pairs, list):
+            return {}
+        return {
+            str(key).lower(): value
+            for key, value in zip(pairs[::2], pairs[1::2])
+            if isinstance(value, str)
+        }
+    
+    @staticmethod
+    def _split_header(raw_email: bytes) -> bytes:
+        """Return the header block of a raw RFC822 message."""
+        for separator in (b"\r\n\r\n", b"\n\n"):
+            index = raw_email.find(separator)
+            if index != -1:
+                return raw_email[:index + len(separator)]
+        return raw_email
+    
+    def _parse_message(self, uid: str, raw_email: bytes, flags: List[str], size: int) -> EmailMessage:
+        """Parse raw RFC822 bytes (or only the header block) into an EmailMessage."""
+        email_message = email.message_from_bytes(raw_email)
+        
+        subject = self._decode_header(email_message.get('Subject', ''))
+        sender = self._extract_email_address(email_message.get('From', ''))
+        recipient = self._extract_email_address(email_message.get('To', ''))
+        date = email_message.get('Date', '')
+        
+        body_text = ""
+        body_html = ""
+        attachments = []
+        
+        if email_message.is_multipart():
+            for part in email_message.walk():
+                content_type = part.get_content_type()
+                content_disposition = part.get('Content-Disposition', '')
+                
+                if content_type == 'text/plain' and 'attachment' not in content_disposition:
+                    charset = part.get_content_charset() or 'utf-8'
+                    body_text = part.get_payload(decode=True).decode(charset, errors='ignore')
+                
+                elif content_type == 'text/html' and 'attachment' not in content_disposition:
+                    charset = part.get_content_charset() or 'utf-8'
+                    body_html = part.get_payload(decode=True).decode(charset, errors='ignore')
+                
+                elif 'attachment' in content_disposition:
+                    filename = part.get_filename()
+                    if filename:
+                        filename = self._decode_header(filename)
+                        content = part.get_payload(decode=True)
+                        attachments.append({
+                            'filename': filename,
+                            'content_type': content_type,
+                            'size': len(content) if content else 0,
+                            'content_base64': base64.b64encode(content).decode('utf-8') if content else ""
+                        })
+        else:
+            content_type = email_message.get_content_type()
+            charset = email_message.get_content_charset() or 'utf-8'
+            payload = email_message.get_payload(decode=True)
+            
+            if payload:
+                content = payload.decode(charset, errors='ignore')
+                if content_type == 'text/html':
+                    body_html = content
+                else:
+                    body_text = content
+        
+        headers = {}
+        for key, value in email_message.items():
+            headers[key] = self._decode_header(value)
+        
+        return EmailMessage(
+            uid=uid,
+            subject=subject,
+            sender=sender,
+            recipient=recipient,
+            date=date,
+            body_text=body_text,
+            body_html=body_html,
+            attachments=attachments,
+            headers=headers,
+            size=size,
+            flags=flags
+        )
+    
+    async def _fetch_batches(self, conn: PooledIMAPConnection, uids: List[str], items: str) -> Dict[str, Dict[str, Any]]:
+        """Run ``UID FETCH`` for ``uids`` in batches of FETCH_BATCH_SIZE."""
+        fetched: Dict[str, Dict[str, Any]] = {}
+        for i in range(0, len(uids), self.FETCH_BATCH_SIZE):
+            uid_set = ",".join(uids[i:i + self.FETCH_BATCH_SIZE])
+            data = await self._run(self._command, conn, "UID FETCH", uid_set, items)
+            fetched.update(self._parse_fetch_response(data))
+        return fetched
+    
+    async def fetch_emails(
+        self,
+        uids: List[str],
+        headers_only: bool = False,
+        folder: Optional[str] = None
+    ) -> List[EmailMessage]:
+        """
+        Fetch several emails from a folder with batched UID FETCH.
+        
+        Messages already in the cache are not downloaded again; only their
+        flags are refreshed (one small FETCH for all of them).
         
         Args:
-            uid: Email UID
+            uids: Email UIDs to fetch
+            headers_only: Only fetch summary header fields, BODYSTRUCTURE and
+                size (bodies are left empty, attachments carry metadata only,
+                and the messages are not marked as seen)
+            folder: Folder holding the UIDs (defaults to ``current_folder``)
             
         Returns:
-            EmailMessage object
+            EmailMessage objects in the order of ``uids``; UIDs that no longer
+            exist are omitted
         """
-        fetch_start = datetime.now()
-        logger.debug(f"[FETCH] Starting fetch for email UID: {uid}")
+        if not uids:
+            return []
         
-        if not await self.ensure_connection():
-            raise Exception("Failed to connect to IMAP server")
+        fetch_start = datetime.now()
+        uids = [str(int(uid)) for uid in uids]
+        folder = folder or self.current_folder
         
+        records: Dict[str, Dict[str, Any]] = {}
         try:
-            logger.debug(f"[FETCH] Executing IMAP FETCH command for UID: {uid}")
-            result, data = self.connection.fetch(uid, '(RFC822 FLAGS)')
-            fetch_time = (datetime.now() - fetch_start).total_seconds()
-            
-            if result != 'OK':
-                logger.error(f"[FETCH] Failed to fetch email {uid} in {fetch_time:.2f}s: {data}")
-                raise Exception(f"Failed to fetch email {uid}: {data}")
-            
-            raw_email = data[0][1]
-            email_message = email.message_from_bytes(raw_email)
-            
-            subject = self._decode_header(email_message.get('Subject', ''))
-            sender = self._extract_email_address(email_message.get('From', ''))
-            recipient = self._extract_email_address(email_message.get('To', ''))
-            date = email_message.get('Date', '')
-            
-            body_text = ""
-            body_html = ""
-            attachments = []
-            
-            if email_message.is_multipart():
-                for part in email_message.walk():
-                    content_type = part.get_content_type()
-                    content_disposition = part.get('Content-Disposition', '')
-                    
-                    if content_type == 'text/plain' and 'attachment' not in content_disposition:
-                        charset = part.get_content_charset() or 'utf-8'
-                        body_text = part.get_payload(decode=True).decode(charset, errors='ignore')
-                    
-                    elif content_type == 'text/html' and 'attachment' not in content_disposition:
-                        charset = part.get_content_charset() or 'utf-8'
-                        body_html = part.get_payload(decode=True).decode(charset, errors='ignore')
-                    
-                    elif 'attachment' in content_disposition:
-                        filename = part.get_filename()
-                        if filename:
-                            filename = self._decode_header(filename)
-                            content = part.get_payload(decode=True)
-                            attachments.append({
-                                'filename': filename,
-                                'content_type': content_type,
-                                'size': len(content) if content else 0,
-                                'content_base64': base64.b64encode(content).decode('utf-8') if content else ""
-                            })
-            else:
-                content_type = email_message.get_content_type()
-                charset = email_message.get_content_charset() or 'utf-8'
-                payload = email_message.get_payload(decode=True)
+            async with self._connection(folder) as conn:
+                uidvalidity = conn.uidvalidity
+                use_cache = self.cache is not None and uidvalidity is not None
                 
-                if payload:
-                    content = payload.decode(charset, errors='ignore')
-                    if content_type == 'text/html':
-                        body_html = content
-                    else:
-                        body_text = content
-            
-            headers = {}
-            for key, value in email_message.items():
-                headers[key] = self._decode_header(value)
-            
-            flags_data = data[0][0].decode('utf-8')
-            flags = []
-            if 'FLAGS' in flags_data:
-                flag_part = flags_data.split('FLAGS (')[1].split(')')[0]
-                flags = [flag.strip() for flag in flag_part.split()]
-            
-            parse_time = (datetime.now() - fetch_start).total_seconds()
-            logger.info(f"[FETCH] Successfully fetched and parsed email {uid} (size: {len(raw_email)} bytes) in {parse_time:.2f}s")
-            logger.debug(f"[FETCH] Email details - Subject: '{subject[:50]}...', Sender: {sender}, Attachments: {len(attachments)}")
-            
-            return EmailMessage(
-                uid=uid,
-                subject=subject,
-                sender=sender,
-                recipient=recipient,
-                date=date,
-                body_text=body_text,
-                body_html=body_html,
-                attachments=attachments,
-                headers=headers,
-                size=len(raw_email),
-                flags=flags
-            )
-            
+                if use_cache:
+                    records = await self._run(self.cache.get_many, folder, uidvalidity, uids, not headers_only)
+                cached_uids = [uid for uid in uids if uid in records]
+                missing_uids = [uid for uid in uids if uid not in records]
+                
+                if cached_uids:
+                    flags = await self._fetch_batches(conn, cached_uids, self.FLAGS_FETCH_ITEMS)
+                    for uid in cached_uids:
+                        if uid in flags:
+                            records[uid]["flags"] = flags[uid]["flags"]
+                        else:
+                            # Expunged since it was cached
+                            del records[uid]
+                
+                items = self.SUMMARY_FETCH_ITEMS if headers_only else self.FULL_FETCH_ITEMS
+                downloaded = await self._fetch_batches(conn, missing_uids, items)
         except Exception as e:
             fetch_time = (datetime.now() - fetch_start).total_seconds()
-            logger.error(f"[FETCH] Error fetching email {uid} after {fetch_time:.2f}s: {str(e)}")
+            logger.error(f"[FETCH] Error fetching {len(uids)} emails after {fetch_time:.2f}s: {str(e)}")
             raise
+        
+        messages = []
+        new_records: Dict[str, Dict[str, Any]] = {}
+        for uid in uids:
+            try:
+                if uid in downloaded:
+                    record = downloaded[uid]
+                    if headers_only:
+                        record = {
+                            "header": record["raw"],
+                            "attachments": self._bodystructure_attachments(self._parse_bodystructure(record["meta"])),
+                            "size": record["size"],
+                            "raw": None,
+                            "flags": record["flags"]
+                        }
+                    else:
+                        record = dict(record, header=self._split_header(record["raw"]))
+                elif uid in records:
+                    record = records[uid]
+                else:
+                    continue
+                
+                if record.get("raw") and not headers_only:
+                    message = self._parse_message(uid, record["raw"], record["flags"], record["size"])
+                else:
+                    message = self._parse_message(uid, record["header"], record["flags"], record["size"])
+                    message.attachments = [dict(att) for att in record["attachments"]]
+                messages.append(message)
+                
+                if uid in downloaded:
+                    if "attachments" not in record:
+                        record["attachments"] = [
+                            {key: att[key] for key in ("filename", "content_type", "size")}
+                            for att in message.attachments
+                        ]
+                    new_records[uid] = record
+            except Exception as e:
+                logger.error(f"[FETCH] Error parsing email {uid}: {str(e)}")
+        
+        if use_cache and new_records:
+            try:
+                await self._run(self.cache.put_many, folder, uidvalidity, new_records)
+            except Exception as e:
+                logger.warning(f"[FETCH] Failed to cache {len(new_records)} emails: {str(e)}")
+        
+        fetch_time = (datetime.now() - fetch_start).total_seconds()
+        logger.info(
+            f"[FETCH] Fetched {len(messages)}/{len(uids)} emails ({'headers' if headers_only else 'full'}, "
+            f"{len(uids) - len(missing_uids)} from cache) in {fetch_time:.2f}s"
+        )
+        return messages
+    
+    async def fetch_email(self, uid: str, folder: Optional[str] = None) -> EmailMessage:
+        """
+        Fetch email message by UID.
+        
+        Args:
+            uid: Email UID
+            folder: Folder holding the UID (defaults to ``current_folder``)
+            
+        Returns:
+            EmailMessage object
+        """
+        messages = await self.fetch_emails([uid], folder=folder)
+        if not messages:
+            raise Exception(f"Failed to fetch email {uid}: message not found")
+        return messages[0]
 
 
 class EmailIMAPMCPServer:
@@ -581,14 +1106,20 @@ class EmailIMAPMCPServer:
                             "description": "Maximum number of emails to return",
                             "default": 1
                         },
+                        "mode": {
+                            "type": "string",
+                            "enum": ["full", "headers"],
+                            "description": "'headers' lists subject, sender, date, flags, size and attachment names without downloading bodies; 'full' also returns body text",
+                            "default": "full"
+                        },
                         "include_body_html": {
                             "type": "boolean",
-                            "description": "Include HTML body content",
+                            "description": "Include HTML body content (full mode only)",
                             "default": False
                         },
                         "include_attachments": {
                             "type": "boolean",
-                            "description": "Include attachment content in base64 format",
+                            "description": "Include attachment content in base64 format (full mode only)",
                             "default": False
                         }
                     }
@@ -842,7 +1373,7 @@ class EmailIMAPMCPServer:
                 }
             
             await self.email_client.select_folder(folder)
-            email_msg = await self.email_client.fetch_email(str(uid))
+            email_msg = await self.email_client.fetch_email(str(uid), folder=folder)
             
             # Ensure all text content is properly encoded
             result = {
@@ -895,8 +1426,6 @@ class EmailIMAPMCPServer:
                 "uid": self._safe_text(str(uid)) if uid else None,
                 "timestamp": datetime.now().isoformat()
             }
-        finally:
-            await self.email_client.disconnect()
     
     async def _get_recent_emails(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Get recent emails and return only the latest email in pure JSON format."""
@@ -907,8 +1436,17 @@ class EmailIMAPMCPServer:
             limit = arguments.get("limit", 1)
             include_body_html = arguments.get("include_body_html", False)
             include_attachments = arguments.get("include_attachments", False)
+            mode = arguments.get("mode", "full")
+            
+            if mode not in ("full", "headers"):
+                return {
+                    "success": False,
+                    "error": f"Invalid mode: {mode}. Must be 'full' or 'headers'",
+                    "timestamp": datetime.now().isoformat()
+                }
+            headers_only = mode == "headers"
             
-            logger.info(f"[GET_RECENT] Starting operation - folder: {folder}, days: {days}, limit: {limit}")
+            logger.info(f"[GET_RECENT] Starting operation - folder: {folder}, days: {days}, limit: {limit}, mode: {mode}")
             logger.debug(f"[GET_RECENT] Options - include_body_html: {include_body_html}, include_attachments: {include_attachments}")
             
             select_start = datetime.now()
@@ -921,7 +1459,7 @@ class EmailIMAPMCPServer:
             logger.debug(f"[GET_RECENT] Search criteria: '{criteria}' (since {since_date})")
             
             search_start = datetime.now()
-            uids = await self.email_client.search_emails(criteria, limit)
+            uids = await self.email_client.search_emails(criteria, limit, folder=folder)
             search_time = (datetime.now() - search_start).total_seconds()
             logger.debug(f"[GET_RECENT] Email search completed in {search_time:.2f}s")
             
@@ -933,54 +1471,49 @@ class EmailIMAPMCPServer:
                     "timestamp": datetime.now().isoformat()
                 }
             
-            # Get the requested number of emails (up to limit)
+            # Fetch the requested emails (up to limit) in a single batched round-trip
             emails_data = []
             
             logger.info(f"[GET_RECENT] Processing {len(uids[:limit])} emails...")
-            for i, uid in enumerate(uids[:limit], 1):  # Process up to 'limit' emails
-                try:
-                    logger.debug(f"[GET_RECENT] Processing email {i}/{len(uids[:limit])} - UID: {uid}")
-                    email_start = datetime.now()
-                    email_msg = await self.email_client.fetch_email(uid)
-                    email_time = (datetime.now() - email_start).total_seconds()
-                    logger.debug(f"[GET_RECENT] Email {i} processed in {email_time:.2f}s")
-                    
-                    # Create email JSON data
-                    email_data = {
-                        "uid": str(email_msg.uid),
-                        "subject": self._clean_body_text(email_msg.subject),
-                        "sender": self._safe_text(email_msg.sender),
-                        "recipient": self._safe_text(email_msg.recipient),
-                        "date": self._safe_text(email_msg.date),
-                        "body_text": self._clean_body_text(email_msg.body_text),
-                        "size": email_msg.size,
-                        "flags": email_msg.flags,
-                        "attachments": []
-                    }
+            fetch_start = datetime.now()
+            email_msgs = await self.email_client.fetch_emails(uids[:limit], headers_only=headers_only, folder=folder)
+            fetch_time = (datetime.now() - fetch_start).total_seconds()
+            logger.debug(f"[GET_RECENT] Batch fetch of {len(email_msgs)} emails completed in {fetch_time:.2f}s")
+            
+            for email_msg in email_msgs:
+                # Create email JSON data
+                email_data = {
+                    "uid": str(email_msg.uid),
+                    "subject": self._clean_body_text(email_msg.subject),
+                    "sender": self._safe_text(email_msg.sender),
+                    "recipient": self._safe_text(email_msg.recipient),
+                    "date": self._safe_text(email_msg.date),
+                    "size": email_msg.size,
+                    "flags": email_msg.flags,
+                    "attachments": []
+                }
+                
+                # Bodies are only available in full mode
+                if not headers_only:
+                    email_data["body_text"] = self._clean_body_text(email_msg.body_text)
                     
                     # Only include body_html if explicitly requested
                     if include_body_html:
                         email_data["body_html"] = self._safe_text(email_msg.body_html)
-                    
-                    # Process attachments - always include metadata
-                    for att in email_msg.attachments:
-                        safe_att = {
-                            "filename": self._safe_text(att.get("filename", "")),
-                            "content_type": self._safe_text(att.get("content_type", "")),
-                            "size": att.get("size", 0)
-                        }
-                        # Only include base64 content if explicitly requested
-                        if include_attachments:
-                            safe_att["content_base64"] = att.get("content_base64", "")
-                        email_data["attachments"].append(safe_att)
-                    
-                    emails_data.append(email_data)
-                    
-                except Exception as e:
-                    # Log error but continue processing other emails
-                    email_time = (datetime.now() - email_start).total_seconds()
-                    logger.error(f"[GET_RECENT] Error processing email {i} (UID: {uid}) after {email_time:.2f}s: {str(e)}")
-                    continue
+                
+                # Process attachments - always include metadata
+                for att in email_msg.attachments:
+                    safe_att = {
+                        "filename": self._safe_text(att.get("filename", "")),
+                        "content_type": self._safe_text(att.get("content_type", "")),
+                        "size": att.get("size", 0)
+                    }
+                    # Only include base64 content if explicitly requested
+                    if include_attachments and not headers_only:
+                        safe_att["content_base64"] = att.get("content_base64", "")
+                    email_data["attachments"].append(safe_att)
+                
+                emails_data.append(email_data)
             
             operation_time = (datetime.now() - operation_start).total_seconds()
             logger.info(f"[GET_RECENT] Operation completed in {operation_time:.2f}s - retrieved {len(emails_data)} emails")
@@ -1000,11 +1533,6 @@ class EmailIMAPMCPServer:
                 "message": "An error occurred while retrieving email data",
                 "timestamp": datetime.now().isoformat()
             }
-        finally:
-            disconnect_start = datetime.now()
-            await self.email_client.disconnect()
-            disconnect_time = (datetime.now() - disconnect_start).total_seconds()
-            logger.debug(f"[GET_RECENT] Disconnection completed in {disconnect_time:.2f}s")
     
     async def _extract_attachments(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Extract and save attachments from email JSON file."""
@@ -13,6 +13,7 @@ Features:
 - Attachment handling with size and type restrictions
 - Configuration via .simacode/config.yaml (primary) and .env.mcp (fallback)
 - Rate limiting and security controls
+- Pooled, kept-alive SMTP sessions and batched sending (send_email_batch)
 
 Configuration:
 This tool reads configuration from SimaCode's config system. Example config.yaml:
@@ -24,6 +25,7 @@ email:
     use_tls: true
     use_ssl: false
     timeout: 60
+    pool_size: 3                    # pooled SMTP sessions
     username: your-email@gmail.com  # Or set EMAIL_USERNAME env var
     password: your-app-password     # Or set EMAIL_PASSWORD env var
   defaults:
@@ -54,14 +56,16 @@ import mimetypes
 import os
 import re
 import sys
+import time
 import base64
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta
 from email.mime.application import MIMEApplication
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from pathlib import Path
-from typing import Any, Dict, List, Optional, AsyncGenerator
-from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, AsyncGenerator, AsyncIterator
+from dataclasses import dataclass, field
 
 # Email libraries
 import aiosmtplib
@@ -102,6 +106,11 @@ class SMTPConfig:
     use_tls: bool = True
     timeout: int = 60
     
+    # Connection pool
+    pool_size: int = 3
+    pool_keepalive: int = 30  # NOOP-check sessions idle longer than this before reuse (seconds)
+    pool_max_idle: int = 240  # close sessions idle longer than this (seconds)
+    
     # Default sender info
     from_name: str = ""
     from_email: str = ""
@@ -151,6 +160,9 @@ class SMTPConfig:
             use_ssl=smtp_config.use_ssl,
             use_tls=smtp_config.use_tls,
             timeout=smtp_config.timeout,
+            pool_size=smtp_config.pool_size,
+            pool_keepalive=smtp_config.pool_keepalive,
+            pool_max_idle=smtp_config.pool_max_idle,
             from_name=from_name,
             from_email=from_email,
             max_recipients=email_config.security.max_recipients,
@@ -172,6 +184,174 @@ class EmailSendResult:
     metadata: Optional[Dict[str, Any]] = None
 
 
+class PooledSMTP(aiosmtplib.SMTP):
+    """SMTP session that records whether the DATA command of a send has started."""
+    
+    data_started = False
+    
+    async def data(self, *args, **kwargs):
+        self.data_started = True
+        return await super().data(*args, **kwargs)
+
+
+@dataclass
+class PooledSMTPConnection:
+    """An authenticated SMTP session owned by the connection pool."""
+    smtp: PooledSMTP
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class SMTPConnectionPool:
+    """
+    Bounded pool of authenticated SMTP sessions.
+    
+    Sessions are reused across messages so TLS negotiation and login happen
+    once per connection instead of once per email. Sessions idle longer than
+    ``pool_keepalive`` are checked with NOOP before reuse, a background task
+    closes sessions idle longer than ``pool_max_idle``, and sessions that
+    fail with a connection error are discarded so the next checkout
+    reconnects.
+    """
+    
+    # Errors after which a session cannot be reused
+    CONNECTION_ERRORS = (
+        aiosmtplib.SMTPServerDisconnected,
+        aiosmtplib.SMTPConnectError,
+        aiosmtplib.SMTPTimeoutError,
+        ConnectionError,
+        OSError,
+    )
+    
+    def __init__(self, config: SMTPConfig):
+        """
+        Initialize the SMTP connection pool.
+        
+        Args:
+            config: SMTP configuration containing server details and pool limits
+        """
+        self.config = config
+        self.max_size = max(1, config.pool_size)
+        self._idle: List[PooledSMTPConnection] = []
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._reaper: Optional[asyncio.Task] = None
+        
+        # Statistics
+        self.stats = {"connections_opened": 0, "connections_reused": 0, "connections_discarded": 0}
+    
+    async def _open(self) -> PooledSMTPConnection:
+        """Open, secure and authenticate a new SMTP session."""
+        smtp = PooledSMTP(
+            hostname=self.config.server,
+            port=self.config.port,
+            timeout=self.config.timeout,
+            use_tls=self.config.use_ssl,  # Direct SSL
+            start_tls=self.config.use_tls  # STARTTLS
+        )
+        await smtp.connect()
+        try:
+            if self.config.username:
+                await smtp.login(self.config.username, self.config.password)
+        except Exception:
+            smtp.close()
+            raise
+        
+        self.stats["connections_opened"] += 1
+        mcp_debug(f"Opened SMTP connection to {self.config.server}:{self.config.port}", tool_name="smtp_email")
+        return PooledSMTPConnection(smtp=smtp)
+    
+    async def _discard(self, conn: PooledSMTPConnection) -> None:
+        """Close a session without waiting on a possibly dead server."""
+        self.stats["connections_discarded"] += 1
+        try:
+            if conn.smtp.is_connected:
+                await asyncio.wait_for(conn.smtp.quit(), timeout=5)
+        except Exception:
+            conn.smtp.close()
+    
+    async def _checkout(self) -> PooledSMTPConnection:
+        """Take a live session from the pool, opening a new one if needed."""
+        while self._idle:
+            conn = self._idle.pop()
+            idle_time = time.monotonic() - conn.last_used
+            
+            if not conn.smtp.is_connected or idle_time > self.config.pool_max_idle:
+                await self._discard(conn)
+                continue
+            
+            if idle_time > self.config.pool_keepalive:
+                try:
+                    await conn.smtp.noop()
+                except Exception as e:
+                    mcp_debug(f"Pooled SMTP connection failed NOOP, reconnecting: {e}", tool_name="smtp_email")
+                    await self._discard(conn)
+                    continue
+            
+            self.stats["connections_reused"] += 1
+            return conn
+        
+        return await self._open()
+    
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[aiosmtplib.SMTP]:
+        """
+        Borrow an authenticated SMTP session.
+        
+        After an SMTP-level error (e.g. a rejected recipient) the session is
+        reset with RSET before it is returned to the pool.
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_size)
+        
+        async with self._slots:
+            conn = await self._checkout()
+            reusable = True
+            try:
+                yield conn.smtp
+            except self.CONNECTION_ERRORS:
+                reusable = False
+                raise
+            except aiosmtplib.SMTPException:
+                try:
+                    await conn.smtp.rset()
+                except Exception:
+                    reusable = False
+                raise
+            except BaseException:
+                reusable = False
+                raise
+            finally:
+                if reusable and conn.smtp.is_connected:
+                    conn.last_used = time.monotonic()
+                    self._idle.append(conn)
+                    if self._reaper is None or self._reaper.done():
+                        self._reaper = asyncio.create_task(self._reap_idle())
+                else:
+                    await self._discard(conn)
+    
+    async def _reap_idle(self) -> None:
+        """Close sessions idle longer than ``pool_max_idle``; stops when the pool is empty."""
+        while self._idle:
+            await asyncio.sleep(self.config.pool_max_idle / 2)
+            cutoff = time.monotonic() - self.config.pool_max_idle
+            expired = [conn for conn in self._idle if conn.last_used < cutoff]
+            self._idle = [conn for conn in self._idle if conn.last_used >= cutoff]
+            for conn in expired:
+                await self._discard(conn)
+    
+    async def close(self) -> None:
+        """Close all idle sessions."""
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            await self._discard(conn)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics."""
+        return {**self.stats, "idle": len(self._idle), "max_size": self.max_size}
+
+
 class SMTPEmailClient:
     """
     SMTP email client for secure email sending.
@@ -192,6 +372,9 @@ class SMTPEmailClient:
         self._email_count_daily = {}
         self._last_cleanup = datetime.now()
         
+        # Pooled SMTP sessions shared by all sends
+        self.pool = SMTPConnectionPool(config)
+        
         mcp_info(f"SMTP client initialized: {self.config.server}:{self.config.port} ({self.config.username})", tool_name="smtp_email")
         
     
@@ -215,8 +398,16 @@ class SMTPEmailClient:
             
             self._last_cleanup = now
     
-    def _check_rate_limits(self) -> tuple[bool, str]:
-        """Check if rate limits are exceeded."""
+    def _reserve_rate_slot(self) -> tuple[Optional[tuple], str]:
+        """Check the rate limits and count one email against them.
+        
+        Checking and counting happen without yielding to the event loop, so
+        concurrent sends cannot all pass the check before any is counted.
+        
+        Returns:
+            Tuple of (slot, error); slot is None if a limit is exceeded and
+            must be passed to ``_release_rate_slot`` if the email is not sent
+        """
         self._cleanup_rate_limiting()
         
         now = datetime.now()
@@ -226,23 +417,24 @@ class SMTPEmailClient:
         # Check hourly limit
         hourly_count = self._email_count_hourly.get(current_hour, 0)
         if hourly_count >= self.config.max_emails_per_hour:
-            return False, f"Hourly rate limit exceeded ({self.config.max_emails_per_hour} emails/hour)"
+            return None, f"Hourly rate limit exceeded ({self.config.max_emails_per_hour} emails/hour)"
         
         # Check daily limit
         daily_count = self._email_count_daily.get(current_day, 0)
         if daily_count >= self.config.max_emails_per_day:
-            return False, f"Daily rate limit exceeded ({self.config.max_emails_per_day} emails/day)"
+            return None, f"Daily rate limit exceeded ({self.config.max_emails_per_day} emails/day)"
         
-        return True, ""
+        self._email_count_hourly[current_hour] = hourly_count + 1
+        self._email_count_daily[current_day] = daily_count + 1
+        return (current_hour, current_day), ""
     
-    def _increment_rate_counters(self):
-        """Increment rate limiting counters."""
-        now = datetime.now()
-        current_hour = now.replace(minute=0, second=0, microsecond=0)
-        current_day = now.date()
-        
-        self._email_count_hourly[current_hour] = self._email_count_hourly.get(current_hour, 0) + 1
-        self._email_count_daily[current_day] = self._email_count_daily.get(current_day, 0) + 1
+    def _release_rate_slot(self, slot: tuple) -> None:
+        """Give back a slot reserved for an email that was not sent."""
+        current_hour, current_day = slot
+        if self._email_count_hourly.get(current_hour, 0) > 0:
+            self._email_count_hourly[current_hour] -= 1
+        if self._email_count_daily.get(current_day, 0) > 0:
+            self._email_count_daily[current_day] -= 1
     
     def _validate_email_address(self, email_addr: str) -> tuple[bool, str]:
         """Validate email address format."""
@@ -463,6 +655,100 @@ class SMTPEmailClient:
         
         return msg, "Email message created successfully"
     
+    async def _prepare_email(
+        self,
+        to: List[str],
+        subject: str,
+        body: str,
+        content_type: str = "text",
+        cc: Optional[List[str]] = None,
+        bcc: Optional[List[str]] = None,
+        reply_to: Optional[str] = None,
+        attachments: Optional[List[str]] = None,
+        priority: str = "normal",
+        from_name: Optional[str] = None,
+        from_email: Optional[str] = None
+    ) -> tuple[Optional[MIMEMultipart], List[str], str]:
+        """Validate recipients and attachments and build the message.
+        
+        Returns:
+            Tuple of (message, all recipients, error); message is None on error
+        """
+        # Normalize and validate recipients
+        to_list = self._normalize_email_list(to)
+        cc_list = self._normalize_email_list(cc) if cc else []
+        bcc_list = self._normalize_email_list(bcc) if bcc else []
+        
+        all_recipients = to_list + cc_list + bcc_list
+        
+        if not all_recipients:
+            return None, [], "No valid recipients specified"
+        
+        if len(all_recipients) > self.config.max_recipients:
+            return None, [], f"Too many recipients ({len(all_recipients)} > {self.config.max_recipients})"
+        
+        # Validate each recipient
+        for recipient in all_recipients:
+            is_valid, result = self._validate_email_address(recipient)
+            if not is_valid:
+                return None, [], f"Invalid recipient: {result}"
+        
+        # Validate attachments
+        if attachments:
+            valid_attachments, attachment_error, total_size = await self.validate_attachments(attachments)
+            if not valid_attachments:
+                return None, [], attachment_error
+        
+        # Create email message
+        email_message, create_error = await self.create_email_message(
+            to=to_list,
+            subject=subject,
+            body=body,
+            content_type=content_type,
+            cc=cc_list if cc_list else None,
+            bcc=bcc_list if bcc_list else None,
+            reply_to=reply_to,
+            attachments=attachments,
+            priority=priority,
+            from_name=from_name,
+            from_email=from_email
+        )
+        
+        if email_message is None:
+            return None, [], create_error
+        
+        return email_message, all_recipients, ""
+    
+    async def _deliver(self, email_message: MIMEMultipart, recipients: List[str]) -> None:
+        """Send a prepared message over a pooled session.
+        
+        A pooled session the server has silently dropped fails on the first
+        command, so delivery is retried once on a fresh session. Once DATA
+        has started the server may already have accepted the message, so a
+        disconnect from then on is not retried to avoid sending it twice.
+        """
+        for attempt in range(2):
+            smtp: Optional[PooledSMTP] = None
+            try:
+                async with self.pool.connection() as smtp:
+                    smtp.data_started = False
+                    await smtp.send_message(email_message, recipients=recipients)
+                return
+            except aiosmtplib.SMTPServerDisconnected as e:
+                if attempt or smtp is None or smtp.data_started:
+                    raise
+                mcp_warning(f"SMTP connection dropped, retrying on a new connection: {e}", tool_name="smtp_email")
+    
+    def _smtp_error(self, error: Exception) -> str:
+        """Describe an SMTP delivery error."""
+        if isinstance(error, aiosmtplib.SMTPAuthenticationError):
+            return "SMTP authentication failed. Please check username and password."
+        if isinstance(error, aiosmtplib.SMTPConnectError):
+            return f"Failed to connect to SMTP server {self.config.server}:{self.config.port}"
+        if isinstance(error, aiosmtplib.SMTPException):
+            return f"SMTP error: {str(error)}"
+        return f"Unexpected error sending email: {str(error)}"
+    
     async def send_email(
         self,
         to: List[str],
@@ -481,60 +767,23 @@ class SMTPEmailClient:
         """Send email message."""
         start_time = datetime.now()
         
+        # Reserve a rate limit slot before any await; released unless the email is sent
+        rate_slot, rate_msg = self._reserve_rate_slot()
+        if rate_slot is None:
+            return EmailSendResult(
+                success=False,
+                error=rate_msg
+            )
+        sent = False
+        
         try:
-            # Check rate limits
-            rate_ok, rate_msg = self._check_rate_limits()
-            if not rate_ok:
-                return EmailSendResult(
-                    success=False,
-                    error=rate_msg
-                )
-            
-            # Normalize and validate recipients
-            to_list = self._normalize_email_list(to)
-            cc_list = self._normalize_email_list(cc) if cc else []
-            bcc_list = self._normalize_email_list(bcc) if bcc else []
-            
-            all_recipients = to_list + cc_list + bcc_list
-            
-            if not all_recipients:
-                return EmailSendResult(
-                    success=False,
-                    error="No valid recipients specified"
-                )
-            
-            if len(all_recipients) > self.config.max_recipients:
-                return EmailSendResult(
-                    success=False,
-                    error=f"Too many recipients ({len(all_recipients)} > {self.config.max_recipients})"
-                )
-            
-            # Validate each recipient
-            for recipient in all_recipients:
-                is_valid, result = self._validate_email_address(recipient)
-                if not is_valid:
-                    return EmailSendResult(
-                        success=False,
-                        error=f"Invalid recipient: {result}"
-                    )
-            
-            # Validate attachments
-            if attachments:
-                valid_attachments, attachment_error, total_size = await self.validate_attachments(attachments)
-                if not valid_attachments:
-                    return EmailSendResult(
-                        success=False,
-                        error=attachment_error
-                    )
-            
-            # Create email message
-            email_message, create_error = await self.create_email_message(
-                to=to_list,
+            email_message, all_recipients, prepare_error = await self._prepare_email(
+                to=to,
                 subject=subject,
                 body=body,
                 content_type=content_type,
-                cc=cc_list if cc_list else None,
-                bcc=bcc_list if bcc_list else None,
+                cc=cc,
+                bcc=bcc,
                 reply_to=reply_to,
                 attachments=attachments,
                 priority=priority,
@@ -545,67 +794,36 @@ class SMTPEmailClient:
             if email_message is None:
                 return EmailSendResult(
                     success=False,
-                    error=create_error
+                    error=prepare_error
                 )
             
             # Handle send delay
             if send_delay > 0:
                 await asyncio.sleep(send_delay)
             
-            # Send email via SMTP
+            # Send email over a pooled SMTP session
             try:
-                async with aiosmtplib.SMTP(
-                    hostname=self.config.server,
-                    port=self.config.port,
-                    timeout=self.config.timeout,
-                    use_tls=self.config.use_ssl,  # Direct SSL
-                    start_tls=self.config.use_tls  # STARTTLS
-                ) as smtp:
-                    
-                    await smtp.login(self.config.username, self.config.password)
-                    
-                    await smtp.send_message(
-                        email_message,
-                        recipients=all_recipients
-                    )
-                    
-                    # Increment rate counters
-                    self._increment_rate_counters()
-                    
-                    execution_time = (datetime.now() - start_time).total_seconds()
-                    
-                    return EmailSendResult(
-                        success=True,
-                        message=f"Email sent successfully to {len(all_recipients)} recipient(s)",
-                        execution_time=execution_time,
-                        metadata={
-                            "subject": subject,
-                            "recipient_count": len(all_recipients),
-                            "attachment_count": len(attachments) if attachments else 0,
-                            "content_type": content_type
-                        }
-                    )
-                    
-            except aiosmtplib.SMTPAuthenticationError:
-                return EmailSendResult(
-                    success=False,
-                    error="SMTP authentication failed. Please check username and password."
-                )
-            except aiosmtplib.SMTPConnectError:
-                return EmailSendResult(
-                    success=False,
-                    error=f"Failed to connect to SMTP server {self.config.server}:{self.config.port}"
-                )
-            except aiosmtplib.SMTPException as e:
-                return EmailSendResult(
-                    success=False,
-                    error=f"SMTP error: {str(e)}"
-                )
+                await self._deliver(email_message, all_recipients)
             except Exception as e:
                 return EmailSendResult(
                     success=False,
-                    error=f"Unexpected error sending email: {str(e)}"
+                    error=self._smtp_error(e)
                 )
+            
+            sent = True
+            execution_time = (datetime.now() - start_time).total_seconds()
+            
+            return EmailSendResult(
+                success=True,
+                message=f"Email sent successfully to {len(all_recipients)} recipient(s)",
+                execution_time=execution_time,
+                metadata={
+                    "subject": subject,
+                    "recipient_count": len(all_recipients),
+                    "attachment_count": len(attachments) if attachments else 0,
+                    "content_type": content_type
+                }
+            )
                 
         except Exception as e:
             execution_time = (datetime.now() - start_time).total_seconds()
@@ -614,6 +832,87 @@ class SMTPEmailClient:
                 error=f"Email sending failed: {str(e)}",
                 execution_time=execution_time
             )
+        finally:
+            if not sent:
+                self._release_rate_slot(rate_slot)
+    
+    async def send_email_batch(
+        self,
+        messages: List[Dict[str, Any]],
+        stop_on_error: bool = False
+    ) -> EmailSendResult:
+        """
+        Send many emails over the pooled SMTP sessions.
+        
+        Messages are sent concurrently, at most ``pool_size`` at a time, and
+        each is validated and rate limited like a single ``send_email`` call.
+        
+        Args:
+            messages: Message specs with the same fields as ``send_email``
+                (except ``send_delay``)
+            stop_on_error: Skip the remaining messages after the first failure
+            
+        Returns:
+            EmailSendResult whose metadata holds one result per message
+        """
+        start_time = datetime.now()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(messages)
+        stop = asyncio.Event()
+        in_flight = asyncio.Semaphore(self.pool.max_size)
+        
+        async def send_one(index: int, spec: Dict[str, Any]) -> None:
+            async with in_flight:
+                if stop.is_set():
+                    results[index] = {"index": index, "success": False, "error": "Skipped after an earlier failure"}
+                    return
+                await send_spec(index, spec)
+        
+        async def send_spec(index: int, spec: Dict[str, Any]) -> None:
+            if not isinstance(spec, dict):
+                result = EmailSendResult(success=False, error="Message must be an object")
+            else:
+                fields = {key: spec.get(key) for key in (
+                    "to", "subject", "body", "cc", "bcc", "reply_to", "attachments", "from_name", "from_email"
+                )}
+                result = await self.send_email(
+                    content_type=spec.get("content_type") or "text",
+                    priority=spec.get("priority") or "normal",
+                    **fields
+                )
+            
+            entry = {"index": index, "success": result.success}
+            if result.success:
+                entry["message"] = result.message
+            else:
+                entry["error"] = result.error
+                if stop_on_error:
+                    stop.set()
+            results[index] = entry
+        
+        await asyncio.gather(*(send_one(i, spec) for i, spec in enumerate(messages)))
+        
+        sent = sum(1 for entry in results if entry["success"])
+        failed = len(messages) - sent
+        execution_time = (datetime.now() - start_time).total_seconds()
+        summary = f"Sent {sent} of {len(messages)} email(s)"
+        
+        return EmailSendResult(
+            success=failed == 0,
+            message=summary,
+            error=None if failed == 0 else f"{summary}; {failed} failed",
+            execution_time=execution_time,
+            metadata={
+                "total": len(messages),
+                "sent": sent,
+                "failed": failed,
+                "results": results,
+                "pool": self.pool.get_stats()
+            }
+        )
+    
+    async def close(self) -> None:
+        """Close pooled SMTP sessions."""
+        await self.pool.close()
 
 
 class EmailSMTPMCPServer:
@@ -722,6 +1021,42 @@ class EmailSMTPMCPServer:
                     },
                     "required": ["to", "subject", "body"]
                 }
+            },
+            "send_email_batch": {
+                "name": "send_email_batch",
+                "description": "Send many emails over pooled SMTP connections and report a result for each message",
+                "input_schema": {
+                    "type": "object",
+                    "properties": {
+                        "messages": {
+                            "type": "array",
+                            "description": "Emails to send; each item accepts the same fields as send_email (except send_delay)",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "to": {"type": "string"},
+                                    "subject": {"type": "string"},
+                                    "body": {"type": "string"},
+                                    "content_type": {"type": "string", "enum": ["text", "html"]},
+                                    "cc": {"type": "string"},
+                                    "bcc": {"type": "string"},
+                                    "reply_to": {"type": "string"},
+                                    "attachments": {"type": "array", "items": {"type": "string"}},
+                                    "priority": {"type": "string", "enum": ["low", "normal", "high"]},
+                                    "from_name": {"type": "string"},
+                                    "from_email": {"type": "string"}
+                                },
+                                "required": ["to", "subject", "body"]
+                            }
+                        },
+                        "stop_on_error": {
+                            "type": "boolean",
+                            "description": "Skip remaining messages after the first failure",
+                            "default": False
+                        }
+                    },
+                    "required": ["messages"]
+                }
             }
         }
         
@@ -836,6 +1171,8 @@ class EmailSMTPMCPServer:
             
             if tool_name == "send_email":
                 result = await self._send_email(arguments)
+            elif tool_name == "send_email_batch":
+                result = await self._send_email_batch(arguments)
             else:
                 raise ValueError(f"Unknown tool: {tool_name}")
             
@@ -927,20 +1264,9 @@ class EmailSMTPMCPServer:
                 )
             
             # Convert string to list for email fields (support comma-separated)
-            def parse_email_list(value):
-                """Parse email string or list into a list of emails."""
-                if not value:
-                    return None
-                if isinstance(value, str):
-                    # Split by comma and strip whitespace
-                    return [email.strip() for email in value.split(',') if email.strip()]
-                if isinstance(value, list):
-                    return value
-                return None
-            
-            to = parse_email_list(to)
-            cc = parse_email_list(cc) 
-            bcc = parse_email_list(bcc)
+            to = self._parse_email_list(to)
+            cc = self._parse_email_list(cc)
+            bcc = self._parse_email_list(bcc)
             
             # Send email
             return await self.email_client.send_email(
@@ -964,6 +1290,46 @@ class EmailSMTPMCPServer:
                 error=f"Failed to send email: {str(e)}"
             )
     
+    async def _send_email_batch(self, arguments: Dict[str, Any]) -> EmailSendResult:
+        """Send a batch of emails with given arguments."""
+        messages = arguments.get("messages")
+        if not isinstance(messages, list) or not messages:
+            return EmailSendResult(
+                success=False,
+                error="'messages' must be a non-empty list"
+            )
+        
+        specs = []
+        for spec in messages:
+            if isinstance(spec, dict):
+                spec = dict(spec)
+                for key in ("to", "cc", "bcc"):
+                    spec[key] = self._parse_email_list(spec.get(key))
+            specs.append(spec)
+        
+        try:
+            return await self.email_client.send_email_batch(
+                specs,
+                stop_on_error=bool(arguments.get("stop_on_error", False))
+            )
+        except Exception as e:
+            return EmailSendResult(
+                success=False,
+                error=f"Failed to send email batch: {str(e)}"
+            )
+    
+    @staticmethod
+    def _parse_email_list(value: Any) -> Optional[List[str]]:
+        """Parse email string (comma-separated) or list into a list of emails."""
+        if not value:
+            return None
+        if isinstance(value, str):
+            # Split by comma and strip whitespace
+            return [email.strip() for email in value.split(',') if email.strip()]
+        if isinstance(value, list):
+            return value
+        return None
+    
     async def run_stdio(self):
         """Run the MCP server using stdio."""
         mcp_info("Starting Email SMTP MCP Server with stdio", tool_name="smtp_email")
@@ -1045,6 +1411,8 @@ class EmailSMTPMCPServer:
         except Exception as e:
             mcp_error(f"Stdio server error: {e}", tool_name="smtp_email")
         finally:
+            # Close pooled SMTP sessions
+            await self.email_client.close()
             mcp_info("Email SMTP MCP Server stopped", tool_name="smtp_email")
 
 